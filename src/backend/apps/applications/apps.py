@@ -1,7 +1,5 @@
 from django.apps import AppConfig  # Django 4.2+
 
-from .signals import connect_application_signals  # ./signals.py
-
 
 class ApplicationsConfig(AppConfig):
     """
@@ -25,4 +23,10 @@ class ApplicationsConfig(AppConfig):
         # Register signal handlers for application status changes
         # Register signal handlers for document uploads
         # Set up any app-specific configurations
-        connect_application_signals()
\ No newline at end of file
+        try:
+            from .signals import connect_application_signals
+            connect_application_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting application signals: {e}")
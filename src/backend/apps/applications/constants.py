@@ -9,7 +9,7 @@ validate data, and control application flow.
 
 from decimal import Decimal  # standard library
 
-from ...utils.constants import (  # v3.11+
+from utils.constants import (  # v3.11+
     APPLICATION_STATUS,
     MINIMUM_LOAN_AMOUNT,
     MAXIMUM_LOAN_AMOUNT,
@@ -239,6 +239,10 @@ class LoanApplication(CoreModel):
         Returns:
             LoanDetails: The associated loan details object or None if not found
         """
+        # Reuse loan details already loaded through select_related
+        if LoanApplication.loan_details.is_cached(self):
+            return getattr(self, 'loan_details', None)
+        
         try:
             return LoanDetails.objects.get(application=self)
         except LoanDetails.DoesNotExist:
@@ -269,6 +273,12 @@ class LoanApplication(CoreModel):
         Returns:
             UnderwritingDecision: The decision object or None if not found
         """
+        # Reuse a decision already loaded through select_related
+        descriptor = getattr(LoanApplication, 'underwriting_decision', None)
+        if descriptor is not None and descriptor.is_cached(self):
+            decision = getattr(self, 'underwriting_decision', None)
+            return decision if decision is not None and not decision.is_deleted else None
+        
         try:
             # This will be implemented in the underwriting app
             from apps.underwriting.models import UnderwritingDecision
@@ -6,7 +6,9 @@ from rest_framework import serializers  # version 3.14+
 from rest_framework.exceptions import ValidationError  # version 3.14+
 from django.db import transaction  # version 4.2+
 
-from core.serializers import BaseModelSerializer, SensitiveDataMixin, ReadOnlyModelSerializer
+from core.serializers import (
+    BaseModelSerializer, SensitiveDataMixin, ReadOnlyModelSerializer, DownloadUrlMixin, DownloadUrlListSerializer
+)
 from apps.users.serializers import BorrowerProfileSerializer, EmploymentInfoSerializer
 from apps.schools.serializers import SchoolSerializer, ProgramSerializer
 from .models import (
@@ -444,7 +446,7 @@ class LoanDetailsSerializer(BaseModelSerializer):
         return data
 
 
-class ApplicationDocumentSerializer(BaseModelSerializer):
+class ApplicationDocumentSerializer(DownloadUrlMixin, BaseModelSerializer):
     """
     Serializer for ApplicationDocument model
     """
@@ -462,6 +464,7 @@ class ApplicationDocumentSerializer(BaseModelSerializer):
             'id', 'document_type', 'file_name', 'file_path',
             'status', 'uploaded_at', 'uploaded_by', 'download_url'
         ]
+        list_serializer_class = DownloadUrlListSerializer
 
     def get_download_url(self, obj):
         """
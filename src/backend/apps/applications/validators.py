@@ -9,7 +9,7 @@ financial data, and document requirements.
 from datetime import datetime, date
 from decimal import Decimal
 
-from ...utils.validators import (
+from utils.validators import (
     ValidationError, validate_email, validate_phone, validate_ssn,
     validate_zip_code, validate_state_code, validate_date, validate_future_date,
     validate_positive_number, validate_non_negative_number, validate_loan_amount,
@@ -22,7 +22,7 @@ from .constants import (
     DOCUMENT_REQUIREMENTS, MINIMUM_EMPLOYMENT_MONTHS, ERROR_MESSAGES
 )
 
-from ...utils.constants import (
+from utils.constants import (
     CITIZENSHIP_STATUS, MINIMUM_AGE, MINIMUM_INCOME, DATE_FORMAT
 )
 
@@ -10,11 +10,12 @@ from rest_framework.response import Response  # rest_framework 3.14+
 from rest_framework.decorators import action  # rest_framework 3.14+
 from rest_framework.permissions import IsAuthenticated  # rest_framework 3.14+
 
-from core.views import BaseGenericAPIView, BaseAPIView, TransactionMixin, AuditLogMixin, format_success_response, get_object_or_exception  # src/backend/core/views.py
+from core.views import BaseGenericAPIView, BaseAPIView, TransactionMixin, AuditLogMixin, StreamingDownloadMixin, format_success_response, get_object_or_exception  # src/backend/core/views.py
 from .models import LoanApplication, LoanDetails, ApplicationDocument  # src/backend/apps/applications/models.py
 from .serializers import LoanApplicationSerializer, LoanApplicationDetailSerializer, LoanApplicationCreateSerializer, LoanApplicationUpdateSerializer, LoanApplicationSubmitSerializer, LoanDetailsSerializer, ApplicationDocumentSerializer, ApplicationDocumentCreateSerializer, ApplicationFormProgressSerializer  # src/backend/apps/applications/serializers.py
 from .permissions import CanViewApplication, CanCreateApplication, CanEditApplication, CanSubmitApplication, CanDeleteApplication, CanUploadDocuments, CanViewApplicationDocuments, CanDeleteApplicationDocument  # src/backend/apps/applications/permissions.py
 from .services import ApplicationService, ApplicationServiceError, application_service  # src/backend/apps/applications/services.py
+from apps.underwriting.context import UnderwritingContext  # src/backend/apps/underwriting/context.py
 from utils.logging import get_request_logger  # src/backend/utils/logging.py
 
 # Get logger with request context
@@ -43,8 +44,11 @@ class ApplicationViewSet(BaseGenericAPIView, AuditLogMixin, TransactionMixin, vi
         Returns:
             QuerySet: Filtered queryset of LoanApplication objects
         """
-        # Get the base queryset from LoanApplication.objects.all()
-        queryset = LoanApplication.objects.all()
+        # Get the base queryset, loading underwriting-related data in one pass for detail views
+        if self.action == 'retrieve':
+            queryset = UnderwritingContext.get_queryset()
+        else:
+            queryset = LoanApplication.objects.all()
         user = self.request.user
 
         # If user is a system admin, return all applications
@@ -388,7 +392,7 @@ class ApplicationViewSet(BaseGenericAPIView, AuditLogMixin, TransactionMixin, vi
             return Response(format_success_response(serializer.errors), status=status.HTTP_400_BAD_REQUEST)
 
 
-class ApplicationDocumentViewSet(BaseGenericAPIView, AuditLogMixin, viewsets.ModelViewSet):  # Fixed: Added AuditLogMixin
+class ApplicationDocumentViewSet(StreamingDownloadMixin, BaseGenericAPIView, AuditLogMixin, viewsets.ModelViewSet):  # Fixed: Added AuditLogMixin
     """
     ViewSet for managing application documents
     """
@@ -516,6 +520,24 @@ class ApplicationDocumentViewSet(BaseGenericAPIView, AuditLogMixin, viewsets.Mod
         except ApplicationServiceError as e:
             return self.handle_exception(e)
 
+    @action(methods=['get'], detail=True, permission_classes=[IsAuthenticated, CanViewApplicationDocuments])
+    def file(self, request, pk=None):
+        """
+        Custom action to download the file of a document
+
+        Args:
+            request (Request): request
+            pk (uuid.UUID): pk
+
+        Returns:
+            StreamingHttpResponse: Response streaming the document file, or a redirect to it
+        """
+        # Get the document instance
+        document = self.get_object()
+
+        # Stream the file from storage
+        return self.stream_file(request, document.file_path, document.file_name)
+
 
 class ApplicationCalculatorView(BaseAPIView):
     """
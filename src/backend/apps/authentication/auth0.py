@@ -7,23 +7,181 @@ includes a custom Django REST Framework authentication class for validating Auth
 """
 
 import requests  # requests 2.28+
+from requests.adapters import HTTPAdapter  # requests 2.28+
 import jwt  # PyJWT 2.8+
+import copy  # standard library
+import hashlib  # standard library
 import json  # standard library
 import logging  # standard library
-from datetime import timedelta  # standard library
+import threading  # standard library
+import time  # standard library
+from collections import OrderedDict  # standard library
+from datetime import datetime, timezone as dt_timezone  # standard library
 
 from django.conf import settings  # Django 4.2+
-from django.utils import timezone  # Django 4.2+
 from rest_framework.authentication import BaseAuthentication, get_authorization_header  # DRF 3.14+
 from rest_framework.exceptions import AuthenticationFailed  # DRF 3.14+
 
 from .models import Auth0User
 from .tokens import validate_jwt_token
-from ...core.exceptions import AuthenticationException, ValidationException
+from core.exceptions import AuthenticationException, ValidationException
+from utils.token_cache import token_cache
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the Auth0 tenant by each process
+AUTH0_HTTP_POOL_SIZE = 10
+
+# Most verified bearer tokens kept by each process
+AUTH0_TOKEN_CACHE_SIZE = 1024
+
+# Process-wide HTTP session and manager, created on first use
+_http_session = None
+_auth0_manager = None
+_process_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Returns the process-wide HTTP session used for Auth0 requests.
+
+    The session pools connections, so consecutive requests to Auth0 reuse an open
+    TLS connection instead of opening a new one each time.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _http_session
+    if _http_session is None:
+        with _process_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=AUTH0_HTTP_POOL_SIZE)
+                session.mount('https://', adapter)
+                _http_session = session
+    return _http_session
+
+
+def get_auth0_manager():
+    """
+    Returns the process-wide Auth0Manager configured from settings.
+
+    Returns:
+        Auth0Manager: The shared manager
+    """
+    global _auth0_manager
+    if _auth0_manager is None:
+        with _process_lock:
+            if _auth0_manager is None:
+                _auth0_manager = Auth0Manager()
+    return _auth0_manager
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified bearer tokens and the users they resolve to.
+
+    The SPA sends many parallel requests with the same token, so each process keeps the
+    decoded payload and user of recently seen tokens, keyed by a hash of the token. An
+    entry is dropped when the token expires, and a user's entries are evicted when
+    TokenService revokes their tokens or the user is saved or deleted (see signals.py);
+    other processes drop theirs at the token's expiry.
+    """
+
+    def __init__(self, max_entries=AUTH0_TOKEN_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Most tokens kept; the least recently used are dropped first
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        """
+        Returns the cached verification of a token.
+
+        Args:
+            token (str): Bearer token
+
+        Returns:
+            tuple: (payload, user), or None if the token is not cached or has expired. The
+                user is a copy, so changes made while handling a request stay in that request.
+        """
+        key = self._make_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, user, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return payload, copy.copy(user)
+
+    def set(self, token, payload, user):
+        """
+        Caches a verified token until it expires.
+
+        Args:
+            token (str): Bearer token
+            payload (dict): Decoded token payload
+            user (Auth0User): User the token resolved to
+        """
+        expires_at = payload.get('exp')
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            # Tokens without an expiry are verified on every request
+            return
+
+        key = self._make_key(token)
+        with self._lock:
+            self._entries[key] = (payload, copy.copy(user), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict_user(self, user_id):
+        """
+        Drops every cached token of a user.
+
+        Args:
+            user_id: Primary key of the Auth0User
+
+        Returns:
+            int: Number of tokens dropped
+        """
+        with self._lock:
+            keys = [key for key, (_, user, _) in self._entries.items() if user.pk == user_id]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Drops all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _make_key(token):
+        """
+        Builds the cache key for a token, so tokens are not kept in memory in the clear.
+
+        Args:
+            token (str): Bearer token
+
+        Returns:
+            str: SHA-256 hex digest of the token
+        """
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+# Process-wide cache of verified bearer tokens
+verified_token_cache = VerifiedTokenCache()
+
 
 class Auth0Manager:
     """
@@ -59,13 +217,28 @@ class Auth0Manager:
         """
         Obtains a management API token from Auth0.
 
+        The token is shared between workers through the token cache, so Auth0 is only
+        asked for a new one when the shared token is about to expire.
+
         Returns:
             str: Management API token
         """
-        # Check if we already have a valid token
-        if self.management_token and self.token_expiry and timezone.now() < self.token_expiry:
-            return self.management_token
+        access_token, expires_at = token_cache.get_token(
+            f'auth0:{self.domain}:{self.client_id}',
+            f'https://{self.domain}/api/v2/',
+            self._request_management_token
+        )
+        self.management_token = access_token
+        self.token_expiry = datetime.fromtimestamp(expires_at, tz=dt_timezone.utc)
+        return self.management_token
 
+    def _request_management_token(self):
+        """
+        Requests a new management API token using client credentials.
+
+        Returns:
+            tuple: (access_token, expires_in seconds)
+        """
         # Prepare the request payload
         payload = {
             'client_id': self.client_id,
@@ -75,7 +248,7 @@ class Auth0Manager:
         }
 
         # Make the request to Auth0
-        response = requests.post(f'https://{self.domain}/oauth/token', json=payload)
+        response = get_http_session().post(f'https://{self.domain}/oauth/token', json=payload)
 
         # Check if the request was successful
         if response.status_code != 200:
@@ -84,13 +257,8 @@ class Auth0Manager:
 
         # Extract the token from the response
         token_data = response.json()
-        self.management_token = token_data.get('access_token')
-        
-        # Set token expiry time (subtract 5 minutes for safety margin)
         expires_in = token_data.get('expires_in', 86400)  # Default to 24 hours
-        self.token_expiry = timezone.now() + timedelta(seconds=expires_in - 300)
-
-        return self.management_token
+        return token_data.get('access_token'), expires_in
 
     def _make_management_api_request(self, method, endpoint, data=None, params=None):
         """
@@ -120,13 +288,13 @@ class Auth0Manager:
         # Make the request
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=params)
+                response = get_http_session().get(url, headers=headers, params=params)
             elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=data)
+                response = get_http_session().post(url, headers=headers, json=data)
             elif method.upper() == 'PATCH':
-                response = requests.patch(url, headers=headers, json=data)
+                response = get_http_session().patch(url, headers=headers, json=data)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers)
+                response = get_http_session().delete(url, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -165,7 +333,7 @@ class Auth0Manager:
             }
 
             # Make authentication request to Auth0
-            response = requests.post(
+            response = get_http_session().post(
                 f'https://{self.domain}/oauth/token',
                 json=payload,
                 headers={'Content-Type': 'application/json'}
@@ -552,7 +720,7 @@ class Auth0Manager:
         
         try:
             # Initiate password reset with Auth0
-            response = requests.post(
+            response = get_http_session().post(
                 f'https://{self.domain}/dbconnections/change_password',
                 json=reset_data,
                 headers={'Content-Type': 'application/json'}
@@ -662,13 +830,19 @@ class Auth0Authentication(BaseAuthentication):
         # Extract token
         token = auth_header[1].decode('utf-8')
         
+        # Repeat requests with a token verified earlier skip verification and the user query
+        cached = verified_token_cache.get(token)
+        if cached:
+            return (cached[1], token)
+        
         try:
             # Validate token
-            auth0_manager = Auth0Manager()
+            auth0_manager = get_auth0_manager()
             token_payload = auth0_manager.validate_token(token)
             
             # Get user from token
             user = auth0_manager.get_user_from_token(token_payload)
+            verified_token_cache.set(token, token_payload, user)
             
             # Return authenticated user and token
             return (user, token)
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from django.utils import timezone
 from django.db import transaction
 
-from .auth0 import Auth0Manager
+from .auth0 import get_auth0_manager, verified_token_cache
 from .models import (
     Auth0User, UserSession, RefreshToken, MFAVerification, 
     LoginAttempt, MFA_METHODS
@@ -39,9 +39,9 @@ class AuthenticationService:
     
     def __init__(self):
         """
-        Initializes the AuthenticationService with an Auth0Manager instance.
+        Initializes the AuthenticationService with the process-wide Auth0Manager.
         """
-        self.auth0_manager = Auth0Manager()
+        self.auth0_manager = get_auth0_manager()
 
     def authenticate(self, email, password, ip_address=None, user_agent=None):
         """
@@ -244,6 +244,7 @@ class AuthenticationService:
             # Revoke associated refresh tokens
             token_service = TokenService()
             RefreshToken.objects.filter(auth0_user=session.auth0_user).update(is_revoked=True)
+            token_service.revoke_access_tokens(session.auth0_user)
             
             return True
             
@@ -758,6 +759,7 @@ class TokenService:
         """
         try:
             refresh_token.revoke()
+            self.revoke_access_tokens(refresh_token.auth0_user)
             return True
         except Exception as e:
             logger.error(f"Failed to revoke refresh token: {str(e)}")
@@ -787,9 +789,23 @@ class TokenService:
                 count += 1
             except Exception as e:
                 logger.warning(f"Failed to revoke token {token.id}: {str(e)}")
-                
+        
+        self.revoke_access_tokens(user)
         return count
 
+    def revoke_access_tokens(self, user):
+        """
+        Drops a user's verified access tokens from this process's token cache, so their
+        next request is verified again and loads the user afresh.
+
+        Args:
+            user (Auth0User): User whose tokens are evicted
+
+        Returns:
+            int: Number of cached tokens evicted
+        """
+        return verified_token_cache.evict_user(user.pk)
+
 
 class LoginAttemptService:
     """
@@ -0,0 +1,21 @@
+"""
+Signal handlers for the authentication app.
+
+Saving or deleting an Auth0User drops their verified tokens from this process's token
+cache, so a user who is soft-deleted or deactivated stops authenticating with tokens
+verified earlier, and other changes are seen on their next request.
+"""
+from django.db.models.signals import post_save, post_delete  # Django 4.2+
+from django.dispatch import receiver  # Django 4.2+
+
+from .auth0 import verified_token_cache
+from .models import Auth0User
+
+
+@receiver(post_save, sender=Auth0User)
+@receiver(post_delete, sender=Auth0User)
+def evict_verified_tokens(sender, instance, **kwargs):
+    """
+    Signal handler that evicts the cached tokens of a saved or deleted user
+    """
+    verified_token_cache.evict_user(instance.pk)
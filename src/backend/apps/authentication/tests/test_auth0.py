@@ -0,0 +1,164 @@
+"""
+Unit tests for Auth0 bearer token authentication.
+
+This module contains test cases for the verified-token cache used by
+Auth0Authentication, covering reuse of verified tokens, expiry, the size bound,
+and eviction when a user's tokens are revoked or the user is changed or deleted.
+"""
+
+import time  # standard library
+from types import SimpleNamespace  # standard library
+from unittest.mock import patch, MagicMock  # standard library
+
+from django.test import SimpleTestCase, TestCase  # Django 4.2+
+from rest_framework.test import APIRequestFactory  # DRF 3.14+
+
+from ..auth0 import Auth0Authentication, VerifiedTokenCache, verified_token_cache
+from ..models import Auth0User
+from ..services import TokenService
+
+# Test constants
+TOKEN = 'header.payload.signature'
+
+
+class VerifiedTokenCacheTestCase(SimpleTestCase):
+    """Test case for the VerifiedTokenCache."""
+
+    def setUp(self):
+        """Set up test data for cache tests."""
+        self.cache = VerifiedTokenCache(max_entries=2)
+        self.user = SimpleNamespace(pk=1, email='test@example.com')
+        self.payload = {'sub': 'auth0|123456789', 'exp': time.time() + 3600}
+
+    def test_cached_token_returns_payload_and_user_copy(self):
+        """Test that a cached token returns its payload and a copy of the user."""
+        self.cache.set(TOKEN, self.payload, self.user)
+
+        payload, user = self.cache.get(TOKEN)
+
+        self.assertEqual(payload, self.payload)
+        self.assertEqual(user.email, 'test@example.com')
+        self.assertIsNot(user, self.user)
+        self.assertIsNone(self.cache.get('other-token'))
+
+    def test_expired_token_is_dropped(self):
+        """Test that entries are not returned after the token's expiry."""
+        self.cache.set(TOKEN, {'sub': 'auth0|123456789', 'exp': time.time() + 1}, self.user)
+
+        with patch('apps.authentication.auth0.time.time', return_value=time.time() + 2):
+            self.assertIsNone(self.cache.get(TOKEN))
+
+    def test_token_without_expiry_is_not_cached(self):
+        """Test that tokens without an exp claim are always verified."""
+        self.cache.set(TOKEN, {'sub': 'auth0|123456789'}, self.user)
+
+        self.assertIsNone(self.cache.get(TOKEN))
+
+    def test_least_recently_used_token_is_dropped(self):
+        """Test that the cache stays within its size."""
+        self.cache.set('token-a', self.payload, self.user)
+        self.cache.set('token-b', self.payload, self.user)
+        self.cache.get('token-a')
+        self.cache.set('token-c', self.payload, self.user)
+
+        self.assertIsNotNone(self.cache.get('token-a'))
+        self.assertIsNone(self.cache.get('token-b'))
+        self.assertIsNotNone(self.cache.get('token-c'))
+
+    def test_evict_user(self):
+        """Test that evicting a user drops only that user's tokens."""
+        other_user = SimpleNamespace(pk=2, email='other@example.com')
+        self.cache.set('token-a', self.payload, self.user)
+        self.cache.set('token-b', self.payload, other_user)
+
+        self.assertEqual(self.cache.evict_user(1), 1)
+
+        self.assertIsNone(self.cache.get('token-a'))
+        self.assertIsNotNone(self.cache.get('token-b'))
+
+
+class Auth0AuthenticationTestCase(SimpleTestCase):
+    """Test case for Auth0Authentication with the verified-token cache."""
+
+    def setUp(self):
+        """Set up test data for authentication tests."""
+        verified_token_cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = SimpleNamespace(pk=1, email='test@example.com')
+        self.manager = MagicMock()
+        self.manager.validate_token.return_value = {'sub': 'auth0|123456789', 'exp': time.time() + 3600}
+        self.manager.get_user_from_token.return_value = self.user
+        patcher = patch('apps.authentication.auth0.get_auth0_manager', return_value=self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(verified_token_cache.clear)
+
+    def test_repeat_requests_skip_verification(self):
+        """Test that a token is verified and its user loaded only once."""
+        authentication = Auth0Authentication()
+        request = self.factory.get('/api/', HTTP_AUTHORIZATION=f'Bearer {TOKEN}')
+
+        first_user, first_token = authentication.authenticate(request)
+        second_user, second_token = authentication.authenticate(request)
+
+        self.assertEqual(first_token, TOKEN)
+        self.assertEqual(second_token, TOKEN)
+        self.assertEqual(second_user.email, first_user.email)
+        self.manager.validate_token.assert_called_once_with(TOKEN)
+        self.manager.get_user_from_token.assert_called_once()
+
+    def test_request_without_bearer_token(self):
+        """Test that requests without a bearer token are not authenticated."""
+        request = self.factory.get('/api/')
+
+        self.assertIsNone(Auth0Authentication().authenticate(request))
+        self.manager.validate_token.assert_not_called()
+
+
+class TokenRevocationTestCase(TestCase):
+    """Test case for evicting cached tokens when tokens are revoked."""
+
+    def setUp(self):
+        """Set up test data for revocation tests."""
+        verified_token_cache.clear()
+        self.addCleanup(verified_token_cache.clear)
+        self.auth0_user = Auth0User.objects.create(
+            auth0_id='auth0|123456789',
+            email='test@example.com',
+            email_verified=True,
+            is_active=True
+        )
+        self.payload = {'sub': self.auth0_user.auth0_id, 'exp': time.time() + 3600}
+
+    def test_revoke_all_user_tokens_evicts_cached_tokens(self):
+        """Test that revoking a user's tokens drops their verified tokens."""
+        verified_token_cache.set(TOKEN, self.payload, self.auth0_user)
+
+        TokenService().revoke_all_user_tokens(self.auth0_user)
+
+        self.assertIsNone(verified_token_cache.get(TOKEN))
+
+    def test_deleting_user_evicts_cached_tokens(self):
+        """Test that a soft-deleted user can no longer authenticate with a cached token."""
+        verified_token_cache.set(TOKEN, self.payload, self.auth0_user)
+
+        self.auth0_user.delete()
+
+        self.assertIsNone(verified_token_cache.get(TOKEN))
+
+    def test_deactivating_user_evicts_cached_tokens(self):
+        """Test that deactivating a user drops their verified tokens."""
+        verified_token_cache.set(TOKEN, self.payload, self.auth0_user)
+
+        self.auth0_user.is_active = False
+        self.auth0_user.save()
+
+        self.assertIsNone(verified_token_cache.get(TOKEN))
+
+    def test_hard_deleting_user_evicts_cached_tokens(self):
+        """Test that a hard-deleted user's verified tokens are dropped."""
+        verified_token_cache.set(TOKEN, self.payload, self.auth0_user)
+
+        self.auth0_user.delete(hard_delete=True)
+
+        self.assertIsNone(verified_token_cache.get(TOKEN))
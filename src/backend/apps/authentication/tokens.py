@@ -18,12 +18,12 @@ import uuid
 from django.conf import settings  # Django 4.2+
 from rest_framework.exceptions import AuthenticationFailed  # DRF 3.14+
 
-from ...utils.constants import (
+from utils.constants import (
     JWT_EXPIRATION_HOURS,
     REFRESH_TOKEN_EXPIRATION_DAYS,
     PASSWORD_RESET_EXPIRATION_HOURS
 )
-from ...utils.encryption import encrypt, decrypt
+from utils.encryption import encrypt, decrypt
 
 # Global constants
 JWT_SECRET_KEY = settings.JWT_SECRET_KEY
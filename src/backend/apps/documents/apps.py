@@ -1,14 +1,12 @@
 from django.apps import AppConfig  # Django 4.2+
 
-from .signals import connect_document_signals  # Import function to connect all document-related signals
-
 
 class DocumentsConfig(AppConfig):
     """
     Django app configuration class for the documents app that defines app metadata and initialization behavior
     """
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'documents'
+    name = 'apps.documents'
     label = 'documents'
     verbose_name = 'Documents'
 
@@ -24,7 +22,13 @@ class DocumentsConfig(AppConfig):
         # from . import signals  # Import document-related signals
 
         # Call connect_document_signals to register signal handlers for document events
-        connect_document_signals()
+        try:
+            from .signals import connect_document_signals
+            connect_document_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting document signals: {e}")
 
         # Register signal handlers for document status changes
         # signals.document_status_signal.connect(signals.handle_document_status_change)
@@ -33,5 +37,26 @@ class DocumentsConfig(AppConfig):
         # signals.signature_status_signal.connect(signals.handle_signature_status_change)
 
         # Set up any app-specific configurations
-        # For example, you could load settings from a file or initialize a cache
-        pass
\ No newline at end of file
+        self._setup_periodic_tasks()
+
+    def _setup_periodic_tasks(self):
+        """
+        Set up the Celery periodic task that reconciles signature statuses with DocuSign.
+        """
+        try:
+            from django.conf import settings
+            from celery.schedules import crontab
+
+            app = settings.CELERY_APP
+
+            # Register periodic tasks with Celery beat scheduler
+            app.conf.beat_schedule.update({
+                'reconcile-envelope-statuses': {
+                    'task': 'apps.documents.tasks.reconcile_envelope_statuses',
+                    'schedule': crontab(minute='*/15'),  # Every 15 minutes
+                }
+            })
+        except (ImportError, AttributeError) as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Error setting up document periodic tasks: {e}")
\ No newline at end of file
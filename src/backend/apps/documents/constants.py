@@ -175,4 +175,38 @@ DOCUSIGN_RECIPIENT_STATUS_MAPPING = {
 REMINDER_INTERVAL_DAYS = 3
 
 # Maximum number of signature reminders to send before escalation
-MAX_REMINDERS = 5
\ No newline at end of file
+MAX_REMINDERS = 5
+
+# Maximum number of compiled document templates kept per process
+DOCUMENT_TEMPLATE_CACHE_SIZE = 64
+
+# Seconds a template's S3 version is trusted before it is checked again
+DOCUMENT_TEMPLATE_VERSION_TTL_SECONDS = 60
+
+# Seconds to wait for one document to be converted to PDF by the rendering pool
+DOCUMENT_RENDER_TIMEOUT_SECONDS = 120
+
+# Number of applications whose documents are rendered together in one cohort batch
+DOCUMENT_RENDER_BATCH_SIZE = 25
+
+# Number of generated PDFs uploaded to storage at the same time during bulk generation
+DOCUMENT_UPLOAD_CONCURRENCY = 8
+
+# Version mixed into document content hashes; bump it when PDF output changes for the same HTML
+# (for example a new stylesheet or WeasyPrint upgrade) so stored content is not reused
+DOCUMENT_CONTENT_HASH_VERSION = 1
+
+# Envelopes requested per page when listing DocuSign envelope status changes
+DOCUSIGN_RECONCILE_PAGE_SIZE = 100
+
+# Number of envelope status pages fetched from DocuSign at the same time
+DOCUSIGN_RECONCILE_CONCURRENCY = 4
+
+# Number of envelopes whose signature requests and documents are updated per transaction
+DOCUSIGN_RECONCILE_BATCH_SIZE = 500
+
+# Seconds each reconciliation run re-reads before the watermark, to cover DocuSign clock skew
+DOCUSIGN_RECONCILE_OVERLAP_SECONDS = 300
+
+# Days of envelope changes read by the first reconciliation run of an account
+DOCUSIGN_RECONCILE_INITIAL_LOOKBACK_DAYS = 30
@@ -10,14 +10,18 @@ import os
 import json
 import base64
 import datetime
+import functools
+import hashlib
+import threading
 import uuid
 import requests
 import docusign_esign  # version 3.20.0+
 from django.conf import settings  # version 4.2+
-from django.db import transaction  # version 4.2+
+from django.db import transaction, IntegrityError  # version 4.2+
 
 from utils.logging import getLogger
-from .models import Document, DocumentPackage, SignatureRequest, DocumentField
+from utils.token_cache import token_cache
+from .models import Document, DocumentPackage, SignatureRequest, DocumentField, DocuSignWebhookEvent
 from .storage import DocumentStorage, document_storage
 from .constants import (
     DOCUSIGN_ENVELOPE_STATUS_MAPPING,
@@ -31,6 +35,16 @@ from .constants import (
 # Configure logger
 logger = getLogger('docusign')
 
+# Scope of the JWT user tokens requested for the service account
+DOCUSIGN_TOKEN_SCOPE = 'signature'
+
+# Lifetime requested for JWT user tokens, in seconds
+DOCUSIGN_TOKEN_EXPIRES_IN = 3600
+
+# Process-wide API clients keyed by host, so every service instance shares one connection pool
+_api_clients = {}
+_api_clients_lock = threading.Lock()
+
 
 class DocuSignError(Exception):
     """
@@ -62,6 +76,72 @@ class DocuSignError(Exception):
         return self.message
 
 
+def derive_document_status(current_status, signature_statuses):
+    """
+    Determines a sent document's status from the statuses of its signature requests.
+    
+    Args:
+        current_status (str): The document's current status
+        signature_statuses (list): Status of each of the document's signature requests
+        
+    Returns:
+        str: The document's new status; unchanged unless the document has been sent
+    """
+    status = current_status
+    if status == 'sent' and signature_statuses:
+        # Check if any signatures are completed
+        if all(sig_status == SIGNATURE_STATUS['COMPLETED'] for sig_status in signature_statuses):
+            status = 'completed'
+        elif any(sig_status == SIGNATURE_STATUS['COMPLETED'] for sig_status in signature_statuses):
+            status = 'partially_signed'
+        
+        # Check if any signatures are declined
+        if any(sig_status == SIGNATURE_STATUS['DECLINED'] for sig_status in signature_statuses):
+            status = 'declined'
+        
+        # Check if envelope is expired
+        if any(sig_status == SIGNATURE_STATUS['EXPIRED'] for sig_status in signature_statuses):
+            status = 'expired'
+    return status
+
+
+def get_api_client(host):
+    """
+    Returns the process-wide DocuSign API client for a host.
+    
+    The client holds the HTTP connection pool, so reusing it keeps connections to
+    DocuSign open between calls instead of opening new ones for every service instance.
+    
+    Args:
+        host (str): API or OAuth host the client talks to
+        
+    Returns:
+        docusign_esign.ApiClient: The shared client
+    """
+    with _api_clients_lock:
+        api_client = _api_clients.get(host)
+        if api_client is None:
+            api_client = docusign_esign.ApiClient()
+            api_client.host = host
+            _api_clients[host] = api_client
+        return api_client
+
+
+@functools.lru_cache(maxsize=None)
+def _read_private_key(private_key_path):
+    """
+    Reads the JWT signing key once per process.
+    
+    Args:
+        private_key_path (str): Path of the RSA private key file
+        
+    Returns:
+        str: The private key
+    """
+    with open(private_key_path, "r") as private_key_file:
+        return private_key_file.read()
+
+
 class DocuSignService:
     """
     Service class that provides DocuSign e-signature functionality.
@@ -85,9 +165,8 @@ class DocuSignService:
             self.user_id = settings.DOCUSIGN_USER_ID
             self.account_id = settings.DOCUSIGN_ACCOUNT_ID
             
-            # Initialize API client with default values
-            self.api_client = docusign_esign.ApiClient()
-            self.api_client.host = self.base_url
+            # Use the process-wide API client for the configured host
+            self.api_client = get_api_client(self.base_url)
             
             # Set up envelopes API
             self.envelopes_api = None
@@ -110,48 +189,26 @@ class DocuSignService:
         """
         Authenticates with DocuSign API using JWT grant.
         
+        Access tokens are shared between workers through the token cache, so a new JWT
+        grant is only requested when the shared token is about to expire, and then by a
+        single worker.
+        
         Returns:
             bool: True if authentication was successful, False otherwise
         """
         try:
-            # Check if current token is still valid
-            if self.access_token and self.token_expiration and self.token_expiration > datetime.datetime.now():
-                logger.debug("Using existing DocuSign access token")
-                return True
-            
-            logger.info("Authenticating with DocuSign API using JWT grant")
-            
-            # Read private key
-            with open(self.private_key_path, "r") as private_key_file:
-                private_key = private_key_file.read()
-            
-            # Set up API client for authentication
-            self.api_client = docusign_esign.ApiClient()
-            self.api_client.host = self.oauth_host
-            
-            # Request access token using JWT grant
-            response = self.api_client.request_jwt_user_token(
-                client_id=self.client_id,
-                user_id=self.user_id,
-                oauth_host_name=self.oauth_host,
-                private_key_bytes=private_key,
-                expires_in=3600  # 1 hour
+            access_token, expires_at = token_cache.get_token(
+                self._get_token_client(), DOCUSIGN_TOKEN_SCOPE, self._request_access_token
             )
             
-            # Extract and store access token and expiration
-            self.access_token = response.access_token
-            expires_in = response.expires_in
-            self.token_expiration = datetime.datetime.now() + datetime.timedelta(seconds=expires_in)
-            
-            # Configure API client with token
-            self.api_client = docusign_esign.ApiClient()
-            self.api_client.host = self.base_url
-            self.api_client.set_default_header("Authorization", f"Bearer {self.access_token}")
+            # Configure the shared API client when the token changed
+            if access_token != self.access_token or self.envelopes_api is None:
+                self.access_token = access_token
+                self.token_expiration = datetime.datetime.fromtimestamp(expires_at)
+                self.api_client = get_api_client(self.base_url)
+                self.api_client.set_default_header("Authorization", f"Bearer {self.access_token}")
+                self.envelopes_api = docusign_esign.EnvelopesApi(self.api_client)
             
-            # Initialize envelopes API
-            self.envelopes_api = docusign_esign.EnvelopesApi(self.api_client)
-            
-            logger.info("Successfully authenticated with DocuSign API")
             return True
         except docusign_esign.rest.ApiException as e:
             error_message = f"DocuSign API authentication error: {str(e)}"
@@ -162,6 +219,35 @@ class DocuSignService:
             logger.error(error_message, exc_info=True)
             raise DocuSignError(error_message, e)
     
+    def _get_token_client(self):
+        """
+        Identifies this service's credentials in the token cache.
+        
+        Returns:
+            str: Client identifier for the token cache
+        """
+        return f"docusign:{self.oauth_host}:{self.client_id}:{self.user_id}"
+    
+    def _request_access_token(self):
+        """
+        Requests a new access token using JWT grant.
+        
+        Returns:
+            tuple: (access_token, expires_in seconds)
+        """
+        logger.info("Authenticating with DocuSign API using JWT grant")
+        
+        response = get_api_client(self.oauth_host).request_jwt_user_token(
+            client_id=self.client_id,
+            user_id=self.user_id,
+            oauth_host_name=self.oauth_host,
+            private_key_bytes=_read_private_key(self.private_key_path),
+            expires_in=DOCUSIGN_TOKEN_EXPIRES_IN
+        )
+        
+        logger.info("Successfully authenticated with DocuSign API")
+        return response.access_token, int(response.expires_in)
+    
     def create_signature_request(self, document, signers, email_subject, email_body):
         """
         Creates a signature request for a document.
@@ -264,7 +350,9 @@ class DocuSignService:
                     signer_type=signer['signer_type'],
                     status=SIGNATURE_STATUS['SENT'],
                     requested_at=datetime.datetime.now(),
-                    external_reference=f"{envelope_id}:{i}"
+                    external_reference=f"{envelope_id}:{i}",
+                    envelope_id=envelope_id,
+                    recipient_id=str(i)
                 )
             
             # Update document status
@@ -437,7 +525,9 @@ class DocuSignService:
                             signer_type=signer['signer_type'],
                             status=SIGNATURE_STATUS['SENT'],
                             requested_at=datetime.datetime.now(),
-                            external_reference=f"{envelope_id}:{i}"
+                            external_reference=f"{envelope_id}:{i}",
+                            envelope_id=envelope_id,
+                            recipient_id=str(i)
                         )
             
             # Update documents status
@@ -595,12 +685,49 @@ class DocuSignService:
             logger.error(error_message, exc_info=True)
             raise DocuSignError(error_message, e)
     
-    def get_signature_status(self, document):
+    def _group_by_envelope(self, signature_requests):
+        """
+        Groups signature requests by the DocuSign envelope they were sent in.
+        
+        Args:
+            signature_requests (iterable): SignatureRequest objects
+            
+        Returns:
+            dict: Maps envelope ID to a list of (signature_request, recipient_id) tuples
+        """
+        envelope_requests = {}
+        for request in signature_requests:
+            envelope_id, recipient_id = request.get_envelope_reference()
+            if envelope_id:
+                envelope_requests.setdefault(envelope_id, []).append((request, recipient_id))
+        return envelope_requests
+    
+    def _get_envelope_status(self, envelope_id, envelope_statuses=None):
+        """
+        Gets the status of an envelope, reusing a status already fetched by the caller.
+        
+        Args:
+            envelope_id (str): The envelope ID to check
+            envelope_statuses (dict, optional): Envelope statuses already fetched, keyed by
+                envelope ID; newly fetched statuses are added to it
+            
+        Returns:
+            dict: Dictionary with envelope status information
+        """
+        if envelope_statuses is None:
+            return self.get_envelope_status(envelope_id)
+        if envelope_id not in envelope_statuses:
+            envelope_statuses[envelope_id] = self.get_envelope_status(envelope_id)
+        return envelope_statuses[envelope_id]
+    
+    def get_signature_status(self, document, envelope_statuses=None):
         """
         Gets the status of all signatures for a document.
         
         Args:
             document (Document): The document to check
+            envelope_statuses (dict, optional): Envelope statuses already fetched, keyed by
+                envelope ID, so documents sharing an envelope fetch it only once
             
         Returns:
             dict: Dictionary with signature status information
@@ -618,19 +745,14 @@ class DocuSignService:
                 }
             
             # Group signature requests by envelope ID
-            envelope_requests = {}
-            for request in signature_requests:
-                if request.external_reference:
-                    envelope_id, recipient_id = request.external_reference.split(':')
-                    if envelope_id not in envelope_requests:
-                        envelope_requests[envelope_id] = []
-                    envelope_requests[envelope_id].append((request, recipient_id))
+            envelope_requests = self._group_by_envelope(signature_requests)
             
             # Get status for each envelope
+            shared_statuses = envelope_statuses
             envelope_statuses = {}
             for envelope_id, requests in envelope_requests.items():
                 try:
-                    envelope_statuses[envelope_id] = self.get_envelope_status(envelope_id)
+                    envelope_statuses[envelope_id] = self._get_envelope_status(envelope_id, shared_statuses)
                 except DocuSignError:
                     logger.warning(f"Could not get status for envelope {envelope_id}")
                     continue
@@ -672,21 +794,7 @@ class DocuSignService:
                     signatures.append(signature)
             
             # Determine overall document status based on signatures
-            status = document.status
-            if status == 'sent' and signatures:
-                # Check if any signatures are completed
-                if all(sig['status'] == SIGNATURE_STATUS['COMPLETED'] for sig in signatures):
-                    status = 'completed'
-                elif any(sig['status'] == SIGNATURE_STATUS['COMPLETED'] for sig in signatures):
-                    status = 'partially_signed'
-                        
-                # Check if any signatures are declined
-                if any(sig['status'] == SIGNATURE_STATUS['DECLINED'] for sig in signatures):
-                    status = 'declined'
-                
-                # Check if envelope is expired
-                if any(sig['status'] == SIGNATURE_STATUS['EXPIRED'] for sig in signatures):
-                    status = 'expired'
+            status = derive_document_status(document.status, [sig['status'] for sig in signatures])
             
             result = {
                 'document_id': document.id,
@@ -702,16 +810,21 @@ class DocuSignService:
             raise DocuSignError(error_message, e)
     
     @transaction.atomic
-    def update_signature_status(self, document):
+    def update_signature_status(self, document, envelope_statuses=None):
         """
         Updates the status of signature requests based on DocuSign status.
         
         Args:
             document (Document): The document to update
+            envelope_statuses (dict, optional): Envelope statuses already fetched, keyed by
+                envelope ID, so documents sharing an envelope fetch it only once
             
         Returns:
             bool: True if update was successful, False otherwise
         """
+        if envelope_statuses is None:
+            envelope_statuses = {}
+        
         try:
             # Get all signature requests for this document
             signature_requests = SignatureRequest.objects.filter(document=document)
@@ -721,18 +834,12 @@ class DocuSignService:
                 return False
             
             # Group signature requests by envelope ID
-            envelope_requests = {}
-            for request in signature_requests:
-                if request.external_reference:
-                    envelope_id, recipient_id = request.external_reference.split(':')
-                    if envelope_id not in envelope_requests:
-                        envelope_requests[envelope_id] = []
-                    envelope_requests[envelope_id].append((request, recipient_id))
+            envelope_requests = self._group_by_envelope(signature_requests)
             
             # Get status for each envelope
             for envelope_id, requests in envelope_requests.items():
                 try:
-                    envelope_status = self.get_envelope_status(envelope_id)
+                    envelope_status = self._get_envelope_status(envelope_id, envelope_statuses)
                     
                     # Update each signature request
                     for request, recipient_id in requests:
@@ -764,7 +871,7 @@ class DocuSignService:
                     continue
             
             # Update document status based on signature statuses
-            status_result = self.get_signature_status(document)
+            status_result = self.get_signature_status(document, envelope_statuses)
             if document.status != status_result['status']:
                 document.status = status_result['status']
                 document.save()
@@ -776,10 +883,37 @@ class DocuSignService:
             logger.error(error_message, exc_info=True)
             raise DocuSignError(error_message, e)
     
+    def get_webhook_event_id(self, webhook_data):
+        """
+        Identifies a webhook delivery so that retries of it can be recognized.
+        
+        DocuSign Connect resends a failed delivery with the same payload, so the eventId
+        is used when present and otherwise a hash of the event, envelope and generation time.
+        
+        Args:
+            webhook_data (dict): The webhook data from DocuSign
+            
+        Returns:
+            str: Event ID, or None if the delivery cannot be identified
+        """
+        if webhook_data.get('eventId'):
+            return str(webhook_data['eventId'])
+        
+        generated = webhook_data.get('generatedDateTime')
+        if not generated:
+            return None
+        
+        envelope_id = webhook_data.get('data', {}).get('envelopeId')
+        key = f"{webhook_data.get('event')}:{envelope_id}:{generated}"
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+    
     def process_webhook_event(self, webhook_data):
         """
         Processes webhook notifications from DocuSign.
         
+        Each delivery is recorded by event ID in the same transaction as its updates, so a
+        retried delivery of an event that was already processed is skipped.
+        
         Args:
             webhook_data (dict): The webhook data from DocuSign
             
@@ -800,84 +934,29 @@ class DocuSignService:
                 raise ValueError("Invalid webhook data: missing 'envelopeId'")
             
             envelope_id = data['envelopeId']
-            logger.info(f"Processing DocuSign webhook event {event} for envelope {envelope_id}")
-            
-            # Get envelope status
-            envelope_status = self.get_envelope_status(envelope_id)
-            
-            # Find signature requests associated with this envelope
-            signature_requests = []
-            for request in SignatureRequest.objects.all():
-                if request.external_reference and request.external_reference.startswith(f"{envelope_id}:"):
-                    signature_requests.append(request)
-            
-            if not signature_requests:
-                logger.warning(f"No signature requests found for envelope {envelope_id}")
-                return {
-                    'status': 'warning',
-                    'message': f"No signature requests found for envelope {envelope_id}",
-                    'envelope_id': envelope_id,
-                    'event': event
-                }
-            
-            # Update signature requests based on envelope status
-            updated_requests = []
-            for request in signature_requests:
-                envelope_id, recipient_id = request.external_reference.split(':')
-                
-                # Find recipient status in envelope
-                recipient_status = None
-                for recipient in envelope_status['recipients']:
-                    if recipient['recipient_id'] == recipient_id:
-                        recipient_status = recipient
-                        break
-                
-                if not recipient_status:
-                    logger.warning(f"Recipient {recipient_id} not found in envelope {envelope_id}")
-                    continue
+            event_id = self.get_webhook_event_id(webhook_data)
+            logger.info(f"Processing DocuSign webhook event {event} ({event_id}) for envelope {envelope_id}")
+            
+            with transaction.atomic():
+                if event_id:
+                    try:
+                        # A concurrent delivery of the same event waits here until the first one commits
+                        with transaction.atomic():
+                            DocuSignWebhookEvent.objects.create(
+                                event_id=event_id,
+                                event=event,
+                                envelope_id=envelope_id
+                            )
+                    except IntegrityError:
+                        logger.info(f"Skipping duplicate DocuSign webhook event {event_id} for envelope {envelope_id}")
+                        return {
+                            'status': 'duplicate',
+                            'message': f"Webhook event {event_id} was already processed",
+                            'envelope_id': envelope_id,
+                            'event': event
+                        }
                 
-                # Update signature request status
-                new_status = recipient_status['status']
-                if request.status != new_status:
-                    old_status = request.status
-                    request.status = new_status
-                    
-                    # Set completed_at if status is COMPLETED
-                    if new_status == SIGNATURE_STATUS['COMPLETED'] and not request.completed_at:
-                        request.completed_at = datetime.datetime.now()
-                    
-                    request.save()
-                    updated_requests.append({
-                        'request_id': request.id,
-                        'old_status': old_status,
-                        'new_status': new_status
-                    })
-                    logger.info(f"Updated signature request {request.id} status from {old_status} to {new_status}")
-            
-            # Update document statuses based on signature statuses
-            updated_documents = []
-            documents = set(request.document for request in signature_requests)
-            for document in documents:
-                status_result = self.get_signature_status(document)
-                if document.status != status_result['status']:
-                    old_status = document.status
-                    document.status = status_result['status']
-                    document.save()
-                    updated_documents.append({
-                        'document_id': document.id,
-                        'old_status': old_status,
-                        'new_status': document.status
-                    })
-                    logger.info(f"Updated document {document.id} status from {old_status} to {document.status}")
-            
-            return {
-                'status': 'success',
-                'message': f"Processed webhook event {event} for envelope {envelope_id}",
-                'envelope_id': envelope_id,
-                'event': event,
-                'updated_requests': updated_requests,
-                'updated_documents': updated_documents
-            }
+                return self._apply_webhook_event(event, envelope_id)
         except docusign_esign.rest.ApiException as e:
             error_message = f"DocuSign API error processing webhook event: {str(e)}"
             logger.error(error_message)
@@ -887,6 +966,92 @@ class DocuSignService:
             logger.error(error_message, exc_info=True)
             raise DocuSignError(error_message, e)
     
+    def _apply_webhook_event(self, event, envelope_id):
+        """
+        Updates the signature requests and documents of an envelope from its DocuSign status.
+        
+        Args:
+            event (str): The webhook event name
+            envelope_id (str): The envelope the event is for
+            
+        Returns:
+            dict: Dictionary with processing results
+        """
+        # Find signature requests associated with this envelope through the envelope index
+        signature_requests = list(SignatureRequest.objects.for_envelope(envelope_id))
+        
+        if not signature_requests:
+            logger.warning(f"No signature requests found for envelope {envelope_id}")
+            return {
+                'status': 'warning',
+                'message': f"No signature requests found for envelope {envelope_id}",
+                'envelope_id': envelope_id,
+                'event': event
+            }
+        
+        # Get envelope status
+        envelope_statuses = {}
+        envelope_status = self._get_envelope_status(envelope_id, envelope_statuses)
+        
+        # Update signature requests based on envelope status
+        updated_requests = []
+        for request in signature_requests:
+            recipient_id = request.recipient_id
+            
+            # Find recipient status in envelope
+            recipient_status = None
+            for recipient in envelope_status['recipients']:
+                if recipient['recipient_id'] == recipient_id:
+                    recipient_status = recipient
+                    break
+            
+            if not recipient_status:
+                logger.warning(f"Recipient {recipient_id} not found in envelope {envelope_id}")
+                continue
+            
+            # Update signature request status
+            new_status = recipient_status['status']
+            if request.status != new_status:
+                old_status = request.status
+                request.status = new_status
+                
+                # Set completed_at if status is COMPLETED
+                if new_status == SIGNATURE_STATUS['COMPLETED'] and not request.completed_at:
+                    request.completed_at = datetime.datetime.now()
+                
+                request.save()
+                updated_requests.append({
+                    'request_id': request.id,
+                    'old_status': old_status,
+                    'new_status': new_status
+                })
+                logger.info(f"Updated signature request {request.id} status from {old_status} to {new_status}")
+        
+        # Update document statuses based on signature statuses
+        updated_documents = []
+        documents = set(request.document for request in signature_requests)
+        for document in documents:
+            status_result = self.get_signature_status(document, envelope_statuses)
+            if document.status != status_result['status']:
+                old_status = document.status
+                document.status = status_result['status']
+                document.save()
+                updated_documents.append({
+                    'document_id': document.id,
+                    'old_status': old_status,
+                    'new_status': document.status
+                })
+                logger.info(f"Updated document {document.id} status from {old_status} to {document.status}")
+        
+        return {
+            'status': 'success',
+            'message': f"Processed webhook event {event} for envelope {envelope_id}",
+            'envelope_id': envelope_id,
+            'event': event,
+            'updated_requests': updated_requests,
+            'updated_documents': updated_documents
+        }
+    
     def download_signed_documents(self, envelope_id):
         """
         Downloads signed documents from a DocuSign envelope.
@@ -1025,16 +1190,14 @@ class DocuSignService:
             logger.info(f"Voided envelope {envelope_id} with reason: {void_reason}")
             
             # Update signature requests associated with this envelope
-            for request in SignatureRequest.objects.all():
-                if request.external_reference and request.external_reference.startswith(f"{envelope_id}:"):
-                    request.status = SIGNATURE_STATUS['VOIDED']
-                    request.save()
-                    logger.info(f"Updated signature request {request.id} status to VOIDED")
+            signature_requests = list(SignatureRequest.objects.for_envelope(envelope_id))
+            for request in signature_requests:
+                request.status = SIGNATURE_STATUS['VOIDED']
+                request.save()
+                logger.info(f"Updated signature request {request.id} status to VOIDED")
             
             # Update document statuses
-            documents = set(request.document for request in SignatureRequest.objects.filter(
-                external_reference__startswith=f"{envelope_id}:"
-            ))
+            documents = set(request.document for request in signature_requests)
             for document in documents:
                 document.status = 'voided'
                 document.save()
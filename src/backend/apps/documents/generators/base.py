@@ -8,13 +8,23 @@ types to customize certain steps in the process.
 
 import os
 import datetime
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import jinja2  # version 3.1+
-import weasyprint  # version 57.0+
+from django.db import transaction  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
 
+from core.signals import model_change_signal
 from utils.logging import getLogger
-from ..models import Document, DocumentTemplate
-from ..storage import document_storage
-from ..constants import DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_TEMPLATE_PATHS
+from apps.applications.models import LoanApplication
+from ..models import Document, DocumentContent, DocumentTemplate, document_storage
+from ..rendering import pdf_rendering_service
+from ..template_cache import get_compiled_template, get_template_environment
+from ..constants import (
+    DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_TEMPLATE_PATHS, DOCUMENT_EXPIRATION_DAYS,
+    DOCUMENT_UPLOAD_CONCURRENCY, DOCUMENT_CONTENT_HASH_VERSION
+)
 
 # Configure logger
 logger = getLogger('document_generators')
@@ -53,6 +63,60 @@ class DocumentGenerationError(Exception):
         return self.message
 
 
+def prefetch_document_context(applications):
+    """
+    Reloads loan applications with everything document contexts read, in a fixed number of queries.
+    
+    Borrowers, co-borrowers, their profiles, the school, the program, the loan details and
+    the underwriting decision are joined in; employment records and stipulations are
+    prefetched for the whole batch.
+    
+    Args:
+        applications (iterable): LoanApplication objects or IDs
+        
+    Returns:
+        list: The applications in the order given; IDs that do not exist are skipped
+    """
+    application_ids = [getattr(application, 'id', application) for application in applications]
+    
+    related = [
+        'borrower__borrowerprofile', 'co_borrower__borrowerprofile',
+        'school', 'program', 'loan_details',
+    ]
+    prefetch = [
+        'borrower__borrowerprofile__employment_info',
+        'co_borrower__borrowerprofile__employment_info',
+    ]
+    # The underwriting app adds the decision and stipulation relations when installed
+    if hasattr(LoanApplication, 'underwriting_decision'):
+        related.append('underwriting_decision')
+    if hasattr(LoanApplication, 'stipulations'):
+        prefetch.append('stipulations')
+    
+    loaded = LoanApplication.objects.filter(id__in=application_ids).select_related(*related).prefetch_related(*prefetch)
+    by_id = {str(application.id): application for application in loaded}
+    return [by_id[str(application_id)] for application_id in application_ids if str(application_id) in by_id]
+
+
+def find_stored_content(content_hashes):
+    """
+    Looks up documents that have already been rendered and stored with the given content hashes.
+    
+    A failing lookup only costs a re-render, so errors are logged and treated as misses.
+    
+    Args:
+        content_hashes (iterable): Content hashes from BaseDocumentGenerator.get_content_hash
+        
+    Returns:
+        dict: Maps each stored content hash to its DocumentContent
+    """
+    try:
+        return DocumentContent.objects.get_stored(content_hashes)
+    except Exception as e:
+        logger.warning(f"Error looking up stored document content: {e}")
+        return {}
+
+
 class BaseDocumentGenerator:
     """
     Abstract base class for document generators that implements the template method pattern.
@@ -83,6 +147,7 @@ class BaseDocumentGenerator:
             document_type (str): Type of document to generate
         """
         self._document_type = document_type
+        self._shared_context = None
         logger.info(f"Initialized document generator for {document_type}")
     
     def generate(self, application, generated_by, additional_context=None):
@@ -107,23 +172,21 @@ class BaseDocumentGenerator:
         logger.info(f"Starting document generation for application {application.id}, type: {self._document_type}")
         
         try:
-            # Step 1: Get the template content
-            template_content = self._get_template()
-            
-            # Step 2: Prepare the context data
-            context = self._prepare_context(application, additional_context or {})
+            # Steps 1-3: Render the template to HTML and name the file
+            html_content, file_name = self.prepare(application, additional_context)
             
-            # Step 3: Render the template
-            html_content = self._render_template(template_content, context)
+            # Identical HTML has already been converted and stored; point at that object
+            content_hash = self.get_content_hash(html_content)
+            stored_content = find_stored_content([content_hash]).get(content_hash)
+            if stored_content is not None:
+                logger.info(f"Reusing stored {self._document_type} document {content_hash} for application {application.id}")
+                return self.store_existing(stored_content, file_name, application, generated_by)
             
             # Step 4: Convert HTML to PDF
             pdf_content = self._html_to_pdf(html_content)
             
-            # Step 5: Generate a file name
-            file_name = self._generate_file_name(application)
-            
-            # Step 6: Store the document
-            document = self._store_document(pdf_content, file_name, application, generated_by)
+            # Step 5: Store the document
+            document = self.store(pdf_content, file_name, application, generated_by, content_hash)
             
             logger.info(f"Successfully generated {self._document_type} document for application {application.id}")
             return document
@@ -137,12 +200,105 @@ class BaseDocumentGenerator:
             logger.error(error_message, exc_info=True)
             raise DocumentGenerationError(error_message, e)
     
+    def prepare(self, application, additional_context=None):
+        """
+        Runs the generation steps that come before PDF conversion.
+        
+        Callers that convert many documents at once use this with the PDF rendering
+        service's render_batch and then store each result with store().
+        
+        Args:
+            application (LoanApplication): The loan application to generate the document for
+            additional_context (dict, optional): Additional context data for template rendering
+        
+        Returns:
+            tuple: (html_content, file_name) tuple
+            
+        Raises:
+            DocumentGenerationError: If the template cannot be loaded or rendered
+        """
+        # Step 1: Get the compiled template
+        template = self._get_template()
+        
+        # Step 2: Prepare the context data
+        context = self._prepare_context(application, additional_context or {})
+        
+        # Step 3: Render the template
+        html_content = self._render_template(template, context)
+        
+        return html_content, self._generate_file_name(application)
+    
+    def store(self, pdf_content, file_name, application, generated_by, content_hash=None):
+        """
+        Stores a converted PDF as the document for an application.
+        
+        Args:
+            pdf_content (bytes): PDF content to store
+            file_name (str): File name from prepare()
+            application (LoanApplication): The loan application the document is for
+            generated_by (User): The user who generated the document
+            content_hash (str, optional): Content hash from get_content_hash to store the PDF under
+        
+        Returns:
+            Document: Created Document object
+            
+        Raises:
+            DocumentGenerationError: If document storage fails
+        """
+        return self._store_document(pdf_content, file_name, application, generated_by, content_hash)
+    
+    def store_existing(self, stored_content, file_name, application, generated_by):
+        """
+        Creates the document for an application from content that is already stored.
+        
+        Args:
+            stored_content (DocumentContent): Stored content from find_stored_content
+            file_name (str): File name from prepare()
+            application (LoanApplication): The loan application the document is for
+            generated_by (User): The user who generated the document
+        
+        Returns:
+            Document: Created Document object
+            
+        Raises:
+            DocumentGenerationError: If the document record cannot be saved
+        """
+        try:
+            return self._save_document(
+                stored_content.get_storage_result(), file_name, application, generated_by,
+                stored_content.content_hash
+            )
+        except Exception as e:
+            error_message = f"Failed to store document for {self._document_type}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentGenerationError(error_message, e)
+    
+    def get_content_hash(self, html_content):
+        """
+        Computes the content hash that identifies a rendered document.
+        
+        The rendered HTML already contains every context value the template uses, so two
+        documents of the same type with the same HTML produce the same PDF.
+        
+        Args:
+            html_content (str): Rendered HTML content
+            
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(f"{DOCUMENT_CONTENT_HASH_VERSION}:{self._document_type}:".encode('utf-8'))
+        digest.update(html_content.encode('utf-8'))
+        return digest.hexdigest()
+    
     def _get_template(self):
         """
-        Retrieves the template content for the document type.
+        Retrieves the compiled template for the document type.
+        
+        The template is compiled once per S3 version and shared by every generator in
+        the process.
         
         Returns:
-            str: Template content as HTML string
+            jinja2.Template: Compiled template
             
         Raises:
             DocumentGenerationError: If template retrieval fails
@@ -154,18 +310,17 @@ class BaseDocumentGenerator:
                 
             template_path = DOCUMENT_TEMPLATE_PATHS[self._document_type]
             
-            # Retrieve the template content from storage
-            template_content, _, _ = document_storage.retrieve_template(template_path)
-            
-            if not template_content:
-                raise ValueError(f"Template content is empty for {self._document_type}")
-                
-            return template_content.decode('utf-8')
+            # Get the compiled template, downloading it only when its S3 version changed
+            return get_compiled_template(template_path, document_storage)
             
         except ValueError as e:
             error_message = f"Failed to get template for {self._document_type}: {str(e)}"
             logger.error(error_message)
             raise DocumentGenerationError(error_message, e)
+        except jinja2.exceptions.TemplateError as e:
+            error_message = f"Failed to compile template for {self._document_type}: {str(e)}"
+            logger.error(error_message)
+            raise DocumentGenerationError(error_message, e)
         except Exception as e:
             error_message = f"Unexpected error retrieving template for {self._document_type}: {str(e)}"
             logger.error(error_message, exc_info=True)
@@ -196,110 +351,21 @@ class BaseDocumentGenerator:
         borrower = application.borrower
         borrower_profile = borrower.get_profile()
         if borrower_profile:
-            context['borrower'] = {
-                'id': str(borrower.id),
-                'first_name': borrower.first_name,
-                'last_name': borrower.last_name,
-                'full_name': borrower.get_full_name(),
-                'email': borrower.email,
-                'phone': borrower.phone,
-                'ssn': borrower_profile.get_ssn() if hasattr(borrower_profile, 'get_ssn') else None,
-                'dob': borrower_profile.dob.strftime('%B %d, %Y') if hasattr(borrower_profile, 'dob') else None,
-                'address': {
-                    'line1': borrower_profile.address_line1 if hasattr(borrower_profile, 'address_line1') else None,
-                    'line2': borrower_profile.address_line2 if hasattr(borrower_profile, 'address_line2') else None,
-                    'city': borrower_profile.city if hasattr(borrower_profile, 'city') else None,
-                    'state': borrower_profile.state if hasattr(borrower_profile, 'state') else None,
-                    'zip': borrower_profile.zip_code if hasattr(borrower_profile, 'zip_code') else None,
-                    'full': borrower_profile.get_full_address() if hasattr(borrower_profile, 'get_full_address') else None,
-                },
-            }
-            
-            # Add employment information if available
-            if hasattr(borrower_profile, 'employment_info') and borrower_profile.employment_info.exists():
-                employment = borrower_profile.employment_info.first()
-                context['borrower']['employment'] = {
-                    'employer': employment.employer_name,
-                    'occupation': employment.occupation,
-                    'phone': employment.employer_phone,
-                    'annual_income': employment.annual_income,
-                    'monthly_income': employment.get_monthly_income() if hasattr(employment, 'get_monthly_income') else None,
-                }
+            context['borrower'] = self._get_person_context(borrower, borrower_profile)
         
         # Add co-borrower information if available
         if application.co_borrower:
             co_borrower = application.co_borrower
             co_borrower_profile = co_borrower.get_profile()
             if co_borrower_profile:
-                context['co_borrower'] = {
-                    'id': str(co_borrower.id),
-                    'first_name': co_borrower.first_name,
-                    'last_name': co_borrower.last_name,
-                    'full_name': co_borrower.get_full_name(),
-                    'email': co_borrower.email,
-                    'phone': co_borrower.phone,
-                    'ssn': co_borrower_profile.get_ssn() if hasattr(co_borrower_profile, 'get_ssn') else None,
-                    'dob': co_borrower_profile.dob.strftime('%B %d, %Y') if hasattr(co_borrower_profile, 'dob') else None,
-                    'relationship': application.relationship_type,
-                    'address': {
-                        'line1': co_borrower_profile.address_line1 if hasattr(co_borrower_profile, 'address_line1') else None,
-                        'line2': co_borrower_profile.address_line2 if hasattr(co_borrower_profile, 'address_line2') else None,
-                        'city': co_borrower_profile.city if hasattr(co_borrower_profile, 'city') else None,
-                        'state': co_borrower_profile.state if hasattr(co_borrower_profile, 'state') else None,
-                        'zip': co_borrower_profile.zip_code if hasattr(co_borrower_profile, 'zip_code') else None,
-                        'full': co_borrower_profile.get_full_address() if hasattr(co_borrower_profile, 'get_full_address') else None,
-                    },
-                }
-                
-                # Add co-borrower employment information if available
-                if hasattr(co_borrower_profile, 'employment_info') and co_borrower_profile.employment_info.exists():
-                    employment = co_borrower_profile.employment_info.first()
-                    context['co_borrower']['employment'] = {
-                        'employer': employment.employer_name,
-                        'occupation': employment.occupation,
-                        'phone': employment.employer_phone,
-                        'annual_income': employment.annual_income,
-                        'monthly_income': employment.get_monthly_income() if hasattr(employment, 'get_monthly_income') else None,
-                    }
-        
-        # Add school information
-        school = application.school
-        context['school'] = {
-            'id': str(school.id),
-            'name': school.name,
-            'legal_name': school.legal_name,
-            'address': {
-                'line1': school.address_line1,
-                'line2': school.address_line2,
-                'city': school.city,
-                'state': school.state,
-                'zip': school.zip_code,
-                'full': school.get_full_address() if hasattr(school, 'get_full_address') else None,
-            },
-            'phone': school.phone,
-            'website': school.website,
-        }
+                context['co_borrower'] = self._get_person_context(co_borrower, co_borrower_profile)
+                context['co_borrower']['relationship'] = application.relationship_type
         
-        # Add primary contact information if available
-        primary_contact = school.get_primary_contact() if hasattr(school, 'get_primary_contact') else None
-        if primary_contact:
-            context['school']['contact'] = {
-                'name': primary_contact.get_full_name() if hasattr(primary_contact, 'get_full_name') else None,
-                'title': primary_contact.title if hasattr(primary_contact, 'title') else None,
-                'email': primary_contact.email if hasattr(primary_contact, 'email') else None,
-                'phone': primary_contact.phone if hasattr(primary_contact, 'phone') else None,
-            }
-        
-        # Add program information
+        # Add school and program information, shared by every application in a bulk run
+        school = application.school
+        context['school'] = self._get_shared_context(('school', school.id), lambda: self._get_school_context(school))
         program = application.program
-        context['program'] = {
-            'id': str(program.id),
-            'name': program.name,
-            'description': program.description,
-            'duration_hours': program.duration_hours,
-            'duration_weeks': program.duration_weeks,
-            'tuition': program.get_current_tuition() if hasattr(program, 'get_current_tuition') else None,
-        }
+        context['program'] = self._get_shared_context(('program', program.id), lambda: self._get_program_context(program))
         
         # Add loan details
         loan_details = application.get_loan_details()
@@ -328,33 +394,148 @@ class BaseDocumentGenerator:
             }
             
             # Add stipulations if available
-            try:
-                from apps.underwriting.models import Stipulation
-                stipulations = Stipulation.objects.filter(application=application)
-                if stipulations.exists():
-                    context['stipulations'] = [
-                        {
-                            'type': stipulation.stipulation_type,
-                            'description': stipulation.description,
-                            'required_by': stipulation.required_by_date.strftime('%B %d, %Y') if stipulation.required_by_date else None,
-                            'status': stipulation.status,
-                        } for stipulation in stipulations
-                    ]
-            except ImportError:
-                # Underwriting app may not be available yet
-                pass
+            stipulations = list(underwriting_decision.get_stipulations())
+            if stipulations:
+                context['stipulations'] = [
+                    {
+                        'type': stipulation.stipulation_type,
+                        'description': stipulation.description,
+                        'required_by': stipulation.required_by_date.strftime('%B %d, %Y') if stipulation.required_by_date else None,
+                        'status': stipulation.status,
+                    } for stipulation in stipulations
+                ]
         
         # Add any additional context
         context.update(additional_context)
         
         return context
     
-    def _render_template(self, template_content, context):
+    def _get_person_context(self, user, profile):
+        """
+        Builds the context for a borrower or co-borrower.
+        
+        Args:
+            user (User): The borrower or co-borrower
+            profile (BorrowerProfile): The user's borrower profile
+            
+        Returns:
+            dict: Context dictionary for the person
+        """
+        person = {
+            'id': str(user.id),
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'full_name': user.get_full_name(),
+            'email': user.email,
+            'phone': user.phone,
+            'ssn': profile.get_ssn() if hasattr(profile, 'get_ssn') else None,
+            'dob': profile.dob.strftime('%B %d, %Y') if hasattr(profile, 'dob') else None,
+            'address': {
+                'line1': profile.address_line1 if hasattr(profile, 'address_line1') else None,
+                'line2': profile.address_line2 if hasattr(profile, 'address_line2') else None,
+                'city': profile.city if hasattr(profile, 'city') else None,
+                'state': profile.state if hasattr(profile, 'state') else None,
+                'zip': profile.zip_code if hasattr(profile, 'zip_code') else None,
+                'full': profile.get_full_address() if hasattr(profile, 'get_full_address') else None,
+            },
+        }
+        
+        # Add employment information if available; all() reuses prefetched rows
+        employment = next(iter(profile.employment_info.all()), None) if hasattr(profile, 'employment_info') else None
+        if employment:
+            person['employment'] = {
+                'employer': employment.employer_name,
+                'occupation': employment.occupation,
+                'phone': employment.employer_phone,
+                'annual_income': employment.annual_income,
+                'monthly_income': employment.get_monthly_income() if hasattr(employment, 'get_monthly_income') else None,
+            }
+        
+        return person
+    
+    def _get_school_context(self, school):
+        """
+        Builds the context for a school, including its primary contact.
+        
+        Args:
+            school (School): The school of the application
+            
+        Returns:
+            dict: Context dictionary for the school
+        """
+        school_context = {
+            'id': str(school.id),
+            'name': school.name,
+            'legal_name': school.legal_name,
+            'address': {
+                'line1': school.address_line1,
+                'line2': school.address_line2,
+                'city': school.city,
+                'state': school.state,
+                'zip': school.zip_code,
+                'full': school.get_full_address() if hasattr(school, 'get_full_address') else None,
+            },
+            'phone': school.phone,
+            'website': school.website,
+        }
+        
+        # Add primary contact information if available
+        primary_contact = school.get_primary_contact() if hasattr(school, 'get_primary_contact') else None
+        if primary_contact:
+            school_context['contact'] = {
+                'name': primary_contact.get_full_name() if hasattr(primary_contact, 'get_full_name') else None,
+                'title': primary_contact.title if hasattr(primary_contact, 'title') else None,
+                'email': primary_contact.email if hasattr(primary_contact, 'email') else None,
+                'phone': primary_contact.phone if hasattr(primary_contact, 'phone') else None,
+            }
+        
+        return school_context
+    
+    def _get_program_context(self, program):
+        """
+        Builds the context for a program, including its current tuition.
+        
+        Args:
+            program (Program): The program of the application
+            
+        Returns:
+            dict: Context dictionary for the program
+        """
+        return {
+            'id': str(program.id),
+            'name': program.name,
+            'description': program.description,
+            'duration_hours': program.duration_hours,
+            'duration_weeks': program.duration_weeks,
+            'tuition': program.get_current_tuition() if hasattr(program, 'get_current_tuition') else None,
+        }
+    
+    def _get_shared_context(self, key, build):
+        """
+        Returns context shared by every application in a bulk run, building it once.
+        
+        Outside generate_bulk the context is built on every call. Shared context is
+        reused as-is, so it must not be modified per document.
+        
+        Args:
+            key (tuple): Identifies the shared data, e.g. ('school', school_id)
+            build (callable): Builds the context on a miss
+            
+        Returns:
+            dict: The shared context
+        """
+        if self._shared_context is None:
+            return build()
+        if key not in self._shared_context:
+            self._shared_context[key] = build()
+        return self._shared_context[key]
+    
+    def _render_template(self, template, context):
         """
         Renders the template with the provided context.
         
         Args:
-            template_content (str): Template content as HTML string
+            template (jinja2.Template|str): Compiled template, or template content as HTML string
             context (dict): Context dictionary for template rendering
             
         Returns:
@@ -364,20 +545,9 @@ class BaseDocumentGenerator:
             DocumentGenerationError: If template rendering fails
         """
         try:
-            # Create a Jinja2 environment with appropriate settings
-            env = jinja2.Environment(
-                loader=jinja2.BaseLoader(),
-                autoescape=jinja2.select_autoescape(['html', 'xml']),
-                trim_blocks=True,
-                lstrip_blocks=True
-            )
-            
-            # Add custom filters if needed
-            env.filters['currency'] = lambda value: f"${value:,.2f}" if value is not None else ""
-            env.filters['percentage'] = lambda value: f"{value:.2f}%" if value is not None else ""
-            
-            # Load the template from the content string
-            template = env.from_string(template_content)
+            # Compile raw template content with the shared environment
+            if isinstance(template, str):
+                template = get_template_environment().from_string(template)
             
             # Render the template with the context
             rendered_html = template.render(**context)
@@ -407,16 +577,15 @@ class BaseDocumentGenerator:
             DocumentGenerationError: If PDF conversion fails
         """
         try:
-            # Convert HTML to PDF using WeasyPrint
-            pdf = weasyprint.HTML(string=html_content).write_pdf()
-            return pdf
+            # Convert HTML to PDF in the rendering pool, which keeps WeasyPrint and its fonts loaded
+            return pdf_rendering_service.render(html_content)
             
         except Exception as e:
             error_message = f"Failed to convert HTML to PDF for {self._document_type}: {str(e)}"
             logger.error(error_message, exc_info=True)
             raise DocumentGenerationError(error_message, e)
     
-    def _store_document(self, pdf_content, file_name, application, generated_by):
+    def _store_document(self, pdf_content, file_name, application, generated_by, content_hash=None):
         """
         Stores the generated document and creates a Document record.
         
@@ -425,6 +594,7 @@ class BaseDocumentGenerator:
             file_name (str): File name for the document
             application (LoanApplication): The loan application the document is for
             generated_by (User): The user who generated the document
+            content_hash (str, optional): Content hash to store the PDF under
             
         Returns:
             Document: Created Document object
@@ -434,36 +604,47 @@ class BaseDocumentGenerator:
         """
         try:
             # Store the PDF document in the document storage
-            storage_result = document_storage.store_document(
-                content=pdf_content,
-                document_type=self._document_type,
-                file_name=file_name,
-                content_type='application/pdf',
-                metadata={
-                    'application_id': str(application.id),
-                    'document_type': self._document_type,
-                    'generated_by': str(generated_by.id),
-                    'generated_at': datetime.datetime.now().isoformat(),
-                }
-            )
+            storage_result = self._upload_document(pdf_content, file_name, application, generated_by, content_hash)
             
-            # Get or create a document package for this application
-            from ..models import DocumentPackage
+            return self._save_document(storage_result, file_name, application, generated_by, content_hash)
             
-            # Determine the package type based on document type
-            package_type = self._get_package_type()
-            
-            # Try to find an existing package of this type for the application
-            document_package = None
-            try:
-                document_package = DocumentPackage.objects.filter(
-                    application=application,
-                    package_type=package_type,
-                    status__in=[DOCUMENT_STATUS['DRAFT'], DOCUMENT_STATUS['GENERATED']]
-                ).first()
-            except Exception as e:
-                logger.warning(f"Error finding document package: {e}")
+        except Exception as e:
+            error_message = f"Failed to store document for {self._document_type}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentGenerationError(error_message, e)
+    
+    def _save_document(self, storage_result, file_name, application, generated_by, content_hash=None):
+        """
+        Creates the Document record for a stored PDF in the application's document package.
+        
+        Args:
+            storage_result (dict): Storage details including the key and version ID
+            file_name (str): File name for the document
+            application (LoanApplication): The loan application the document is for
+            generated_by (User): The user who generated the document
+            content_hash (str, optional): Content hash the PDF is stored under
             
+        Returns:
+            Document: Created Document object
+        """
+        # Get or create a document package for this application
+        from ..models import DocumentPackage
+        
+        # Determine the package type based on document type
+        package_type = self._get_package_type()
+        
+        # Try to find an existing package of this type for the application
+        document_package = None
+        try:
+            document_package = DocumentPackage.objects.filter(
+                application=application,
+                package_type=package_type,
+                status__in=[DOCUMENT_STATUS['DRAFT'], DOCUMENT_STATUS['GENERATED']]
+            ).first()
+        except Exception as e:
+            logger.warning(f"Error finding document package: {e}")
+        
+        with transaction.atomic():
             # Create a new package if none exists
             if not document_package:
                 document_package = DocumentPackage.objects.create(
@@ -473,24 +654,277 @@ class BaseDocumentGenerator:
                     created_by=generated_by
                 )
             
-            # Create a Document record
-            document = Document.objects.create(
-                package=document_package,
-                document_type=self._document_type,
-                file_name=file_name,
-                file_path=storage_result['key'],
-                version=storage_result.get('version_id', '1.0'),
-                status=DOCUMENT_STATUS['GENERATED'],
-                generated_at=datetime.datetime.now(),
-                generated_by=generated_by
-            )
+            # Create a Document record, counted as a reference to its stored content
+            document = self._build_document(document_package, file_name, storage_result, generated_by, content_hash)
+            document.save(force_insert=True)
+            if content_hash:
+                DocumentContent.objects.add_reference(content_hash, self._document_type, storage_result)
+        
+        return document
+    
+    def _upload_document(self, pdf_content, file_name, application, generated_by, content_hash=None):
+        """
+        Uploads a generated PDF to document storage.
+        
+        A PDF with a content hash is stored under a key derived from the hash and may be
+        shared by several documents, so its metadata describes the content only.
+        
+        Args:
+            pdf_content (bytes): PDF content to store
+            file_name (str): File name for the document
+            application (LoanApplication): The loan application the document is for
+            generated_by (User): The user who generated the document
+            content_hash (str, optional): Content hash to store the PDF under
             
-            return document
+        Returns:
+            dict: Storage details including the key and version ID
+        """
+        metadata = {
+            'document_type': self._document_type,
+            'generated_at': datetime.datetime.now().isoformat(),
+        }
+        if content_hash:
+            metadata['content_hash'] = content_hash
+        else:
+            metadata['application_id'] = str(application.id)
+            metadata['generated_by'] = str(generated_by.id)
+        
+        return document_storage.store_document(
+            content=pdf_content,
+            document_type=self._document_type,
+            file_name=file_name,
+            content_type='application/pdf',
+            metadata=metadata,
+            content_hash=content_hash
+        )
+    
+    def _build_document(self, document_package, file_name, storage_result, generated_by, content_hash=None):
+        """
+        Builds an unsaved Document record for an uploaded PDF.
+        
+        Args:
+            document_package (DocumentPackage): Package the document belongs to
+            file_name (str): File name for the document
+            storage_result (dict): Storage details from _upload_document
+            generated_by (User): The user who generated the document
+            content_hash (str, optional): Content hash the PDF is stored under
             
-        except Exception as e:
-            error_message = f"Failed to store document for {self._document_type}: {str(e)}"
-            logger.error(error_message, exc_info=True)
-            raise DocumentGenerationError(error_message, e)
+        Returns:
+            Document: Unsaved Document object
+        """
+        return Document(
+            package=document_package,
+            document_type=self._document_type,
+            file_name=file_name,
+            file_path=storage_result['key'],
+            version=storage_result.get('version_id', '1.0'),
+            content_hash=content_hash,
+            status=DOCUMENT_STATUS['GENERATED'],
+            generated_at=datetime.datetime.now(),
+            generated_by=generated_by
+        )
+    
+    def generate_bulk(self, applications, generated_by, additional_context=None):
+        """
+        Generates this document type for a batch of loan applications.
+        
+        Contexts are built from applications reloaded by prefetch_document_context, with
+        school and program data built once per batch. Documents whose content is already
+        stored are not converted again; the rest are converted to PDF in one rendering
+        batch, once per distinct content, and uploaded concurrently. The Document records
+        and any missing packages are written with bulk_create. A failing application does
+        not stop the others.
+        
+        Args:
+            applications (iterable): LoanApplication objects or IDs
+            generated_by (User): The user who initiated document generation
+            additional_context (dict, optional): Additional context data for template rendering
+        
+        Returns:
+            dict: Maps application ID to its Document, or to the DocumentGenerationError that stopped it
+        """
+        applications = prefetch_document_context(applications)
+        results = {}
+        
+        # Steps 1-3: Render every application's HTML with the shared school and program context
+        prepared = self._bulk_prepare(applications, additional_context, results)
+        
+        # Steps 4-5: Convert and upload each distinct content that is not stored yet
+        storage_results, converted_count = self._bulk_store(prepared, generated_by)
+        
+        uploaded = []
+        for application, file_name, content_hash, _ in prepared:
+            storage_result = storage_results[content_hash]
+            if isinstance(storage_result, Exception):
+                results[application.id] = self._bulk_error('render or store', application, storage_result)
+            else:
+                uploaded.append((application, file_name, storage_result, content_hash))
+        
+        # Step 6: Create the Document records
+        if uploaded:
+            try:
+                results.update(self._bulk_create_documents(uploaded, generated_by))
+            except Exception as e:
+                for application, _, _, _ in uploaded:
+                    results[application.id] = self._bulk_error('save', application, e)
+        
+        logger.info(
+            f"Bulk generated {sum(1 for result in results.values() if isinstance(result, Document))} "
+            f"{self._document_type} documents for {len(applications)} applications, "
+            f"{len(prepared) - converted_count} from stored content"
+        )
+        return results
+    
+    def _bulk_prepare(self, applications, additional_context, results):
+        """
+        Renders the HTML of a bulk run, building school and program context once per batch.
+        
+        Args:
+            applications (list): LoanApplication objects reloaded by prefetch_document_context
+            additional_context (dict): Additional context data for template rendering, or None
+            results (dict): Bulk results, which receive the error of any application that fails
+            
+        Returns:
+            list: (application, file_name, content_hash, html_content) tuples
+        """
+        prepared = []
+        self._shared_context = {}
+        try:
+            for application in applications:
+                try:
+                    html_content, file_name = self.prepare(application, additional_context)
+                    prepared.append((application, file_name, self.get_content_hash(html_content), html_content))
+                except Exception as e:
+                    results[application.id] = self._bulk_error('prepare', application, e)
+        finally:
+            self._shared_context = None
+        return prepared
+    
+    def _bulk_store(self, prepared, generated_by):
+        """
+        Stores the distinct contents of a bulk run, reusing content that is already stored.
+        
+        Missing contents are converted to PDF in one rendering batch and uploaded concurrently.
+        
+        Args:
+            prepared (list): (application, file_name, content_hash, html_content) tuples
+            generated_by (User): The user who initiated document generation
+            
+        Returns:
+            tuple: (storage_results, converted_count), where storage_results maps each content
+                hash to its storage result or to the exception that stopped it
+        """
+        # Content that is already stored is neither converted nor uploaded again
+        storage_results = {
+            content_hash: stored_content.get_storage_result()
+            for content_hash, stored_content in find_stored_content(
+                content_hash for _, _, content_hash, _ in prepared
+            ).items()
+        }
+        missing = {}
+        for application, file_name, content_hash, html_content in prepared:
+            if content_hash not in storage_results:
+                missing.setdefault(content_hash, (application, file_name, html_content))
+        
+        # Step 4: Convert the batch to PDF
+        pdf_contents = pdf_rendering_service.render_batch(
+            [html_content for _, _, html_content in missing.values()],
+            return_exceptions=True
+        )
+        
+        # Step 5: Upload the PDFs concurrently
+        def upload(item):
+            (content_hash, (application, file_name, _)), pdf_content = item
+            if isinstance(pdf_content, Exception):
+                return pdf_content
+            try:
+                return self._upload_document(pdf_content, file_name, application, generated_by, content_hash)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=DOCUMENT_UPLOAD_CONCURRENCY) as executor:
+            storage_results.update(zip(missing, executor.map(upload, zip(missing.items(), pdf_contents))))
+        
+        return storage_results, len(missing)
+    
+    def _bulk_create_documents(self, uploaded, generated_by):
+        """
+        Creates the Document records of a bulk run, and any packages they need, in bulk.
+        
+        Args:
+            uploaded (list): (application, file_name, storage_result, content_hash) tuples
+            generated_by (User): The user who generated the documents
+            
+        Returns:
+            dict: Maps application ID to its created Document
+        """
+        from ..models import DocumentPackage
+        
+        package_type = self._get_package_type()
+        application_ids = [application.id for application, _, _, _ in uploaded]
+        
+        with transaction.atomic():
+            # Reuse each application's open package of this type, as _save_document does
+            packages = {}
+            for package in DocumentPackage.objects.filter(
+                application_id__in=application_ids,
+                package_type=package_type,
+                status__in=[DOCUMENT_STATUS['DRAFT'], DOCUMENT_STATUS['GENERATED']]
+            ).order_by('created_at'):
+                packages.setdefault(package.application_id, package)
+            
+            # bulk_create skips save(), so set the fields DocumentPackage.save() would. created_by
+            # is left empty: it references the auth user model, not the generating User
+            now = timezone.now()
+            new_packages = [
+                DocumentPackage(
+                    application=application,
+                    package_type=package_type,
+                    status=DOCUMENT_STATUS['GENERATED'],
+                    created_at=now,
+                    expiration_date=now + datetime.timedelta(days=DOCUMENT_EXPIRATION_DAYS)
+                )
+                for application, _, _, _ in uploaded if application.id not in packages
+            ]
+            DocumentPackage.objects.bulk_create(new_packages)
+            packages.update({package.application_id: package for package in new_packages})
+            
+            documents = [
+                self._build_document(packages[application.id], file_name, storage_result, generated_by, content_hash)
+                for application, file_name, storage_result, content_hash in uploaded
+            ]
+            Document.objects.bulk_create(documents)
+            
+            # Count the new documents as references to their stored content
+            storage_by_hash = {content_hash: storage_result for _, _, storage_result, content_hash in uploaded}
+            for content_hash, count in Counter(content_hash for _, _, _, content_hash in uploaded).items():
+                DocumentContent.objects.add_reference(
+                    content_hash, self._document_type, storage_by_hash[content_hash], count=count
+                )
+        
+        # bulk_create sends no post_save, so emit the audit signal save() would have sent
+        for instance in new_packages + documents:
+            model_change_signal.send(sender=type(instance), instance=instance, created=True)
+        
+        return {application.id: document for (application, _, _, _), document in zip(uploaded, documents)}
+    
+    def _bulk_error(self, step, application, error):
+        """
+        Wraps a per-application failure in a bulk run.
+        
+        Args:
+            step (str): Generation step that failed
+            application (LoanApplication): The application that failed
+            error (Exception): The original error
+            
+        Returns:
+            DocumentGenerationError: The wrapped error
+        """
+        if isinstance(error, DocumentGenerationError):
+            return error
+        return DocumentGenerationError(
+            f"Failed to {step} {self._document_type} document for application {application.id}", error
+        )
     
     def _get_package_type(self):
         """
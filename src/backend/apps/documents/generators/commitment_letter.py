@@ -6,7 +6,7 @@ before proceeding to the loan agreement phase.
 
 from datetime import datetime  # version 3.11+
 from .base import BaseDocumentGenerator, DocumentGenerationError  # Implements a specialized document generator for creating commitment letters that are sent to schools after loan approval.
-from .constants import DOCUMENT_TYPES  # Implements a specialized document generator for creating commitment letters that are sent to schools after loan approval.
+from ..constants import DOCUMENT_TYPES  # Implements a specialized document generator for creating commitment letters that are sent to schools after loan approval.
 from utils.logging import getLogger  # Implements a specialized document generator for creating commitment letters that are sent to schools after loan approval.
 from apps.underwriting.models import UnderwritingDecision  # Implements a specialized document generator for creating commitment letters that are sent to schools after loan approval.
 
@@ -32,51 +32,6 @@ class DisclosureFormGenerator(BaseDocumentGenerator):
         super().__init__(DOCUMENT_TYPES['DISCLOSURE_FORM'])
         logger.info("Initialized DisclosureFormGenerator")
 
-    def generate(self, application, generated_by, additional_context=None):
-        """
-        Generate a disclosure form for the given loan application
-
-        Args:
-            application (LoanApplication): The loan application to generate the document for
-            generated_by (User): The user who initiated document generation
-            additional_context (dict): Additional context data
-
-        Returns:
-            Document: Generated disclosure form Document object
-        """
-        logger.info(f"Starting disclosure form generation for application {application.id}")
-
-        try:
-            # Step 1: Get the template content
-            template_content = self._get_template()
-
-            # Step 2: Prepare the context data
-            context = self._prepare_context(application, additional_context or {})
-
-            # Step 3: Render the template
-            html_content = self._render_template(template_content, context)
-
-            # Step 4: Convert the HTML to PDF
-            pdf_content = self._html_to_pdf(html_content)
-
-            # Step 5: Generate a file name
-            file_name = self._generate_file_name(application)
-
-            # Step 6: Store the document
-            document = self._store_document(pdf_content, file_name, application, generated_by)
-
-            logger.info(f"Successfully generated disclosure form for application {application.id}")
-            return document
-
-        except DocumentGenerationError:
-            # Re-raise DocumentGenerationError to preserve the error chain
-            raise
-        except Exception as e:
-            # Wrap any other exceptions in DocumentGenerationError
-            error_message = f"Failed to generate disclosure form for application {application.id}"
-            logger.error(error_message, exc_info=True)
-            raise DocumentGenerationError(error_message, e)
-
     def _prepare_context(self, application, additional_context):
         """
         Prepare the context data specific to disclosure forms
@@ -149,55 +104,26 @@ class TruthInLendingGenerator(BaseDocumentGenerator):
         super().__init__(DOCUMENT_TYPES['TRUTH_IN_LENDING'])
         logger.info("Initialized TruthInLendingGenerator")
 
-    def generate(self, application, generated_by, additional_context=None):
+    def prepare(self, application, additional_context=None):
         """
-        Generate a Truth in Lending disclosure for the given loan application
+        Render a Truth in Lending disclosure for the given loan application
 
         Args:
             application (LoanApplication): The loan application to generate the document for
-            generated_by (User): The user who initiated document generation
             additional_context (dict): Additional context data
 
         Returns:
-            Document: Generated Truth in Lending Document object
-        """
-        logger.info(f"Starting Truth in Lending generation for application {application.id}")
-
-        try:
-            # Step 1: Verify that the application has an underwriting decision
-            underwriting_decision = application.get_underwriting_decision()
-            if not underwriting_decision:
-                raise DocumentGenerationError("Application must have an underwriting decision to generate Truth in Lending disclosure")
-
-            # Step 2: Get the template content
-            template_content = self._get_template()
-
-            # Step 3: Prepare the context data
-            context = self._prepare_context(application, additional_context or {})
+            tuple: (html_content, file_name) tuple
 
-            # Step 4: Render the template
-            html_content = self._render_template(template_content, context)
-
-            # Step 5: Convert the HTML to PDF
-            pdf_content = self._html_to_pdf(html_content)
-
-            # Step 6: Generate a file name
-            file_name = self._generate_file_name(application)
-
-            # Step 7: Store the document
-            document = self._store_document(pdf_content, file_name, application, generated_by)
-
-            logger.info(f"Successfully generated Truth in Lending disclosure for application {application.id}")
-            return document
+        Raises:
+            DocumentGenerationError: If the application has no underwriting decision
+        """
+        # Verify that the application has an underwriting decision
+        underwriting_decision = application.get_underwriting_decision()
+        if not underwriting_decision:
+            raise DocumentGenerationError("Application must have an underwriting decision to generate Truth in Lending disclosure")
 
-        except DocumentGenerationError:
-            # Re-raise DocumentGenerationError to preserve the error chain
-            raise
-        except Exception as e:
-            # Wrap any other exceptions in DocumentGenerationError
-            error_message = f"Failed to generate Truth in Lending disclosure for application {application.id}"
-            logger.error(error_message, exc_info=True)
-            raise DocumentGenerationError(error_message, e)
+        return super().prepare(application, additional_context)
 
     def _prepare_context(self, application, additional_context):
         """
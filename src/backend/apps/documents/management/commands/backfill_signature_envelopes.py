@@ -0,0 +1,57 @@
+"""
+Management command that fills the envelope columns of existing signature requests.
+
+Signature requests created before envelope_id and recipient_id existed only carry the
+"<envelope_id>:<recipient_id>" external reference. Envelope lookups, including webhook
+processing, go through the indexed columns, so run this once after deploying them. The
+command is idempotent and walks the table in primary key order, one batch at a time.
+"""
+
+from django.core.management.base import BaseCommand  # Django 4.2+
+from django.db import transaction  # Django 4.2+
+
+from ...models import SignatureRequest
+
+
+class Command(BaseCommand):
+    """
+    Copies the envelope and recipient IDs out of each signature request's external reference.
+    """
+    help = 'Backfill envelope_id and recipient_id on signature requests from external_reference'
+
+    def add_arguments(self, parser):
+        """
+        Adds the batch size option.
+        """
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of signature requests updated per transaction')
+
+    def handle(self, *args, **options):
+        """
+        Backfills every signature request that has an external reference but no envelope ID.
+        """
+        batch_size = options['batch_size']
+        pending = SignatureRequest.all_objects.filter(
+            envelope_id__isnull=True, external_reference__isnull=False
+        ).exclude(external_reference='').order_by('pk')
+
+        updated = 0
+        last_pk = None
+        while True:
+            batch = pending.filter(pk__gt=last_pk) if last_pk is not None else pending
+            batch = list(batch.only('pk', 'external_reference')[:batch_size])
+            if not batch:
+                break
+
+            for request in batch:
+                request.envelope_id, request.recipient_id = SignatureRequest.parse_external_reference(
+                    request.external_reference
+                )
+            with transaction.atomic():
+                SignatureRequest.all_objects.bulk_update(batch, ['envelope_id', 'recipient_id'])
+
+            updated += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"Backfilled {updated} signature requests")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled envelope columns on {updated} signature requests"))
@@ -0,0 +1,36 @@
+"""
+Management command that preloads the document generation templates.
+
+Compiling every template in DOCUMENT_TEMPLATE_PATHS fills the shared bytecode cache, so
+workers started afterwards on the same host load templates without recompiling them. Run
+it after deploying template changes or as part of worker start-up.
+"""
+
+from django.core.management.base import BaseCommand, CommandError  # Django 4.2+
+
+from ...template_cache import preload_document_templates
+
+
+class Command(BaseCommand):
+    """
+    Compiles every document template and reports the ones that could not be loaded.
+    """
+    help = 'Preload and compile all document generation templates'
+
+    def handle(self, *args, **options):
+        """
+        Preloads the templates and fails if any of them could not be loaded.
+        """
+        results = preload_document_templates()
+
+        failed = {document_type: error for document_type, error in results.items() if error}
+        for document_type in results:
+            if document_type in failed:
+                self.stderr.write(f"{document_type}: {failed[document_type]}")
+            else:
+                self.stdout.write(f"{document_type}: loaded")
+
+        if failed:
+            raise CommandError(f"Failed to preload {len(failed)} of {len(results)} document templates")
+
+        self.stdout.write(self.style.SUCCESS(f"Preloaded {len(results)} document templates"))
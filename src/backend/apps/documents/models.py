@@ -6,7 +6,8 @@ signature requests, and document fields. These models support the generation, st
 signing, and tracking of all loan-related documents throughout the application lifecycle.
 """
 
-from django.db import models  # Django 4.2+
+from django.db import models, transaction, IntegrityError  # Django 4.2+
+from django.db.models import F  # Django 4.2+
 from django.utils import timezone  # Django 4.2+
 from datetime import timedelta  # standard library
 from django.core.exceptions import ValidationError  # Django 4.2+
@@ -14,11 +15,11 @@ from django.core.exceptions import ValidationError  # Django 4.2+
 from core.models import CoreModel, ActiveManager
 from apps.applications.models import LoanApplication
 from apps.users.models import User
-from .storage import DocumentStorage
+from .storage import document_storage
 from .constants import (
     DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_PACKAGE_TYPES,
     SIGNATURE_STATUS, SIGNER_TYPES, DOCUMENT_FIELD_TYPES,
-    DOCUMENT_EXPIRATION_DAYS
+    DOCUMENT_EXPIRATION_DAYS, DOCUMENT_TEMPLATE_PATHS
 )
 
 # Create choice tuples for model fields
@@ -29,9 +30,6 @@ SIGNATURE_STATUS_CHOICES = ([(status, label) for status, label in SIGNATURE_STAT
 SIGNER_TYPE_CHOICES = ([(signer_type, label) for signer_type, label in SIGNER_TYPES.items()])
 DOCUMENT_FIELD_TYPE_CHOICES = ([(field_type, label) for field_type, label in DOCUMENT_FIELD_TYPES.items()])
 
-# Initialize document storage
-document_storage = DocumentStorage()
-
 
 class DocumentTemplate(CoreModel):
     """
@@ -74,7 +72,11 @@ class DocumentTemplate(CoreModel):
         If this is a new template (no ID), set created_at to current time.
         If version is not set, set it to '1.0'.
         If is_active is True, deactivate other templates of the same type.
+        Compiled copies of the template and of its document type are evicted so the
+        next document is generated from the saved version.
         """
+        from .template_cache import invalidate_document_template
+
         if not self.pk:
             self.created_at = timezone.now()
             
@@ -87,8 +89,10 @@ class DocumentTemplate(CoreModel):
                 document_type=self.document_type,
                 is_active=True
             ).exclude(pk=self.pk).update(is_active=False)
-            
+
         super().save(**kwargs)
+
+        invalidate_document_template(self.file_path, DOCUMENT_TEMPLATE_PATHS.get(self.document_type))
     
     def __str__(self):
         """
@@ -210,6 +214,132 @@ class DocumentPackage(CoreModel):
         return f"{self.get_package_type_display()} - Application {self.application.id}"
 
 
+class DocumentContentManager(ActiveManager):
+    """
+    Custom manager for DocumentContent providing reference-counted lookups by content hash
+    """
+
+    def get_stored(self, content_hashes):
+        """
+        Returns the stored content entries for a set of content hashes.
+
+        Args:
+            content_hashes (iterable): Content hashes to look up
+
+        Returns:
+            dict: Maps each stored content hash to its DocumentContent
+        """
+        content_hashes = set(content_hashes)
+        if not content_hashes:
+            return {}
+        return {
+            content.content_hash: content
+            for content in self.get_queryset().filter(content_hash__in=content_hashes)
+        }
+
+    def add_reference(self, content_hash, document_type, storage_result, count=1):
+        """
+        Records documents that point at a stored object, creating its index entry if needed.
+
+        Args:
+            content_hash (str): Content hash of the stored object
+            document_type (str): Type of document stored under the hash
+            storage_result (dict): Storage details including the key and version ID
+            count (int): Number of documents added
+
+        Returns:
+            int: Number of index entries updated (always 1)
+        """
+        with transaction.atomic():
+            updated = self.get_queryset().filter(content_hash=content_hash).update(
+                reference_count=F('reference_count') + count,
+                updated_at=timezone.now()
+            )
+            if updated:
+                return updated
+
+            try:
+                # A savepoint keeps the outer transaction usable if another worker won the insert
+                with transaction.atomic():
+                    self.create(
+                        content_hash=content_hash,
+                        document_type=document_type,
+                        file_path=storage_result['key'],
+                        version=storage_result.get('version_id'),
+                        reference_count=count
+                    )
+                return 1
+            except IntegrityError:
+                return self.get_queryset().filter(content_hash=content_hash).update(
+                    reference_count=F('reference_count') + count,
+                    updated_at=timezone.now()
+                )
+
+    def release_reference(self, content_hash):
+        """
+        Records that a document no longer points at a stored object.
+
+        Args:
+            content_hash (str): Content hash of the stored object
+
+        Returns:
+            int: Number of index entries updated
+        """
+        return self.get_queryset().filter(content_hash=content_hash, reference_count__gt=0).update(
+            reference_count=F('reference_count') - 1,
+            updated_at=timezone.now()
+        )
+
+    def get_unreferenced(self):
+        """
+        Returns stored objects that no document points at anymore.
+
+        Returns:
+            QuerySet: QuerySet of DocumentContent objects with no references
+        """
+        return self.get_queryset().filter(reference_count=0)
+
+
+class DocumentContent(CoreModel):
+    """
+    Index of content-addressed document objects in storage.
+
+    Generated documents are stored under a key derived from the hash of their rendered
+    HTML, so regenerating a document with unchanged content reuses the existing object
+    instead of rendering and uploading it again. reference_count tracks how many
+    documents point at the object.
+    """
+    content_hash = models.CharField(max_length=64, unique=True)
+    document_type = models.CharField(max_length=50, choices=DOCUMENT_TYPE_CHOICES)
+    file_path = models.CharField(max_length=255)
+    version = models.CharField(max_length=255, null=True, blank=True)
+    reference_count = models.PositiveIntegerField(default=0)
+
+    objects = DocumentContentManager()
+    all_objects = models.Manager()
+
+    def get_storage_result(self):
+        """
+        Returns the storage details of the stored object, as returned by store_document.
+
+        Returns:
+            dict: Dictionary containing the key and version ID
+        """
+        storage_result = {'key': self.file_path}
+        if self.version:
+            storage_result['version_id'] = self.version
+        return storage_result
+
+    def __str__(self):
+        """
+        String representation of the DocumentContent instance.
+
+        Returns:
+            str: Content hash and reference count
+        """
+        return f"{self.content_hash} ({self.reference_count} references)"
+
+
 class Document(CoreModel):
     """
     Model representing an individual document in the system.
@@ -223,6 +353,7 @@ class Document(CoreModel):
     file_name = models.CharField(max_length=255)
     file_path = models.CharField(max_length=255)
     version = models.CharField(max_length=20, default='1.0')
+    content_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
     status = models.CharField(
         max_length=20, 
         choices=DOCUMENT_STATUS_CHOICES,
@@ -270,6 +401,24 @@ class Document(CoreModel):
         if update_package:
             self.package.update_status()
     
+    def delete(self, hard_delete=False, **kwargs):
+        """
+        Override delete method to release the document's reference to its stored content.
+        
+        Args:
+            hard_delete (bool): If True, performs an actual deletion instead of soft delete
+            **kwargs: Additional keyword arguments to pass to the parent delete method
+            
+        Returns:
+            tuple: Number of deleted objects and a dictionary of deleted objects by type
+        """
+        release = self.content_hash and not self.is_deleted
+        with transaction.atomic():
+            result = super().delete(hard_delete=hard_delete, **kwargs)
+            if release:
+                DocumentContent.objects.release_reference(self.content_hash)
+        return result
+    
     def get_content(self):
         """
         Retrieves the document content from storage.
@@ -371,9 +520,30 @@ class Document(CoreModel):
         return f"{self.get_document_type_display()} - {self.file_name}"
 
 
+class SignatureRequestManager(ActiveManager):
+    """
+    Custom manager for SignatureRequest providing indexed envelope lookups
+    """
+
+    def for_envelope(self, envelope_id):
+        """
+        Returns the signature requests sent in a DocuSign envelope.
+
+        Args:
+            envelope_id (str): DocuSign envelope ID
+
+        Returns:
+            QuerySet: QuerySet of SignatureRequest objects with their documents
+        """
+        return self.get_queryset().filter(envelope_id=envelope_id).select_related('document')
+
+
 class SignatureRequest(CoreModel):
     """
     Model tracking signature requests for documents.
+    
+    external_reference holds "<envelope_id>:<recipient_id>"; both parts are also kept in
+    their own indexed columns so envelope lookups do not scan the table.
     """
     document = models.ForeignKey(
         Document,
@@ -396,20 +566,31 @@ class SignatureRequest(CoreModel):
     reminder_count = models.IntegerField(default=0)
     last_reminder_at = models.DateTimeField(null=True, blank=True)
     external_reference = models.CharField(max_length=255, null=True, blank=True)
+    envelope_id = models.CharField(max_length=100, null=True, blank=True)
+    recipient_id = models.CharField(max_length=100, null=True, blank=True)
     
-    objects = ActiveManager()
+    objects = SignatureRequestManager()
     all_objects = models.Manager()
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['envelope_id', 'recipient_id']),
+        ]
+    
     def save(self, **kwargs):
         """
         Override save method to set requested_at and handle status changes.
         
         If this is a new request (no ID), set requested_at to current time.
         If status is changing to 'COMPLETED', set completed_at to current time.
+        The envelope and recipient columns are filled from external_reference.
         """
         if not self.pk:
             self.requested_at = timezone.now()
         
+        if self.external_reference and not self.envelope_id:
+            self.envelope_id, self.recipient_id = self.parse_external_reference(self.external_reference)
+        
         # If status changed to COMPLETED, set completed_at
         if self.pk:
             try:
@@ -428,6 +609,34 @@ class SignatureRequest(CoreModel):
             if all(sig.status == SIGNATURE_STATUS['COMPLETED'] for sig in document_signatures):
                 self.document.update_status(DOCUMENT_STATUS['COMPLETED'])
     
+    @staticmethod
+    def parse_external_reference(external_reference):
+        """
+        Splits an external reference into its envelope and recipient IDs.
+        
+        Args:
+            external_reference (str): Reference in the form "<envelope_id>:<recipient_id>"
+            
+        Returns:
+            tuple: (envelope_id, recipient_id) tuple; recipient_id is None if absent
+        """
+        envelope_id, _, recipient_id = external_reference.partition(':')
+        return envelope_id, recipient_id or None
+    
+    def get_envelope_reference(self):
+        """
+        Returns the DocuSign envelope and recipient of this request.
+        
+        Returns:
+            tuple: (envelope_id, recipient_id) tuple, or (None, None) if the request was not sent
+        """
+        if self.envelope_id:
+            return self.envelope_id, self.recipient_id
+        if self.external_reference:
+            # Rows written before the envelope columns existed and not yet backfilled
+            return self.parse_external_reference(self.external_reference)
+        return None, None
+    
     def update_status(self, new_status):
         """
         Updates the signature request status.
@@ -540,6 +749,51 @@ class SignatureRequest(CoreModel):
         return f"{self.document.get_document_type_display()} - {self.signer.get_full_name()} - {self.get_status_display()}"
 
 
+class DocuSignWebhookEvent(CoreModel):
+    """
+    Record of a processed DocuSign webhook delivery, used to skip retried deliveries.
+    """
+    event_id = models.CharField(max_length=100, unique=True)
+    event = models.CharField(max_length=100)
+    envelope_id = models.CharField(max_length=100, db_index=True)
+    processed_at = models.DateTimeField(default=timezone.now)
+    
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the DocuSignWebhookEvent instance.
+        
+        Returns:
+            str: Event ID, event and envelope ID
+        """
+        return f"{self.event_id} - {self.event} - {self.envelope_id}"
+
+
+class EnvelopeSyncWatermark(CoreModel):
+    """
+    Model for tracking how far DocuSign envelope status changes have been reconciled.
+    
+    Envelope changes up to synced_through have been applied to the account's signature
+    requests and documents.
+    """
+    account_id = models.CharField(max_length=100, unique=True)
+    synced_through = models.DateTimeField(null=True, blank=True)
+    
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the EnvelopeSyncWatermark instance.
+        
+        Returns:
+            str: Account ID and the time envelopes are reconciled through
+        """
+        return f"DocuSign account {self.account_id} reconciled through {self.synced_through}"
+
+
 class DocumentField(CoreModel):
     """
     Model representing a field in a document (signature, date, text, etc.).
@@ -0,0 +1,300 @@
+"""
+Batched reconciliation of DocuSign envelope statuses.
+
+Instead of asking DocuSign for one envelope at a time, the reconciler lists every envelope
+of the account that changed since a stored watermark, with its recipients, fetching the
+result pages concurrently. The changes are then applied to signature requests and
+documents with bulk updates, one transaction per batch of envelopes, and the watermark is
+advanced once every batch has been applied. A failed run leaves the watermark in place, so
+the next run reads the same changes again.
+"""
+
+import datetime  # standard library
+import logging  # standard library
+from collections import defaultdict  # standard library
+from concurrent.futures import ThreadPoolExecutor  # standard library
+
+from django.db import transaction  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
+
+from core.signals import model_change_signal
+from .models import Document, DocumentPackage, SignatureRequest, EnvelopeSyncWatermark
+from .docusign import DocuSignError, derive_document_status
+from .constants import (
+    DOCUSIGN_RECIPIENT_STATUS_MAPPING, SIGNATURE_STATUS,
+    DOCUSIGN_RECONCILE_PAGE_SIZE, DOCUSIGN_RECONCILE_CONCURRENCY, DOCUSIGN_RECONCILE_BATCH_SIZE,
+    DOCUSIGN_RECONCILE_OVERLAP_SECONDS, DOCUSIGN_RECONCILE_INITIAL_LOOKBACK_DAYS
+)
+
+# Configure logger
+logger = logging.getLogger('docusign')
+
+
+def _to_signature_status(docusign_status):
+    """
+    Maps a DocuSign recipient status to the internal signature status.
+
+    Args:
+        docusign_status (str): Recipient status reported by DocuSign
+
+    Returns:
+        str: Internal signature status, or None if the status is unknown
+    """
+    status_key = DOCUSIGN_RECIPIENT_STATUS_MAPPING.get((docusign_status or '').lower())
+    return SIGNATURE_STATUS.get(status_key) if status_key else None
+
+
+class EnvelopeReconciler:
+    """
+    Applies DocuSign envelope status changes to signature requests and documents in bulk.
+    """
+
+    def __init__(self, service=None, page_size=DOCUSIGN_RECONCILE_PAGE_SIZE,
+                 concurrency=DOCUSIGN_RECONCILE_CONCURRENCY, batch_size=DOCUSIGN_RECONCILE_BATCH_SIZE):
+        """
+        Initialize the reconciler.
+
+        Args:
+            service (DocuSignService, optional): Service used to authenticate and reach the
+                envelopes API (default: the module-wide docusign_service)
+            page_size (int): Envelopes requested per page
+            concurrency (int): Number of pages fetched at the same time
+            batch_size (int): Number of envelopes applied per transaction
+        """
+        self._service = service
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+
+    @property
+    def service(self):
+        """
+        DocuSign service used for API access.
+
+        Returns:
+            DocuSignService: The service
+        """
+        if self._service is None:
+            from .docusign import docusign_service
+            self._service = docusign_service
+        return self._service
+
+    def reconcile(self, from_date=None):
+        """
+        Applies every envelope change since the account's watermark and advances it.
+
+        Args:
+            from_date (datetime, optional): Read changes from this time instead of the watermark
+
+        Returns:
+            dict: The window read and the number of envelopes, signature requests, documents
+                and packages updated
+
+        Raises:
+            DocuSignError: If the envelope changes cannot be listed
+        """
+        watermark, _ = EnvelopeSyncWatermark.objects.get_or_create(account_id=self.service.account_id)
+
+        to_date = timezone.now()
+        if from_date is None:
+            from_date = self._get_from_date(watermark, to_date)
+
+        envelopes = self.list_changed_envelopes(from_date, to_date)
+        summary = self.apply_envelope_statuses(envelopes)
+
+        watermark.synced_through = to_date
+        watermark.save()
+
+        summary.update({
+            'from_date': from_date.isoformat(),
+            'to_date': to_date.isoformat(),
+            'envelopes': len(envelopes),
+        })
+        logger.info(
+            f"Reconciled {len(envelopes)} DocuSign envelopes changed from {from_date} to {to_date}: "
+            f"{summary['updated_requests']} signature requests, {summary['updated_documents']} documents updated"
+        )
+        return summary
+
+    def _get_from_date(self, watermark, to_date):
+        """
+        Determines where a run starts reading envelope changes.
+
+        Args:
+            watermark (EnvelopeSyncWatermark): The account's watermark
+            to_date (datetime): End of the window being read
+
+        Returns:
+            datetime: Start of the window
+        """
+        if watermark.synced_through:
+            return watermark.synced_through - datetime.timedelta(seconds=DOCUSIGN_RECONCILE_OVERLAP_SECONDS)
+        return to_date - datetime.timedelta(days=DOCUSIGN_RECONCILE_INITIAL_LOOKBACK_DAYS)
+
+    def list_changed_envelopes(self, from_date, to_date):
+        """
+        Lists the envelopes that changed in a time window, with their recipient statuses.
+
+        The first page reports the size of the result set; the remaining pages are then
+        fetched concurrently. The window is closed at to_date so pages do not shift while
+        they are read.
+
+        Args:
+            from_date (datetime): Start of the window
+            to_date (datetime): End of the window
+
+        Returns:
+            dict: Maps envelope ID to a dict of envelope status and recipient statuses
+
+        Raises:
+            DocuSignError: If a page cannot be fetched
+        """
+        try:
+            self.service.authenticate()
+            envelopes_api = self.service.envelopes_api
+
+            first_page = self._fetch_page(envelopes_api, from_date, to_date, 0)
+            total = int(first_page.total_set_size or 0)
+            pages = [first_page]
+
+            start_positions = range(self.page_size, total, self.page_size)
+            if start_positions:
+                with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                    pages.extend(executor.map(
+                        lambda start_position: self._fetch_page(envelopes_api, from_date, to_date, start_position),
+                        start_positions
+                    ))
+        except DocuSignError:
+            raise
+        except Exception as e:
+            raise DocuSignError(f"Error listing DocuSign envelope changes since {from_date}", e)
+
+        envelopes = {}
+        for page in pages:
+            for envelope in page.envelopes or []:
+                envelopes[envelope.envelope_id] = self._parse_envelope(envelope)
+        return envelopes
+
+    def _fetch_page(self, envelopes_api, from_date, to_date, start_position):
+        """
+        Fetches one page of envelope status changes.
+
+        Args:
+            envelopes_api (EnvelopesApi): Authenticated DocuSign envelopes API
+            from_date (datetime): Start of the window
+            to_date (datetime): End of the window
+            start_position (int): Position of the first envelope of the page
+
+        Returns:
+            EnvelopesInformation: The page
+        """
+        return envelopes_api.list_status_changes(
+            account_id=self.service.account_id,
+            from_date=from_date.isoformat(),
+            to_date=to_date.isoformat(),
+            include='recipients',
+            count=str(self.page_size),
+            start_position=str(start_position)
+        )
+
+    def _parse_envelope(self, envelope):
+        """
+        Extracts the envelope and signer statuses from a listed envelope.
+
+        Args:
+            envelope (Envelope): Envelope returned by the API
+
+        Returns:
+            dict: Envelope status and a map of recipient ID to internal signature status
+        """
+        recipients = {}
+        signers = getattr(envelope.recipients, 'signers', None) or []
+        for signer in signers:
+            status = _to_signature_status(signer.status)
+            if status:
+                recipients[str(signer.recipient_id)] = status
+        return {'status': envelope.status, 'recipients': recipients}
+
+    def apply_envelope_statuses(self, envelopes):
+        """
+        Applies listed envelope statuses to signature requests, documents and packages.
+
+        Args:
+            envelopes (dict): Envelope statuses from list_changed_envelopes
+
+        Returns:
+            dict: Number of signature requests, documents and packages updated
+        """
+        summary = {'updated_requests': 0, 'updated_documents': 0, 'updated_packages': 0}
+        envelope_ids = list(envelopes)
+        for start in range(0, len(envelope_ids), self.batch_size):
+            batch = {envelope_id: envelopes[envelope_id] for envelope_id in envelope_ids[start:start + self.batch_size]}
+            for key, count in self._apply_batch(batch).items():
+                summary[key] += count
+        return summary
+
+    def _apply_batch(self, envelopes):
+        """
+        Applies one batch of envelope statuses in a single transaction.
+
+        Args:
+            envelopes (dict): Envelope statuses keyed by envelope ID
+
+        Returns:
+            dict: Number of signature requests, documents and packages updated
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Signature requests whose recipient status changed
+            changed_requests = []
+            for request in SignatureRequest.objects.filter(envelope_id__in=list(envelopes)):
+                new_status = envelopes[request.envelope_id]['recipients'].get(request.recipient_id)
+                if not new_status or new_status == request.status:
+                    continue
+                request.status = new_status
+                if new_status == SIGNATURE_STATUS['COMPLETED'] and not request.completed_at:
+                    request.completed_at = now
+                # bulk_update skips auto_now, so set it as save() would
+                request.updated_at = now
+                changed_requests.append(request)
+            SignatureRequest.objects.bulk_update(changed_requests, ['status', 'completed_at', 'updated_at'])
+
+            # Documents whose overall status follows from their signature requests
+            document_ids = {request.document_id for request in changed_requests}
+            signature_statuses = defaultdict(list)
+            for document_id, status in SignatureRequest.objects.filter(
+                document_id__in=document_ids
+            ).values_list('document_id', 'status'):
+                signature_statuses[document_id].append(status)
+
+            changed_documents = []
+            for document in Document.objects.filter(id__in=document_ids):
+                new_status = derive_document_status(document.status, signature_statuses[document.id])
+                if new_status != document.status:
+                    document.status = new_status
+                    document.updated_at = now
+                    changed_documents.append(document)
+            Document.objects.bulk_update(changed_documents, ['status', 'updated_at'])
+
+            # Package statuses depend on all of their documents
+            updated_packages = 0
+            for package in DocumentPackage.objects.filter(
+                id__in={document.package_id for document in changed_documents}
+            ):
+                if package.update_status():
+                    updated_packages += 1
+
+        # bulk_update sends no post_save, so emit the audit signal save() would have sent
+        for instance in changed_requests + changed_documents:
+            model_change_signal.send(sender=type(instance), instance=instance, created=False)
+
+        return {
+            'updated_requests': len(changed_requests),
+            'updated_documents': len(changed_documents),
+            'updated_packages': updated_packages,
+        }
+
+
+# Process-wide reconciler used by the periodic task
+envelope_reconciler = EnvelopeReconciler()
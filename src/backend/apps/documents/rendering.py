@@ -0,0 +1,296 @@
+"""
+PDF rendering service for document generation.
+
+WeasyPrint rendering is CPU-bound and takes seconds per document, so HTML is converted to
+PDF in a persistent pool of worker processes instead of on the calling thread. Each worker
+imports WeasyPrint once and keeps a font configuration, the shared document stylesheets and
+an image cache for its whole life, so only the first document a worker renders pays for font
+discovery and stylesheet parsing.
+
+The pool is created on first use in each process. Workers are forked so that they start with
+the caller's modules already imported; they never touch the database. Setting
+DOCUMENT_RENDER_POOL_SIZE to 0 renders on the calling thread instead, and rendering also
+falls back to the calling thread when the pool cannot be started.
+"""
+
+import logging  # standard library
+import multiprocessing  # standard library
+import os  # standard library
+import threading  # standard library
+from concurrent.futures import ProcessPoolExecutor  # standard library
+from concurrent.futures.process import BrokenProcessPool  # standard library
+
+from django.conf import settings  # Django 4.2+
+
+from .constants import DOCUMENT_RENDER_TIMEOUT_SECONDS
+
+# Configure logger
+logger = logging.getLogger('document_generators')
+
+# Per-worker WeasyPrint state, set up by _init_render_worker
+_font_config = None
+_stylesheets = None
+_image_cache = None
+
+
+class PDFRenderingError(Exception):
+    """
+    Custom exception class for PDF rendering errors.
+    """
+
+    def __init__(self, message, original_exception=None):
+        """
+        Initialize the PDFRenderingError with a message and original exception.
+
+        Args:
+            message (str): Human-readable error message
+            original_exception (Exception, optional): Original exception that caused this error
+        """
+        super().__init__(message)
+        self.message = message
+        self.original_exception = original_exception
+
+    def __str__(self):
+        """Return a string representation of the error."""
+        if self.original_exception:
+            return f"{self.message} (Original error: {str(self.original_exception)})"
+        return self.message
+
+
+def _init_render_worker(stylesheet_sources=()):
+    """
+    Imports WeasyPrint and builds the font and stylesheet caches a worker reuses.
+
+    Args:
+        stylesheet_sources (tuple): CSS source strings applied to every document
+    """
+    global _font_config, _stylesheets, _image_cache
+
+    import weasyprint  # version 57.0+
+    from weasyprint.text.fonts import FontConfiguration
+
+    _font_config = FontConfiguration()
+    _stylesheets = [
+        weasyprint.CSS(string=source, font_config=_font_config) for source in stylesheet_sources
+    ]
+    _image_cache = {}
+
+
+def _render_pdf(html_content, base_url=None):
+    """
+    Converts HTML content to PDF with the worker's cached fonts and stylesheets.
+
+    Args:
+        html_content (str): HTML content to convert
+        base_url (str, optional): Base URL used to resolve relative links in the HTML
+
+    Returns:
+        bytes: PDF content
+    """
+    if _font_config is None:
+        _init_render_worker()
+
+    import weasyprint  # version 57.0+
+
+    return weasyprint.HTML(string=html_content, base_url=base_url).write_pdf(
+        stylesheets=_stylesheets,
+        font_config=_font_config,
+        cache=_image_cache
+    )
+
+
+def _get_default_pool_size():
+    """
+    Returns the configured number of rendering processes.
+
+    Returns:
+        int: Pool size; 0 renders on the calling thread
+    """
+    return getattr(settings, 'DOCUMENT_RENDER_POOL_SIZE', min(4, os.cpu_count() or 1))
+
+
+def _load_stylesheets():
+    """
+    Reads the stylesheets listed in DOCUMENT_RENDER_STYLESHEETS.
+
+    Returns:
+        tuple: CSS source strings
+    """
+    sources = []
+    for path in getattr(settings, 'DOCUMENT_RENDER_STYLESHEETS', ()):
+        with open(path, encoding='utf-8') as stylesheet:
+            sources.append(stylesheet.read())
+    return tuple(sources)
+
+
+class PDFRenderingService:
+    """
+    Converts batches of HTML documents to PDF in a persistent process pool.
+    """
+
+    def __init__(self, max_workers=None, timeout=DOCUMENT_RENDER_TIMEOUT_SECONDS):
+        """
+        Initialize the service; the pool itself is started on first use.
+
+        Args:
+            max_workers (int, optional): Number of rendering processes (default: DOCUMENT_RENDER_POOL_SIZE)
+            timeout (int): Seconds to wait for a single document
+        """
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._executor = None
+        self._executor_pid = None
+
+    @property
+    def max_workers(self):
+        """
+        Number of rendering processes.
+
+        Returns:
+            int: Pool size; 0 renders on the calling thread
+        """
+        return self._max_workers if self._max_workers is not None else _get_default_pool_size()
+
+    def render(self, html_content, base_url=None):
+        """
+        Converts one HTML document to PDF.
+
+        Args:
+            html_content (str): HTML content to convert
+            base_url (str, optional): Base URL used to resolve relative links in the HTML
+
+        Returns:
+            bytes: PDF content
+
+        Raises:
+            PDFRenderingError: If rendering fails
+        """
+        return self.render_batch([html_content], base_url=base_url)[0]
+
+    def render_batch(self, html_documents, base_url=None, return_exceptions=False):
+        """
+        Converts a batch of HTML documents to PDF in parallel.
+
+        Args:
+            html_documents (list): HTML content strings to convert
+            base_url (str, optional): Base URL used to resolve relative links in the HTML
+            return_exceptions (bool): Whether to return a PDFRenderingError in place of a failed
+                document instead of raising it
+
+        Returns:
+            list: PDF content for each document, in the order given
+
+        Raises:
+            PDFRenderingError: If a document fails and return_exceptions is False
+        """
+        html_documents = list(html_documents)
+        if not html_documents:
+            return []
+
+        executor = self._get_executor()
+        futures = None
+        if executor is not None:
+            try:
+                futures = [executor.submit(_render_pdf, html, base_url) for html in html_documents]
+            except AssertionError as e:
+                # Daemonic processes, such as Celery prefork children, cannot start a pool
+                logger.warning(f"PDF rendering pool unavailable, rendering inline: {str(e)}")
+                self._max_workers = 0
+                self._reset_executor(executor)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._reset_executor(executor)
+                raise PDFRenderingError("PDF rendering pool is unavailable", e)
+
+        if futures is None:
+            return [
+                self._collect(index, lambda html=html: _render_pdf(html, base_url), return_exceptions)
+                for index, html in enumerate(html_documents)
+            ]
+
+        return [
+            self._collect(index, lambda future=future: future.result(timeout=self._timeout), return_exceptions)
+            for index, future in enumerate(futures)
+        ]
+
+    def _collect(self, index, get_result, return_exceptions):
+        """
+        Returns one rendered document, wrapping a failure in PDFRenderingError.
+
+        Args:
+            index (int): Position of the document in the batch
+            get_result (callable): Returns the PDF content or raises the rendering error
+            return_exceptions (bool): Whether to return the error instead of raising it
+
+        Returns:
+            bytes: PDF content, or PDFRenderingError when return_exceptions is True
+        """
+        try:
+            return get_result()
+        except Exception as e:
+            error = PDFRenderingError(f"Failed to render document {index} of batch", e)
+            if isinstance(e, BrokenProcessPool):
+                # A worker that died takes the whole pool with it; start a fresh one next time
+                self._reset_executor(self._executor)
+            if not return_exceptions:
+                raise error
+            logger.error(str(error))
+            return error
+
+    def _get_executor(self):
+        """
+        Returns this process's rendering pool, starting it on first use.
+
+        Returns:
+            ProcessPoolExecutor: The pool, or None to render on the calling thread
+        """
+        if self.max_workers <= 0:
+            return None
+
+        with self._lock:
+            # A pool inherited through fork belongs to the parent process
+            if self._executor is not None and self._executor_pid == os.getpid():
+                return self._executor
+
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('fork'),
+                    initializer=_init_render_worker,
+                    initargs=(_load_stylesheets(),)
+                )
+                self._executor_pid = os.getpid()
+                logger.info(f"Started PDF rendering pool with {self.max_workers} processes")
+            except (OSError, ValueError) as e:
+                logger.warning(f"PDF rendering pool unavailable, rendering inline: {str(e)}")
+                self._executor = None
+                self._max_workers = 0
+            return self._executor
+
+    def _reset_executor(self, executor):
+        """
+        Discards a broken pool so the next batch starts a new one.
+
+        Args:
+            executor (ProcessPoolExecutor): The pool that failed
+        """
+        with self._lock:
+            if executor is not None and self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait=True):
+        """
+        Stops the rendering pool.
+
+        Args:
+            wait (bool): Whether to wait for in-flight documents to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Process-wide rendering service used by the document generators
+pdf_rendering_service = PDFRenderingService()
@@ -22,9 +22,11 @@ from .docusign import DocuSignService  # Import DocuSign service for e-signature
 from .docusign import docusign_service  # Import DocuSign service singleton instance
 from .generators.base import BaseDocumentGenerator  # Import base document generator class
 from .generators.base import DocumentGenerationError  # Import document generation error class
+from .generators.base import find_stored_content  # Import stored content lookup for rendered documents
 from .generators.commitment_letter import CommitmentLetterGenerator  # Import commitment letter generator class
 from .generators.loan_agreement import LoanAgreementGenerator  # Import loan agreement generator class
-from .generators.disclosure_forms import DisclosureFormsGenerator  # Import disclosure forms generator class
+from .generators.disclosure_forms import DisclosureFormGenerator  # Import disclosure forms generator class
+from .rendering import pdf_rendering_service  # Import PDF rendering pool for batch conversion
 from .constants import DOCUMENT_TYPES  # Import document type constants
 from .constants import DOCUMENT_STATUS  # Import document status constants
 from .constants import DOCUMENT_PACKAGE_TYPES  # Import document package type constants
@@ -38,7 +40,7 @@ logger = logging.getLogger('document_services')
 DOCUMENT_GENERATOR_MAPPING = {
     DOCUMENT_TYPES['COMMITMENT_LETTER']: CommitmentLetterGenerator,
     DOCUMENT_TYPES['LOAN_AGREEMENT']: LoanAgreementGenerator,
-    DOCUMENT_TYPES['DISCLOSURE_FORM']: DisclosureFormsGenerator,
+    DOCUMENT_TYPES['DISCLOSURE_FORM']: DisclosureFormGenerator,
 }
 
 
@@ -59,6 +61,50 @@ class DocumentServiceError(Exception):
         return self.message
 
 
+def get_document_generator(document_type):
+    """Returns a generator instance for a document type
+
+    Args:
+        document_type (str): Type of document to generate
+
+    Returns:
+        BaseDocumentGenerator: Generator for the document type
+
+    Raises:
+        ValueError: If the document type has no generator
+    """
+    if document_type not in DOCUMENT_GENERATOR_MAPPING:
+        raise ValueError(f"Unsupported document type: {document_type}")
+
+    return DOCUMENT_GENERATOR_MAPPING[document_type]()
+
+
+def get_package_document_types(package_type):
+    """Returns the document types included in a document package
+
+    Args:
+        package_type (str): Type of document package
+
+    Returns:
+        list: Document types generated for the package
+
+    Raises:
+        ValueError: If the package type is not supported
+    """
+    if package_type not in DOCUMENT_PACKAGE_TYPES.values():
+        raise ValueError(f"Unsupported document package type: {package_type}")
+
+    if package_type == DOCUMENT_PACKAGE_TYPES['APPLICATION']:
+        return [DOCUMENT_TYPES['DISCLOSURE_FORM']]
+    if package_type == DOCUMENT_PACKAGE_TYPES['APPROVAL']:
+        return [DOCUMENT_TYPES['COMMITMENT_LETTER']]
+    if package_type == DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT']:
+        return [DOCUMENT_TYPES['LOAN_AGREEMENT'], DOCUMENT_TYPES['TRUTH_IN_LENDING']]
+    if package_type == DOCUMENT_PACKAGE_TYPES['FUNDING']:
+        return [DOCUMENT_TYPES['DISBURSEMENT_AUTHORIZATION']]
+    return []
+
+
 def generate_document(document_type, application, generated_by, additional_context=None):
     """Generates a document of the specified type for a loan application
 
@@ -72,11 +118,7 @@ def generate_document(document_type, application, generated_by, additional_conte
         Document: Generated Document object
     """
     try:
-        if document_type not in DOCUMENT_GENERATOR_MAPPING:
-            raise ValueError(f"Unsupported document type: {document_type}")
-
-        generator_class = DOCUMENT_GENERATOR_MAPPING[document_type]
-        generator = generator_class()
+        generator = get_document_generator(document_type)
 
         document = generator.generate(application, generated_by, additional_context)
         logger.info(f"Document generated successfully: {document.id}")
@@ -86,10 +128,66 @@ def generate_document(document_type, application, generated_by, additional_conte
         raise
 
 
+def _prepare_package_documents(package_type, application, additional_context=None):
+    """Renders the HTML of every document in a package, ready for PDF conversion
+
+    Args:
+        package_type (str): Type of document package to generate
+        application (LoanApplication): Loan application object
+        additional_context (dict): Additional context for template rendering
+
+    Returns:
+        list: (generator, html_content, file_name) tuples, one per document
+    """
+    prepared = []
+    for document_type in get_package_document_types(package_type):
+        generator = get_document_generator(document_type)
+        html_content, file_name = generator.prepare(application, additional_context)
+        prepared.append((generator, html_content, file_name))
+    return prepared
+
+
 @transaction.atomic
+def _store_package_documents(package_type, application, generated_by, prepared, pdf_contents, content_hashes,
+                             stored_contents):
+    """Stores the converted documents of a package and updates the package status
+
+    Args:
+        package_type (str): Type of document package
+        application (LoanApplication): Loan application object
+        generated_by (User): User object generating the document package
+        prepared (list): (generator, html_content, file_name) tuples from _prepare_package_documents
+        pdf_contents (dict): PDF content of each converted document, keyed by its index in prepared
+        content_hashes (list): Content hash of each prepared document, in the same order
+        stored_contents (dict): Stored content for the hashes that were not converted again
+
+    Returns:
+        DocumentPackage: The document package
+    """
+    # Create or get an existing DocumentPackage for the application and package_type
+    document_package, created = DocumentPackage.objects.get_or_create(
+        application=application,
+        package_type=package_type,
+    )
+
+    for index, ((generator, _, file_name), content_hash) in enumerate(zip(prepared, content_hashes)):
+        if content_hash in stored_contents:
+            generator.store_existing(stored_contents[content_hash], file_name, application, generated_by)
+        else:
+            generator.store(pdf_contents[index], file_name, application, generated_by, content_hash)
+
+    # Update the package status based on document statuses
+    document_package.update_status()
+    return document_package
+
+
 def generate_document_package(package_type, application, generated_by, additional_context=None):
     """Generates a package of related documents for a loan application
 
+    The package's documents are converted to PDF in parallel by the rendering pool, and
+    only stored once all of them have been converted. Documents whose rendered HTML is
+    already stored, as when an unchanged package is regenerated, reuse the stored PDF.
+
     Args:
         package_type (str): Type of document package to generate
         application (LoanApplication): Loan application object
@@ -100,34 +198,18 @@ def generate_document_package(package_type, application, generated_by, additiona
         DocumentPackage: Generated DocumentPackage object with associated documents
     """
     try:
-        if package_type not in DOCUMENT_PACKAGE_TYPES:
-            raise ValueError(f"Unsupported document package type: {package_type}")
+        prepared = _prepare_package_documents(package_type, application, additional_context)
 
-        # Create or get an existing DocumentPackage for the application and package_type
-        document_package, created = DocumentPackage.objects.get_or_create(
-            application=application,
-            package_type=package_type,
-        )
+        content_hashes = [generator.get_content_hash(html_content) for generator, html_content, _ in prepared]
+        stored_contents = find_stored_content(content_hashes)
 
-        # Determine which document types should be included in the package
-        document_types = []
-        if package_type == DOCUMENT_PACKAGE_TYPES['APPLICATION']:
-            document_types = [DOCUMENT_TYPES['DISCLOSURE_FORM']]
-        elif package_type == DOCUMENT_PACKAGE_TYPES['APPROVAL']:
-            document_types = [DOCUMENT_TYPES['COMMITMENT_LETTER']]
-        elif package_type == DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT']:
-            document_types = [DOCUMENT_TYPES['LOAN_AGREEMENT'], DOCUMENT_TYPES['TRUTH_IN_LENDING']]
-        elif package_type == DOCUMENT_PACKAGE_TYPES['FUNDING']:
-            document_types = [DOCUMENT_TYPES['DISBURSEMENT_AUTHORIZATION']]
-
-        # For each document type, generate the document
-        documents = []
-        for document_type in document_types:
-            document = generate_document(document_type, application, generated_by, additional_context)
-            documents.append(document)
-
-        # Update the package status based on document statuses
-        document_package.update_status()
+        # Convert every new document in the package at once, outside the database transaction
+        missing = [index for index, content_hash in enumerate(content_hashes) if content_hash not in stored_contents]
+        pdf_contents = dict(zip(missing, pdf_rendering_service.render_batch([prepared[index][1] for index in missing])))
+
+        document_package = _store_package_documents(
+            package_type, application, generated_by, prepared, pdf_contents, content_hashes, stored_contents
+        )
 
         logger.info(f"Document package generated successfully: {document_package.id}")
         return document_package
@@ -136,6 +218,70 @@ def generate_document_package(package_type, application, generated_by, additiona
         raise
 
 
+def generate_documents_bulk(document_type, applications, generated_by, additional_context=None):
+    """Generates a document of the specified type for a batch of loan applications
+
+    Contexts for the whole batch are built from a fixed number of queries, school and
+    program data are shared across the batch, and the Document records are written with
+    bulk_create. An application that fails does not stop the others.
+
+    Args:
+        document_type (str): Type of document to generate
+        applications (iterable): LoanApplication objects or IDs
+        generated_by (User): User object generating the documents
+        additional_context (dict): Additional context for template rendering
+
+    Returns:
+        dict: Maps application ID to its Document, or to the exception that stopped it
+    """
+    generator = get_document_generator(document_type)
+    results = generator.generate_bulk(applications, generated_by, additional_context)
+    logger.info(f"Bulk generated {document_type} documents for {len(results)} applications")
+    return results
+
+
+def generate_document_packages(package_type, applications, generated_by, additional_context=None):
+    """Generates the same document package for a cohort of loan applications
+
+    Each document type in the package is generated for the whole cohort with
+    generate_documents_bulk; an application that fails one document type is skipped for
+    the rest and does not stop the others.
+
+    Args:
+        package_type (str): Type of document package to generate
+        applications (iterable): LoanApplication objects or IDs
+        generated_by (User): User object generating the document packages
+        additional_context (dict): Additional context for template rendering
+
+    Returns:
+        dict: Maps application ID to its DocumentPackage, or to the exception that stopped it
+    """
+    results = {}
+    packages = {}
+    remaining = list(applications)
+
+    for document_type in get_package_document_types(package_type):
+        documents = generate_documents_bulk(document_type, remaining, generated_by, additional_context)
+        for application_id, document in documents.items():
+            if isinstance(document, Exception):
+                results[application_id] = document
+                packages.pop(application_id, None)
+            else:
+                packages[application_id] = document.package
+        remaining = list(packages)
+
+    # Update the package status based on document statuses
+    for application_id, document_package in packages.items():
+        try:
+            document_package.update_status()
+            results[application_id] = document_package
+        except Exception as e:
+            logger.error(f"Error updating document package for application {application_id}: {e}", exc_info=True)
+            results[application_id] = e
+
+    return results
+
+
 def get_document_by_id(document_id):
     """Retrieves a document by its ID
 
@@ -298,17 +444,18 @@ def get_signature_status(document):
 
 
 @transaction.atomic
-def update_signature_status(document):
+def update_signature_status(document, envelope_statuses=None):
     """Updates the status of signatures for a document based on DocuSign status
 
     Args:
         document (Document): The document to update
+        envelope_statuses (dict): Envelope statuses already fetched, keyed by envelope ID
 
     Returns:
         bool: True if update was successful, False otherwise
     """
     try:
-        return docusign_service.update_signature_status(document)
+        return docusign_service.update_signature_status(document, envelope_statuses)
     except Exception as e:
         logger.error(f"Error updating signature status: {e}", exc_info=True)
         raise
@@ -328,9 +475,10 @@ def update_package_signature_status(package):
         # Get all documents in the package
         documents = package.get_documents()
 
-        # For each document, update signature status
+        # For each document, update signature status; documents sent in one envelope fetch it once
+        envelope_statuses = {}
         for document in documents:
-            update_signature_status(document)
+            update_signature_status(document, envelope_statuses)
 
         # Update package status based on document statuses
         package.update_status()
@@ -373,7 +521,7 @@ def process_signed_documents(document):
             raise ValueError(f"Document is not in a signed state: {document.status}")
 
         # Download signed documents from DocuSign
-        envelope_id = document.signature_requests.first().external_reference.split(':')[0]
+        envelope_id, _ = document.signature_requests.first().get_envelope_reference()
         documents = docusign_service.download_signed_documents(envelope_id)
 
         # Find the correct document in the downloaded documents
@@ -456,11 +604,9 @@ def void_signature_request(document, void_reason):
         # Group signature requests by envelope ID
         envelope_requests = {}
         for request in signature_requests:
-            if request.external_reference:
-                envelope_id, recipient_id = request.external_reference.split(':')
-                if envelope_id not in envelope_requests:
-                    envelope_requests[envelope_id] = []
-                envelope_requests[envelope_id].append((request, recipient_id))
+            envelope_id, recipient_id = request.get_envelope_reference()
+            if envelope_id:
+                envelope_requests.setdefault(envelope_id, []).append((request, recipient_id))
 
         # For each envelope, void
         for envelope_id, requests in envelope_requests.items():
@@ -72,16 +72,21 @@ class DocumentStorage:
         self.s3_storage = S3Storage(self.bucket_name, self.region_name)
         logger.info(f"Initialized DocumentStorage with bucket: {self.bucket_name}, region: {self.region_name}")
     
-    def store_document(self, content, document_type, file_name=None, content_type=None, metadata=None):
+    def store_document(self, content, document_type, file_name=None, content_type=None, metadata=None,
+                       content_hash=None):
         """
         Store a document in S3 with appropriate path based on document type.
         
+        When a content hash is given the document is stored under a key derived from the
+        hash, so documents with identical content share one object.
+        
         Args:
             content (bytes): Document content
             document_type (str): Type of document (e.g., 'loan_agreement', 'disclosure_form')
             file_name (str, optional): Name of the file (if not provided, one will be generated)
             content_type (str, optional): MIME type of the document
             metadata (dict, optional): Additional metadata to store with the document
+            content_hash (str, optional): Hash of the document content to store it under
             
         Returns:
             dict: Dictionary containing file path, version ID, and other storage details
@@ -103,8 +108,11 @@ class DocumentStorage:
             elif '.' not in file_name:
                 file_name = f"{file_name}.pdf"  # Add default extension if none present
             
-            # Construct the full S3 key (path + filename)
-            file_path = os.path.join(output_path, file_name)
+            # Construct the full S3 key (path + filename, or path + content hash)
+            if content_hash:
+                file_path = self.get_content_key(document_type, content_hash, os.path.splitext(file_name)[1])
+            else:
+                file_path = os.path.join(output_path, file_name)
             
             # Store the document with encryption enabled
             result = self.s3_storage.store(
@@ -218,6 +226,61 @@ class DocumentStorage:
             logger.error(error_message, exc_info=True)
             raise DocumentStorageError(error_message, e)
     
+    def retrieve_template(self, template_path, version_id=None):
+        """
+        Retrieve a document template from S3 by its path.
+
+        Args:
+            template_path (str): Path to the template in S3
+            version_id (str, optional): Specific version of the template to retrieve
+
+        Returns:
+            tuple: (content, content_type, metadata) tuple
+
+        Raises:
+            DocumentStorageError: If template retrieval fails
+        """
+        try:
+            content, content_type, metadata = self.s3_storage.retrieve(template_path, version_id)
+            logger.info(f"Successfully retrieved template: {template_path}")
+            return content, content_type, metadata
+        except StorageError as e:
+            error_message = f"Failed to retrieve template {template_path}: {str(e)}"
+            logger.error(error_message)
+            raise DocumentStorageError(error_message, e)
+        except Exception as e:
+            error_message = f"Unexpected error retrieving template {template_path}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentStorageError(error_message, e)
+
+    def get_template_version(self, template_path):
+        """
+        Get the current version of a document template without downloading it.
+
+        The S3 version ID is used when the bucket is versioned, otherwise the ETag,
+        so the result changes whenever the template content is replaced.
+
+        Args:
+            template_path (str): Path to the template in S3
+
+        Returns:
+            tuple: (version, version_id) tuple; version_id is None for unversioned buckets
+
+        Raises:
+            DocumentStorageError: If the template cannot be found
+        """
+        try:
+            info = self.s3_storage.get_object_info(template_path)
+            return info['version_id'] or info['etag'], info['version_id']
+        except StorageError as e:
+            error_message = f"Failed to get version of template {template_path}: {str(e)}"
+            logger.error(error_message)
+            raise DocumentStorageError(error_message, e)
+        except Exception as e:
+            error_message = f"Unexpected error getting version of template {template_path}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentStorageError(error_message, e)
+
     def delete_document(self, file_path, version_id=None):
         """
         Delete a document from S3 by its file path.
@@ -245,6 +308,58 @@ class DocumentStorage:
             logger.error(error_message, exc_info=True)
             raise DocumentStorageError(error_message, e)
     
+    def delete_documents(self, file_paths):
+        """
+        Delete many documents from S3 with batched requests.
+        
+        Args:
+            file_paths (iterable): Paths to the documents in S3
+            
+        Returns:
+            dict: Lists of 'deleted' paths and of 'errors' for paths that could not be deleted
+            
+        Raises:
+            DocumentStorageError: If a delete request fails as a whole
+        """
+        try:
+            result = self.s3_storage.delete_many(file_paths)
+            logger.info(f"Successfully deleted {len(result['deleted'])} documents")
+            return result
+        except StorageError as e:
+            error_message = f"Failed to delete documents: {str(e)}"
+            logger.error(error_message)
+            raise DocumentStorageError(error_message, e)
+        except Exception as e:
+            error_message = f"Unexpected error deleting documents: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentStorageError(error_message, e)
+    
+    def download_document(self, file_path, file_obj, version_id=None):
+        """
+        Download a document from S3 into a file, fetching large documents in parallel parts.
+        
+        Args:
+            file_path (str): Path to the document in S3
+            file_obj: Writable binary file-like object
+            version_id (str, optional): Specific version of the document to download
+            
+        Returns:
+            bool: True if the download was successful
+            
+        Raises:
+            DocumentStorageError: If the download fails
+        """
+        try:
+            return self.s3_storage.download(file_path, file_obj, version_id)
+        except StorageError as e:
+            error_message = f"Failed to download document {file_path}: {str(e)}"
+            logger.error(error_message)
+            raise DocumentStorageError(error_message, e)
+        except Exception as e:
+            error_message = f"Unexpected error downloading document {file_path}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise DocumentStorageError(error_message, e)
+    
     def get_document_url(self, file_path, expiration=3600, version_id=None):
         """
         Generate a presigned URL for temporary access to a document.
@@ -351,4 +466,28 @@ class DocumentStorage:
         unique_id = str(uuid.uuid4().hex[:8])
         
         # Construct and return the file name
-        return f"{timestamp}_{unique_id}{extension}"
\ No newline at end of file
+        return f"{timestamp}_{unique_id}{extension}"
+    
+    def get_content_key(self, document_type, content_hash, extension='.pdf'):
+        """
+        Build the S3 key of a content-addressed document.
+        
+        Args:
+            document_type (str): Type of document
+            content_hash (str): Hash of the document content
+            extension (str): File extension (with dot, e.g. '.pdf')
+            
+        Returns:
+            str: S3 key for the content
+            
+        Raises:
+            ValueError: If the document type is unknown
+        """
+        if document_type not in DOCUMENT_OUTPUT_PATHS:
+            raise ValueError(f"Unknown document type: {document_type}")
+        
+        return os.path.join(DOCUMENT_OUTPUT_PATHS[document_type], 'content', f"{content_hash}{extension or '.pdf'}")
+
+
+# Shared document storage instance
+document_storage = DocumentStorage()
@@ -0,0 +1,92 @@
+"""
+Defines Celery tasks for document generation.
+
+This module includes the batch task that generates the same document package for a whole
+cohort of loan applications, building each chunk's contexts with set-based queries and
+converting its documents to PDF in parallel, and the periodic task that reconciles
+signature statuses with DocuSign.
+"""
+
+import logging
+
+from config.celery import app
+from apps.users.models import User
+from .services import generate_document_packages
+from .reconciliation import envelope_reconciler
+from .constants import DOCUMENT_RENDER_BATCH_SIZE
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def generate_document_packages_batch(package_type, application_ids, generated_by_id,
+                                     additional_context=None, batch_size=DOCUMENT_RENDER_BATCH_SIZE):
+    """
+    Celery task to generate a document package for every application in a cohort.
+
+    Applications are processed in chunks of batch_size; each document type of a chunk is
+    generated with generate_documents_bulk, so its documents are rendered together and
+    stored with bulk_create.
+
+    Args:
+        package_type (str): Type of document package to generate
+        application_ids (list): IDs of the loan applications
+        generated_by_id (UUID): ID of the user generating the packages
+        additional_context (dict): Additional context for template rendering
+        batch_size (int): Number of applications rendered together
+
+    Returns:
+        dict: Counts of generated and failed packages, and the error of each failed application
+    """
+    generated_by = User.objects.get(id=generated_by_id)
+    application_ids = list(application_ids)
+    generated = 0
+    errors = {}
+
+    for start in range(0, len(application_ids), batch_size):
+        chunk_ids = application_ids[start:start + batch_size]
+
+        try:
+            # Applications are loaded with their document context in a fixed number of queries
+            results = generate_document_packages(package_type, chunk_ids, generated_by, additional_context)
+        except Exception as e:
+            # One failing chunk should not hold back the rest of the cohort
+            logger.exception(f"Error generating {package_type} packages for chunk starting at {start}: {str(e)}")
+            results = {application_id: e for application_id in chunk_ids}
+
+        missing_ids = {str(application_id) for application_id in chunk_ids} - {
+            str(application_id) for application_id in results
+        }
+        for application_id in missing_ids:
+            errors[application_id] = 'Application not found'
+
+        for application_id, result in results.items():
+            if isinstance(result, Exception):
+                errors[str(application_id)] = str(result)
+            else:
+                generated += 1
+
+    logger.info(
+        f"Generated {generated} {package_type} packages, {len(errors)} failed, "
+        f"for {len(application_ids)} applications"
+    )
+    return {
+        'generated': generated,
+        'failed': len(errors),
+        'errors': errors,
+    }
+
+
+@app.task
+def reconcile_envelope_statuses():
+    """
+    Periodic Celery task that applies DocuSign envelope status changes in bulk.
+
+    Lists the envelopes changed since the last run, with their recipients, and updates
+    signature requests, documents and packages in bulk transactions.
+
+    Returns:
+        dict: The window read and the number of envelopes and records updated
+    """
+    return envelope_reconciler.reconcile()
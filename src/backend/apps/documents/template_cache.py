@@ -0,0 +1,271 @@
+"""
+Process-local caches for document generation templates.
+
+Every document generator renders through one shared Jinja2 environment. Compiled templates
+are kept in a bounded LRU keyed by template path and S3 version (the version ID when the
+bucket is versioned, otherwise the ETag), so replacing a template in S3 causes it to be
+recompiled on its next use. The current version of each path is checked with a HEAD request
+at most once per DOCUMENT_TEMPLATE_VERSION_TTL_SECONDS.
+
+Template bytecode is also written to a filesystem bytecode cache shared by every process on
+the host, so new workers load templates without recompiling them. Saving a DocumentTemplate
+evicts its entries in the saving process; other processes pick up the change when their
+version check expires.
+"""
+
+import logging  # standard library
+import threading  # standard library
+import time  # standard library
+from collections import OrderedDict  # standard library
+
+import jinja2  # version 3.1+
+from django.conf import settings  # Django 4.2+
+
+from .constants import (
+    DOCUMENT_TEMPLATE_PATHS, DOCUMENT_TEMPLATE_CACHE_SIZE, DOCUMENT_TEMPLATE_VERSION_TTL_SECONDS
+)
+
+# Configure logger
+logger = logging.getLogger('document_generators')
+
+
+def _currency(value):
+    """Formats a number as a dollar amount."""
+    return f"${value:,.2f}" if value is not None else ""
+
+
+def _percentage(value):
+    """Formats a number as a percentage."""
+    return f"{value:.2f}%" if value is not None else ""
+
+
+def _create_environment():
+    """
+    Creates the Jinja2 environment shared by all document generators.
+
+    Returns:
+        jinja2.Environment: Configured environment with the document filters
+    """
+    bytecode_dir = getattr(settings, 'DOCUMENT_TEMPLATE_BYTECODE_CACHE_DIR', None)
+    env = jinja2.Environment(
+        loader=jinja2.BaseLoader(),
+        autoescape=jinja2.select_autoescape(['html', 'xml']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(bytecode_dir),
+        # Compiled templates are cached below, keyed by S3 version
+        cache_size=0
+    )
+    env.filters['currency'] = _currency
+    env.filters['percentage'] = _percentage
+    return env
+
+
+class _DocumentTemplateCache:
+    """
+    Bounded LRU of compiled templates keyed by (template path, S3 version).
+    """
+
+    def __init__(self, max_size=DOCUMENT_TEMPLATE_CACHE_SIZE,
+                 ttl_seconds=DOCUMENT_TEMPLATE_VERSION_TTL_SECONDS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of compiled templates kept
+            ttl_seconds (int): How long a template's S3 version is reused
+        """
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._compiled = OrderedDict()
+        self._versions = {}
+        self._environment = None
+
+    @property
+    def environment(self):
+        """
+        The shared Jinja2 environment, created on first use.
+
+        Returns:
+            jinja2.Environment: The shared environment
+        """
+        if self._environment is None:
+            with self._lock:
+                if self._environment is None:
+                    self._environment = _create_environment()
+        return self._environment
+
+    def get(self, template_path, storage):
+        """
+        Returns the compiled template for a path, compiling the current S3 version on a miss.
+
+        Args:
+            template_path (str): Path to the template in S3
+            storage (DocumentStorage): Storage used to look up and download the template
+
+        Returns:
+            jinja2.Template: The compiled template
+        """
+        version, version_id = self._get_version(template_path, storage)
+        key = (template_path, version)
+
+        with self._lock:
+            template = self._compiled.get(key)
+            if template is not None:
+                self._compiled.move_to_end(key)
+                return template
+
+        # Compile outside the lock; a concurrent miss compiles the same template twice at worst
+        content, _, _ = storage.retrieve_template(template_path, version_id)
+        if not content:
+            raise ValueError(f"Template content is empty for {template_path}")
+        template = self._compile(content.decode('utf-8'), template_path, version)
+
+        with self._lock:
+            self._compiled[key] = template
+            self._compiled.move_to_end(key)
+            while len(self._compiled) > self._max_size:
+                self._compiled.popitem(last=False)
+        return template
+
+    def _get_version(self, template_path, storage):
+        """
+        Returns the current S3 version of a template, checking S3 when the last check expired.
+
+        Args:
+            template_path (str): Path to the template in S3
+            storage (DocumentStorage): Storage used to look up the template
+
+        Returns:
+            tuple: (version, version_id) tuple
+        """
+        now = time.monotonic()
+        entry = self._versions.get(template_path)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        version = storage.get_template_version(template_path)
+        with self._lock:
+            self._versions[template_path] = (version, now + self._ttl_seconds)
+        return version
+
+    def _compile(self, source, template_path, version):
+        """
+        Compiles template source, reusing bytecode from the shared bytecode cache.
+
+        Args:
+            source (str): Template source
+            template_path (str): Path to the template in S3, used as the template name
+            version (str): S3 version of the source
+
+        Returns:
+            jinja2.Template: The compiled template
+        """
+        env = self.environment
+        filename = f"{template_path}@{version}"
+
+        # Same steps as jinja2.BaseLoader.load, for source that does not come from a loader
+        bucket = env.bytecode_cache.get_bucket(env, template_path, filename, source)
+        code = bucket.code
+        if code is None:
+            code = env.compile(source, template_path, filename)
+            bucket.code = code
+            env.bytecode_cache.set_bucket(bucket)
+
+        return env.template_class.from_code(env, code, env.make_globals(None))
+
+    def invalidate(self, template_path):
+        """
+        Drops every compiled version of a template and its version check.
+
+        Args:
+            template_path (str): Path to the template in S3
+        """
+        with self._lock:
+            self._versions.pop(template_path, None)
+            for key in [key for key in self._compiled if key[0] == template_path]:
+                del self._compiled[key]
+
+    def clear(self):
+        """
+        Drops all compiled templates and version checks.
+        """
+        with self._lock:
+            self._compiled.clear()
+            self._versions.clear()
+
+
+_document_templates = _DocumentTemplateCache()
+
+
+def get_template_environment():
+    """
+    Returns the Jinja2 environment shared by all document generators.
+
+    Returns:
+        jinja2.Environment: The shared environment
+    """
+    return _document_templates.environment
+
+
+def get_compiled_template(template_path, storage=None):
+    """
+    Returns the compiled template for a template path at its current S3 version.
+
+    Args:
+        template_path (str): Path to the template in S3
+        storage (DocumentStorage, optional): Storage to read from; defaults to document_storage
+
+    Returns:
+        jinja2.Template: The compiled template
+
+    Raises:
+        ValueError: If the template is empty
+        DocumentStorageError: If the template cannot be read from storage
+    """
+    if storage is None:
+        from .models import document_storage
+        storage = document_storage
+    return _document_templates.get(template_path, storage)
+
+
+def invalidate_document_template(*template_paths):
+    """
+    Evicts the compiled versions of one or more templates.
+
+    Args:
+        template_paths (str): Paths of the templates in S3
+    """
+    for template_path in template_paths:
+        if template_path:
+            _document_templates.invalidate(template_path)
+
+
+def clear_document_template_cache():
+    """
+    Clears the per-process document template cache.
+    """
+    _document_templates.clear()
+
+
+def preload_document_templates(storage=None):
+    """
+    Compiles every template in DOCUMENT_TEMPLATE_PATHS so the first documents do not pay for it.
+
+    Args:
+        storage (DocumentStorage, optional): Storage to read from; defaults to document_storage
+
+    Returns:
+        dict: Map of document type to None on success, or the error message on failure
+    """
+    results = {}
+    for document_type, template_path in DOCUMENT_TEMPLATE_PATHS.items():
+        try:
+            get_compiled_template(template_path, storage)
+            results[document_type] = None
+        except Exception as e:
+            # A missing template should not stop the others from loading
+            logger.warning(f"Failed to preload {document_type} template {template_path}: {str(e)}")
+            results[document_type] = str(e)
+    return results
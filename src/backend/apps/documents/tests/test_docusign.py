@@ -1,20 +1,25 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 import json
 from datetime import datetime, timedelta
 import uuid
 
 import docusign_esign  # version 3.20.0+
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import IntegrityError
+from django.test import TestCase
 
-from src.backend.apps.documents.docusign import DocuSignService, DocuSignError
-from src.backend.apps.documents.models import Document, DocumentPackage, SignatureRequest, DocumentField
-from src.backend.apps.documents.constants import (
+from utils.token_cache import TokenCache
+
+from apps.documents.docusign import DocuSignService, DocuSignError
+from apps.documents.models import Document, DocumentPackage, SignatureRequest, DocumentField
+from apps.documents.constants import (
     DOCUMENT_TYPES, SIGNATURE_STATUS, SIGNER_TYPES,
     DOCUSIGN_ENVELOPE_STATUS_MAPPING, DOCUSIGN_RECIPIENT_STATUS_MAPPING
 )
 
 
-class TestDocuSignService(unittest.TestCase):
+class TestDocuSignService(TestCase):
     """
     Test case for the DocuSignService class
     """
@@ -30,6 +35,17 @@ class TestDocuSignService(unittest.TestCase):
         """
         Set up test environment before each test
         """
+        # Isolate the shared token cache so tokens do not leak between tests
+        self.token_cache_patch = patch(
+            'apps.documents.docusign.token_cache',
+            TokenCache(cache=LocMemCache(f'docusign-tokens-{uuid.uuid4()}', {}))
+        )
+        self.token_cache_patch.start()
+        self.private_key_patch = patch(
+            'apps.documents.docusign._read_private_key', return_value='private-key'
+        )
+        self.private_key_patch.start()
+
         # Create a DocuSignService instance
         self.docusign_service = DocuSignService()
 
@@ -60,7 +76,8 @@ class TestDocuSignService(unittest.TestCase):
         Clean up test environment after each test
         """
         # Clean up any resources created during tests
-        pass
+        self.token_cache_patch.stop()
+        self.private_key_patch.stop()
 
     @patch('docusign_esign.ApiClient.request_jwt_user_token')
     def test_authenticate_success(self, mock_request_jwt_user_token):
@@ -82,6 +99,24 @@ class TestDocuSignService(unittest.TestCase):
         # Verify API client was configured with token
         self.assertEqual(self.docusign_service.api_client.default_headers['Authorization'], 'Bearer mock_access_token')
 
+    @patch('docusign_esign.ApiClient.request_jwt_user_token')
+    def test_authenticate_reuses_shared_token(self, mock_request_jwt_user_token):
+        """
+        Test that service instances share one access token and API client
+        """
+        mock_request_jwt_user_token.return_value.access_token = 'mock_access_token'
+        mock_request_jwt_user_token.return_value.expires_in = 3600
+
+        other_service = DocuSignService()
+        self.docusign_service.authenticate()
+        other_service.authenticate()
+        self.docusign_service.authenticate()
+
+        # Only one JWT grant is requested, and both services use the same connection pool
+        mock_request_jwt_user_token.assert_called_once()
+        self.assertEqual(other_service.access_token, 'mock_access_token')
+        self.assertIs(other_service.api_client, self.docusign_service.api_client)
+
     @patch('docusign_esign.ApiClient.request_jwt_user_token')
     def test_authenticate_failure(self, mock_request_jwt_user_token):
         """
@@ -100,7 +135,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify error was handled properly
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.create_envelope')
     def test_create_signature_request_success(self, mock_create_envelope, mock_authenticate):
         """
@@ -133,7 +168,7 @@ class TestDocuSignService(unittest.TestCase):
         # Verify envelope ID was returned
         self.assertEqual(mock_create_envelope.call_count, 1)
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.create_envelope')
     def test_create_signature_request_failure(self, mock_create_envelope, mock_authenticate):
         """
@@ -164,7 +199,7 @@ class TestDocuSignService(unittest.TestCase):
         # Verify error message contains original exception details
         self.assertIn('Invalid request', str(context.exception))
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.create_envelope')
     def test_create_signature_request_for_package_success(self, mock_create_envelope, mock_authenticate):
         """
@@ -206,7 +241,7 @@ class TestDocuSignService(unittest.TestCase):
         # Verify envelope ID was returned
         self.assertEqual(mock_create_envelope.call_count, 1)
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.get_envelope')
     def test_get_envelope_status_success(self, mock_get_envelope, mock_authenticate):
         """
@@ -238,7 +273,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify recipient information was included
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.list_recipients')
     def test_get_recipient_status_success(self, mock_list_recipients, mock_authenticate):
         """
@@ -261,9 +296,9 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify recipient details were included
 
-    @patch('src.backend.apps.documents.models.SignatureRequest.objects.filter')
-    @patch('src.backend.apps.documents.docusign.DocuSignService.get_envelope_status')
-    @patch('src.backend.apps.documents.docusign.DocuSignService.get_recipient_status')
+    @patch('apps.documents.models.SignatureRequest.objects.filter')
+    @patch('apps.documents.docusign.DocuSignService.get_envelope_status')
+    @patch('apps.documents.docusign.DocuSignService.get_recipient_status')
     def test_get_signature_status_success(self, mock_get_recipient_status, mock_get_envelope_status, mock_signature_requests_filter):
         """
         Test successful retrieval of signature status for a document
@@ -306,9 +341,9 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify envelope and recipient information was included
 
-    @patch('src.backend.apps.documents.models.SignatureRequest.objects.filter')
-    @patch('src.backend.apps.documents.docusign.DocuSignService.get_envelope_status')
-    @patch('src.backend.apps.documents.docusign.DocuSignService.get_recipient_status')
+    @patch('apps.documents.models.SignatureRequest.objects.filter')
+    @patch('apps.documents.docusign.DocuSignService.get_envelope_status')
+    @patch('apps.documents.docusign.DocuSignService.get_recipient_status')
     def test_update_signature_status_success(self, mock_get_recipient_status, mock_get_envelope_status, mock_signature_requests_filter):
         """
         Test successful update of signature status
@@ -349,9 +384,13 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify transaction was used for updates
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.get_envelope_status')
-    @patch('src.backend.apps.documents.models.SignatureRequest.objects.filter')
-    def test_process_webhook_event_success(self, mock_signature_requests_filter, mock_get_envelope_status):
+    @patch('apps.documents.docusign.DocuSignService.get_envelope_status')
+    @patch('apps.documents.models.Document.save')
+    @patch('apps.documents.models.SignatureRequest.save')
+    @patch('apps.documents.models.SignatureRequest.objects.filter')
+    @patch('apps.documents.models.SignatureRequest.objects.for_envelope')
+    def test_process_webhook_event_success(self, mock_for_envelope, mock_signature_requests_filter,
+                                           mock_signature_request_save, mock_document_save, mock_get_envelope_status):
         """
         Test successful processing of DocuSign webhook event
         """
@@ -379,9 +418,15 @@ class TestDocuSignService(unittest.TestCase):
             signer_id=uuid.uuid4(),
             signer_type=SIGNER_TYPES['BORROWER'],
             status=SIGNATURE_STATUS['SENT'],
-            external_reference=f"{self.mock_envelope_id}:1"
+            external_reference=f"{self.mock_envelope_id}:1",
+            envelope_id=self.mock_envelope_id,
+            recipient_id='1'
         )
-        mock_signature_requests_filter.return_value = [mock_signature_request]
+        mock_for_envelope.return_value = [mock_signature_request]
+        mock_signature_requests = MagicMock()
+        mock_signature_requests.exists.return_value = True
+        mock_signature_requests.__iter__.return_value = iter([mock_signature_request])
+        mock_signature_requests_filter.return_value = mock_signature_requests
 
         # Call process_webhook_event method
         result = self.docusign_service.process_webhook_event(mock_webhook_data)
@@ -393,9 +438,59 @@ class TestDocuSignService(unittest.TestCase):
         self.assertEqual(len(result['updated_requests']), 1)
         self.assertEqual(result['updated_requests'][0]['new_status'], SIGNATURE_STATUS['COMPLETED'])
 
-        # Verify processing results were returned
+        mock_signature_request_save.assert_called_once()
+
+        # Verify the envelope was looked up through the index and fetched once
+        mock_for_envelope.assert_called_once_with(self.mock_envelope_id)
+        mock_get_envelope_status.assert_called_once_with(self.mock_envelope_id)
+
+    @patch('apps.documents.docusign.DocuSignService.get_envelope_status')
+    @patch('apps.documents.models.SignatureRequest.objects.for_envelope')
+    @patch('apps.documents.models.DocuSignWebhookEvent.objects.create')
+    def test_process_webhook_event_duplicate(self, mock_create_event, mock_for_envelope, mock_get_envelope_status):
+        """
+        Test that a retried delivery of a processed webhook event is skipped
+        """
+        mock_webhook_data = {
+            'event': 'recipient-completed',
+            'eventId': 'event-1',
+            'data': {
+                'envelopeId': self.mock_envelope_id
+            }
+        }
+        mock_create_event.side_effect = IntegrityError('duplicate key value violates unique constraint')
+
+        result = self.docusign_service.process_webhook_event(mock_webhook_data)
+
+        self.assertEqual(result['status'], 'duplicate')
+        mock_create_event.assert_called_once_with(
+            event_id='event-1', event='recipient-completed', envelope_id=self.mock_envelope_id
+        )
+        mock_for_envelope.assert_not_called()
+        mock_get_envelope_status.assert_not_called()
+
+    def test_get_webhook_event_id(self):
+        """
+        Test that webhook deliveries are identified by event ID or by their generation time
+        """
+        delivery = {
+            'event': 'recipient-completed',
+            'generatedDateTime': '2024-01-01T00:00:00Z',
+            'data': {'envelopeId': self.mock_envelope_id}
+        }
+
+        self.assertEqual(self.docusign_service.get_webhook_event_id({**delivery, 'eventId': 'event-1'}), 'event-1')
+        self.assertEqual(
+            self.docusign_service.get_webhook_event_id(delivery),
+            self.docusign_service.get_webhook_event_id(dict(delivery))
+        )
+        self.assertNotEqual(
+            self.docusign_service.get_webhook_event_id(delivery),
+            self.docusign_service.get_webhook_event_id({**delivery, 'generatedDateTime': '2024-01-01T00:05:00Z'})
+        )
+        self.assertIsNone(self.docusign_service.get_webhook_event_id({'event': 'x', 'data': {}}))
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.list_documents')
     @patch('docusign_esign.EnvelopesApi.get_document')
     def test_download_signed_documents_success(self, mock_get_document, mock_list_documents, mock_authenticate):
@@ -424,7 +519,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify document content and metadata were returned
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.get_document')
     def test_download_signed_document_success(self, mock_get_document, mock_authenticate):
         """
@@ -444,7 +539,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify document content and metadata were returned
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.update')
     def test_void_envelope_success(self, mock_update, mock_authenticate):
         """
@@ -464,7 +559,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify success result was returned
 
-    @patch('src.backend.apps.documents.docusign.DocuSignService.authenticate')
+    @patch('apps.documents.docusign.DocuSignService.authenticate')
     @patch('docusign_esign.EnvelopesApi.create_recipient_view')
     def test_create_embedded_signing_url_success(self, mock_create_recipient_view, mock_authenticate):
         """
@@ -489,7 +584,7 @@ class TestDocuSignService(unittest.TestCase):
 
         # Verify signing URL was returned
 
-    @patch('src.backend.apps.documents.models.DocumentField.to_docusign_tab')
+    @patch('apps.documents.models.DocumentField.to_docusign_tab')
     def test_create_recipient_tabs_success(self, mock_to_docusign_tab):
         """
         Test successful creation of recipient tabs (signature fields)
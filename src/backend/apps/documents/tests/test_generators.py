@@ -0,0 +1,355 @@
+import datetime
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from django.test import TestCase
+
+from core.signals import model_change_signal
+from ..template_cache import _DocumentTemplateCache, preload_document_templates
+from ..generators.base import BaseDocumentGenerator, DocumentGenerationError
+from ..models import Document, DocumentContent, DocumentPackage
+from ..constants import (
+    DOCUMENT_TEMPLATE_PATHS, DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_PACKAGE_TYPES, DOCUMENT_EXPIRATION_DAYS
+)
+from apps.applications.models import LoanApplication
+from apps.authentication.models import Auth0User
+from apps.schools.models import School, Program, ProgramVersion
+from apps.users.models import User
+from utils.constants import USER_TYPES
+
+# Test constants
+TEMPLATE_PATH = DOCUMENT_TEMPLATE_PATHS['commitment_letter']
+
+
+class TestDocumentTemplateCache(unittest.TestCase):
+    """Test case for the per-process compiled document template cache"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.bytecode_dir = tempfile.mkdtemp()
+        self.settings_patch = patch('apps.documents.template_cache.settings')
+        self.mock_settings = self.settings_patch.start()
+        self.mock_settings.DOCUMENT_TEMPLATE_BYTECODE_CACHE_DIR = self.bytecode_dir
+
+        self.storage = MagicMock()
+        self.storage.get_template_version.return_value = ('v1', 'v1')
+        self.storage.retrieve_template.return_value = (
+            b'Dear {{ name }}, your loan is {{ amount|currency }}', 'text/html', {}
+        )
+        self.cache = _DocumentTemplateCache()
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.settings_patch.stop()
+        shutil.rmtree(self.bytecode_dir, ignore_errors=True)
+
+    def test_template_is_compiled_once_per_version(self):
+        """Test that repeated lookups reuse the compiled template and version check"""
+        first = self.cache.get(TEMPLATE_PATH, self.storage)
+        second = self.cache.get(TEMPLATE_PATH, self.storage)
+
+        self.assertIs(first, second)
+        self.storage.retrieve_template.assert_called_once_with(TEMPLATE_PATH, 'v1')
+        self.storage.get_template_version.assert_called_once_with(TEMPLATE_PATH)
+        self.assertEqual(
+            first.render(name='Jane', amount=12500),
+            'Dear Jane, your loan is $12,500.00'
+        )
+
+    def test_new_version_is_recompiled(self):
+        """Test that a changed S3 version is downloaded and compiled again"""
+        cache = _DocumentTemplateCache(ttl_seconds=0)
+        cache.get(TEMPLATE_PATH, self.storage)
+
+        self.storage.get_template_version.return_value = ('etag-2', None)
+        self.storage.retrieve_template.return_value = (b'Hello {{ name }}', 'text/html', {})
+        template = cache.get(TEMPLATE_PATH, self.storage)
+
+        self.storage.retrieve_template.assert_called_with(TEMPLATE_PATH, None)
+        self.assertEqual(template.render(name='Jane'), 'Hello Jane')
+
+    def test_invalidate_forces_version_check(self):
+        """Test that invalidating a path drops its compiled template and version"""
+        self.cache.get(TEMPLATE_PATH, self.storage)
+        self.cache.invalidate(TEMPLATE_PATH)
+        self.cache.get(TEMPLATE_PATH, self.storage)
+
+        self.assertEqual(self.storage.get_template_version.call_count, 2)
+        self.assertEqual(self.storage.retrieve_template.call_count, 2)
+
+    def test_bytecode_is_shared_between_caches(self):
+        """Test that a new process reuses bytecode instead of recompiling the source"""
+        self.cache.get(TEMPLATE_PATH, self.storage)
+
+        other_cache = _DocumentTemplateCache()
+        with patch.object(other_cache.environment, 'compile') as mock_compile:
+            template = other_cache.get(TEMPLATE_PATH, self.storage)
+
+        mock_compile.assert_not_called()
+        self.assertEqual(template.render(name='Jane', amount=None), 'Dear Jane, your loan is ')
+
+    def test_empty_template_raises(self):
+        """Test that an empty template is rejected"""
+        self.storage.retrieve_template.return_value = (b'', 'text/html', {})
+
+        with self.assertRaises(ValueError):
+            self.cache.get(TEMPLATE_PATH, self.storage)
+
+    @patch('apps.documents.template_cache.get_compiled_template')
+    def test_preload_reports_failures(self, mock_get_compiled_template):
+        """Test that preloading continues past templates that fail to load"""
+        mock_get_compiled_template.side_effect = [ValueError('missing')] + [MagicMock()] * (
+            len(DOCUMENT_TEMPLATE_PATHS) - 1
+        )
+
+        results = preload_document_templates(self.storage)
+
+        self.assertEqual(set(results), set(DOCUMENT_TEMPLATE_PATHS))
+        self.assertEqual([error for error in results.values() if error], ['missing'])
+        self.assertEqual(mock_get_compiled_template.call_count, len(DOCUMENT_TEMPLATE_PATHS))
+
+
+class _TestGenerator(BaseDocumentGenerator):
+    """Minimal generator used to exercise the bulk generation path"""
+
+    def __init__(self):
+        super().__init__(DOCUMENT_TYPES['LOAN_AGREEMENT'])
+
+    def _generate_file_name(self, application):
+        return f"{application.id}.pdf"
+
+
+def create_mock_application(application_id, school, program):
+    """Creates a mock LoanApplication without borrower, loan or decision data"""
+    application = MagicMock()
+    application.id = application_id
+    application.borrower.get_profile.return_value = None
+    application.co_borrower = None
+    application.school = school
+    application.program = program
+    application.get_loan_details.return_value = None
+    application.get_underwriting_decision.return_value = None
+    return application
+
+
+class TestBaseDocumentGeneratorBulk(unittest.TestCase):
+    """Test case for generating one document type for a batch of applications"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.school = MagicMock(id='school-1', legal_name='Test School LLC', phone='555', website='x')
+        self.school.name = 'Test School'
+        self.program = MagicMock(id='program-1', description='', duration_hours=10, duration_weeks=2)
+        self.program.name = 'Test Program'
+        self.applications = [create_mock_application(f'app-{i}', self.school, self.program) for i in range(3)]
+        self.user = MagicMock(id='user-1')
+
+        self.generator = _TestGenerator()
+        self.template = MagicMock()
+        self.template.render.side_effect = lambda **context: f"<p>{context['application_id']}</p>"
+
+        self.patches = [
+            patch('apps.documents.generators.base.prefetch_document_context',
+                  return_value=self.applications),
+            patch('apps.documents.generators.base.pdf_rendering_service'),
+            patch('apps.documents.generators.base.document_storage'),
+            patch.object(_TestGenerator, '_get_template', return_value=self.template),
+            patch.object(_TestGenerator, '_bulk_create_documents'),
+            patch('apps.documents.generators.base.find_stored_content', return_value={}),
+        ]
+        (self.mock_prefetch, self.mock_rendering, self.mock_storage, _, self.mock_bulk_create,
+         self.mock_find_stored) = [p.start() for p in self.patches]
+        self.mock_rendering.render_batch.side_effect = lambda documents, return_exceptions: [
+            html.encode() for html in documents
+        ]
+        self.mock_storage.store_document.side_effect = lambda content, file_name, **kwargs: {
+            'key': f'documents/{file_name}', 'version_id': '1'
+        }
+        self.mock_bulk_create.side_effect = lambda uploaded, generated_by: {
+            application.id: MagicMock(file_path=storage_result['key'])
+            for application, _, storage_result, _ in uploaded
+        }
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        for p in self.patches:
+            p.stop()
+
+    def test_school_and_program_context_is_shared(self):
+        """Test that school and program data is built once per batch"""
+        results = self.generator.generate_bulk(self.applications, self.user)
+
+        self.assertEqual(len(results), 3)
+        self.school.get_primary_contact.assert_called_once()
+        self.program.get_current_tuition.assert_called_once()
+        self.mock_rendering.render_batch.assert_called_once()
+        self.mock_bulk_create.assert_called_once()
+        self.assertIsNone(self.generator._shared_context)
+
+    def test_single_document_does_not_share_context(self):
+        """Test that context is rebuilt outside a bulk run"""
+        self.generator.prepare(self.applications[0])
+        self.generator.prepare(self.applications[1])
+
+        self.assertEqual(self.school.get_primary_contact.call_count, 2)
+
+    def test_failed_application_is_isolated(self):
+        """Test that one failed render does not stop the rest of the batch"""
+        self.mock_rendering.render_batch.side_effect = lambda documents, return_exceptions: [
+            ValueError('bad html') if html == '<p>app-1</p>' else html.encode() for html in documents
+        ]
+
+        results = self.generator.generate_bulk(self.applications, self.user)
+
+        self.assertIsInstance(results['app-1'], DocumentGenerationError)
+        self.assertEqual(results['app-0'].file_path, 'documents/app-0.pdf')
+        uploaded = self.mock_bulk_create.call_args[0][0]
+        self.assertEqual([application.id for application, _, _, _ in uploaded], ['app-0', 'app-2'])
+        self.assertEqual(self.mock_storage.store_document.call_count, 2)
+
+    def test_stored_content_is_reused(self):
+        """Test that documents whose content is already stored are not rendered or uploaded"""
+        stored_hash = self.generator.get_content_hash('<p>app-1</p>')
+        stored_content = MagicMock(content_hash=stored_hash)
+        stored_content.get_storage_result.return_value = {'key': f'documents/content/{stored_hash}.pdf'}
+        self.mock_find_stored.return_value = {stored_hash: stored_content}
+
+        results = self.generator.generate_bulk(self.applications, self.user)
+
+        rendered = self.mock_rendering.render_batch.call_args[0][0]
+        self.assertEqual(rendered, ['<p>app-0</p>', '<p>app-2</p>'])
+        self.assertEqual(self.mock_storage.store_document.call_count, 2)
+        self.assertEqual(results['app-1'].file_path, f'documents/content/{stored_hash}.pdf')
+        uploaded = self.mock_bulk_create.call_args[0][0]
+        self.assertEqual([content_hash for _, _, _, content_hash in uploaded][1], stored_hash)
+
+    def test_identical_content_is_rendered_once(self):
+        """Test that applications with identical HTML share one rendered and uploaded PDF"""
+        self.template.render.side_effect = lambda **context: '<p>same</p>'
+
+        results = self.generator.generate_bulk(self.applications, self.user)
+
+        self.assertEqual(self.mock_rendering.render_batch.call_args[0][0], ['<p>same</p>'])
+        self.mock_storage.store_document.assert_called_once()
+        self.assertEqual(self.mock_storage.store_document.call_args[1]['content_hash'],
+                         self.generator.get_content_hash('<p>same</p>'))
+        self.assertEqual(len({result.file_path for result in results.values()}), 1)
+
+    def test_content_hash_depends_on_document_type(self):
+        """Test that the same HTML for different document types is stored separately"""
+        other = BaseDocumentGenerator(DOCUMENT_TYPES['DISCLOSURE_FORM'])
+
+        self.assertEqual(self.generator.get_content_hash('<p>a</p>'), self.generator.get_content_hash('<p>a</p>'))
+        self.assertNotEqual(self.generator.get_content_hash('<p>a</p>'), self.generator.get_content_hash('<p>b</p>'))
+        self.assertNotEqual(self.generator.get_content_hash('<p>a</p>'), other.get_content_hash('<p>a</p>'))
+
+
+
+class TestBaseDocumentGeneratorBulkCreate(TestCase):
+    """Test case for writing the packages and documents of a bulk run to the database"""
+
+    def setUp(self):
+        """Create applications, one of which already has an open loan agreement package"""
+        auth0_user = Auth0User.objects.create(
+            auth0_id='auth0|bulkdocs', email='bulkdocs@example.com', email_verified=True
+        )
+        self.user = User.objects.create(
+            auth0_user=auth0_user, first_name='Test', last_name='Borrower',
+            email='bulkdocs@example.com', phone='(555) 123-4567', user_type=USER_TYPES['BORROWER']
+        )
+        school = School.objects.create(
+            name='Test School', legal_name='Test School LLC', tax_id='12-3456789',
+            address_line1='123 Main St', city='Anytown', state='CA', zip_code='12345',
+            phone='(555) 123-4567', status='active'
+        )
+        program = Program.objects.create(
+            school=school, name='Test Program', description='Test program',
+            duration_hours=400, duration_weeks=12
+        )
+        program_version = ProgramVersion.objects.create(
+            program=program, version_number=1, effective_date=datetime.date(2024, 1, 1),
+            tuition_amount=Decimal('10000.00'), is_current=True
+        )
+        self.applications = [
+            LoanApplication.objects.create(
+                borrower=self.user, school=school, program=program, program_version=program_version
+            )
+            for _ in range(3)
+        ]
+        self.open_package = DocumentPackage.objects.create(
+            application=self.applications[0],
+            package_type=DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT'],
+            status=DOCUMENT_STATUS['DRAFT']
+        )
+
+        self.generator = _TestGenerator()
+        # All three documents share content that is already stored
+        self.content_hash = self.generator.get_content_hash('<p>same</p>')
+        self.storage_result = {'key': f'documents/content/{self.content_hash}.pdf', 'version_id': '1'}
+        DocumentContent.objects.create(
+            content_hash=self.content_hash,
+            document_type=DOCUMENT_TYPES['LOAN_AGREEMENT'],
+            file_path=self.storage_result['key'],
+            version='1',
+            reference_count=1
+        )
+        self.uploaded = [
+            (application, f'{application.id}.pdf', self.storage_result, self.content_hash)
+            for application in self.applications
+        ]
+
+        self.signals = []
+        model_change_signal.connect(self.record_signal)
+
+    def tearDown(self):
+        """Disconnect the signal receiver"""
+        model_change_signal.disconnect(self.record_signal)
+
+    def record_signal(self, sender, instance, created=False, **kwargs):
+        """Record model_change_signal emissions"""
+        self.signals.append((sender, instance.pk, created))
+
+    def test_bulk_create_documents(self):
+        """Test that packages and documents are written in a fixed number of queries"""
+        # SAVEPOINT, open packages, package insert, document insert, the content reference
+        # update in its own SAVEPOINT and RELEASE, and the final RELEASE
+        with self.assertNumQueries(8):
+            documents = self.generator._bulk_create_documents(self.uploaded, self.user)
+
+        self.assertEqual(set(documents), {application.id for application in self.applications})
+        self.assertEqual(Document.objects.filter(content_hash=self.content_hash).count(), 3)
+        self.assertEqual(DocumentContent.objects.get(content_hash=self.content_hash).reference_count, 4)
+        self.assertEqual(
+            set(Document.objects.filter(content_hash=self.content_hash).values_list('generated_by_id', flat=True)),
+            {self.user.pk}
+        )
+
+        # The open package is reused; the others get a new package
+        self.assertEqual(documents[self.applications[0].id].package_id, self.open_package.pk)
+        new_packages = DocumentPackage.objects.exclude(pk=self.open_package.pk)
+        self.assertEqual(
+            set(new_packages.values_list('application_id', flat=True)),
+            {self.applications[1].id, self.applications[2].id}
+        )
+        # bulk_create skips save(), so its created_at and expiration_date are set up front
+        for package in new_packages:
+            self.assertEqual(package.status, DOCUMENT_STATUS['GENERATED'])
+            self.assertIsNotNone(package.created_at)
+            self.assertEqual(
+                package.expiration_date - package.created_at,
+                datetime.timedelta(days=DOCUMENT_EXPIRATION_DAYS)
+            )
+
+        # The audit signal save() would have sent is emitted for every new row
+        self.assertCountEqual(
+            self.signals,
+            [(DocumentPackage, package.pk, True) for package in new_packages]
+            + [(Document, document.pk, True) for document in documents.values()]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,13 +5,13 @@ from datetime import datetime, timedelta
 from django.contrib.auth import get_user_model
 
 from ..models import (
-    DocumentTemplate, DocumentPackage, Document, 
+    DocumentTemplate, DocumentPackage, Document, DocumentContent,
     SignatureRequest, DocumentField
 )
 from ..storage import document_storage
 from ..constants import (
     DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_PACKAGE_TYPES,
-    SIGNATURE_STATUS, SIGNER_TYPES, DOCUMENT_EXPIRATION_DAYS
+    SIGNATURE_STATUS, SIGNER_TYPES, DOCUMENT_EXPIRATION_DAYS, DOCUMENT_TEMPLATE_PATHS
 )
 from ...applications.models import LoanApplication
 
@@ -91,10 +91,21 @@ class TestDocumentTemplate(TestCase):
         
         # Assert that the first template is now inactive
         self.assertFalse(template1.is_active)
-        
+
         # Assert that the second template is active
         self.assertTrue(template2.is_active)
 
+    @patch('apps.documents.template_cache.invalidate_document_template')
+    def test_save_invalidates_compiled_template(self, mock_invalidate):
+        """Test that saving a template evicts its compiled copies"""
+        self.template.version = "1.1"
+        self.template.save()
+
+        mock_invalidate.assert_called_once_with(
+            self.template.file_path,
+            DOCUMENT_TEMPLATE_PATHS[DOCUMENT_TYPES['LOAN_AGREEMENT']]
+        )
+
     @patch('apps.documents.storage.document_storage.retrieve_document')
     def test_get_content(self, mock_retrieve):
         """Test that get_content retrieves template content correctly"""
@@ -540,6 +551,63 @@ class TestDocument(TestCase):
         self.assertEqual(str(self.document), expected)
 
 
+class TestDocumentContent(TestCase):
+    """Test case for the DocumentContent index of content-addressed documents"""
+    
+    def setUp(self):
+        """Set up test data before each test method runs"""
+        User = get_user_model()
+        self.user = User.objects.create(
+            email="test@example.com",
+            first_name="Test",
+            last_name="User"
+        )
+        self.application = LoanApplication.objects.create(
+            status="draft",
+            created_by=self.user
+        )
+        self.package = DocumentPackage.objects.create(
+            application=self.application,
+            package_type=DOCUMENT_PACKAGE_TYPES['DISCLOSURE'],
+            status=DOCUMENT_STATUS['DRAFT'],
+            created_by=self.user
+        )
+        self.content_hash = 'a' * 64
+        self.storage_result = {'key': f"documents/disclosures/content/{self.content_hash}.pdf", 'version_id': 'v1'}
+
+    def test_add_reference_creates_then_increments(self):
+        """Test that the first reference creates the entry and later ones increment it"""
+        DocumentContent.objects.add_reference(self.content_hash, DOCUMENT_TYPES['DISCLOSURE_FORM'], self.storage_result)
+        DocumentContent.objects.add_reference(
+            self.content_hash, DOCUMENT_TYPES['DISCLOSURE_FORM'], self.storage_result, count=2
+        )
+        
+        content = DocumentContent.objects.get(content_hash=self.content_hash)
+        self.assertEqual(content.reference_count, 3)
+        self.assertEqual(content.get_storage_result(), self.storage_result)
+        self.assertEqual(DocumentContent.objects.get_stored([self.content_hash, 'b' * 64]), {self.content_hash: content})
+
+    def test_deleting_document_releases_reference(self):
+        """Test that deleting a document decrements its content's reference count once"""
+        DocumentContent.objects.add_reference(self.content_hash, DOCUMENT_TYPES['DISCLOSURE_FORM'], self.storage_result)
+        document = Document.objects.create(
+            package=self.package,
+            document_type=DOCUMENT_TYPES['DISCLOSURE_FORM'],
+            file_name="disclosure.pdf",
+            file_path=self.storage_result['key'],
+            content_hash=self.content_hash,
+            status=DOCUMENT_STATUS['GENERATED'],
+            generated_by=self.user
+        )
+        
+        document.delete()
+        document.delete(hard_delete=True)
+        
+        content = DocumentContent.objects.get(content_hash=self.content_hash)
+        self.assertEqual(content.reference_count, 0)
+        self.assertIn(content, DocumentContent.objects.get_unreferenced())
+
+
 class TestSignatureRequest(TestCase):
     """Test case for the SignatureRequest model"""
     
@@ -593,6 +661,17 @@ class TestSignatureRequest(TestCase):
             created_by=self.user
         )
 
+    def test_envelope_columns_follow_external_reference(self):
+        """Test that saving fills the indexed envelope columns used for envelope lookups"""
+        self.signature_request.external_reference = "envelope-123:2"
+        self.signature_request.save()
+        
+        self.assertEqual(self.signature_request.envelope_id, "envelope-123")
+        self.assertEqual(self.signature_request.recipient_id, "2")
+        self.assertEqual(list(SignatureRequest.objects.for_envelope("envelope-123")), [self.signature_request])
+        self.assertFalse(SignatureRequest.objects.for_envelope("envelope-12").exists())
+        self.assertEqual(self.signature_request.get_envelope_reference(), ("envelope-123", "2"))
+
     def test_signature_request_creation(self):
         """Test that a signature request can be created with valid data"""
         # Create a new signature request with valid data
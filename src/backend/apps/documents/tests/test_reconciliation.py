@@ -0,0 +1,259 @@
+import json
+import threading
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from unittest.mock import patch, MagicMock
+from urllib.parse import urlparse, parse_qs
+
+import docusign_esign  # version 3.20.0+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ..docusign import DocuSignError
+from ..models import Document, DocumentPackage, SignatureRequest
+from ..reconciliation import EnvelopeReconciler
+from ..constants import DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_PACKAGE_TYPES, SIGNATURE_STATUS, SIGNER_TYPES
+from ...applications.models import LoanApplication
+
+# Test constants
+ACCOUNT_ID = 'test-account'
+
+
+class FakeDocuSignServer:
+    """
+    Local HTTP server answering the DocuSign list status changes endpoint from a fixed set of envelopes
+    """
+
+    def __init__(self, envelopes):
+        """
+        Starts the server on a free local port.
+
+        Args:
+            envelopes (list): Envelope JSON objects, as DocuSign returns them
+        """
+        self.envelopes = envelopes
+        self.requests = []
+        self.fail = False
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                server.requests.append((url.path, query))
+
+                if server.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+
+                start = int(query.get('start_position', 0))
+                count = int(query.get('count', 100))
+                page = server.envelopes[start:start + count]
+                self._send_json({
+                    'envelopes': page,
+                    'resultSetSize': str(len(page)),
+                    'totalSetSize': str(len(server.envelopes)),
+                    'startPosition': str(start),
+                    'endPosition': str(start + len(page) - 1),
+                })
+
+            def _send_json(self, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self):
+        """Base URL of the fake REST API"""
+        return f"http://127.0.0.1:{self.httpd.server_port}/restapi"
+
+    def create_service(self):
+        """Creates a DocuSign service stand-in whose envelopes API talks to this server"""
+        api_client = docusign_esign.ApiClient()
+        api_client.host = self.url
+        service = MagicMock(account_id=ACCOUNT_ID)
+        service.envelopes_api = docusign_esign.EnvelopesApi(api_client)
+        return service
+
+    def stop(self):
+        """Stops the server"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def create_envelope(envelope_id, *signer_statuses):
+    """Creates envelope JSON with one signer per status"""
+    return {
+        'envelopeId': envelope_id,
+        'status': 'sent',
+        'recipients': {
+            'signers': [
+                {'recipientId': str(index), 'status': status}
+                for index, status in enumerate(signer_statuses, start=1)
+            ]
+        },
+    }
+
+
+class TestEnvelopeListing(unittest.TestCase):
+    """Test case for listing envelope changes from a fake DocuSign server"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.server = FakeDocuSignServer(
+            [create_envelope(f'envelope-{index}', 'completed', 'sent') for index in range(250)]
+        )
+        self.reconciler = EnvelopeReconciler(service=self.server.create_service(), page_size=100, concurrency=3)
+        self.to_date = datetime(2024, 1, 2, tzinfo=dt_timezone.utc)
+        self.from_date = self.to_date - timedelta(days=1)
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.server.stop()
+
+    def test_pages_are_fetched_with_watermark_window(self):
+        """Test that every page of the window is fetched and parsed"""
+        envelopes = self.reconciler.list_changed_envelopes(self.from_date, self.to_date)
+
+        self.assertEqual(len(envelopes), 250)
+        self.assertEqual(envelopes['envelope-7'], {
+            'status': 'sent',
+            'recipients': {'1': SIGNATURE_STATUS['COMPLETED'], '2': SIGNATURE_STATUS['SENT']},
+        })
+
+        paths = {path for path, _ in self.server.requests}
+        self.assertEqual(paths, {f'/restapi/v2.1/accounts/{ACCOUNT_ID}/envelopes'})
+        queries = sorted(self.server.requests, key=lambda request: int(request[1]['start_position']))
+        self.assertEqual([query['start_position'] for _, query in queries], ['0', '100', '200'])
+        for _, query in queries:
+            self.assertEqual(query['from_date'], self.from_date.isoformat())
+            self.assertEqual(query['to_date'], self.to_date.isoformat())
+            self.assertEqual(query['include'], 'recipients')
+
+    def test_single_page_makes_one_request(self):
+        """Test that a window that fits in one page is read with one request"""
+        self.server.envelopes = self.server.envelopes[:40]
+
+        envelopes = self.reconciler.list_changed_envelopes(self.from_date, self.to_date)
+
+        self.assertEqual(len(envelopes), 40)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_server_error_raises(self):
+        """Test that a failed page raises DocuSignError"""
+        self.server.fail = True
+
+        with self.assertRaises(DocuSignError):
+            self.reconciler.list_changed_envelopes(self.from_date, self.to_date)
+
+
+class TestEnvelopeReconciliation(TestCase):
+    """Test case for applying envelope changes to signature requests, documents and packages"""
+
+    def setUp(self):
+        """Set up test data before each test method runs"""
+        User = get_user_model()
+        self.user = User.objects.create(email="test@example.com", first_name="Test", last_name="User")
+        self.co_signer = User.objects.create(email="cosigner@example.com", first_name="Co", last_name="Signer")
+        self.application = LoanApplication.objects.create(status="draft", created_by=self.user)
+        self.package = DocumentPackage.objects.create(
+            application=self.application,
+            package_type=DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT'],
+            status=DOCUMENT_STATUS['SENT'],
+            created_by=self.user
+        )
+        self.document = Document.objects.create(
+            package=self.package,
+            document_type=DOCUMENT_TYPES['LOAN_AGREEMENT'],
+            file_name="loan_agreement.pdf",
+            file_path="documents/loan_agreement.pdf",
+            status=DOCUMENT_STATUS['SENT'],
+            generated_by=self.user
+        )
+        self.envelope_id = str(uuid.uuid4())
+        self.requests = [
+            SignatureRequest.objects.create(
+                document=self.document,
+                signer=signer,
+                signer_type=signer_type,
+                status=SIGNATURE_STATUS['SENT'],
+                external_reference=f"{self.envelope_id}:{index}",
+                created_by=self.user
+            )
+            for index, (signer, signer_type) in enumerate(
+                [(self.user, SIGNER_TYPES['BORROWER']), (self.co_signer, SIGNER_TYPES['CO_BORROWER'])], start=1
+            )
+        ]
+        self.reconciler = EnvelopeReconciler(service=MagicMock(account_id=ACCOUNT_ID))
+
+    def test_changes_are_applied_in_bulk(self):
+        """Test that recipient statuses update requests, the document and the package"""
+        envelopes = {
+            self.envelope_id: {'status': 'completed', 'recipients': {
+                '1': SIGNATURE_STATUS['COMPLETED'], '2': SIGNATURE_STATUS['COMPLETED']
+            }},
+            'unknown-envelope': {'status': 'sent', 'recipients': {'1': SIGNATURE_STATUS['SENT']}},
+        }
+
+        summary = self.reconciler.apply_envelope_statuses(envelopes)
+
+        self.assertEqual(summary, {'updated_requests': 2, 'updated_documents': 1, 'updated_packages': 1})
+        for request in self.requests:
+            request.refresh_from_db()
+            self.assertEqual(request.status, SIGNATURE_STATUS['COMPLETED'])
+            self.assertIsNotNone(request.completed_at)
+        self.document.refresh_from_db()
+        self.assertEqual(self.document.status, DOCUMENT_STATUS['COMPLETED'])
+        self.package.refresh_from_db()
+        self.assertEqual(self.package.status, DOCUMENT_STATUS['COMPLETED'])
+
+    def test_unchanged_envelope_updates_nothing(self):
+        """Test that statuses already in the database are not written again"""
+        envelopes = {self.envelope_id: {'status': 'sent', 'recipients': {
+            '1': SIGNATURE_STATUS['SENT'], '2': SIGNATURE_STATUS['SENT']
+        }}}
+
+        summary = self.reconciler.apply_envelope_statuses(envelopes)
+
+        self.assertEqual(summary, {'updated_requests': 0, 'updated_documents': 0, 'updated_packages': 0})
+
+    def test_reconcile_advances_watermark(self):
+        """Test that a run reads from the watermark, with overlap, and advances it"""
+        with patch.object(EnvelopeReconciler, 'list_changed_envelopes', return_value={}) as mock_list:
+            first = self.reconciler.reconcile()
+            second = self.reconciler.reconcile()
+
+        self.assertEqual(mock_list.call_count, 2)
+        second_from = mock_list.call_args_list[1][0][0]
+        self.assertLess(second_from.isoformat(), first['to_date'])
+        self.assertGreater(second['to_date'], first['to_date'])
+
+    def test_failed_listing_keeps_watermark(self):
+        """Test that a failed run does not advance the watermark"""
+        with patch.object(EnvelopeReconciler, 'list_changed_envelopes', return_value={}):
+            first = self.reconciler.reconcile()
+
+        with patch.object(EnvelopeReconciler, 'list_changed_envelopes', side_effect=DocuSignError('unavailable')):
+            with self.assertRaises(DocuSignError):
+                self.reconciler.reconcile()
+
+        with patch.object(EnvelopeReconciler, 'list_changed_envelopes', return_value={}) as mock_list:
+            self.reconciler.reconcile()
+        self.assertLess(mock_list.call_args[0][0].isoformat(), first['to_date'])
+
+
+if __name__ == '__main__':
+    unittest.main()
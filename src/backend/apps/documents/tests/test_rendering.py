@@ -0,0 +1,93 @@
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from ..rendering import PDFRenderingService, PDFRenderingError
+
+
+def _completed_future(result=None, exception=None):
+    """Helper returning a future that has already finished"""
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestPDFRenderingService(unittest.TestCase):
+    """Test case for the process-pool PDF rendering service"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.render_patch = patch('apps.documents.rendering._render_pdf')
+        self.mock_render = self.render_patch.start()
+        self.mock_render.side_effect = lambda html, base_url=None: f"PDF:{html}".encode()
+
+        self.executor_patch = patch('apps.documents.rendering.ProcessPoolExecutor')
+        self.mock_executor_class = self.executor_patch.start()
+        self.mock_executor = self.mock_executor_class.return_value
+        self.mock_executor.submit.side_effect = lambda func, html, base_url: _completed_future(func(html, base_url))
+
+        self.stylesheets_patch = patch('apps.documents.rendering._load_stylesheets', return_value=())
+        self.stylesheets_patch.start()
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.render_patch.stop()
+        self.executor_patch.stop()
+        self.stylesheets_patch.stop()
+
+    def test_batch_is_rendered_in_pool_in_order(self):
+        """Test that a batch is submitted to one persistent pool and keeps its order"""
+        service = PDFRenderingService(max_workers=2)
+
+        first = service.render_batch(['<p>a</p>', '<p>b</p>'])
+        second = service.render_batch(['<p>c</p>'])
+
+        self.assertEqual(first, [b'PDF:<p>a</p>', b'PDF:<p>b</p>'])
+        self.assertEqual(second, [b'PDF:<p>c</p>'])
+        self.mock_executor_class.assert_called_once()
+        self.assertEqual(self.mock_executor.submit.call_count, 3)
+
+    def test_zero_workers_renders_inline(self):
+        """Test that a pool size of 0 renders on the calling thread"""
+        service = PDFRenderingService(max_workers=0)
+
+        self.assertEqual(service.render('<p>a</p>'), b'PDF:<p>a</p>')
+        self.mock_executor_class.assert_not_called()
+
+    def test_daemon_process_falls_back_to_inline(self):
+        """Test that a process that cannot start children renders inline"""
+        self.mock_executor.submit.side_effect = AssertionError('daemonic processes are not allowed to have children')
+        service = PDFRenderingService(max_workers=2)
+
+        self.assertEqual(service.render_batch(['<p>a</p>']), [b'PDF:<p>a</p>'])
+        self.assertEqual(service.max_workers, 0)
+
+    def test_failed_document_raises(self):
+        """Test that a failed document raises PDFRenderingError"""
+        self.mock_executor.submit.side_effect = None
+        self.mock_executor.submit.return_value = _completed_future(exception=ValueError('bad html'))
+        service = PDFRenderingService(max_workers=2)
+
+        with self.assertRaises(PDFRenderingError):
+            service.render_batch(['<p>a</p>'])
+
+    def test_failed_document_returned_when_requested(self):
+        """Test that return_exceptions keeps the rest of the batch"""
+        self.mock_executor.submit.side_effect = [
+            _completed_future(b'PDF:a'),
+            _completed_future(exception=ValueError('bad html')),
+        ]
+        service = PDFRenderingService(max_workers=2)
+
+        results = service.render_batch(['a', 'b'], return_exceptions=True)
+
+        self.assertEqual(results[0], b'PDF:a')
+        self.assertIsInstance(results[1], PDFRenderingError)
+        self.assertIsInstance(results[1].original_exception, ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
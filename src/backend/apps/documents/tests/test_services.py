@@ -1,7 +1,7 @@
 import logging  # Import logging utilities for error and activity logging
 from datetime import datetime  # Date and time utilities for document expiration and timestamps
 import uuid  # Generate unique identifiers for documents
-from unittest.mock import MagicMock  # Mocking dependencies for isolated unit testing
+from unittest.mock import MagicMock, patch  # Mocking dependencies for isolated unit testing
 
 import pytest  # Testing framework for writing and running tests
 from django.test import TestCase  # Django-specific testing utilities
@@ -156,6 +156,88 @@ class TestDocumentGeneration(TestCase):
         mock_generator.generate.assert_called()
 
 
+class TestDocumentPackageRendering(TestCase):
+    """Test cases for converting package documents to PDF in batches"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_user = create_mock_user()
+        self.generator = MagicMock(spec=BaseDocumentGenerator)
+        self.generator.prepare.side_effect = lambda application, context=None: (
+            f"<html>{application.id}</html>", f"{application.id}.pdf"
+        )
+        self.content_hashes = iter(['hash-1', 'hash-2'])
+        self.generator.get_content_hash.side_effect = lambda html: next(self.content_hashes)
+
+        self.generator_patch = patch('apps.documents.services.get_document_generator',
+                                     return_value=self.generator)
+        self.generator_patch.start()
+        self.rendering_patch = patch('apps.documents.services.pdf_rendering_service')
+        self.mock_rendering = self.rendering_patch.start()
+        self.store_patch = patch('apps.documents.services._store_package_documents')
+        self.mock_store = self.store_patch.start()
+        self.stored_patch = patch('apps.documents.services.find_stored_content', return_value={})
+        self.mock_find_stored = self.stored_patch.start()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.generator_patch.stop()
+        self.rendering_patch.stop()
+        self.store_patch.stop()
+        self.stored_patch.stop()
+
+    def test_package_documents_are_rendered_in_one_batch(self):
+        """Test that a package's documents are converted together before being stored"""
+        application = create_mock_application()
+        self.mock_rendering.render_batch.return_value = [b'pdf-1', b'pdf-2']
+
+        package = services.generate_document_package(
+            DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT'], application, self.mock_user
+        )
+
+        html = f"<html>{application.id}</html>"
+        self.mock_rendering.render_batch.assert_called_once_with([html, html])
+        stored_pdfs = self.mock_store.call_args[0][4]
+        self.assertEqual(stored_pdfs, {0: b'pdf-1', 1: b'pdf-2'})
+        self.assertEqual(package, self.mock_store.return_value)
+
+    def test_stored_documents_are_not_rendered_again(self):
+        """Test that a document whose content is already stored skips PDF conversion"""
+        application = create_mock_application()
+        stored_content = MagicMock(content_hash='hash-1')
+        self.mock_find_stored.return_value = {'hash-1': stored_content}
+        self.mock_rendering.render_batch.return_value = [b'pdf-2']
+
+        services.generate_document_package(DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT'], application, self.mock_user)
+
+        self.mock_find_stored.assert_called_once_with(['hash-1', 'hash-2'])
+        self.mock_rendering.render_batch.assert_called_once_with([f"<html>{application.id}</html>"])
+        args = self.mock_store.call_args[0]
+        self.assertEqual(args[4], {1: b'pdf-2'})
+        self.assertEqual(args[6], {'hash-1': stored_content})
+
+    @patch('apps.documents.services.generate_documents_bulk')
+    def test_cohort_failure_is_isolated(self, mock_bulk):
+        """Test that an application failing one document type is skipped for the rest"""
+        failing, passing = uuid.uuid4(), uuid.uuid4()
+        document = create_mock_document(DOCUMENT_TYPES['LOAN_AGREEMENT'], DOCUMENT_STATUS['GENERATED'])
+        error = ValueError('bad html')
+        mock_bulk.side_effect = [
+            {failing: error, passing: document},
+            {passing: document},
+        ]
+
+        results = services.generate_document_packages(
+            DOCUMENT_PACKAGE_TYPES['LOAN_AGREEMENT'], [failing, passing], self.mock_user
+        )
+
+        self.assertEqual(mock_bulk.call_count, 2)
+        self.assertEqual(mock_bulk.call_args_list[1][0][1], [passing])
+        self.assertIs(results[failing], error)
+        self.assertEqual(results[passing], document.package)
+        document.package.update_status.assert_called_once()
+
+
 class TestDocumentRetrieval(TestCase):
     """Test cases for document retrieval functions"""
 
@@ -375,7 +457,7 @@ class TestSignatureRequests(TestCase):
 
         # Assert signature request statuses were updated
         self.assertTrue(result)
-        docusign_service.update_signature_status.assert_called_with(self.mock_document)
+        docusign_service.update_signature_status.assert_called_with(self.mock_document, None)
 
         # Assert document status was updated if all signatures complete
         self.mock_document.update_status.assert_called_once()
@@ -396,7 +478,7 @@ class TestSignatureRequests(TestCase):
 
         # Assert update_signature_status was called for each document
         self.assertTrue(result)
-        services.update_signature_status.assert_called_with(self.mock_document)
+        services.update_signature_status.assert_called_with(self.mock_document, {})
 
         # Assert package status was updated
         self.mock_package.update_status.assert_called_once()
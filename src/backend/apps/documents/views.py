@@ -10,13 +10,12 @@ from rest_framework.permissions import IsAuthenticated  # rest_framework.permiss
 from rest_framework.decorators import parser_classes  # rest_framework.decorators 3.14+
 from rest_framework.parsers import MultiPartParser, FileUploadParser  # rest_framework.parsers 3.14+
 from django.shortcuts import get_object_or_404  # django.shortcuts 4.2+
-from django.http import HttpResponse  # django.http 4.2+
 
-from core.views import BaseAPIView, BaseGenericAPIView, TransactionMixin, AuditLogMixin  # Internal import
-from .models import DocumentTemplate, DocumentPackage, Document, SignatureRequest  # Internal import
+from core.views import BaseAPIView, BaseGenericAPIView, TransactionMixin, AuditLogMixin, StreamingDownloadMixin  # Internal import
+from .models import DocumentTemplate, DocumentPackage, Document, SignatureRequest, document_storage  # Internal import
 from .serializers import DocumentTemplateSerializer, DocumentPackageSerializer, DocumentPackageCreateSerializer, DocumentSerializer, DocumentDetailSerializer, DocumentUploadSerializer, SignatureRequestSerializer, SignatureRequestDetailSerializer, SignatureRequestCreateSerializer  # Internal import
 from .permissions import CanManageDocumentTemplates, CanGenerateDocuments, CanViewDocument, CanViewDocumentPackage, CanDownloadDocument, CanSignDocument, IsDocumentSigner, CanManageSignatureRequests, CanRequestSignatures, CanAccessDocuSignWebhook  # Internal import
-from .services import generate_document, generate_document_package, get_document_by_id, get_document_package_by_id, get_document_content, get_document_download_url, create_signature_request, create_package_signature_request, get_signature_status, update_signature_status, update_package_signature_status, send_signature_reminder, process_signed_documents, process_package_signed_documents, void_signature_request, get_document_templates, get_document_template_by_id, create_document_template, update_document_template, get_application_documents, get_application_document_packages  # Internal import
+from .services import generate_document, generate_document_package, get_document_by_id, get_document_package_by_id, get_document_download_url, create_signature_request, create_package_signature_request, get_signature_status, update_signature_status, update_package_signature_status, send_signature_reminder, process_signed_documents, process_package_signed_documents, void_signature_request, get_document_templates, get_document_template_by_id, create_document_template, update_document_template, get_application_documents, get_application_document_packages  # Internal import
 from .services import DocumentServiceError  # Internal import
 from apps.applications.models import LoanApplication  # Internal import
 
@@ -161,13 +160,22 @@ class DocumentDetailView(BaseGenericAPIView, RetrieveAPIView):
     serializer_class = DocumentDetailSerializer
     permission_classes = [IsAuthenticated, CanViewDocument]
 
-class DocumentDownloadView(BaseGenericAPIView):
+class DocumentDownloadView(StreamingDownloadMixin, BaseGenericAPIView):
     """
     API view for downloading a document
     """
     queryset = Document.objects.all()
     permission_classes = [IsAuthenticated, CanDownloadDocument]
 
+    def get_download_storage(self):
+        """
+        Returns the storage holding generated documents
+
+        Returns:
+            S3Storage: Document storage bucket
+        """
+        return document_storage.s3_storage
+
     def get(self, request, pk):
         """
         Handle GET request to download a document
@@ -177,16 +185,10 @@ class DocumentDownloadView(BaseGenericAPIView):
             pk (str): document id
 
         Returns:
-            HttpResponse: Response with document content
+            StreamingHttpResponse: Response streaming the document content, or a redirect to it
         """
         document = self.get_object()
-        try:
-            document_content = get_document_content(document)
-            response = HttpResponse(document_content, content_type='application/pdf')
-            response['Content-Disposition'] = f'attachment; filename="{document.file_name}"'
-            return response
-        except DocumentServiceError as e:
-            return self.handle_exception(e)
+        return self.stream_file(request, document.file_path, document.file_name, content_type='application/pdf')
 
 @parser_classes([MultiPartParser, FileUploadParser])
 class DocumentUploadView(BaseAPIView):
@@ -1,5 +1,4 @@
 from django.apps import AppConfig  # Django 4.2+
-from .signals import connect_funding_signals  # Import function to connect all funding-related signals
 
 
 class FundingConfig(AppConfig):
@@ -17,7 +16,13 @@ class FundingConfig(AppConfig):
         """
         # Import funding-related signals
         # Call connect_funding_signals to register signal handlers for funding events
-        connect_funding_signals()
+        try:
+            from .signals import connect_funding_signals
+            connect_funding_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting funding signals: {e}")
         # Register signal handlers for funding request status changes
         # Register signal handlers for disbursement processing
         # Register signal handlers for enrollment verification
@@ -8,7 +8,7 @@ values.
 
 import os  # standard library
 
-from ../../utils.constants import (  # Note: In actual Python code, this would be replaced with a valid import like 'from src.backend.utils.constants import' or an appropriate relative import
+from utils.constants import (
     APPLICATION_STATUS,
     DOCUMENT_TYPES,
     DOCUMENT_STATUS,
@@ -174,6 +174,10 @@ MAX_RETRY_ATTEMPTS = 3  # Maximum number of retry attempts for failed notificati
 RETRY_DELAY_SECONDS = 300  # Delay between retry attempts (5 minutes)
 REMINDER_SCHEDULE_DAYS = [30, 15, 7, 3, 1]  # Days before deadline to send reminders
 NOTIFICATION_RETENTION_DAYS = 90  # Days to retain notification records before cleanup
+NOTIFICATION_SEND_CONCURRENCY = 8  # Maximum concurrent SendGrid requests per queue worker
+SENDGRID_MAX_PERSONALIZATIONS = 1000  # SendGrid limit on recipients (personalizations) per request
+TEMPLATE_CACHE_SIZE = 256  # Compiled notification templates kept per process
+TEMPLATE_LOOKUP_TTL_SECONDS = 60  # How long a process reuses the active template found for a notification type
 
 # Template Directory Configuration
 TEMPLATE_DIR = os.path.join('notifications', 'templates')
\ No newline at end of file
@@ -6,10 +6,12 @@ batch processing, and delivery status tracking for the notification system.
 """
 
 import logging  # standard library
+from concurrent.futures import ThreadPoolExecutor  # standard library
 from sendgrid import SendGridAPIClient  # sendgrid 6.9.0+
 from sendgrid.helpers.mail import Mail  # sendgrid 6.9.0+
 from django.conf import settings  # Django 4.2+
 from django.db import transaction  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
 
 from .models import Notification, NotificationTemplate
 from .constants import (
@@ -17,9 +19,11 @@ from .constants import (
     EMAIL_SENDER_NAME, 
     EMAIL_REPLY_TO,
     NOTIFICATION_STATUS,
-    MAX_RETRY_ATTEMPTS
+    MAX_RETRY_ATTEMPTS,
+    NOTIFICATION_SEND_CONCURRENCY,
+    SENDGRID_MAX_PERSONALIZATIONS
 )
-from ../../utils.logging import get_audit_logger, mask_pii
+from utils.logging import get_audit_logger, mask_pii
 
 # Set up loggers
 logger = logging.getLogger(__name__)
@@ -96,35 +100,116 @@ def send_notification_email(notification):
         notification.mark_failed(error_message)
         return False
 
-def process_notification_batch(queryset):
+def send_notification_emails(notifications, max_workers=NOTIFICATION_SEND_CONCURRENCY):
     """
-    Processes a batch of notifications for delivery.
+    Sends many notification emails through a bounded pool of concurrent SendGrid requests.
+    
+    Notifications with identical rendered content are sent in a single SendGrid request,
+    with one personalization per recipient so recipients do not see each other. Status
+    fields are updated on the notification objects but not saved, so callers can persist
+    the whole batch with a single bulk_update().
     
     Args:
-        queryset: QuerySet of Notification objects to process
+        notifications (list): Notification objects to send
+        max_workers (int): Maximum number of concurrent SendGrid requests
         
     Returns:
-        dict: Statistics about the processed batch (sent, failed, total)
+        dict: Statistics about the sent notifications (sent, failed, total)
     """
+    if not notifications:
+        return {'sent': 0, 'failed': 0, 'total': 0}
+    
+    # Group notifications with the same content so they share one request
+    content_groups = {}
+    for notification in notifications:
+        content_groups.setdefault((notification.subject, notification.body), []).append(notification)
+    
+    mail_requests = []
+    for (subject, html_content), group in content_groups.items():
+        for start in range(0, len(group), SENDGRID_MAX_PERSONALIZATIONS):
+            mail_requests.append((subject, html_content, group[start:start + SENDGRID_MAX_PERSONALIZATIONS]))
+    
+    # One client is shared by the pool; each request builds its own HTTP call
+    client = SendGridAPIClient(settings.SENDGRID_API_KEY)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(mail_requests))) as executor:
+        errors = list(executor.map(
+            lambda mail_request: _send_mail_request(client, *mail_request),
+            mail_requests
+        ))
+    
     sent_count = 0
     failed_count = 0
-    total_count = queryset.count()
+    now = timezone.now()
     
-    for notification in queryset:
-        success = send_notification_email(notification)
-        if success:
-            sent_count += 1
-        else:
-            failed_count += 1
+    for (subject, html_content, group), error_message in zip(mail_requests, errors):
+        for notification in group:
+            if error_message is None:
+                notification.status = NOTIFICATION_STATUS['SENT']
+                notification.sent_at = now
+                sent_count += 1
+                audit_logger.info(
+                    "Email notification sent",
+                    extra={
+                        'notification_id': str(notification.id),
+                        'recipient_type': notification.recipient.user_type if notification.recipient else 'unknown',
+                        'email_masked': mask_pii(notification.recipient_email),
+                        'template_type': notification.template.notification_type if notification.template else 'unknown'
+                    }
+                )
+            else:
+                notification.status = NOTIFICATION_STATUS['FAILED']
+                notification.error_message = error_message
+                failed_count += 1
+            notification.updated_at = now
     
-    logger.info(f"Batch processing completed: {sent_count} sent, {failed_count} failed, {total_count} total")
+    logger.info(
+        f"Sent {sent_count} of {len(notifications)} notification emails in {len(mail_requests)} SendGrid requests"
+    )
     
     return {
         'sent': sent_count,
         'failed': failed_count,
-        'total': total_count
+        'total': len(notifications)
     }
 
+def _send_mail_request(client, subject, html_content, notifications):
+    """
+    Sends one SendGrid request addressed to the recipients of the given notifications.
+    
+    Args:
+        client (SendGridAPIClient): SendGrid client
+        subject (str): Email subject
+        html_content (str): Email body in HTML format
+        notifications (list): Notifications sharing this content
+        
+    Returns:
+        str: Error message if the request failed, otherwise None
+    """
+    message = Mail(
+        from_email=(EMAIL_SENDER, EMAIL_SENDER_NAME),
+        to_emails=[notification.recipient_email for notification in notifications],
+        subject=subject,
+        html_content=html_content,
+        is_multiple=True
+    )
+    message.reply_to = EMAIL_REPLY_TO
+    
+    try:
+        response = client.send(message)
+        
+        if 200 <= response.status_code < 300:
+            return None
+        
+        error_message = f"SendGrid API returned status code {response.status_code}"
+        logger.error(f"Failed to send {len(notifications)} emails: {error_message}")
+        return error_message
+    
+    except Exception as e:
+        error_message = f"Error sending email: {str(e)}"
+        logger.exception(error_message)
+        return error_message
+
 class EmailDeliveryService:
     """
     Service class for handling email delivery operations.
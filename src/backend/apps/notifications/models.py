@@ -26,6 +26,11 @@ from .constants import (
     EMAIL_TEMPLATES,
     EVENT_TYPE
 )
+from .template_cache import (
+    get_compiled_templates,
+    get_cached_template_for_type,
+    invalidate_template
+)
 
 
 class NotificationTemplate(CoreModel):
@@ -57,6 +62,21 @@ class NotificationTemplate(CoreModel):
         """String representation of template."""
         return f"{self.name} ({self.notification_type})"
 
+    def save(self, **kwargs):
+        """
+        Saves the template and evicts it from the per-process template caches.
+        """
+        super().save(**kwargs)
+        invalidate_template(self.id)
+
+    def delete(self, hard_delete=False, **kwargs):
+        """
+        Deletes the template and evicts it from the per-process template caches.
+        """
+        result = super().delete(hard_delete=hard_delete, **kwargs)
+        invalidate_template(self.id)
+        return result
+
     def render(self, context):
         """
         Renders the template with the provided context.
@@ -67,28 +87,56 @@ class NotificationTemplate(CoreModel):
         Returns:
             tuple: Tuple containing (rendered_subject, rendered_body)
         """
-        from django.template import Template, Context
+        return self.render_many([context])[0]
+    
+    def render_many(self, contexts):
+        """
+        Renders the template against many contexts, compiling it at most once.
         
-        # If template_path is provided, use render_to_string
-        if self.template_path:
-            rendered_body = render_to_string(self.template_path, context)
-            # Still use the subject_template from the model
-            subject_template = Template(self.subject_template)
-            rendered_subject = subject_template.render(Context(context))
-        else:
-            # Otherwise use the stored template content
-            subject_template = Template(self.subject_template)
-            body_template = Template(self.body_template)
+        Args:
+            contexts (list): Context data dictionaries, one per rendered notification
+            
+        Returns:
+            list: List of (rendered_subject, rendered_body) tuples in context order
+        """
+        from django.template import Context
+        
+        subject_template, body_template = get_compiled_templates(self)
+        
+        rendered = []
+        for context in contexts:
             rendered_subject = subject_template.render(Context(context))
-            rendered_body = body_template.render(Context(context))
+            
+            # If template_path is provided, the file template takes precedence over the stored body
+            if self.template_path:
+                rendered_body = render_to_string(self.template_path, context)
+            else:
+                rendered_body = body_template.render(Context(context))
+            
+            rendered.append((rendered_subject, rendered_body))
         
-        return (rendered_subject, rendered_body)
+        return rendered
     
     @classmethod
     def get_template_for_type(cls, notification_type):
         """
         Class method to get the active template for a notification type.
         
+        Lookups are cached per process for TEMPLATE_LOOKUP_TTL_SECONDS.
+        
+        Args:
+            notification_type (str): The notification type to get a template for
+            
+        Returns:
+            NotificationTemplate: The active template for the given type or None
+        """
+        return get_cached_template_for_type(notification_type, cls._load_template_for_type)
+    
+    @classmethod
+    def _load_template_for_type(cls, notification_type):
+        """
+        Loads the active template for a notification type from the database.
+        
         Args:
             notification_type (str): The notification type to get a template for
             
@@ -25,7 +25,7 @@ from .constants import (
 )
 from ..users.models import User
 from ..applications.models import LoanApplication
-from ...utils.logging import get_audit_logger, mask_pii
+from utils.logging import get_audit_logger, mask_pii
 
 # Set up loggers
 logger = logging.getLogger(__name__)
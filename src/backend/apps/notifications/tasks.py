@@ -12,9 +12,9 @@ from django.db import transaction
 from django.db.models import Q
 from django.conf import settings
 
-from ../../config.celery import app
+from config.celery import app
 from .models import Notification, NotificationEvent
-from .email import send_notification_email, process_notification_batch
+from .email import send_notification_email, send_notification_emails
 from .services import process_pending_events
 from .constants import (
     NOTIFICATION_STATUS,
@@ -23,7 +23,7 @@ from .constants import (
     RETRY_DELAY_SECONDS,
     NOTIFICATION_RETENTION_DAYS
 )
-from ../../utils.logging import get_audit_logger
+from utils.logging import get_audit_logger
 
 # Set up loggers
 logger = logging.getLogger(__name__)
@@ -77,41 +77,44 @@ def process_notification_queue():
     """
     Celery task to process pending notifications in batches.
     
+    Batches are claimed with SELECT ... FOR UPDATE SKIP LOCKED in keyset order, so several
+    workers can drain the queue at once without sending a notification twice. Each batch is
+    sent through a bounded pool of concurrent SendGrid requests and its status changes are
+    written back with a single bulk update before the claim is released.
+    
     Returns:
         dict: Statistics about processed notifications
     """
     try:
-        # Query for pending notifications
-        pending_notifications = Notification.objects.filter(
-            status=NOTIFICATION_STATUS['PENDING']
-        ).order_by('created_at')
-        
-        total_count = pending_notifications.count()
-        logger.info(f"Processing {total_count} pending notifications")
-        
-        if total_count == 0:
-            return {'sent': 0, 'failed': 0, 'total': 0}
-        
-        # Initialize counters for tracking progress
-        processed_count = 0
         sent_count = 0
         failed_count = 0
+        total_count = 0
+        last_key = None
         
-        # Process in batches to avoid memory issues
-        while processed_count < total_count:
-            # Get the next batch
-            batch = pending_notifications[processed_count:processed_count+BATCH_SIZE]
+        while True:
+            with transaction.atomic():
+                batch = claim_pending_notifications(last_key, BATCH_SIZE)
+                if not batch:
+                    break
+                
+                # Send while the rows are locked so other workers skip them
+                result = send_notification_emails(batch)
+                Notification.objects.bulk_update(
+                    batch, ['status', 'sent_at', 'error_message', 'updated_at']
+                )
             
-            # Process the batch
-            result = process_notification_batch(batch)
+            # Continue after the last claimed row; rows locked by other workers are not revisited
+            last_key = (batch[-1].created_at, batch[-1].id)
             
-            # Update counters
             sent_count += result['sent']
             failed_count += result['failed']
-            processed_count += BATCH_SIZE if processed_count + BATCH_SIZE < total_count else total_count
+            total_count += result['total']
             
             logger.info(f"Processed batch: {result['sent']} sent, {result['failed']} failed")
         
+        if total_count == 0:
+            return {'sent': 0, 'failed': 0, 'total': 0}
+        
         # Log overall statistics
         logger.info(f"Notification queue processing completed: {sent_count} sent, {failed_count} failed, {total_count} total")
         audit_logger.info(
@@ -138,6 +141,36 @@ def process_notification_queue():
             'error': str(e)
         }
 
+def claim_pending_notifications(last_key, limit):
+    """
+    Locks the next batch of pending notifications that no other worker has claimed.
+    
+    Must be called inside a transaction; the row locks are held until it commits.
+    
+    Args:
+        last_key (tuple): (created_at, id) of the last notification already processed, or None
+        limit (int): Maximum number of notifications to claim
+        
+    Returns:
+        list: Claimed Notification objects ordered by (created_at, id)
+    """
+    pending_notifications = Notification.objects.filter(
+        status=NOTIFICATION_STATUS['PENDING']
+    )
+    
+    if last_key is not None:
+        last_created_at, last_id = last_key
+        pending_notifications = pending_notifications.filter(
+            Q(created_at__gt=last_created_at) | Q(created_at=last_created_at, id__gt=last_id)
+        )
+    
+    return list(
+        pending_notifications
+        .select_related('template', 'recipient')
+        .select_for_update(skip_locked=True, of=('self',))
+        .order_by('created_at', 'id')[:limit]
+    )
+
 @app.task
 def retry_failed_notifications():
     """
@@ -0,0 +1,194 @@
+"""
+Process-local caches for notification templates.
+
+Compiled subject and body templates are kept in a bounded LRU keyed by template id and
+updated_at, so an edited template is recompiled on its next use without any explicit
+invalidation. The active template for each notification type is remembered for a short
+time to avoid a database query per notification. Saving a template evicts both entries in
+the saving process; other processes pick up the change when their lookup expires.
+"""
+
+import threading  # standard library
+import time  # standard library
+from collections import OrderedDict  # standard library
+
+from django.template import Template  # Django 4.2+
+
+from .constants import TEMPLATE_CACHE_SIZE, TEMPLATE_LOOKUP_TTL_SECONDS
+
+# Marker for notification types that have no active template
+_MISSING = object()
+
+
+class _CompiledTemplateCache:
+    """
+    Bounded LRU of compiled (subject, body) templates keyed by (template id, updated_at).
+    """
+
+    def __init__(self, max_size=TEMPLATE_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of templates kept
+        """
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._compiled = OrderedDict()
+
+    def get(self, template):
+        """
+        Returns the compiled templates for a notification template, compiling on a miss.
+
+        Args:
+            template (NotificationTemplate): The template to compile
+
+        Returns:
+            tuple: (subject Template, body Template); the body is None for file templates
+        """
+        key = (template.id, template.updated_at)
+
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                return compiled
+
+        # Compile outside the lock; a concurrent miss compiles the same template twice at worst
+        compiled = (
+            Template(template.subject_template),
+            None if template.template_path else Template(template.body_template)
+        )
+
+        with self._lock:
+            self._compiled[key] = compiled
+            self._compiled.move_to_end(key)
+            while len(self._compiled) > self._max_size:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def invalidate(self, template_id):
+        """
+        Drops every compiled version of a template.
+
+        Args:
+            template_id (UUID): ID of the template
+        """
+        with self._lock:
+            for key in [key for key in self._compiled if key[0] == template_id]:
+                del self._compiled[key]
+
+    def clear(self):
+        """
+        Drops all compiled templates.
+        """
+        with self._lock:
+            self._compiled.clear()
+
+
+class _TemplateLookupCache:
+    """
+    Short-lived map of notification type to its active template.
+    """
+
+    def __init__(self, ttl_seconds=TEMPLATE_LOOKUP_TTL_SECONDS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds (int): How long a lookup is reused
+        """
+        self._lock = threading.Lock()
+        self._ttl_seconds = ttl_seconds
+        self._templates = {}
+
+    def get(self, notification_type, loader):
+        """
+        Returns the active template for a notification type, loading it when expired.
+
+        Args:
+            notification_type (str): The notification type
+            loader (callable): Called with the notification type to load the template on a miss
+
+        Returns:
+            NotificationTemplate: The active template, or None if there is none
+        """
+        now = time.monotonic()
+        entry = self._templates.get(notification_type)
+        if entry is not None and entry[1] > now:
+            template = entry[0]
+        else:
+            template = loader(notification_type)
+            with self._lock:
+                self._templates[notification_type] = (
+                    _MISSING if template is None else template,
+                    now + self._ttl_seconds
+                )
+
+        return None if template is _MISSING else template
+
+    def invalidate(self, notification_type=None):
+        """
+        Drops the cached lookup of a notification type, or of every type.
+
+        Args:
+            notification_type (str): The notification type; None drops all lookups
+        """
+        with self._lock:
+            if notification_type is None:
+                self._templates.clear()
+            else:
+                self._templates.pop(notification_type, None)
+
+
+_compiled_templates = _CompiledTemplateCache()
+_template_lookups = _TemplateLookupCache()
+
+
+def get_compiled_templates(template):
+    """
+    Returns the compiled subject and body templates of a notification template.
+
+    Args:
+        template (NotificationTemplate): The template to compile
+
+    Returns:
+        tuple: (subject Template, body Template); the body is None for file templates
+    """
+    return _compiled_templates.get(template)
+
+
+def get_cached_template_for_type(notification_type, loader):
+    """
+    Returns the active template for a notification type from the lookup cache.
+
+    Args:
+        notification_type (str): The notification type
+        loader (callable): Called with the notification type to load the template on a miss
+
+    Returns:
+        NotificationTemplate: The active template, or None if there is none
+    """
+    return _template_lookups.get(notification_type, loader)
+
+
+def invalidate_template(template_id):
+    """
+    Evicts a template's compiled versions and the notification type lookups.
+
+    Every lookup is dropped because a save can change which template is active for a
+    type, or move a template to another type; there are only a handful of types.
+
+    Args:
+        template_id (UUID): ID of the template
+    """
+    _compiled_templates.invalidate(template_id)
+    _template_lookups.invalidate()
+
+
+def clear_template_caches():
+    """
+    Clears all per-process notification template caches.
+    """
+    _compiled_templates.clear()
+    _template_lookups.invalidate()
@@ -0,0 +1,126 @@
+"""
+Unit tests for batched notification email delivery.
+
+SendGrid is never called: _send_mail_request is stubbed so the tests cover how
+send_notification_emails groups notifications into requests and applies each
+request's outcome to its notifications.
+"""
+
+import threading  # standard library
+from types import SimpleNamespace  # standard library
+from unittest.mock import patch  # standard library
+
+import pytest  # pytest 7.0+
+
+from .. import email
+from ..email import send_notification_emails
+from ..constants import NOTIFICATION_STATUS, SENDGRID_MAX_PERSONALIZATIONS
+
+
+def make_notifications(count, subject, body, start=0):
+    """
+    Builds notification stand-ins with the attributes send_notification_emails reads.
+    """
+    return [
+        SimpleNamespace(
+            id=start + index,
+            subject=subject,
+            body=body,
+            recipient_email=f'borrower{start + index}@example.com',
+            recipient=None,
+            template=None,
+            status=NOTIFICATION_STATUS['PENDING'],
+            sent_at=None,
+            error_message=None,
+            updated_at=None,
+        )
+        for index in range(count)
+    ]
+
+
+class MailRequestStub:
+    """
+    Records the requests passed to _send_mail_request and fails the chosen ones.
+    """
+
+    def __init__(self, fail_when=None):
+        self.fail_when = fail_when or (lambda subject, notifications: False)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, client, subject, html_content, notifications):
+        with self.lock:
+            self.requests.append((subject, html_content, list(notifications)))
+        if self.fail_when(subject, notifications):
+            return 'SendGrid API returned status code 500'
+        return None
+
+
+@pytest.mark.unit
+class TestSendNotificationEmails:
+    """Test class for send_notification_emails"""
+
+    def send(self, notifications, stub):
+        """Sends the notifications with SendGrid stubbed out"""
+        with patch.object(email, 'SendGridAPIClient'), \
+                patch.object(email, '_send_mail_request', side_effect=stub):
+            return send_notification_emails(notifications, max_workers=4)
+
+    def test_groups_identical_content_into_one_request(self):
+        """Test that notifications with the same subject and body share a request"""
+        welcome = make_notifications(3, 'Welcome', '<p>Welcome</p>')
+        reminder = make_notifications(2, 'Reminder', '<p>Sign now</p>', start=3)
+        stub = MailRequestStub()
+
+        result = self.send(welcome + reminder, stub)
+
+        assert result == {'sent': 5, 'failed': 0, 'total': 5}
+        recipients = {subject: notifications for subject, _, notifications in stub.requests}
+        assert len(stub.requests) == 2
+        assert recipients['Welcome'] == welcome
+        assert recipients['Reminder'] == reminder
+        for notification in welcome + reminder:
+            assert notification.status == NOTIFICATION_STATUS['SENT']
+            assert notification.sent_at is not None
+            assert notification.updated_at == notification.sent_at
+
+    def test_splits_groups_at_personalization_limit(self):
+        """Test that a group larger than the SendGrid limit is split into chunks"""
+        notifications = make_notifications(2 * SENDGRID_MAX_PERSONALIZATIONS + 5, 'Statement', '<p>Statement</p>')
+        stub = MailRequestStub()
+
+        result = self.send(notifications, stub)
+
+        assert result['sent'] == len(notifications)
+        chunk_sizes = sorted(len(chunk) for _, _, chunk in stub.requests)
+        assert chunk_sizes == [5, SENDGRID_MAX_PERSONALIZATIONS, SENDGRID_MAX_PERSONALIZATIONS]
+        sent_ids = sorted(notification.id for _, _, chunk in stub.requests for notification in chunk)
+        assert sent_ids == list(range(len(notifications)))
+
+    def test_failed_request_only_fails_its_chunk(self):
+        """Test that a failed request marks only the notifications it carried as failed"""
+        statements = make_notifications(SENDGRID_MAX_PERSONALIZATIONS + 10, 'Statement', '<p>Statement</p>')
+        reminders = make_notifications(2, 'Reminder', '<p>Sign now</p>', start=len(statements))
+        # Fail the second chunk of statements
+        stub = MailRequestStub(
+            fail_when=lambda subject, chunk: subject == 'Statement' and len(chunk) == 10
+        )
+
+        result = self.send(statements + reminders, stub)
+
+        assert result == {'sent': SENDGRID_MAX_PERSONALIZATIONS + 2, 'failed': 10, 'total': len(statements) + 2}
+        for notification in statements[:SENDGRID_MAX_PERSONALIZATIONS] + reminders:
+            assert notification.status == NOTIFICATION_STATUS['SENT']
+            assert notification.error_message is None
+        for notification in statements[SENDGRID_MAX_PERSONALIZATIONS:]:
+            assert notification.status == NOTIFICATION_STATUS['FAILED']
+            assert notification.error_message == 'SendGrid API returned status code 500'
+            assert notification.sent_at is None
+            assert notification.updated_at is not None
+
+    def test_empty_batch_sends_nothing(self):
+        """Test that an empty batch makes no requests"""
+        stub = MailRequestStub()
+
+        assert self.send([], stub) == {'sent': 0, 'failed': 0, 'total': 0}
+        assert stub.requests == []
@@ -9,6 +9,7 @@ functionality for creating, managing, and rendering notifications.
 from django.test import TestCase
 from unittest.mock import patch, MagicMock
 from django.utils import timezone
+from django.template import Template
 from django.template.loader import render_to_string
 import json
 import uuid
@@ -22,6 +23,7 @@ from ..constants import (
     NOTIFICATION_DELIVERY_METHODS, NOTIFICATION_PRIORITIES,
     NOTIFICATION_CATEGORIES, EVENT_TYPE, MAX_RETRY_ATTEMPTS
 )
+from ..template_cache import clear_template_caches
 from apps.users.models import User
 from apps.applications.models import LoanApplication
 
@@ -29,6 +31,7 @@ from apps.applications.models import LoanApplication
 class NotificationTemplateTestCase(TestCase):
     def setUp(self):
         """Set up test data for notification template tests."""
+        clear_template_caches()
         self.template = NotificationTemplate.objects.create(
             name="Test Template",
             description="Test description",
@@ -69,6 +72,37 @@ class NotificationTemplateTestCase(TestCase):
         self.assertIn("Dear John Doe,", body)
         self.assertIn("Your application APP-12345 has been approved.", body)
     
+    def test_render_many(self):
+        """Test rendering one template against many contexts."""
+        contexts = [
+            {"name": "John Doe", "application_id": "APP-1", "status": "approved"},
+            {"name": "Jane Roe", "application_id": "APP-2", "status": "denied"},
+        ]
+        
+        rendered = self.template.render_many(contexts)
+        
+        self.assertEqual([subject for subject, _ in rendered], ["Hello, John Doe!", "Hello, Jane Roe!"])
+        self.assertIn("Your application APP-2 has been denied.", rendered[1][1])
+        self.assertEqual(self.template.render(contexts[0]), rendered[0])
+    
+    @patch('src.backend.apps.notifications.template_cache.Template', wraps=Template)
+    def test_render_reuses_compiled_templates(self, mock_template):
+        """Test that templates are compiled once and recompiled after a save."""
+        context = {"name": "John Doe", "application_id": "APP-1", "status": "approved"}
+        
+        self.template.render(context)
+        self.template.render_many([context, context])
+        
+        # Subject and body compiled once
+        self.assertEqual(mock_template.call_count, 2)
+        
+        self.template.subject_template = "Hi, {{name}}!"
+        self.template.save()
+        subject, _ = self.template.render(context)
+        
+        self.assertEqual(subject, "Hi, John Doe!")
+        self.assertEqual(mock_template.call_count, 4)
+    
     @patch('django.template.loader.render_to_string')
     def test_render_with_template_path(self, mock_render_to_string):
         """Test rendering a template from a file path."""
@@ -113,6 +147,20 @@ class NotificationTemplateTestCase(TestCase):
         # Try with a type that doesn't exist
         template = NotificationTemplate.get_template_for_type("non_existent_type")
         self.assertIsNone(template)
+    
+    def test_get_template_for_type_is_cached(self):
+        """Test that active template lookups are cached until a template is saved."""
+        notification_type = NOTIFICATION_TYPES['APPLICATION_APPROVED']
+        
+        NotificationTemplate.get_template_for_type(notification_type)
+        with self.assertNumQueries(0):
+            template = NotificationTemplate.get_template_for_type(notification_type)
+        self.assertEqual(template.id, self.template.id)
+        
+        # Deactivating the template evicts the cached lookup
+        self.template.is_active = False
+        self.template.save()
+        self.assertIsNone(NotificationTemplate.get_template_for_type(notification_type))
 
 
 class NotificationEventTestCase(TestCase):
@@ -1,9 +1,13 @@
 import pytest  # pytest 7.0+
 from unittest.mock import patch  # standard library
 from datetime import datetime  # standard library
+from django.test import TestCase  # Django 4.2+
 from django.utils import timezone  # Django 4.2+
 import freezegun  # freezegun 1.2+
 
+from apps.authentication.models import Auth0User
+from apps.users.models import User
+
 from ..tasks import (
     send_notification,
     process_notification_queue,
@@ -13,7 +17,7 @@ from ..tasks import (
     cleanup_old_notifications
 )
 from ..models import Notification, NotificationEvent, NotificationTemplate
-from ..email import send_notification_email, process_notification_batch
+from ..email import send_notification_email
 from ..services import process_pending_events
 from ..constants import (
     NOTIFICATION_STATUS,
@@ -27,7 +31,7 @@ from ..constants import (
 
 @pytest.mark.notification
 @pytest.mark.task
-class TestNotificationTasks:
+class TestNotificationTasks(TestCase):
     """Test class for notification task functions"""
 
     def setUp(self):
@@ -43,7 +47,11 @@ class TestNotificationTasks:
         )
 
         # Create test user for recipient
-        self.user = Notification.objects.create(
+        auth0_user = Auth0User.objects.create(
+            auth0_id="auth0|notifications", email="test@example.com", email_verified=True
+        )
+        self.user = User.objects.create(
+            auth0_user=auth0_user,
             first_name="Test",
             last_name="User",
             email="test@example.com",
@@ -104,11 +112,11 @@ class TestNotificationTasks:
         NotificationTemplate.objects.all().delete()
 
         # Delete test user
-        Notification.objects.all().delete()
+        User.objects.all().delete()
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.send_notification_email')
+    @patch('apps.notifications.tasks.send_notification_email')
     def test_send_notification_success(self, mock_send_notification_email):
         """Test successful sending of a notification"""
         # Mock send_notification_email to return True
@@ -125,7 +133,7 @@ class TestNotificationTasks:
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.send_notification_email')
+    @patch('apps.notifications.tasks.send_notification_email')
     def test_send_notification_not_found(self, mock_send_notification_email):
         """Test sending a notification that doesn't exist"""
         # Call send_notification with a non-existent notification ID
@@ -139,8 +147,8 @@ class TestNotificationTasks:
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.process_notification_batch')
-    def test_process_notification_queue_with_pending(self, mock_process_notification_batch):
+    @patch('apps.notifications.tasks.send_notification_emails')
+    def test_process_notification_queue_with_pending(self, mock_send_notification_emails):
         """Test processing notification queue with pending notifications"""
         # Create multiple pending notifications
         pending_notifications = [
@@ -155,22 +163,58 @@ class TestNotificationTasks:
             for i in range(3)
         ]
 
-        # Mock process_notification_batch to return success statistics
-        mock_process_notification_batch.return_value = {"sent": 3, "failed": 0, "total": 3}
+        # Mock send_notification_emails to return success statistics
+        mock_send_notification_emails.return_value = {"sent": 3, "failed": 0, "total": 3}
 
         # Call process_notification_queue
         result = process_notification_queue()
 
-        # Assert that process_notification_batch was called with correct batches
-        mock_process_notification_batch.assert_called_once()
+        # Assert that all pending notifications were claimed in a single batch
+        mock_send_notification_emails.assert_called_once()
 
         # Assert that the task returns correct aggregated statistics
         assert result == {"sent": 3, "failed": 0, "total": 3}
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.process_notification_batch')
-    def test_process_notification_queue_empty(self, mock_process_notification_batch):
+    @patch('apps.notifications.tasks.BATCH_SIZE', 2)
+    @patch('apps.notifications.tasks.send_notification_emails')
+    def test_process_notification_queue_keyset_batches(self, mock_send_notification_emails):
+        """Test that batches advance by keyset and statuses are written back in bulk"""
+        for i in range(3):
+            Notification.objects.create(
+                template=self.template,
+                recipient=self.user,
+                recipient_email=f"test{i}@example.com",
+                subject=f"Test Notification {i}",
+                body=f"Test Notification Body {i}",
+                status=NOTIFICATION_STATUS["PENDING"],
+            )
+
+        claimed_ids = []
+
+        def send(batch):
+            # Leave the first notification pending; keyset pagination must not revisit it
+            for notification in batch:
+                claimed_ids.append(notification.id)
+                if notification.id != self.notification1.id:
+                    notification.status = NOTIFICATION_STATUS["SENT"]
+            return {"sent": len(batch), "failed": 0, "total": len(batch)}
+
+        mock_send_notification_emails.side_effect = send
+
+        result = process_notification_queue()
+
+        # Four pending notifications in batches of two
+        assert mock_send_notification_emails.call_count == 2
+        assert len(claimed_ids) == len(set(claimed_ids)) == 4
+        assert result["total"] == 4
+        assert Notification.objects.filter(status=NOTIFICATION_STATUS["SENT"]).count() == 3
+
+    @pytest.mark.notification
+    @pytest.mark.task
+    @patch('apps.notifications.tasks.send_notification_emails')
+    def test_process_notification_queue_empty(self, mock_send_notification_emails):
         """Test processing an empty notification queue"""
         # Ensure no pending notifications exist
         Notification.objects.filter(status=NOTIFICATION_STATUS["PENDING"]).delete()
@@ -178,17 +222,17 @@ class TestNotificationTasks:
         # Call process_notification_queue
         result = process_notification_queue()
 
-        # Assert that process_notification_batch was not called
-        mock_process_notification_batch.assert_not_called()
+        # Assert that send_notification_emails was not called
+        mock_send_notification_emails.assert_not_called()
 
         # Assert that the task returns zero statistics
         assert result == {"sent": 0, "failed": 0, "total": 0}
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.models.Notification.can_retry')
-    @patch('src.backend.apps.notifications.models.Notification.mark_retry')
-    @patch('src.backend.apps.notifications.tasks.send_notification')
+    @patch('apps.notifications.models.Notification.can_retry')
+    @patch('apps.notifications.models.Notification.mark_retry')
+    @patch('apps.notifications.tasks.send_notification')
     def test_retry_failed_notifications_with_retryable(self, mock_send_notification, mock_mark_retry, mock_can_retry):
         """Test retrying failed notifications that are retryable"""
         # Create failed notifications with retry counts below MAX_RETRY_ATTEMPTS
@@ -208,23 +252,26 @@ class TestNotificationTasks:
         # Mock can_retry to return True
         mock_can_retry.return_value = True
 
+        # notification2 from setUp is below MAX_RETRY_ATTEMPTS as well
+        retryable_count = len(failed_notifications) + 1
+
         # Call retry_failed_notifications
         result = retry_failed_notifications()
 
         # Assert that mark_retry was called for each retryable notification
-        assert mock_mark_retry.call_count == len(failed_notifications)
+        assert mock_mark_retry.call_count == retryable_count
 
         # Assert that send_notification was called for each retryable notification
-        assert mock_send_notification.call_count == len(failed_notifications)
+        assert mock_send_notification.delay.call_count == retryable_count
 
         # Assert that the task returns correct retry statistics
-        assert result == {"retried": len(failed_notifications), "total": len(failed_notifications)}
+        assert result == {"retried": retryable_count, "total": retryable_count}
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.models.Notification.can_retry')
-    @patch('src.backend.apps.notifications.models.Notification.mark_retry')
-    @patch('src.backend.apps.notifications.tasks.send_notification')
+    @patch('apps.notifications.models.Notification.can_retry')
+    @patch('apps.notifications.models.Notification.mark_retry')
+    @patch('apps.notifications.tasks.send_notification')
     def test_retry_failed_notifications_non_retryable(self, mock_send_notification, mock_mark_retry, mock_can_retry):
         """Test retrying failed notifications that are not retryable"""
         # Create failed notifications with retry counts at MAX_RETRY_ATTEMPTS
@@ -251,14 +298,15 @@ class TestNotificationTasks:
         mock_mark_retry.assert_not_called()
 
         # Assert that send_notification was not called
-        mock_send_notification.assert_not_called()
+        mock_send_notification.delay.assert_not_called()
 
-        # Assert that the task returns zero retry statistics
-        assert result == {"retried": 0, "total": len(failed_notifications)}
+        # Assert that the task returns zero retry statistics; notifications that used up
+        # their attempts are not queried, so only notification2 from setUp is counted
+        assert result == {"retried": 0, "total": 1}
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.process_pending_events')
+    @patch('apps.notifications.tasks.process_pending_events')
     def test_process_notification_events_success(self, mock_process_pending_events):
         """Test successful processing of notification events"""
         # Create unprocessed notification events
@@ -285,24 +333,21 @@ class TestNotificationTasks:
 
     @pytest.mark.notification
     @pytest.mark.task
-    @patch('src.backend.apps.notifications.tasks.Document.objects.filter')
-    @patch('src.backend.apps.notifications.tasks.schedule_reminder')
-    def test_schedule_signature_reminders_with_pending(self, mock_schedule_reminder, mock_document_filter):
-        """Test scheduling signature reminders for pending signatures"""
-        # Mock Document.objects.filter to return test document packages
-        mock_document_filter.return_value = [1, 2, 3]
-
-        # Mock schedule_reminder to return test notifications
-        mock_schedule_reminder.return_value = [1, 2, 3]
+    @patch('apps.documents.models.DocumentPackage.objects.filter')
+    @patch('apps.notifications.services.send_immediate_notification')
+    def test_schedule_signature_reminders_without_pending(self, mock_send_immediate_notification, mock_package_filter):
+        """Test scheduling signature reminders when no packages await signatures"""
+        # Mock DocumentPackage.objects.filter to return no pending packages
+        mock_package_filter.return_value = []
 
         # Call schedule_signature_reminders
         result = schedule_signature_reminders()
 
-        # Assert that Document.objects.filter was called with correct filters
-        mock_document_filter.assert_called()
+        # Assert that only packages awaiting signatures were queried
+        mock_package_filter.assert_called_once_with(status__in=['sent', 'partially_executed'])
 
-        # Assert that schedule_reminder was called for each recipient
-        mock_schedule_reminder.assert_called()
+        # Assert that no reminders were sent
+        mock_send_immediate_notification.assert_not_called()
 
         # Assert that the task returns correct count of scheduled reminders
         assert result == 0
@@ -319,7 +364,6 @@ class TestNotificationTasks:
             recipient_email="old1@example.com",
             subject="Old Notification 1",
             body="Old Notification Body 1",
-            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS + 1),
         )
         old_notification2 = Notification.objects.create(
             template=self.template,
@@ -327,7 +371,6 @@ class TestNotificationTasks:
             recipient_email="old2@example.com",
             subject="Old Notification 2",
             body="Old Notification Body 2",
-            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS + 2),
         )
 
         # Create notifications with recent created_at dates
@@ -337,7 +380,6 @@ class TestNotificationTasks:
             recipient_email="recent1@example.com",
             subject="Recent Notification 1",
             body="Recent Notification Body 1",
-            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS - 1),
         )
         recent_notification2 = Notification.objects.create(
             template=self.template,
@@ -345,7 +387,17 @@ class TestNotificationTasks:
             recipient_email="recent2@example.com",
             subject="Recent Notification 2",
             body="Recent Notification Body 2",
-            created_at=timezone.now(),
+        )
+
+        # created_at is set on insert, so backdate the older notifications afterwards
+        Notification.objects.filter(id=old_notification1.id).update(
+            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS + 1)
+        )
+        Notification.objects.filter(id=old_notification2.id).update(
+            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS + 2)
+        )
+        Notification.objects.filter(id=recent_notification1.id).update(
+            created_at=timezone.now() - timezone.timedelta(days=NOTIFICATION_RETENTION_DAYS - 1)
         )
 
         # Call cleanup_old_notifications
@@ -1,25 +1,6 @@
-from .apps import QCConfig  # Django 4.2+
-from .models import QCReview, DocumentVerification, QCStipulationVerification, QCChecklistItem, QCNote  # Importing QCReview model
-from .constants import QC_STATUS, QC_VERIFICATION_STATUS, QC_RETURN_REASON, QC_CHECKLIST_CATEGORY, QC_PRIORITY, QC_ASSIGNMENT_TYPE  # Importing QC status constants
-from .services import QCService  # Importing QCService class
-from .checklist import ChecklistManager  # Importing ChecklistManager class
+"""
+Quality control app for the loan management system.
 
-
-default_app_config = "src.backend.apps.qc.apps.QCConfig"
-
-__all__ = [
-    'QCConfig',
-    'QCReview',
-    'DocumentVerification',
-    'QCStipulationVerification',
-    'QCChecklistItem',
-    'QCNote',
-    'QC_STATUS',
-    'QC_VERIFICATION_STATUS',
-    'QC_RETURN_REASON',
-    'QC_CHECKLIST_CATEGORY',
-    'QC_PRIORITY',
-    'QC_ASSIGNMENT_TYPE',
-    'QCService',
-    'ChecklistManager',
-]
\ No newline at end of file
+This app manages QC reviews of approved applications, document verification and
+checklists before funding.
+"""
@@ -1,5 +1,4 @@
 from django.apps import AppConfig  # Django 4.2+
-from .signals import connect_qc_signals  # Importing QCReview model
 
 
 class QCConfig(AppConfig):
@@ -20,7 +19,13 @@ class QCConfig(AppConfig):
         """
         # Import QC-related signals
         # Call connect_qc_signals to register signal handlers for QC events
-        connect_qc_signals()
+        try:
+            from .signals import connect_qc_signals
+            connect_qc_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting QC signals: {e}")
         # Register signal handlers for document package completion
         # Register signal handlers for QC review status changes
         # Register signal handlers for QC review assignments
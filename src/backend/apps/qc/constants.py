@@ -6,7 +6,7 @@ status codes, verification statuses, checklist categories, and other configurati
 The QC process is a critical step after document completion and before funding approval.
 """
 
-from ...utils.constants import APPLICATION_STATUS, FUNDING_STATUS
+from utils.constants import APPLICATION_STATUS, FUNDING_STATUS
 
 # QC Status Constants
 QC_STATUS = {
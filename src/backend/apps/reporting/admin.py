@@ -6,7 +6,7 @@ from .models import (
     ReportConfiguration, SavedReport, ReportSchedule,
     ReportDelivery, ReportPermission, REPORT_TYPES,
     REPORT_STATUS, SCHEDULE_FREQUENCY, DELIVERY_METHOD,
-    DELIVERY_STATUS, EXPORT_FORMATS
+    DELIVERY_STATUS, EXPORT_FORMATS, ReportRollupWatermark
 )
 
 
@@ -135,8 +135,14 @@ class ReportPermissionAdmin(admin.ModelAdmin):
 
 
 # Register models with admin site
+class ReportRollupWatermarkAdmin(admin.ModelAdmin):
+    list_display = ('source', 'covered_through', 'last_processed_at')
+    readonly_fields = ('source', 'covered_through', 'last_processed_at')
+
+
 admin.site.register(ReportConfiguration, ReportConfigurationAdmin)
 admin.site.register(SavedReport, SavedReportAdmin)
 admin.site.register(ReportSchedule, ReportScheduleAdmin)
 admin.site.register(ReportDelivery, ReportDeliveryAdmin)
-admin.site.register(ReportPermission, ReportPermissionAdmin)
\ No newline at end of file
+admin.site.register(ReportPermission, ReportPermissionAdmin)
+admin.site.register(ReportRollupWatermark, ReportRollupWatermarkAdmin)
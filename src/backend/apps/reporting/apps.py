@@ -30,6 +30,17 @@ class ReportingConfig(AppConfig):
         
         Also configures export capabilities for PDF, Excel, and CSV formats.
         """
+        # Keep the reporting rollups current between refresh runs
+        try:
+            from .signals import connect_reporting_signals
+            connect_reporting_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting reporting signals: {e}")
+        
+        self._setup_periodic_tasks()
+        
         # Avoid importing at module level to prevent AppRegistryNotReady exception
         try:
             # Import here to prevent circular imports and app registry issues
@@ -42,4 +53,32 @@ class ReportingConfig(AppConfig):
             # Log initialization errors but don't prevent app from loading
             import logging
             logger = logging.getLogger(__name__)
-            logger.error(f"Error initializing reporting app: {e}")
\ No newline at end of file
+            logger.error(f"Error initializing reporting app: {e}")
+    
+    def _setup_periodic_tasks(self):
+        """
+        Set up the Celery periodic tasks that refresh and fully rebuild the reporting rollups.
+        """
+        try:
+            from django.conf import settings
+            from celery.schedules import crontab
+            
+            app = settings.CELERY_APP
+            
+            # Register periodic tasks with Celery beat scheduler
+            app.conf.beat_schedule.update({
+                'refresh-report-rollups': {
+                    'task': 'apps.reporting.tasks.refresh_report_rollups',
+                    'schedule': crontab(minute='*/15'),  # Every 15 minutes
+                },
+                # Corrects days changed by .update() or hard deletes outside the trailing window
+                'rebuild-report-rollups': {
+                    'task': 'apps.reporting.tasks.refresh_report_rollups',
+                    'schedule': crontab(minute=30, hour=3, day_of_week='sunday'),  # Weekly
+                    'kwargs': {'full': True},
+                }
+            })
+        except (ImportError, AttributeError) as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Error setting up reporting periodic tasks: {e}")
@@ -1,8 +1,11 @@
 """
 Module for exporting report data to various formats in the loan management system.
 
-This module provides functionality for exporting report data to CSV, Excel, PDF, and JSON formats,
-as well as managing the export process, storing exported files, and generating download URLs.
+This module provides functionality for exporting report data to CSV, Excel, PDF, JSON, Parquet and
+Arrow IPC formats, as well as managing the export process, storing exported files, and generating
+download URLs. The columnar formats keep decimal and date/time types intact for analysis tools.
+Large row-level exports can be streamed from a server-side cursor straight to S3 through a
+multipart upload, so memory use stays bounded regardless of the size of the export.
 """
 
 import os  # standard library
@@ -10,10 +13,21 @@ import tempfile  # standard library
 import json  # standard library
 import csv  # standard library
 import datetime  # standard library
+import io  # standard library
+import itertools  # standard library
 import uuid  # standard library
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP  # standard library
 
 import pandas as pd  # pandas 2.1+
+import pyarrow as pa  # pyarrow 14.0+
+import pyarrow.parquet as pq  # pyarrow 14.0+
+from openpyxl import Workbook  # openpyxl 3.1+
+from openpyxl.cell import WriteOnlyCell  # openpyxl 3.1+
+from openpyxl.styles import Font  # openpyxl 3.1+
 from openpyxl.utils import get_column_letter  # openpyxl 3.1+
+from django.core.exceptions import FieldDoesNotExist  # Django 4.2+
+from django.db.models.constants import LOOKUP_SEP  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
 from weasyprint import HTML  # weasyprint 59.0+
 from jinja2 import Environment, FileSystemLoader  # jinja2 3.1+
 
@@ -27,7 +41,9 @@ EXPORT_CONTENT_TYPES = {
     'csv': 'text/csv',
     'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     'pdf': 'application/pdf',
-    'json': 'application/json'
+    'json': 'application/json',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.file'
 }
 
 # S3 bucket configuration for export storage
@@ -37,6 +53,60 @@ EXPORT_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 # Default URL expiry time in seconds (1 hour)
 DEFAULT_EXPIRY_SECONDS = 3600
 
+# Formats that can be streamed row by row from a queryset
+STREAMING_EXPORT_FORMATS = ('csv', 'xlsx', 'parquet', 'arrow')
+
+# Columnar formats, written one row group (Parquet) or record batch (Arrow) at a time
+COLUMNAR_EXPORT_FORMATS = ('parquet', 'arrow')
+
+# Rows per Parquet row group and Arrow record batch
+COLUMNAR_ROW_GROUP_SIZE = 50000
+
+# Columns with few distinct values that are dictionary-encoded in columnar exports
+DICTIONARY_ENCODED_COLUMNS = ('Status', 'School', 'School Name')
+
+# Arrow types for format specification types in columnar exports
+COLUMNAR_FORMAT_TYPES = {
+    'currency': pa.decimal128(18, 2),
+    'percentage': pa.float64(),
+    'number': pa.float64(),
+    'integer': pa.int64()
+}
+
+# Arrow types for Django model fields in columnar exports; unlisted fields are written as strings
+DJANGO_ARROW_TYPES = {
+    'DateTimeField': pa.timestamp('us', tz='UTC'),
+    'DateField': pa.date32(),
+    'BooleanField': pa.bool_(),
+    'FloatField': pa.float64(),
+    'IntegerField': pa.int64(),
+    'BigIntegerField': pa.int64(),
+    'SmallIntegerField': pa.int64(),
+    'PositiveIntegerField': pa.int64(),
+    'PositiveBigIntegerField': pa.int64(),
+    'PositiveSmallIntegerField': pa.int64(),
+    'AutoField': pa.int64(),
+    'BigAutoField': pa.int64(),
+    'SmallAutoField': pa.int64()
+}
+
+# Rows fetched per round trip from the server-side cursor in streamed exports
+STREAM_CHUNK_SIZE = 2000
+
+# Excel worksheet limits; streamed exports continue on a new worksheet when one is full
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_SHEET_TITLE_LENGTH = 31
+
+# Column width used in streamed Excel exports, where content widths are not known up front
+STREAMED_EXCEL_MIN_COLUMN_WIDTH = 12
+
+# Value formatters applied to columns by format type
+VALUE_FORMATTERS = {
+    'currency': format_currency,
+    'date': format_date,
+    'percentage': format_percentage
+}
+
 
 class ExportError(Exception):
     """
@@ -128,6 +198,10 @@ class ReportExporter:
                 content, filename = self._export_to_pdf(results, report_type)
             elif export_format == 'json':
                 content, filename = self._export_to_json(results, report_type)
+            elif export_format == 'parquet':
+                content, filename = self._export_to_parquet(results, report_type)
+            elif export_format == 'arrow':
+                content, filename = self._export_to_arrow(results, report_type)
             else:
                 # This should not happen due to validation above, but as a safeguard
                 raise ExportError(f"Unsupported export format: {export_format}")
@@ -171,6 +245,91 @@ class ReportExporter:
             # Catch all other exceptions
             raise ExportError(f"Failed to export report: {str(e)}", e)
     
+    def export_queryset(self, report, queryset, fields, export_format, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Streams the rows of a queryset to S3 without materializing the whole dataset.
+        
+        Rows are read from a server-side cursor in chunks and written to a multipart
+        upload, so memory use is bounded by the chunk and part sizes rather than by the
+        number of rows exported.
+        
+        Args:
+            report: The report the export belongs to
+            queryset: QuerySet providing the rows to export
+            fields: Field names (including lookups and annotations) to export as columns
+            export_format: Format to export the rows to (csv, xlsx, parquet, arrow)
+            chunk_size: Number of rows fetched per round trip from the cursor
+            
+        Returns:
+            Dictionary containing export details including file path, content type and row count
+            
+        Raises:
+            ExportError: If export fails for any reason
+        """
+        try:
+            # Validate export format
+            if export_format not in STREAMING_EXPORT_FORMATS:
+                valid_formats = ", ".join(STREAMING_EXPORT_FORMATS)
+                raise ExportError(f"Invalid streaming export format: {export_format}. Valid formats: {valid_formats}")
+            
+            if not fields:
+                raise ExportError("At least one field is required for a streaming export")
+            
+            # Determine report type for filename and formatting
+            report_type = report.report_type.replace("_", "-")
+            filename = self._generate_filename(report_type, export_format)
+            file_path = f"reports/{report.id}/{filename}"
+            
+            headers = self._get_column_headers(fields)
+            
+            # Stream the rows into a multipart upload; the upload is aborted if writing fails
+            with self._storage.open_multipart_upload(
+                file_path,
+                content_type=EXPORT_CONTENT_TYPES.get(export_format),
+                encrypt=True,
+                metadata={
+                    'report_id': str(report.id),
+                    'report_type': report.report_type,
+                    'export_format': export_format,
+                    'exported_at': datetime.datetime.now().isoformat()
+                }
+            ) as upload:
+                if export_format in COLUMNAR_EXPORT_FORMATS:
+                    # Columnar formats keep raw database values so types are preserved
+                    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+                    model_fields = [self._get_model_field(queryset.model, field) for field in fields]
+                    row_count = self._write_columnar(
+                        rows, headers, report_type, export_format, pa.PythonFile(upload, mode='w'), model_fields
+                    )
+                else:
+                    rows = self._iter_formatted_rows(queryset, fields, headers, report_type, chunk_size)
+                    if export_format == 'csv':
+                        row_count = self._stream_csv(rows, headers, upload, chunk_size)
+                    else:
+                        row_count = self._stream_excel(rows, headers, report_type, upload)
+            
+            # Update report with file path and format
+            report.file_path = file_path
+            report.file_format = export_format
+            report.save()
+            
+            logger.info(f"Successfully streamed {row_count} rows of report {report.id} to {export_format} format")
+            
+            return {
+                'file_path': file_path,
+                'file_format': export_format,
+                'content_type': EXPORT_CONTENT_TYPES.get(export_format),
+                'filename': filename,
+                'row_count': row_count
+            }
+        
+        except StorageError as e:
+            # Wrap storage errors
+            raise ExportError(f"Failed to store exported report: {str(e)}", e)
+        except Exception as e:
+            # Catch all other exceptions
+            raise ExportError(f"Failed to export report: {str(e)}", e)
+    
     def get_download_url(self, file_path, expiry_seconds=None):
         """
         Generates a download URL for a previously exported report.
@@ -407,6 +566,536 @@ class ReportExporter:
         except Exception as e:
             raise ExportError(f"Failed to export to JSON: {str(e)}", e)
     
+    def _export_to_parquet(self, data, report_type):
+        """
+        Exports report data to Parquet format.
+        
+        Args:
+            data: Report data to export
+            report_type: Type of report for filename generation and column types
+            
+        Returns:
+            Tuple containing file content (bytes) and filename
+            
+        Raises:
+            ExportError: If Parquet export fails
+        """
+        try:
+            content = self._export_dataframe_to_columnar(data, report_type, 'parquet')
+            filename = self._generate_filename(report_type, 'parquet')
+            return content, filename
+        
+        except Exception as e:
+            raise ExportError(f"Failed to export to Parquet: {str(e)}", e)
+    
+    def _export_to_arrow(self, data, report_type):
+        """
+        Exports report data to Arrow IPC file format.
+        
+        Args:
+            data: Report data to export
+            report_type: Type of report for filename generation and column types
+            
+        Returns:
+            Tuple containing file content (bytes) and filename
+            
+        Raises:
+            ExportError: If Arrow export fails
+        """
+        try:
+            content = self._export_dataframe_to_columnar(data, report_type, 'arrow')
+            filename = self._generate_filename(report_type, 'arrow')
+            return content, filename
+        
+        except Exception as e:
+            raise ExportError(f"Failed to export to Arrow: {str(e)}", e)
+    
+    def _export_dataframe_to_columnar(self, data, report_type, export_format):
+        """
+        Writes report data prepared as a DataFrame to a columnar format in memory.
+        
+        Args:
+            data: Report data to export
+            report_type: Type of report for column types
+            export_format: Columnar format to write (parquet, arrow)
+            
+        Returns:
+            File content (bytes)
+        """
+        df = self._prepare_dataframe(data)
+        rows = df.itertuples(index=False, name=None)
+        
+        sink = pa.BufferOutputStream()
+        self._write_columnar(rows, [str(column) for column in df.columns], report_type, export_format, sink)
+        return sink.getvalue().to_pybytes()
+    
+    def _write_columnar(self, rows, headers, report_type, export_format, sink, model_fields=None):
+        """
+        Writes rows to a Parquet or Arrow IPC file one row group at a time.
+        
+        Column types come from the model fields when known, then from the report's format
+        specifications, and are otherwise inferred from the first row group.
+        
+        Args:
+            rows: Iterable of row tuples
+            headers: Column headers
+            report_type: Type of report for format specifications
+            export_format: Columnar format to write (parquet, arrow)
+            sink: Writable pyarrow sink
+            model_fields: Django model fields matching the columns, or None where unknown
+            
+        Returns:
+            Number of rows written
+        """
+        row_groups = self._chunk_rows(rows, COLUMNAR_ROW_GROUP_SIZE)
+        first_group = next(row_groups, [])
+        
+        schema = self._get_arrow_schema(headers, report_type, first_group, model_fields)
+        
+        # Dictionaries grow across row groups so Arrow files can emit them as deltas
+        dictionaries = [{} for _ in headers]
+        
+        if export_format == 'parquet':
+            writer = pq.ParquetWriter(sink, schema, compression='snappy')
+        else:
+            writer = pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+        
+        row_count = 0
+        for group in itertools.chain([first_group], row_groups):
+            if not group:
+                continue
+            
+            arrays = [
+                self._to_arrow_array([row[index] for row in group], field.type, dictionaries[index])
+                for index, field in enumerate(schema)
+            ]
+            batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+            
+            if export_format == 'parquet':
+                writer.write_table(pa.Table.from_batches([batch]), row_group_size=COLUMNAR_ROW_GROUP_SIZE)
+            else:
+                writer.write_batch(batch)
+            row_count += len(group)
+        
+        writer.close()
+        return row_count
+    
+    def _get_arrow_schema(self, headers, report_type, sample_rows, model_fields=None):
+        """
+        Builds the Arrow schema for a columnar export.
+        
+        Args:
+            headers: Column headers
+            report_type: Type of report for format specifications
+            sample_rows: Rows used to infer the types of columns with no known type
+            model_fields: Django model fields matching the columns, or None where unknown
+            
+        Returns:
+            pyarrow Schema for the export
+        """
+        format_specs = self._get_format_specifications(report_type)
+        
+        fields = []
+        for index, header in enumerate(headers):
+            if header in DICTIONARY_ENCODED_COLUMNS:
+                arrow_type = pa.dictionary(pa.int32(), pa.string())
+            else:
+                model_field = model_fields[index] if model_fields else None
+                format_type = format_specs.get(header)
+                arrow_type = self._get_arrow_type(model_field, format_type)
+                if arrow_type is None:
+                    values = [row[index] for row in sample_rows if not self._is_missing(row[index])]
+                    arrow_type = self._infer_arrow_type(values, format_type)
+            fields.append(pa.field(header, arrow_type))
+        
+        return pa.schema(fields)
+    
+    def _get_arrow_type(self, model_field, format_type):
+        """
+        Gets the Arrow type of a column from its model field or format type.
+        
+        Args:
+            model_field: Django model field backing the column, or None
+            format_type: Format type from the format specifications, or None
+            
+        Returns:
+            pyarrow DataType, or None if the type must be inferred from the values
+        """
+        if model_field is not None:
+            internal_type = model_field.get_internal_type()
+            if internal_type == 'DecimalField':
+                return pa.decimal128(model_field.max_digits, model_field.decimal_places)
+            return DJANGO_ARROW_TYPES.get(internal_type, pa.string())
+        
+        return COLUMNAR_FORMAT_TYPES.get(format_type)
+    
+    def _infer_arrow_type(self, values, format_type):
+        """
+        Infers the Arrow type of a column from sample values.
+        
+        Args:
+            values: Non-missing sample values of the column
+            format_type: Format type from the format specifications, or None
+            
+        Returns:
+            pyarrow DataType for the column
+        """
+        if format_type == 'date':
+            # Report results hold dates as ISO strings; keep date-only columns as dates
+            is_date_only = all(
+                (isinstance(value, datetime.date) and not isinstance(value, datetime.datetime))
+                or (isinstance(value, str) and len(value) == 10)
+                for value in values
+            )
+            return pa.date32() if values and is_date_only else pa.timestamp('us', tz='UTC')
+        
+        try:
+            inferred_type = pa.array(values).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.string()
+        
+        if pa.types.is_null(inferred_type) or pa.types.is_nested(inferred_type):
+            return pa.string()
+        if pa.types.is_decimal(inferred_type):
+            # The sample may understate the precision needed by later row groups
+            return pa.decimal128(38, inferred_type.scale)
+        return inferred_type
+    
+    def _to_arrow_array(self, values, arrow_type, dictionary):
+        """
+        Converts column values to an Arrow array of the given type.
+        
+        Args:
+            values: Column values of one row group
+            arrow_type: Arrow type of the column
+            dictionary: Running value-to-index mapping for dictionary-encoded columns
+            
+        Returns:
+            pyarrow Array
+        """
+        values = [None if self._is_missing(value) else value for value in values]
+        
+        if pa.types.is_dictionary(arrow_type):
+            indices = []
+            for value in values:
+                if value is None:
+                    indices.append(None)
+                    continue
+                indices.append(dictionary.setdefault(str(value), len(dictionary)))
+            return pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=arrow_type.index_type),
+                pa.array(list(dictionary), type=arrow_type.value_type)
+            )
+        
+        if pa.types.is_decimal(arrow_type):
+            values = [self._to_decimal(value, arrow_type.scale) for value in values]
+        elif pa.types.is_timestamp(arrow_type):
+            values = [self._to_datetime(value) for value in values]
+        elif pa.types.is_date(arrow_type):
+            values = [self._to_date(value) for value in values]
+        elif pa.types.is_string(arrow_type):
+            values = [None if value is None else self._to_text(value) for value in values]
+        elif pa.types.is_floating(arrow_type):
+            values = [None if value is None else float(value) for value in values]
+        elif pa.types.is_integer(arrow_type):
+            values = [None if value is None else int(value) for value in values]
+        
+        return pa.array(values, type=arrow_type)
+    
+    def _get_model_field(self, model, field_name):
+        """
+        Resolves the model field behind a values_list() field name.
+        
+        Args:
+            model: Model class of the queryset
+            field_name: Field name, possibly including lookups such as school__name
+            
+        Returns:
+            Django model field, or None for annotations and unresolvable names
+        """
+        field = None
+        for part in field_name.split(LOOKUP_SEP):
+            if model is None:
+                return None
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None
+            model = field.related_model
+        
+        # Relations are exported as the value of their target field (usually the primary key)
+        if field is not None and field.is_relation:
+            return getattr(field, 'target_field', None)
+        return field
+    
+    def _chunk_rows(self, rows, size):
+        """
+        Splits an iterable of rows into lists of at most size rows.
+        
+        Args:
+            rows: Iterable of rows
+            size: Maximum number of rows per chunk
+            
+        Yields:
+            Lists of rows
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _is_missing(self, value):
+        """
+        Checks whether a value is missing (None, NaN or NaT).
+        
+        Args:
+            value: Value to check
+            
+        Returns:
+            True if the value is missing
+        """
+        return value is None or value is pd.NaT or (isinstance(value, float) and value != value)
+    
+    def _to_decimal(self, value, scale):
+        """
+        Converts a value to a Decimal rounded to the column scale.
+        
+        Args:
+            value: Numeric value or numeric string
+            scale: Number of decimal places of the column
+            
+        Returns:
+            Decimal value, or None if the value is missing or not numeric
+        """
+        if value is None:
+            return None
+        try:
+            return Decimal(str(value)).quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+        except (InvalidOperation, ValueError):
+            return None
+    
+    def _to_datetime(self, value):
+        """
+        Converts a value to an aware datetime.
+        
+        Args:
+            value: datetime, date or ISO-formatted string
+            
+        Returns:
+            Aware datetime, or None if the value is missing or unparseable
+        """
+        if value is None:
+            return None
+        try:
+            if isinstance(value, str):
+                value = datetime.datetime.fromisoformat(value)
+            elif not isinstance(value, datetime.datetime):
+                value = datetime.datetime.combine(value, datetime.time.min)
+        except (TypeError, ValueError):
+            return None
+        return value if timezone.is_aware(value) else timezone.make_aware(value)
+    
+    def _to_date(self, value):
+        """
+        Converts a value to a date.
+        
+        Args:
+            value: date, datetime or ISO-formatted string
+            
+        Returns:
+            date, or None if the value is missing or unparseable
+        """
+        if value is None:
+            return None
+        if isinstance(value, datetime.datetime):
+            return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+        if isinstance(value, datetime.date):
+            return value
+        try:
+            return datetime.date.fromisoformat(str(value)[:10])
+        except ValueError:
+            return None
+    
+    def _to_text(self, value):
+        """
+        Converts a value to text for string columns.
+        
+        Args:
+            value: Value to convert
+            
+        Returns:
+            JSON for dictionaries and lists, otherwise the string form of the value
+        """
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        return str(value)
+    
+    def _iter_formatted_rows(self, queryset, fields, headers, report_type, chunk_size):
+        """
+        Yields formatted rows from a server-side cursor over the queryset.
+        
+        Args:
+            queryset: QuerySet providing the rows to export
+            fields: Field names to read from each row
+            headers: Column headers matching the fields
+            report_type: Type of report for format specifications
+            chunk_size: Number of rows fetched per round trip from the cursor
+            
+        Yields:
+            List of formatted values for each row
+        """
+        format_specs = self._get_format_specifications(report_type)
+        format_types = [format_specs.get(header) for header in headers]
+        
+        for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+            yield [self._format_value(value, format_type) for value, format_type in zip(row, format_types)]
+    
+    def _stream_csv(self, rows, headers, upload, chunk_size):
+        """
+        Writes rows as CSV to an upload, flushing the encoded text every chunk.
+        
+        Args:
+            rows: Iterable of formatted rows
+            headers: Column headers
+            upload: Writable file-like object receiving the encoded CSV
+            chunk_size: Number of rows buffered between writes
+            
+        Returns:
+            Number of data rows written
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writerow(headers)
+        
+        row_count = 0
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+            
+            if row_count % chunk_size == 0:
+                upload.write(buffer.getvalue().encode('utf-8'))
+                buffer.seek(0)
+                buffer.truncate()
+        
+        upload.write(buffer.getvalue().encode('utf-8'))
+        return row_count
+    
+    def _stream_excel(self, rows, headers, report_type, upload):
+        """
+        Writes rows to a write-only Excel workbook and streams the saved file to an upload.
+        
+        Write-only worksheets keep rows out of memory; the workbook is assembled in a
+        temporary file and copied to the upload one part at a time.
+        
+        Args:
+            rows: Iterable of formatted rows
+            headers: Column headers
+            report_type: Type of report for worksheet titles
+            upload: Writable file-like object receiving the workbook
+            
+        Returns:
+            Number of data rows written
+        """
+        workbook = Workbook(write_only=True)
+        title = self._get_report_title(report_type)
+        
+        sheet_number = 1
+        worksheet = self._add_streamed_worksheet(workbook, title, headers, sheet_number)
+        sheet_rows = 1
+        row_count = 0
+        
+        for row in rows:
+            # Continue on a new worksheet once the current one is full
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                sheet_number += 1
+                worksheet = self._add_streamed_worksheet(workbook, title, headers, sheet_number)
+                sheet_rows = 1
+            
+            worksheet.append([self._to_excel_value(value) for value in row])
+            sheet_rows += 1
+            row_count += 1
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as temp_file:
+            try:
+                workbook.save(temp_file.name)
+                
+                with open(temp_file.name, 'rb') as f:
+                    for block in iter(lambda: f.read(upload.part_size), b''):
+                        upload.write(block)
+            
+            finally:
+                # Ensure the temporary file is removed
+                try:
+                    os.unlink(temp_file.name)
+                except Exception as e:
+                    logger.warning(f"Failed to remove temporary file {temp_file.name}: {str(e)}")
+        
+        return row_count
+    
+    def _add_streamed_worksheet(self, workbook, title, headers, sheet_number):
+        """
+        Adds a write-only worksheet with column widths and a bold header row.
+        
+        Args:
+            workbook: Write-only openpyxl workbook
+            title: Report title used as the worksheet title
+            headers: Column headers
+            sheet_number: 1-based worksheet number; later worksheets get a numbered suffix
+            
+        Returns:
+            The new write-only worksheet
+        """
+        suffix = f" ({sheet_number})" if sheet_number > 1 else ''
+        sheet_title = title[:EXCEL_MAX_SHEET_TITLE_LENGTH - len(suffix)] + suffix
+        worksheet = workbook.create_sheet(title=sheet_title)
+        
+        # Column widths must be set before the first row is written
+        for index, header in enumerate(headers, start=1):
+            width = max(len(header), STREAMED_EXCEL_MIN_COLUMN_WIDTH) + 2  # Add some padding
+            worksheet.column_dimensions[get_column_letter(index)].width = width
+        
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.font = Font(bold=True)
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        return worksheet
+    
+    def _to_excel_value(self, value):
+        """
+        Converts a database value to a type openpyxl can write.
+        
+        Args:
+            value: Value read from the database
+            
+        Returns:
+            Value suitable for an Excel cell
+        """
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+            # Excel does not support timezones
+            return timezone.make_naive(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        return value
+    
+    def _get_column_headers(self, fields):
+        """
+        Gets readable column headers for queryset fields.
+        
+        Args:
+            fields: Field names, possibly including lookups such as school__name
+            
+        Returns:
+            List of column headers matching those produced by _prepare_dataframe
+        """
+        return [field.replace('__', '_').replace('_', ' ').title() for field in fields]
+    
     def _prepare_dataframe(self, data):
         """
         Prepares a pandas DataFrame from report data.
@@ -478,19 +1167,29 @@ class ReportExporter:
         
         # Apply formatting based on format specifications
         for column, format_type in format_specs.items():
-            if column in formatted_df.columns:
-                if format_type == 'currency':
-                    formatted_df[column] = formatted_df[column].apply(
-                        lambda x: format_currency(x) if pd.notna(x) else '')
-                elif format_type == 'date':
-                    formatted_df[column] = formatted_df[column].apply(
-                        lambda x: format_date(x) if pd.notna(x) else '')
-                elif format_type == 'percentage':
-                    formatted_df[column] = formatted_df[column].apply(
-                        lambda x: format_percentage(x) if pd.notna(x) else '')
+            if column in formatted_df.columns and format_type in VALUE_FORMATTERS:
+                formatted_df[column] = formatted_df[column].apply(
+                    lambda x, format_type=format_type: self._format_value(x, format_type))
         
         return formatted_df
     
+    def _format_value(self, value, format_type):
+        """
+        Formats a single value according to its format type.
+        
+        Args:
+            value: Value to format
+            format_type: Format type from the format specifications, or None
+            
+        Returns:
+            Formatted value, an empty string for missing values, or the value unchanged
+            when the format type has no formatter
+        """
+        formatter = VALUE_FORMATTERS.get(format_type)
+        if formatter is None:
+            return value
+        return formatter(value) if pd.notna(value) else ''
+    
     def _get_format_specifications(self, report_type):
         """
         Gets format specifications for a specific report type.
@@ -12,9 +12,9 @@ import uuid  # standard library
 import json  # standard library
 from croniter import croniter  # croniter 1.0+
 
-from ...core.models import CoreModel
-from ...utils.storage import S3Storage
-from ...utils.logging import logger
+from core.models import CoreModel
+from utils.storage import get_default_storage
+from utils.logging import logger
 
 # Report types with display names
 REPORT_TYPES = {
@@ -60,7 +60,17 @@ EXPORT_FORMATS = {
     'CSV': 'csv',
     'EXCEL': 'xlsx',
     'PDF': 'pdf',
-    'JSON': 'json'
+    'JSON': 'json',
+    'PARQUET': 'parquet',
+    'ARROW': 'arrow'
+}
+
+# Source tables aggregated into daily reporting rollups
+ROLLUP_SOURCES = {
+    'APPLICATIONS': 'applications',
+    'UNDERWRITING_DECISIONS': 'underwriting_decisions',
+    'DOCUMENTS': 'documents',
+    'DISBURSEMENTS': 'disbursements'
 }
 
 
@@ -247,9 +257,7 @@ class SavedReport(CoreModel):
         if not self.file_path:
             raise ValueError("No file path available for this report")
             
-        s3_storage = S3Storage()
-        url = s3_storage.get_presigned_url(self.file_path, expiry_seconds)
-        return url
+        return get_default_storage().get_presigned_url(self.file_path, expiry_seconds)
     
     def is_expired(self):
         """
@@ -515,7 +523,7 @@ class ReportDelivery(CoreModel):
             
         try:
             # Get report file from storage
-            s3_storage = S3Storage()
+            s3_storage = get_default_storage()
             file_content, content_type, _ = s3_storage.retrieve(self.report.file_path)
             
             # Construct destination key
@@ -552,7 +560,7 @@ class ReportDelivery(CoreModel):
             
         try:
             # Get report file from storage
-            s3_storage = S3Storage()
+            s3_storage = get_default_storage()
             file_content, _, _ = s3_storage.retrieve(self.report.file_path)
             
             # Construct destination path
@@ -604,4 +612,48 @@ class ReportPermission(CoreModel):
         super().save(*args, **kwargs)
     
     def __str__(self):
-        return f"Permission for {self.user} on {self.configuration.name}"
\ No newline at end of file
+        return f"Permission for {self.user} on {self.configuration.name}"
+
+
+class ReportRollup(CoreModel):
+    """
+    Model for pre-aggregated daily report counts.
+    
+    Each row holds the number of source records (and the sum of their amounts, where the
+    source has one) for a single day, school, program and status. Report generators read
+    these rows for fully rolled-up days instead of scanning the source tables.
+    """
+    source = models.CharField(max_length=50, choices=[(v, v) for v in ROLLUP_SOURCES.values()])
+    day = models.DateField()
+    school = models.ForeignKey('schools.School', on_delete=models.CASCADE,
+                              null=True, blank=True, related_name='+')
+    program = models.ForeignKey('schools.Program', on_delete=models.CASCADE,
+                               null=True, blank=True, related_name='+')
+    status = models.CharField(max_length=50)
+    count = models.PositiveIntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['source', 'day']),
+            models.Index(fields=['source', 'school', 'day']),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} - {self.day} - {self.status}: {self.count}"
+
+
+class ReportRollupWatermark(CoreModel):
+    """
+    Model for tracking how far the rollups of each source have been built.
+    
+    Source rows changed after last_processed_at have not yet been folded into the
+    rollups; every day up to and including covered_through is fully rolled up.
+    """
+    source = models.CharField(max_length=50, unique=True,
+                             choices=[(v, v) for v in ROLLUP_SOURCES.values()])
+    last_processed_at = models.DateTimeField(null=True, blank=True)
+    covered_through = models.DateField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"{self.source} rollups through {self.covered_through}"
@@ -8,15 +8,19 @@ and conversion rates to support business analytics and operational monitoring.
 
 from datetime import datetime, timedelta
 from django.utils import timezone
-from django.db.models import Q, Count, F, Avg, ExpressionWrapper, DurationField
-from django.db.models.functions import Trunc
+from django.db import connection
+from django.db.models import (
+    Q, Count, F, Avg, Min, ExpressionWrapper, DurationField, Case, When, Value, BooleanField, Window
+)
+from django.db.models.functions import Lead, RowNumber
 import json
 import pandas as pd
 
-from ..apps.applications.models import LoanApplication, ApplicationStatusHistory
-from ..utils.constants import APPLICATION_STATUS
-from ..apps.applications.constants import APPLICATION_TYPES, APPLICATION_TERMINAL_STATUSES
-from ..reporting.models import SavedReport
+from apps.applications.models import LoanApplication, ApplicationStatusHistory
+from utils.constants import APPLICATION_STATUS
+from apps.applications.constants import APPLICATION_TYPES, APPLICATION_TERMINAL_STATUSES
+from ..models import SavedReport, ROLLUP_SOURCES
+from ..rollups import get_rollup_counts, get_interval_start
 
 # Default report parameters
 DEFAULT_PARAMETERS = {
@@ -32,6 +36,12 @@ DEFAULT_PARAMETERS = {
     'include_processing_time': True
 }
 
+# Columns of the row-level export, one row per application
+EXPORT_FIELDS = [
+    'id', 'created_at', 'submission_date', 'status', 'application_type',
+    'school__name', 'program__name'
+]
+
 # Status groupings for easier analysis
 STATUS_GROUPS = {
     'new': ['draft', 'submitted'],
@@ -48,6 +58,127 @@ STATUS_GROUPS = {
 # Valid time intervals for trending data
 TIME_INTERVALS = ['day', 'week', 'month', 'quarter', 'year']
 
+# Statuses counted as approved when calculating approval rates
+APPROVED_STATUSES = [
+    APPLICATION_STATUS['APPROVED'],
+    APPLICATION_STATUS['COMMITMENT_SENT'],
+    APPLICATION_STATUS['COMMITMENT_ACCEPTED'],
+    APPLICATION_STATUS['DOCUMENTS_SENT'],
+    APPLICATION_STATUS['PARTIALLY_EXECUTED'],
+    APPLICATION_STATUS['FULLY_EXECUTED'],
+    APPLICATION_STATUS['QC_REVIEW'],
+    APPLICATION_STATUS['QC_APPROVED'],
+    APPLICATION_STATUS['READY_TO_FUND'],
+    APPLICATION_STATUS['FUNDED']
+]
+
+# Statuses that end the submitted stage with an underwriting decision
+DECISION_STATUSES = [APPLICATION_STATUS['APPROVED'], APPLICATION_STATUS['DENIED']]
+
+# Percentiles reported for processing times, keyed by result field name
+PROCESSING_TIME_PERCENTILES = {
+    'median_hours': 0.5,
+    'p90_hours': 0.9,
+}
+
+# Hours between two timestamp columns, per database vendor
+HOURS_BETWEEN_SQL = {
+    'postgresql': "EXTRACT(EPOCH FROM ({end} - {start})) / 3600.0",
+    'sqlite': "(julianday({end}) - julianday({start})) * 24.0",
+}
+
+# Continuous percentile (as percentile_cont) over rows ranked by hours: linear
+# interpolation between the rows ranked either side of (hours_count - 1) * p
+PERCENTILE_SQL = """
+    SUM(CASE
+        WHEN hours_rank <= (hours_count - 1) * {percentile} AND (hours_count - 1) * {percentile} < hours_rank + 1
+            THEN hours * (1 - ((hours_count - 1) * {percentile} - hours_rank))
+        WHEN hours_rank - 1 <= (hours_count - 1) * {percentile} AND (hours_count - 1) * {percentile} < hours_rank
+            THEN hours * ((hours_count - 1) * {percentile} - (hours_rank - 1))
+    END)
+"""
+
+# Aggregates time spent in each status from the windowed status history
+STATUS_TIMING_SQL = """
+    WITH transitions AS ({transitions}),
+    status_times AS (
+        SELECT new_status, {hours} AS hours
+        FROM transitions
+        WHERE next_changed_at IS NOT NULL
+    ),
+    ranked AS (
+        SELECT new_status, hours,
+            ROW_NUMBER() OVER (PARTITION BY new_status ORDER BY hours) - 1 AS hours_rank,
+            COUNT(*) OVER (PARTITION BY new_status) AS hours_count
+        FROM status_times
+    )
+    SELECT new_status, AVG(hours), MIN(hours), MAX(hours), COUNT(*), {percentiles}
+    FROM ranked
+    GROUP BY new_status
+"""
+
+# Aggregates submission-to-decision time from each application's latest decision
+DECISION_TIMING_SQL = """
+    WITH transitions AS ({transitions}),
+    decision_times AS (
+        SELECT {hours} AS hours
+        FROM transitions
+        WHERE is_decision AND decision_rank = 1 AND first_submitted_at IS NOT NULL
+    ),
+    ranked AS (
+        SELECT hours,
+            ROW_NUMBER() OVER (ORDER BY hours) - 1 AS hours_rank,
+            COUNT(*) OVER () AS hours_count
+        FROM decision_times
+    )
+    SELECT AVG(hours), COUNT(*), {percentiles}
+    FROM ranked
+"""
+
+
+def _approval_rate(approved_count, denied_count):
+    """
+    Calculates the approval rate among decided applications.
+    
+    Args:
+        approved_count (int): Number of approved applications
+        denied_count (int): Number of denied applications
+        
+    Returns:
+        float: Approval rate as a percentage
+    """
+    decided_count = approved_count + denied_count
+    return (approved_count / decided_count) * 100 if decided_count > 0 else 0
+
+
+def _to_float(value):
+    """
+    Converts a database numeric value to float, preserving None.
+    
+    Args:
+        value (Decimal): Numeric value returned by the database
+        
+    Returns:
+        float: The value as a float, or None
+    """
+    return float(value) if value is not None else None
+
+
+def _percentile_stats(values):
+    """
+    Maps percentile column values to their result field names.
+    
+    Args:
+        values (tuple): Percentile values in PROCESSING_TIME_PERCENTILES order
+        
+    Returns:
+        dict: Percentile values keyed by result field name
+    """
+    return {
+        key: _to_float(value)
+        for key, value in zip(PROCESSING_TIME_PERCENTILES, values)
+    }
+
 
 class ApplicationVolumeReport:
     """
@@ -101,7 +232,7 @@ class ApplicationVolumeReport:
         school_id = parameters.get('school_id')
         if school_id:
             try:
-                from ...apps.schools.models import School
+                from apps.schools.models import School
                 school_exists = School.objects.filter(id=school_id).exists()
                 if not school_exists:
                     return False, f"School with ID {school_id} does not exist"
@@ -112,7 +243,7 @@ class ApplicationVolumeReport:
         program_id = parameters.get('program_id')
         if program_id:
             try:
-                from ...apps.schools.models import Program
+                from apps.schools.models import Program
                 program_exists = Program.objects.filter(id=program_id).exists()
                 if not program_exists:
                     return False, f"Program with ID {program_id} does not exist"
@@ -189,24 +320,7 @@ class ApplicationVolumeReport:
         params = self.prepare_parameters(parameters)
         
         try:
-            # Base queryset for application data
-            queryset = LoanApplication.objects.all()
-            
-            # Apply filters based on parameters
-            if params['date_range']['start_date'] and params['date_range']['end_date']:
-                queryset = queryset.filter(
-                    created_at__gte=params['date_range']['start_date'],
-                    created_at__lte=params['date_range']['end_date']
-                )
-            
-            if params['school_id']:
-                queryset = queryset.filter(school_id=params['school_id'])
-            
-            if params['program_id']:
-                queryset = queryset.filter(program_id=params['program_id'])
-            
-            if params['application_type']:
-                queryset = queryset.filter(application_type=params['application_type'])
+            queryset = self.build_queryset(params)
             
             # Generate the metrics
             volume_metrics = self.get_application_volume(queryset, params)
@@ -250,6 +364,50 @@ class ApplicationVolumeReport:
             report.set_error(error_message)
             return False
     
+    def build_queryset(self, params):
+        """
+        Builds the application queryset the report covers.
+        
+        Args:
+            params (dict): Prepared report parameters
+            
+        Returns:
+            QuerySet: Applications filtered by the report parameters
+        """
+        # Base queryset for application data
+        queryset = LoanApplication.objects.all()
+        
+        # Apply filters based on parameters
+        if params['date_range']['start_date'] and params['date_range']['end_date']:
+            queryset = queryset.filter(
+                created_at__gte=params['date_range']['start_date'],
+                created_at__lte=params['date_range']['end_date']
+            )
+        
+        if params['school_id']:
+            queryset = queryset.filter(school_id=params['school_id'])
+        
+        if params['program_id']:
+            queryset = queryset.filter(program_id=params['program_id'])
+        
+        if params['application_type']:
+            queryset = queryset.filter(application_type=params['application_type'])
+        
+        return queryset
+    
+    def get_export_queryset(self, parameters):
+        """
+        Builds the row-level queryset streamed by CSV, Excel and columnar exports.
+        
+        Args:
+            parameters (dict): Report parameters, as stored on the saved report
+            
+        Returns:
+            tuple: (queryset, fields) with one row per application
+        """
+        params = self.prepare_parameters(parameters)
+        return self.build_queryset(params).order_by('created_at', 'pk'), EXPORT_FIELDS
+    
     def get_application_volume(self, queryset, parameters):
         """
         Calculates the total application volume and growth metrics.
@@ -262,7 +420,7 @@ class ApplicationVolumeReport:
             dict: Application volume metrics
         """
         # Get total count
-        total_count = queryset.count()
+        total_count = sum(item['count'] for item in self.get_status_counts(queryset, parameters))
         
         # Calculate timeframe in days
         start_date = parameters['date_range']['start_date']
@@ -273,10 +431,15 @@ class ApplicationVolumeReport:
         previous_start = start_date - timedelta(days=date_range_days)
         previous_end = start_date - timedelta(days=1)
         
-        previous_count = LoanApplication.objects.filter(
+        previous_queryset = LoanApplication.objects.filter(
             created_at__gte=previous_start,
             created_at__lte=previous_end
-        ).count()
+        )
+        previous_count = sum(
+            item['count'] for item in get_rollup_counts(
+                ROLLUP_SOURCES['APPLICATIONS'], previous_queryset, previous_start, previous_end
+            )
+        )
         
         # Calculate growth percentage
         if previous_count > 0:
@@ -303,6 +466,33 @@ class ApplicationVolumeReport:
             }
         }
     
+    def get_status_counts(self, queryset, parameters, by_day=False):
+        """
+        Counts applications by status, reading rolled-up days from the reporting rollups.
+        
+        Only days after the rollup watermark (normally just today) and partial boundary
+        days are counted from the application table. Rollups are bypassed when filtering
+        by application type, which they do not track.
+        
+        Args:
+            queryset (QuerySet): The filtered application queryset
+            parameters (dict): Report parameters
+            by_day (bool): Whether to break counts down by day
+            
+        Returns:
+            list: Dicts with status and count keys (and day when by_day is set)
+        """
+        return get_rollup_counts(
+            ROLLUP_SOURCES['APPLICATIONS'],
+            queryset,
+            parameters['date_range']['start_date'],
+            parameters['date_range']['end_date'],
+            school_id=parameters.get('school_id'),
+            program_id=parameters.get('program_id'),
+            by_day=by_day,
+            use_rollups=not parameters.get('application_type')
+        )
+    
     def get_status_distribution(self, queryset, parameters):
         """
         Calculates the distribution of applications by status.
@@ -315,7 +505,7 @@ class ApplicationVolumeReport:
             dict: Status distribution data
         """
         # Count applications by status
-        status_counts = queryset.values('status').annotate(count=Count('id'))
+        status_counts = self.get_status_counts(queryset, parameters)
         
         # Convert to dictionary for easier manipulation
         status_dict = {item['status']: item['count'] for item in status_counts}
@@ -371,17 +561,14 @@ class ApplicationVolumeReport:
         else:  # year
             trunc_func = 'year'
             
-        # Group by date interval and status
-        trend_data = queryset.annotate(
-            interval=Trunc('created_at', trunc_func)
-        ).values('interval', 'status').annotate(
-            count=Count('id')
-        ).order_by('interval')
+        # Group by day and status, then roll days up into the date interval
+        trend_data = self.get_status_counts(queryset, parameters, by_day=True)
         
         # Organize data by interval and status
         result = {}
         for item in trend_data:
-            interval_str = item['interval'].isoformat()
+            interval = get_interval_start(ROLLUP_SOURCES['APPLICATIONS'], item['day'], trunc_func)
+            interval_str = interval.isoformat()
             status = item['status']
             
             if interval_str not in result:
@@ -390,7 +577,9 @@ class ApplicationVolumeReport:
                     'by_status': {}
                 }
             
-            result[interval_str]['by_status'][status] = item['count']
+            result[interval_str]['by_status'][status] = (
+                result[interval_str]['by_status'].get(status, 0) + item['count']
+            )
             result[interval_str]['total'] += item['count']
             
         # Format trend data as a list sorted by date
@@ -426,6 +615,13 @@ class ApplicationVolumeReport:
         """
         Calculates metrics for application processing times.
         
+        Time spent in each status is derived in the database with window functions over
+        the status history (LEAD over changed_at, partitioned by application), and the
+        average, min, max and percentiles are aggregated per status in SQL. Percentiles
+        are interpolated from ROW_NUMBER ranks rather than percentile_cont, so the same
+        queries run on PostgreSQL and on the SQLite test database. The report runs a
+        constant two queries regardless of the number of applications.
+        
         Args:
             queryset (QuerySet): The filtered application queryset
             parameters (dict): Report parameters
@@ -433,88 +629,109 @@ class ApplicationVolumeReport:
         Returns:
             dict: Processing time metrics
         """
-        # Find applications with status changes
-        status_transitions = ApplicationStatusHistory.objects.filter(
-            application__in=queryset
-        ).values(
-            'application_id', 'previous_status', 'new_status', 'changed_at'
-        ).order_by('application_id', 'changed_at')
-        
-        # Calculate time in each status
-        status_time_data = {}
-        app_time_data = {}
-        
-        for record in status_transitions:
-            app_id = record['application_id']
-            prev_status = record['previous_status']
-            new_status = record['new_status']
-            changed_at = record['changed_at']
-            
-            if app_id not in app_time_data:
-                app_time_data[app_id] = {'transitions': [], 'submission_to_decision': None}
-            
-            app_time_data[app_id]['transitions'].append({
-                'previous_status': prev_status,
-                'new_status': new_status,
-                'changed_at': changed_at
-            })
-            
-            # Track key transitions for metrics
-            if prev_status == APPLICATION_STATUS['SUBMITTED'] and new_status in [
-                APPLICATION_STATUS['APPROVED'], APPLICATION_STATUS['DENIED']
-            ]:
-                # Find the original submission time
-                submission_records = ApplicationStatusHistory.objects.filter(
-                    application_id=app_id,
-                    new_status=APPLICATION_STATUS['SUBMITTED']
-                ).order_by('changed_at')
-                
-                if submission_records.exists():
-                    submission_time = submission_records.first().changed_at
-                    decision_time = changed_at
-                    time_to_decision = (decision_time - submission_time).total_seconds() / 3600  # hours
-                    app_time_data[app_id]['submission_to_decision'] = time_to_decision
-        
-        # Compute average time in each status
-        status_pairs = {}
-        for app_id, data in app_time_data.items():
-            for i in range(len(data['transitions']) - 1):
-                curr = data['transitions'][i]
-                next_record = data['transitions'][i + 1]
-                
-                status = curr['new_status']
-                time_in_status = (next_record['changed_at'] - curr['changed_at']).total_seconds() / 3600  # hours
-                
-                if status not in status_pairs:
-                    status_pairs[status] = []
-                
-                status_pairs[status].append(time_in_status)
+        # Build the windowed status history and compile it for use as a CTE
+        transitions_sql, transitions_params = self.get_status_transitions(queryset).query.sql_with_params()
+        
+        percentile_columns = ', '.join(
+            PERCENTILE_SQL.format(percentile=percentile)
+            for percentile in PROCESSING_TIME_PERCENTILES.values()
+        )
+        hours_between = HOURS_BETWEEN_SQL.get(connection.vendor, HOURS_BETWEEN_SQL['postgresql'])
+        
+        # Time in each status: the gap until the application's next transition
+        status_sql = STATUS_TIMING_SQL.format(
+            transitions=transitions_sql,
+            hours=hours_between.format(start='changed_at', end='next_changed_at'),
+            percentiles=percentile_columns
+        )
+        
+        # Submission to decision: the latest decision per application, measured from first submission
+        decision_sql = DECISION_TIMING_SQL.format(
+            transitions=transitions_sql,
+            hours=hours_between.format(start='first_submitted_at', end='changed_at'),
+            percentiles=percentile_columns
+        )
+        
+        with connection.cursor() as cursor:
+            cursor.execute(status_sql, transitions_params)
+            status_rows = cursor.fetchall()
+            
+            cursor.execute(decision_sql, transitions_params)
+            decision_row = cursor.fetchone()
         
         # Calculate statistics for each status
         status_time_stats = {}
-        for status, times in status_pairs.items():
-            if times:
-                status_time_stats[status] = {
-                    'average_hours': sum(times) / len(times),
-                    'min_hours': min(times),
-                    'max_hours': max(times),
-                    'count': len(times)
-                }
+        for row in status_rows:
+            status, average_hours, min_hours, max_hours, count = row[:5]
+            status_time_stats[status] = {
+                'average_hours': _to_float(average_hours),
+                'min_hours': _to_float(min_hours),
+                'max_hours': _to_float(max_hours),
+                'count': count
+            }
+            status_time_stats[status].update(_percentile_stats(row[5:]))
         
         # Calculate average time from submission to decision
-        decision_times = [data['submission_to_decision'] for app_id, data in app_time_data.items() 
-                         if data['submission_to_decision'] is not None]
-        
-        avg_time_to_decision = None
-        if decision_times:
-            avg_time_to_decision = sum(decision_times) / len(decision_times)
+        average_time_to_decision, sample_size = decision_row[0], decision_row[1]
         
         return {
-            'average_time_to_decision_hours': avg_time_to_decision,
+            'average_time_to_decision_hours': _to_float(average_time_to_decision),
+            'time_to_decision_percentiles': _percentile_stats(decision_row[2:]),
             'status_timing': status_time_stats,
-            'sample_size': len(decision_times)
+            'sample_size': sample_size or 0
         }
     
+    def get_status_transitions(self, queryset):
+        """
+        Builds the status history queryset annotated with per-application window values.
+        
+        Each row carries the time of the application's next transition, its first
+        submission time, and whether it is the application's latest submitted-to-decision
+        transition, so the processing time metrics can be aggregated without loading
+        history rows into Python.
+        
+        Args:
+            queryset (QuerySet): The filtered application queryset
+            
+        Returns:
+            QuerySet: Annotated ApplicationStatusHistory values queryset
+        """
+        partition = [F('application_id')]
+        is_decision = Case(
+            When(
+                previous_status=APPLICATION_STATUS['SUBMITTED'],
+                new_status__in=DECISION_STATUSES,
+                then=Value(True)
+            ),
+            default=Value(False),
+            output_field=BooleanField()
+        )
+        
+        return ApplicationStatusHistory.objects.filter(
+            application__in=queryset
+        ).annotate(
+            next_changed_at=Window(
+                expression=Lead('changed_at'),
+                partition_by=partition,
+                order_by=F('changed_at').asc()
+            ),
+            first_submitted_at=Window(
+                expression=Min(Case(
+                    When(new_status=APPLICATION_STATUS['SUBMITTED'], then=F('changed_at'))
+                )),
+                partition_by=partition
+            ),
+            is_decision=is_decision,
+            decision_rank=Window(
+                expression=RowNumber(),
+                partition_by=partition + [is_decision],
+                order_by=F('changed_at').desc()
+            )
+        ).values(
+            'application_id', 'new_status', 'changed_at', 'next_changed_at',
+            'first_submitted_at', 'is_decision', 'decision_rank'
+        )
+    
     def get_conversion_rates(self, queryset, parameters):
         """
         Calculates conversion rates between application statuses.
@@ -527,14 +744,15 @@ class ApplicationVolumeReport:
             dict: Conversion rate metrics
         """
         # Count applications by status
+        counts = {item['status']: item['count'] for item in self.get_status_counts(queryset, parameters)}
         status_counts = {
-            status: queryset.filter(status=status).count()
+            status: counts.get(status, 0)
             for status in APPLICATION_STATUS.values()
         }
         
         # Add count for grouped statuses
         for category, statuses in STATUS_GROUPS.items():
-            status_counts[f'group_{category}'] = queryset.filter(status__in=statuses).count()
+            status_counts[f'group_{category}'] = sum(counts.get(status, 0) for status in statuses)
         
         # Calculate key conversion metrics
         
@@ -544,23 +762,10 @@ class ApplicationVolumeReport:
         submission_rate = (submitted_count / (draft_count + submitted_count)) * 100 if (draft_count + submitted_count) > 0 else 0
         
         # Submitted to Approved rate
-        approved_status = [
-            APPLICATION_STATUS['APPROVED'],
-            APPLICATION_STATUS['COMMITMENT_SENT'],
-            APPLICATION_STATUS['COMMITMENT_ACCEPTED'],
-            APPLICATION_STATUS['DOCUMENTS_SENT'],
-            APPLICATION_STATUS['PARTIALLY_EXECUTED'],
-            APPLICATION_STATUS['FULLY_EXECUTED'],
-            APPLICATION_STATUS['QC_REVIEW'],
-            APPLICATION_STATUS['QC_APPROVED'],
-            APPLICATION_STATUS['READY_TO_FUND'],
-            APPLICATION_STATUS['FUNDED']
-        ]
-        
-        approved_count = sum(status_counts.get(status, 0) for status in approved_status)
+        approved_count = sum(status_counts.get(status, 0) for status in APPROVED_STATUSES)
         denied_count = status_counts.get(APPLICATION_STATUS['DENIED'], 0)
         
-        approval_rate = (approved_count / (approved_count + denied_count)) * 100 if (approved_count + denied_count) > 0 else 0
+        approval_rate = _approval_rate(approved_count, denied_count)
         
         # Approved to Funded rate
         funded_count = status_counts.get(APPLICATION_STATUS['FUNDED'], 0)
@@ -597,6 +802,10 @@ class ApplicationVolumeReport:
         """
         Breaks down application metrics by school and program.
         
+        Approved and denied counts are computed with conditional aggregation inside the
+        grouped queries, so the breakdown takes two queries regardless of the number of
+        schools and programs.
+        
         Args:
             queryset (QuerySet): The filtered application queryset
             parameters (dict): Report parameters
@@ -604,81 +813,44 @@ class ApplicationVolumeReport:
         Returns:
             dict: School and program breakdown data
         """
+        outcome_counts = {
+            'count': Count('id'),
+            'approved_count': Count('id', filter=Q(status__in=APPROVED_STATUSES)),
+            'denied_count': Count('id', filter=Q(status=APPLICATION_STATUS['DENIED']))
+        }
+        
         # Group by school
         school_data = queryset.values('school_id', 'school__name').annotate(
-            count=Count('id')
+            **outcome_counts
         ).order_by('-count')
         
         schools = {}
         for item in school_data:
             school_id = item['school_id']
-            school_name = item['school__name']
-            
-            if school_id not in schools:
-                schools[school_id] = {
-                    'id': school_id,
-                    'name': school_name,
-                    'total_applications': item['count'],
-                    'programs': {}
-                }
-                
-                # Calculate approval rate for this school
-                school_apps = queryset.filter(school_id=school_id)
-                approved_count = school_apps.filter(status__in=[
-                    APPLICATION_STATUS['APPROVED'], 
-                    APPLICATION_STATUS['COMMITMENT_SENT'],
-                    APPLICATION_STATUS['COMMITMENT_ACCEPTED'],
-                    APPLICATION_STATUS['DOCUMENTS_SENT'],
-                    APPLICATION_STATUS['PARTIALLY_EXECUTED'],
-                    APPLICATION_STATUS['FULLY_EXECUTED'],
-                    APPLICATION_STATUS['QC_REVIEW'],
-                    APPLICATION_STATUS['QC_APPROVED'],
-                    APPLICATION_STATUS['READY_TO_FUND'],
-                    APPLICATION_STATUS['FUNDED']
-                ]).count()
-                
-                denied_count = school_apps.filter(status=APPLICATION_STATUS['DENIED']).count()
-                
-                approval_rate = (approved_count / (approved_count + denied_count)) * 100 if (approved_count + denied_count) > 0 else 0
-                schools[school_id]['approval_rate'] = approval_rate
+            schools[school_id] = {
+                'id': school_id,
+                'name': item['school__name'],
+                'total_applications': item['count'],
+                'programs': {},
+                'approval_rate': _approval_rate(item['approved_count'], item['denied_count'])
+            }
         
         # Group by program for each school
         program_data = queryset.values('school_id', 'program_id', 'program__name').annotate(
-            count=Count('id')
+            **outcome_counts
         ).order_by('school_id', '-count')
         
         for item in program_data:
             school_id = item['school_id']
             program_id = item['program_id']
-            program_name = item['program__name']
-            
-            if school_id in schools:
-                if program_id not in schools[school_id]['programs']:
-                    schools[school_id]['programs'][program_id] = {
-                        'id': program_id,
-                        'name': program_name,
-                        'application_count': item['count']
-                    }
-                    
-                    # Calculate approval rate for this program
-                    program_apps = queryset.filter(program_id=program_id)
-                    approved_count = program_apps.filter(status__in=[
-                        APPLICATION_STATUS['APPROVED'], 
-                        APPLICATION_STATUS['COMMITMENT_SENT'],
-                        APPLICATION_STATUS['COMMITMENT_ACCEPTED'],
-                        APPLICATION_STATUS['DOCUMENTS_SENT'],
-                        APPLICATION_STATUS['PARTIALLY_EXECUTED'],
-                        APPLICATION_STATUS['FULLY_EXECUTED'],
-                        APPLICATION_STATUS['QC_REVIEW'],
-                        APPLICATION_STATUS['QC_APPROVED'],
-                        APPLICATION_STATUS['READY_TO_FUND'],
-                        APPLICATION_STATUS['FUNDED']
-                    ]).count()
-                    
-                    denied_count = program_apps.filter(status=APPLICATION_STATUS['DENIED']).count()
-                    
-                    approval_rate = (approved_count / (approved_count + denied_count)) * 100 if (approved_count + denied_count) > 0 else 0
-                    schools[school_id]['programs'][program_id]['approval_rate'] = approval_rate
+            
+            if school_id in schools and program_id not in schools[school_id]['programs']:
+                schools[school_id]['programs'][program_id] = {
+                    'id': program_id,
+                    'name': item['program__name'],
+                    'application_count': item['count'],
+                    'approval_rate': _approval_rate(item['approved_count'], item['denied_count'])
+                }
         
         # Convert to list format
         school_list = []
@@ -9,16 +9,16 @@ import pandas  # version 2.1+
 from datetime import datetime  # standard library
 
 from django.utils import timezone  # Django 4.2+
-from django.db.models import Q, Count, F, Avg, ExpressionWrapper, DurationField  # Django 4.2+
-from django.db.models.functions import Trunc  # Django 4.2+
+from django.db.models import Q, Count, F, Avg, Min, Max, Aggregate, ExpressionWrapper, DurationField  # Django 4.2+
 
-from ....core.models import CoreModel  # v3.11+
-from ....apps.documents.models import Document, DocumentPackage, SignatureRequest  # v3.11+
-from ....apps.documents.constants import (  # v3.11+
+from core.models import CoreModel  # v3.11+
+from apps.documents.models import Document, SignatureRequest  # v3.11+
+from apps.documents.constants import (  # v3.11+
     DOCUMENT_TYPES, DOCUMENT_STATUS, DOCUMENT_PACKAGE_TYPES,
     SIGNATURE_STATUS, DOCUMENT_EXPIRATION_DAYS
 )
-from ...reporting.models import SavedReport  # v3.11+
+from ...reporting.models import SavedReport, ROLLUP_SOURCES  # v3.11+
+from ...reporting.rollups import get_rollup_counts, get_interval_start  # v3.11+
 
 # Default parameters for document status reports
 DEFAULT_PARAMETERS = {
@@ -33,6 +33,12 @@ DEFAULT_PARAMETERS = {
     'include_expiration_metrics': 'True'
 }
 
+# Columns of the row-level export, one row per document
+EXPORT_FIELDS = [
+    'id', 'package__application_id', 'document_type', 'package__package_type', 'status',
+    'generated_at', 'package__application__school__name', 'package__application__program__name'
+]
+
 # Grouping of document statuses into logical categories
 STATUS_GROUPS = {
     'pending': ['draft', 'generated', 'sent'],
@@ -44,6 +50,9 @@ STATUS_GROUPS = {
 # Allowed time intervals for time-based reports
 TIME_INTERVALS = ['day', 'week', 'month', 'quarter', 'year']
 
+# Processing time metrics reported for completed documents
+PROCESSING_TIME_METRICS = ['average', 'median', 'minimum', 'maximum']
+
 # Thresholds for categorizing document expiration risk levels
 EXPIRATION_RISK_THRESHOLDS = {
     'high': 7,
@@ -52,6 +61,64 @@ EXPIRATION_RISK_THRESHOLDS = {
 }
 
 
+class Median(Aggregate):
+    """
+    Median aggregate computed in the database with PERCENTILE_CONT
+    """
+    function = 'PERCENTILE_CONT'
+    name = 'Median'
+    template = '%(function)s(0.5) WITHIN GROUP (ORDER BY %(expressions)s)'
+
+
+def get_processing_time_aggregates():
+    """
+    Builds the aggregates for generation-to-completion time of completed documents
+    Returns:
+        dict: Aggregate expressions keyed by metric name, usable in aggregate() or annotate()
+    """
+    completed = Q(status='completed', generated_at__isnull=False)
+    processing_time = ExpressionWrapper(F('updated_at') - F('generated_at'), output_field=DurationField())
+
+    return {
+        'average': Avg(processing_time, filter=completed),
+        'median': Median(processing_time, filter=completed, output_field=DurationField()),
+        'minimum': Min(processing_time, filter=completed),
+        'maximum': Max(processing_time, filter=completed)
+    }
+
+
+def summarize_status_groups(rows, group_field):
+    """
+    Folds grouped status rows into per-group totals, status distributions and processing times
+    Args:
+        rows (QuerySet): Values rows grouped by group_field and status, annotated with count
+            and the processing time aggregates
+        group_field (str): Name of the grouping field in each row
+    Returns:
+        dict: Per-group totals, status distributions and processing time metrics
+    """
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(row[group_field], {
+            'total_documents': 0,
+            'status_distribution': {},
+            'processing_time_metrics': {key: None for key in PROCESSING_TIME_METRICS}
+        })
+        group['total_documents'] += row['count']
+        group['status_distribution'][row['status']] = row['count']
+
+        # Processing times only aggregate completed documents, so only that row carries them
+        if row['status'] == 'completed':
+            group['processing_time_metrics'] = {key: row[key] for key in PROCESSING_TIME_METRICS}
+
+    for group in groups.values():
+        completed_count = group['status_distribution'].get('completed', 0)
+        total_documents = group['total_documents']
+        group['completion_rate'] = (completed_count / total_documents) * 100 if total_documents else 0
+
+    return groups
+
+
 class DocumentStatusReport:
     """
     Report generator for document status metrics, providing insights into document completion rates, signature status, and expiration tracking
@@ -133,29 +200,7 @@ class DocumentStatusReport:
 
         prepared_params = self.prepare_parameters(parameters)
 
-        # Build the base queryset
-        queryset = Document.objects.all()
-
-        # Apply filters based on parameters
-        if prepared_params['date_range']['start_date'] and prepared_params['date_range']['end_date']:
-            queryset = queryset.filter(
-                generated_at__date__range=(
-                    prepared_params['date_range']['start_date'],
-                    prepared_params['date_range']['end_date']
-                )
-            )
-
-        if prepared_params['school_id'] != 'None':
-            queryset = queryset.filter(package__application__school_id=prepared_params['school_id'])
-
-        if prepared_params['program_id'] != 'None':
-            queryset = queryset.filter(package__application__program_id=prepared_params['program_id'])
-
-        if prepared_params['document_type'] != 'None':
-            queryset = queryset.filter(document_type=prepared_params['document_type'])
-
-        if prepared_params['package_type'] != 'None':
-            queryset = queryset.filter(package__package_type=prepared_params['package_type'])
+        queryset = self.build_queryset(prepared_params)
 
         # Generate document status metrics
         status_metrics = self.get_document_status_metrics(queryset, prepared_params)
@@ -201,6 +246,51 @@ class DocumentStatusReport:
 
         return True
 
+    def build_queryset(self, prepared_params):
+        """
+        Builds the document queryset the report covers
+        Args:
+            prepared_params (dict): Prepared report parameters
+        Returns:
+            QuerySet: Documents filtered by the report parameters
+        """
+        # Build the base queryset
+        queryset = Document.objects.all()
+
+        # Apply filters based on parameters
+        if prepared_params['date_range']['start_date'] and prepared_params['date_range']['end_date']:
+            queryset = queryset.filter(
+                generated_at__date__range=(
+                    prepared_params['date_range']['start_date'],
+                    prepared_params['date_range']['end_date']
+                )
+            )
+
+        if prepared_params['school_id'] != 'None':
+            queryset = queryset.filter(package__application__school_id=prepared_params['school_id'])
+
+        if prepared_params['program_id'] != 'None':
+            queryset = queryset.filter(package__application__program_id=prepared_params['program_id'])
+
+        if prepared_params['document_type'] != 'None':
+            queryset = queryset.filter(document_type=prepared_params['document_type'])
+
+        if prepared_params['package_type'] != 'None':
+            queryset = queryset.filter(package__package_type=prepared_params['package_type'])
+
+        return queryset
+
+    def get_export_queryset(self, parameters):
+        """
+        Builds the row-level queryset streamed by CSV, Excel and columnar exports
+        Args:
+            parameters (dict): Report parameters, as stored on the saved report
+        Returns:
+            tuple: (queryset, fields) with one row per document
+        """
+        prepared_params = self.prepare_parameters(parameters)
+        return self.build_queryset(prepared_params).order_by('generated_at', 'pk'), EXPORT_FIELDS
+
     def get_document_status_metrics(self, queryset, parameters):
         """
         Calculates metrics for document status distribution
@@ -210,8 +300,8 @@ class DocumentStatusReport:
         Returns:
             dict: Document status metrics
         """
-        total_documents = queryset.count()
-        status_counts = queryset.values('status').annotate(count=Count('id'))
+        status_counts = self.get_status_counts(queryset, parameters)
+        total_documents = sum(item['count'] for item in status_counts)
 
         status_metrics = {
             'total_documents': total_documents,
@@ -252,6 +342,30 @@ class DocumentStatusReport:
 
         return status_metrics
 
+    def get_status_counts(self, queryset, parameters, by_day=False):
+        """
+        Counts documents by status, reading rolled-up days from the reporting rollups
+        Args:
+            queryset (QuerySet):
+            parameters (dict):
+            by_day (bool): Whether to break counts down by generation day
+        Returns:
+            list: Dicts with status and count keys (and day when by_day is set)
+        """
+        # Rollups are keyed by school, program and status only
+        use_rollups = parameters['document_type'] == 'None' and parameters['package_type'] == 'None'
+
+        return get_rollup_counts(
+            ROLLUP_SOURCES['DOCUMENTS'],
+            queryset,
+            parameters['date_range']['start_date'],
+            parameters['date_range']['end_date'],
+            school_id=parameters['school_id'] if parameters['school_id'] != 'None' else None,
+            program_id=parameters['program_id'] if parameters['program_id'] != 'None' else None,
+            by_day=by_day,
+            use_rollups=use_rollups
+        )
+
     def get_signature_metrics(self, queryset, parameters):
         """
         Calculates metrics for document signature status
@@ -359,23 +473,25 @@ class DocumentStatusReport:
         Returns:
             dict: Time-based trend data
         """
-        time_interval = parameters.get('time_interval', 'day')
+        interval_name = parameters.get('time_interval', 'day').strip('"')
 
-        # Group documents by time interval and status
-        time_trend_data = queryset.annotate(
-            time_interval=Trunc('generated_at', time_interval, output_field=models.DateTimeField())
-        ).values('time_interval', 'status').annotate(count=Count('id')).order_by('time_interval')
+        # Group documents by day and status, then fold the days into the time interval
+        time_trend_data = sorted(
+            self.get_status_counts(queryset, parameters, by_day=True),
+            key=lambda item: item['day']
+        )
 
         # Calculate document counts for each interval and status
         trend_data = {}
         for item in time_trend_data:
-            time_interval = item['time_interval'].strftime('%Y-%m-%d')  # Format as date string
+            interval_start = get_interval_start(ROLLUP_SOURCES['DOCUMENTS'], item['day'], interval_name)
+            time_interval = interval_start.strftime('%Y-%m-%d')  # Format as date string
             status = item['status']
             count = item['count']
 
             if time_interval not in trend_data:
                 trend_data[time_interval] = {}
-            trend_data[time_interval][status] = count
+            trend_data[time_interval][status] = trend_data[time_interval].get(status, 0) + count
 
         # Calculate completion rate trend over time
         for time_interval, statuses in trend_data.items():
@@ -394,32 +510,19 @@ class DocumentStatusReport:
         Returns:
             dict: Document type breakdown data
         """
-        document_type_breakdown = {}
-
-        # Group documents by document type
-        document_types = queryset.values_list('document_type', flat=True).distinct()
-        for doc_type in document_types:
-            document_type_queryset = queryset.filter(document_type=doc_type)
-            total_documents = document_type_queryset.count()
-
-            # Calculate status distribution for each document type
-            status_counts = document_type_queryset.values('status').annotate(count=Count('id'))
-            status_distribution = {}
-            for item in status_counts:
-                status_distribution[item['status']] = item['count']
-
-            # Calculate completion rate for each document type
-            completed_count = status_distribution.get('completed', 0)
-            completion_rate = (completed_count / total_documents) * 100 if total_documents else 0
-
-            # Calculate average processing time for each document type
-            processing_time_metrics = self.get_processing_time_metrics(document_type_queryset, parameters)
+        # Count statuses and processing times for every document type in one grouped query
+        rows = queryset.values('document_type', 'status').annotate(
+            count=Count('id'),
+            **get_processing_time_aggregates()
+        ).order_by()
 
+        document_type_breakdown = {}
+        for doc_type, group in summarize_status_groups(rows, 'document_type').items():
             document_type_breakdown[doc_type] = {
-                'total_documents': total_documents,
-                'status_distribution': status_distribution,
-                'completion_rate': completion_rate,
-                'processing_time_metrics': processing_time_metrics
+                'total_documents': group['total_documents'],
+                'status_distribution': group['status_distribution'],
+                'completion_rate': group['completion_rate'],
+                'processing_time_metrics': group['processing_time_metrics']
             }
 
         return document_type_breakdown
@@ -433,32 +536,22 @@ class DocumentStatusReport:
         Returns:
             dict: Package type breakdown data
         """
-        package_type_breakdown = {}
-
-        # Join with DocumentPackage model and group by package type
-        package_types = DocumentPackage.objects.filter(documents__in=queryset).values_list('package_type', flat=True).distinct()
-        for package_type in package_types:
-            package_type_queryset = queryset.filter(package__package_type=package_type)
-            total_documents = package_type_queryset.count()
-
-            # Calculate status distribution for each package type
-            status_counts = package_type_queryset.values('status').annotate(count=Count('id'))
-            status_distribution = {}
-            for item in status_counts:
-                status_distribution[item['status']] = item['count']
-
-            # Calculate completion rate for each package type
-            completed_count = status_distribution.get('completed', 0)
-            completion_rate = (completed_count / total_documents) * 100 if total_documents else 0
-
-            # Calculate average processing time for each package type
-            processing_time_metrics = self.get_processing_time_metrics(package_type_queryset, parameters)
+        # Count statuses and processing times for every package type in one grouped query
+        rows = queryset.values(
+            'status',
+            package_type=F('package__package_type')
+        ).annotate(
+            count=Count('id'),
+            **get_processing_time_aggregates()
+        ).order_by()
 
+        package_type_breakdown = {}
+        for package_type, group in summarize_status_groups(rows, 'package_type').items():
             package_type_breakdown[package_type] = {
-                'total_documents': total_documents,
-                'status_distribution': status_distribution,
-                'completion_rate': completion_rate,
-                'processing_time_metrics': processing_time_metrics
+                'total_documents': group['total_documents'],
+                'status_distribution': group['status_distribution'],
+                'completion_rate': group['completion_rate'],
+                'processing_time_metrics': group['processing_time_metrics']
             }
 
         return package_type_breakdown
@@ -474,30 +567,27 @@ class DocumentStatusReport:
         """
         school_program_breakdown = {}
 
-        # Join with DocumentPackage and LoanApplication models and group by school
-        schools = queryset.values_list('package__application__school__name', flat=True).distinct()
-        for school in schools:
-            school_queryset = queryset.filter(package__application__school__name=school)
-            school_program_breakdown[school] = {}
-
-            # Group by program within each school
-            programs = school_queryset.values_list('package__application__program__name', flat=True).distinct()
-            for program in programs:
-                program_queryset = school_queryset.filter(package__application__program__name=program)
-                total_documents = program_queryset.count()
+        # Join with DocumentPackage and LoanApplication models and group by school and program
+        rows = queryset.values(
+            school=F('package__application__school__name'),
+            program=F('package__application__program__name')
+        ).annotate(
+            total_documents=Count('id'),
+            completed_count=Count('id', filter=Q(status='completed')),
+            **get_processing_time_aggregates()
+        ).order_by()
 
-                # Calculate completion rate for each school/program
-                completed_count = program_queryset.filter(status='completed').count()
-                completion_rate = (completed_count / total_documents) * 100 if total_documents else 0
+        for row in rows:
+            total_documents = row['total_documents']
 
-                # Calculate average processing time for each school/program
-                processing_time_metrics = self.get_processing_time_metrics(program_queryset, parameters)
+            # Calculate completion rate for each school/program
+            completion_rate = (row['completed_count'] / total_documents) * 100 if total_documents else 0
 
-                school_program_breakdown[school][program] = {
-                    'total_documents': total_documents,
-                    'completion_rate': completion_rate,
-                    'processing_time_metrics': processing_time_metrics
-                }
+            school_program_breakdown.setdefault(row['school'], {})[row['program']] = {
+                'total_documents': total_documents,
+                'completion_rate': completion_rate,
+                'processing_time_metrics': {key: row[key] for key in PROCESSING_TIME_METRICS}
+            }
 
         return school_program_breakdown
 
@@ -510,26 +600,10 @@ class DocumentStatusReport:
         Returns:
             dict: Processing time metrics
         """
-        processing_time_metrics = {}
-
         # Calculate time from generation to completion for completed documents
-        completed_documents = queryset.filter(status='completed', generated_at__isnull=False)
-        processing_times = completed_documents.annotate(
-            processing_time=ExpressionWrapper(
-                F('updated_at') - F('generated_at'),
-                output_field=DurationField()
-            )
-        ).aggregate(
-            average=Avg('processing_time'),
-            median=models.Median('processing_time'),
-            minimum=models.Min('processing_time'),
-            maximum=models.Max('processing_time')
-        )
+        processing_times = queryset.aggregate(**get_processing_time_aggregates())
 
-        processing_time_metrics['average'] = processing_times['average']
-        processing_time_metrics['median'] = processing_times['median']
-        processing_time_metrics['minimum'] = processing_times['minimum']
-        processing_time_metrics['maximum'] = processing_times['maximum']
+        processing_time_metrics = {key: processing_times[key] for key in PROCESSING_TIME_METRICS}
 
         # TODO: Break down processing times by document type and package type if needed
 
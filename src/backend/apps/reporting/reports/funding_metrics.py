@@ -8,14 +8,15 @@ and other funding-related analytics to support business monitoring and financial
 import datetime
 from django.utils import timezone
 from django.db.models import Q, Count, Sum, Avg, ExpressionWrapper, DurationField, F, Min, Max
-from django.db.models.functions import Trunc
 import json
 import pandas as pd
 
 # Import models and constants
-from ...apps.funding.models import FundingRequest, Disbursement
-from ...apps.funding.constants import FUNDING_REQUEST_STATUS, DISBURSEMENT_STATUS
-from ..reporting.models import SavedReport
+from apps.funding.models import FundingRequest, Disbursement
+from apps.funding.constants import FUNDING_REQUEST_STATUS, DISBURSEMENT_STATUS
+from apps.reporting.models import SavedReport
+from ..models import ROLLUP_SOURCES
+from ..rollups import get_rollup_counts, get_interval_start
 
 # Default parameters for the funding metrics report
 DEFAULT_PARAMETERS = {
@@ -30,6 +31,12 @@ DEFAULT_PARAMETERS = {
     'include_time_to_fund': True
 }
 
+# Columns of the row-level export, one row per disbursement
+EXPORT_FIELDS = [
+    'id', 'funding_request__application_id', 'disbursement_date', 'amount', 'status',
+    'funding_request__application__school__name', 'funding_request__application__program__name'
+]
+
 # Grouping of funding statuses into logical categories
 FUNDING_STATUS_GROUPS = {
     'pending': [
@@ -310,6 +317,20 @@ class FundingMetricsReport:
         
         return queryset
     
+    def get_export_queryset(self, parameters):
+        """
+        Builds the row-level queryset streamed by CSV, Excel and columnar exports.
+        
+        Args:
+            parameters (dict): Report parameters, as stored on the saved report
+            
+        Returns:
+            tuple: (queryset, fields) with one row per disbursement
+        """
+        prepared_params = self.prepare_parameters(parameters)
+        queryset = self._build_disbursement_query(prepared_params)
+        return queryset.order_by('disbursement_date', 'pk'), EXPORT_FIELDS
+    
     def get_disbursement_volume(self, funding_queryset, disbursement_queryset, parameters):
         """
         Calculates the total disbursement volume and growth metrics.
@@ -326,18 +347,11 @@ class FundingMetricsReport:
         total_requests = funding_queryset.count()
         
         # Calculate total disbursed amount
-        disbursed_amount = disbursement_queryset.filter(
-            status=DISBURSEMENT_STATUS['COMPLETED']
-        ).aggregate(
-            total=Sum('amount')
-        ).get('total', 0) or 0
+        completed = self._get_completed_disbursements(disbursement_queryset, parameters)
+        disbursed_amount = sum(item['amount'] for item in completed) or 0
         
         # Calculate average disbursement amount
-        completed_disbursements = disbursement_queryset.filter(
-            status=DISBURSEMENT_STATUS['COMPLETED']
-        )
-        
-        count_completed = completed_disbursements.count()
+        count_completed = sum(item['count'] for item in completed)
         avg_amount = 0
         if count_completed > 0:
             avg_amount = disbursed_amount / count_completed
@@ -373,9 +387,17 @@ class FundingMetricsReport:
                     funding_request__application__program_id=parameters.get('program_id')
                 )
             
-            previous_amount = previous_disbursements.aggregate(
-                total=Sum('amount')
-            ).get('total', 0) or 0
+            previous_amount = sum(
+                item['amount'] for item in get_rollup_counts(
+                    ROLLUP_SOURCES['DISBURSEMENTS'],
+                    previous_disbursements,
+                    previous_start,
+                    previous_end,
+                    school_id=parameters.get('school_id'),
+                    program_id=parameters.get('program_id')
+                )
+                if item['status'] == DISBURSEMENT_STATUS['COMPLETED']
+            ) or 0
             
             # Calculate growth percentage
             if previous_amount > 0:
@@ -390,6 +412,30 @@ class FundingMetricsReport:
             'completed_disbursements': count_completed
         }
     
+    def _get_completed_disbursements(self, queryset, parameters, by_day=False):
+        """
+        Sums completed disbursements, reading rolled-up days from the reporting rollups.
+        
+        Args:
+            queryset (QuerySet): Filtered disbursement queryset
+            parameters (dict): Report parameters
+            by_day (bool): Whether to break the totals down by disbursement day
+            
+        Returns:
+            list: Dicts with count and amount keys (and day when by_day is set)
+        """
+        date_range = parameters.get('date_range', {})
+        counts = get_rollup_counts(
+            ROLLUP_SOURCES['DISBURSEMENTS'],
+            queryset,
+            date_range.get('start_date'),
+            date_range.get('end_date'),
+            school_id=parameters.get('school_id'),
+            program_id=parameters.get('program_id'),
+            by_day=by_day
+        )
+        return [item for item in counts if item['status'] == DISBURSEMENT_STATUS['COMPLETED']]
+    
     def get_status_distribution(self, queryset, parameters):
         """
         Calculates the distribution of funding requests by status.
@@ -471,17 +517,14 @@ class FundingMetricsReport:
         # Determine time interval for grouping
         time_interval = parameters.get('time_interval', 'month')
         
-        # Apply status filter to only include completed disbursements
-        completed_queryset = queryset.filter(status=DISBURSEMENT_STATUS['COMPLETED'])
-        
-        # Group by time interval
-        truncated_date = Trunc('disbursement_date', time_interval)
-        trend_data = completed_queryset.annotate(
-            interval=truncated_date
-        ).values('interval').annotate(
-            amount=Sum('amount'),
-            count=Count('id')
-        ).order_by('interval')
+        # Only include completed disbursements, grouped by day and folded into the time interval
+        intervals = {}
+        for item in self._get_completed_disbursements(queryset, parameters, by_day=True):
+            interval = get_interval_start(ROLLUP_SOURCES['DISBURSEMENTS'], item['day'], time_interval)
+            entry = intervals.setdefault(interval, {'interval': interval, 'amount': 0, 'count': 0})
+            entry['amount'] += item['amount']
+            entry['count'] += item['count']
+        trend_data = [intervals[interval] for interval in sorted(intervals)]
         
         # Convert to list of dicts for output
         results = []
@@ -619,6 +662,10 @@ class FundingMetricsReport:
         """
         Breaks down funding metrics by school and program.
         
+        Request counts and disbursed amounts are each computed in one grouped query at the
+        program level and rolled up into their schools, so the breakdown takes two queries
+        regardless of the number of schools and programs.
+        
         Args:
             funding_queryset (QuerySet): Filtered funding request queryset
             disbursement_queryset (QuerySet): Filtered disbursement queryset
@@ -627,108 +674,69 @@ class FundingMetricsReport:
         Returns:
             dict: School and program breakdown data
         """
-        # Group funding requests by school
-        school_metrics = funding_queryset.values(
-            'application__school_id', 
-            'application__school__name'
-        ).annotate(
-            request_count=Count('id'),
-            disbursed_count=Count('id', filter=Q(status=FUNDING_REQUEST_STATUS['DISBURSED']))
-        ).order_by('application__school__name')
-        
-        # Get disbursement amounts by school
-        school_disbursements = disbursement_queryset.filter(
-            status=DISBURSEMENT_STATUS['COMPLETED']
-        ).values('funding_request__application__school_id').annotate(
-            total_amount=Sum('amount')
-        )
-        
-        # Create a lookup for school disbursement amounts
-        school_amount_map = {
-            item['funding_request__application__school_id']: item['total_amount']
-            for item in school_disbursements
-        }
-        
-        # Prepare school breakdown with program details
-        schools_data = []
-        
-        for school in school_metrics:
-            school_id = school['application__school_id']
-            
-            # Get program metrics for this school
-            programs_metrics = self._get_school_programs(
-                funding_queryset, 
-                disbursement_queryset, 
-                school_id
-            )
-            
-            # Add school data with program details
-            schools_data.append({
-                'school_id': school_id,
-                'school_name': school['application__school__name'],
-                'request_count': school['request_count'],
-                'disbursed_count': school['disbursed_count'],
-                'total_amount': school_amount_map.get(school_id, 0),
-                'programs': programs_metrics
-            })
-        
-        return {
-            'schools': schools_data
-        }
-    
-    def _get_school_programs(self, funding_queryset, disbursement_queryset, school_id):
-        """
-        Helper method to get program metrics for a specific school.
-        
-        Args:
-            funding_queryset (QuerySet): Filtered funding request queryset
-            disbursement_queryset (QuerySet): Filtered disbursement queryset
-            school_id (UUID): School ID
-            
-        Returns:
-            list: Program metrics for the school
-        """
-        # Filter to the specified school
-        school_funding = funding_queryset.filter(application__school_id=school_id)
-        
-        # Group by program
-        program_metrics = school_funding.values(
+        # Group funding requests by school and program
+        program_metrics = funding_queryset.values(
+            'application__school_id',
+            'application__school__name',
             'application__program_id',
             'application__program__name'
         ).annotate(
             request_count=Count('id'),
             disbursed_count=Count('id', filter=Q(status=FUNDING_REQUEST_STATUS['DISBURSED']))
-        ).order_by('application__program__name')
+        ).order_by('application__school__name', 'application__program__name')
         
-        # Get disbursement amounts by program
+        # Get disbursement amounts by school and program
         program_disbursements = disbursement_queryset.filter(
-            status=DISBURSEMENT_STATUS['COMPLETED'],
-            funding_request__application__school_id=school_id
-        ).values('funding_request__application__program_id').annotate(
+            status=DISBURSEMENT_STATUS['COMPLETED']
+        ).values(
+            'funding_request__application__school_id',
+            'funding_request__application__program_id'
+        ).annotate(
             total_amount=Sum('amount')
         )
         
-        # Create a lookup for program disbursement amounts
-        program_amount_map = {
-            item['funding_request__application__program_id']: item['total_amount']
-            for item in program_disbursements
-        }
+        # Create lookups for program and school disbursement amounts
+        program_amount_map = {}
+        school_amount_map = {}
+        for item in program_disbursements:
+            school_id = item['funding_request__application__school_id']
+            program_id = item['funding_request__application__program_id']
+            program_amount_map[(school_id, program_id)] = item['total_amount']
+            school_amount_map[school_id] = school_amount_map.get(school_id, 0) + (item['total_amount'] or 0)
         
-        # Prepare program metrics
-        programs_data = []
+        # Prepare school breakdown with program details
+        schools = {}
         
         for program in program_metrics:
+            school_id = program['application__school_id']
             program_id = program['application__program_id']
+            total_amount = program_amount_map.get((school_id, program_id), 0)
+            
+            if school_id not in schools:
+                schools[school_id] = {
+                    'school_id': school_id,
+                    'school_name': program['application__school__name'],
+                    'request_count': 0,
+                    'disbursed_count': 0,
+                    'total_amount': school_amount_map.get(school_id, 0),
+                    'programs': []
+                }
+            
+            school = schools[school_id]
+            school['request_count'] += program['request_count']
+            school['disbursed_count'] += program['disbursed_count']
             
-            programs_data.append({
+            school['programs'].append({
                 'program_id': program_id,
                 'program_name': program['application__program__name'],
                 'request_count': program['request_count'],
                 'disbursed_count': program['disbursed_count'],
-                'total_amount': program_amount_map.get(program_id, 0)
+                'total_amount': total_amount
             })
         
-        return programs_data
+        return {
+            'schools': list(schools.values())
+        }
     
     def format_results(self, volume_metrics, status_distribution, time_trend, time_to_fund, school_program_breakdown):
         """
@@ -849,7 +857,7 @@ class FundingMetricsReport:
             dfs['time_trend'] = time_trend_df
             
             # Generate file based on format
-            from ...utils.storage import S3Storage
+            from utils.storage import S3Storage
             
             # In a real implementation, we would:
             # 1. Create a temporary file
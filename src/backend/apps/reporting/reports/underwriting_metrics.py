@@ -10,11 +10,11 @@ from datetime import datetime  # standard library
 
 import pandas  # version 2.1+
 from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Min, Max, Q  # Django 4.2+
-from django.db.models.functions import Trunc  # Django 4.2+
 from django.utils import timezone  # Django 4.2+
 
 from apps.applications.models import ApplicationStatusHistory, LoanApplication  # Import the LoanApplication model for querying application data
-from apps.reporting.models import SavedReport  # Import the SavedReport model for storing report results
+from apps.reporting.models import SavedReport, ROLLUP_SOURCES  # Import the SavedReport model for storing report results
+from apps.reporting.rollups import get_interval_start, get_rollup_counts  # Rollup-backed decision counts
 from apps.underwriting.models import (  # Import the UnderwritingQueue model for queue metrics
     CreditInformation,  # Import the CreditInformation model for credit metrics
     DecisionReason,  # Import the DecisionReason model for tracking denial reasons
@@ -24,6 +24,12 @@ from apps.underwriting.models import (  # Import the UnderwritingQueue model for
 )
 from utils.constants import UNDERWRITING_DECISION  # Import underwriting decision constants for report categorization
 
+# Columns of the row-level export, one row per underwriting decision
+EXPORT_FIELDS = [
+    'application_id', 'decision_date', 'decision', 'approved_amount', 'interest_rate',
+    'term_months', 'rule_set_version', 'application__school__name', 'application__program__name'
+]
+
 DEFAULT_PARAMETERS = {
     'date_range': {'start_date': 'None', 'end_date': 'None'},
     'school_id': 'None',
@@ -147,28 +153,7 @@ class UnderwritingMetricsReport:
 
         prepared_params = self.prepare_parameters(parameters)
 
-        # Build base queryset for UnderwritingDecision
-        queryset = UnderwritingDecision.objects.filter(is_deleted=False)
-
-        # Apply date range filter
-        start_date = prepared_params['date_range']['start_date']
-        end_date = prepared_params['date_range']['end_date']
-        queryset = queryset.filter(decision_date__date__range=[start_date, end_date])
-
-        # Apply school filter
-        school_id = prepared_params.get('school_id')
-        if school_id and school_id != 'None':
-            queryset = queryset.filter(application__school_id=school_id)
-
-        # Apply program filter
-        program_id = prepared_params.get('program_id')
-        if program_id and program_id != 'None':
-            queryset = queryset.filter(application__program_id=program_id)
-
-        # Apply underwriter filter
-        underwriter_id = prepared_params.get('underwriter_id')
-        if underwriter_id and underwriter_id != 'None':
-            queryset = queryset.filter(underwriter_id=underwriter_id)
+        queryset = self.build_queryset(prepared_params)
 
         # Generate decision metrics
         decision_metrics = self.get_decision_metrics(queryset, prepared_params)
@@ -216,6 +201,54 @@ class UnderwritingMetricsReport:
 
         return True
 
+    def build_queryset(self, prepared_params):
+        """
+        Builds the underwriting decision queryset the report covers
+
+        Args:
+            prepared_params (dict): Prepared report parameters
+
+        Returns:
+            QuerySet: Decisions filtered by the report parameters
+        """
+        # Build base queryset for UnderwritingDecision
+        queryset = UnderwritingDecision.objects.filter(is_deleted=False)
+
+        # Apply date range filter
+        start_date = prepared_params['date_range']['start_date']
+        end_date = prepared_params['date_range']['end_date']
+        queryset = queryset.filter(decision_date__date__range=[start_date, end_date])
+
+        # Apply school filter
+        school_id = prepared_params.get('school_id')
+        if school_id and school_id != 'None':
+            queryset = queryset.filter(application__school_id=school_id)
+
+        # Apply program filter
+        program_id = prepared_params.get('program_id')
+        if program_id and program_id != 'None':
+            queryset = queryset.filter(application__program_id=program_id)
+
+        # Apply underwriter filter
+        underwriter_id = prepared_params.get('underwriter_id')
+        if underwriter_id and underwriter_id != 'None':
+            queryset = queryset.filter(underwriter_id=underwriter_id)
+
+        return queryset
+
+    def get_export_queryset(self, parameters):
+        """
+        Builds the row-level queryset streamed by CSV, Excel and columnar exports
+
+        Args:
+            parameters (dict): Report parameters, as stored on the saved report
+
+        Returns:
+            tuple: (queryset, fields) with one row per underwriting decision
+        """
+        prepared_params = self.prepare_parameters(parameters)
+        return self.build_queryset(prepared_params).order_by('decision_date', 'pk'), EXPORT_FIELDS
+
     def get_decision_metrics(self, queryset, parameters):
         """
         Calculates metrics related to underwriting decisions
@@ -227,10 +260,11 @@ class UnderwritingMetricsReport:
         Returns:
             dict: Decision metrics including approval rate, denial rate, and revision rate
         """
-        total_decisions = queryset.count()
-        approved_count = queryset.filter(decision=UNDERWRITING_DECISION['APPROVE']).count()
-        denied_count = queryset.filter(decision=UNDERWRITING_DECISION['DENY']).count()
-        revision_count = queryset.filter(decision=UNDERWRITING_DECISION['REVISE']).count()
+        decision_counts = {item['status']: item['count'] for item in self.get_decision_counts(queryset, parameters)}
+        total_decisions = sum(decision_counts.values())
+        approved_count = decision_counts.get(UNDERWRITING_DECISION['APPROVE'], 0)
+        denied_count = decision_counts.get(UNDERWRITING_DECISION['DENY'], 0)
+        revision_count = decision_counts.get(UNDERWRITING_DECISION['REVISE'], 0)
 
         approval_rate = (approved_count / total_decisions) * 100 if total_decisions else 0
         denial_rate = (denied_count / total_decisions) * 100 if total_decisions else 0
@@ -246,10 +280,17 @@ class UnderwritingMetricsReport:
         previous_queryset = UnderwritingDecision.objects.filter(
             decision_date__date__range=[previous_start_date, previous_end_date]
         )
-        previous_total_decisions = previous_queryset.count()
-        previous_approved_count = previous_queryset.filter(decision=UNDERWRITING_DECISION['APPROVE']).count()
-        previous_denial_count = previous_queryset.filter(decision=UNDERWRITING_DECISION['DENY']).count()
-        previous_revision_count = previous_queryset.filter(decision=UNDERWRITING_DECISION['REVISE']).count()
+        previous_counts = {
+            item['status']: item['count']
+            for item in get_rollup_counts(
+                ROLLUP_SOURCES['UNDERWRITING_DECISIONS'], previous_queryset,
+                previous_start_date, previous_end_date
+            )
+        }
+        previous_total_decisions = sum(previous_counts.values())
+        previous_approved_count = previous_counts.get(UNDERWRITING_DECISION['APPROVE'], 0)
+        previous_denial_count = previous_counts.get(UNDERWRITING_DECISION['DENY'], 0)
+        previous_revision_count = previous_counts.get(UNDERWRITING_DECISION['REVISE'], 0)
 
         previous_approval_rate = (previous_approved_count / previous_total_decisions) * 100 if previous_total_decisions else 0
         previous_denial_rate = (previous_denial_count / previous_total_decisions) * 100 if previous_total_decisions else 0
@@ -273,6 +314,36 @@ class UnderwritingMetricsReport:
             'revision_rate_change': revision_rate_change,
         }
 
+    def get_decision_counts(self, queryset, parameters, by_day=False):
+        """
+        Counts decisions by outcome, reading rolled-up days from the reporting rollups
+
+        Only days after the rollup watermark and the live current day are counted from the
+        decision table. Rollups are bypassed when filtering by underwriter, which they do not track.
+
+        Args:
+            queryset (QuerySet): Base queryset for UnderwritingDecision
+            parameters (dict): Report parameters
+            by_day (bool): Whether to break counts down by day
+
+        Returns:
+            list: Dicts with status (the decision) and count keys, plus day when by_day is set
+        """
+        school_id = parameters.get('school_id')
+        program_id = parameters.get('program_id')
+        underwriter_id = parameters.get('underwriter_id')
+
+        return get_rollup_counts(
+            ROLLUP_SOURCES['UNDERWRITING_DECISIONS'],
+            queryset,
+            parameters['date_range']['start_date'],
+            parameters['date_range']['end_date'],
+            school_id=school_id if school_id != 'None' else None,
+            program_id=program_id if program_id != 'None' else None,
+            by_day=by_day,
+            use_rollups=not underwriter_id or underwriter_id == 'None'
+        )
+
     def get_time_trend(self, queryset, parameters):
         """
         Generates time-based trend data for underwriting decisions
@@ -284,18 +355,21 @@ class UnderwritingMetricsReport:
         Returns:
             dict: Time-based trend data for decisions
         """
-        time_interval = parameters.get('time_interval', 'day')
-
-        # Truncate the decision_date to the specified time interval
-        truncated_date = Trunc('decision_date', time_interval, output_field=models.DateTimeField())
-
-        # Annotate the queryset with the truncated date and count decisions
-        trend_data = queryset.annotate(time=truncated_date).values('time').annotate(
-            total=Count('id'),
-            approved=Count('id', filter=Q(decision=UNDERWRITING_DECISION['APPROVE'])),
-            denied=Count('id', filter=Q(decision=UNDERWRITING_DECISION['DENY'])),
-            revision=Count('id', filter=Q(decision=UNDERWRITING_DECISION['REVISE']))
-        ).order_by('time')
+        time_interval = parameters.get('time_interval', 'day').strip('"')
+
+        # Count decisions per day and fold the days into the specified time interval
+        intervals = {}
+        for item in self.get_decision_counts(queryset, parameters, by_day=True):
+            time = get_interval_start(ROLLUP_SOURCES['UNDERWRITING_DECISIONS'], item['day'], time_interval)
+            interval = intervals.setdefault(time, {'time': time, 'total': 0, 'approved': 0, 'denied': 0, 'revision': 0})
+            interval['total'] += item['count']
+            if item['status'] == UNDERWRITING_DECISION['APPROVE']:
+                interval['approved'] += item['count']
+            elif item['status'] == UNDERWRITING_DECISION['DENY']:
+                interval['denied'] += item['count']
+            elif item['status'] == UNDERWRITING_DECISION['REVISE']:
+                interval['revision'] += item['count']
+        trend_data = [intervals[time] for time in sorted(intervals)]
 
         # Calculate approval rate for each interval
         trend = []
@@ -0,0 +1,432 @@
+"""
+Incremental daily rollups for the reporting subsystem.
+
+This module maintains ReportRollup rows (record counts and amount sums per source, day,
+school, program and status) and answers report queries from them. Days are rebuilt
+idempotently from the source tables, either in bulk by the watermark-driven refresh task
+or one at a time when a status change touches an already rolled-up day. Report generators
+read rolled-up days from the rollup table and only query the source tables for the live
+tail (today, and any day the watermark has not reached yet) and partial boundary days.
+"""
+
+from datetime import date, datetime, time, timedelta  # standard library
+from decimal import Decimal  # standard library
+import logging  # standard library
+
+from django.apps import apps  # Django 4.2+
+from django.db import models, transaction  # Django 4.2+
+from django.db.models import Count, F, Q, Sum, Value  # Django 4.2+
+from django.db.models.functions import TruncDate  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
+
+from .models import ReportRollup, ReportRollupWatermark, ROLLUP_SOURCES
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# How each rollup source maps onto the fields of its model
+ROLLUP_SOURCE_DEFINITIONS = {
+    ROLLUP_SOURCES['APPLICATIONS']: {
+        'model': 'applications.LoanApplication',
+        'date_field': 'created_at',
+        'school_field': 'school_id',
+        'program_field': 'program_id',
+        'status_field': 'status',
+        'amount_field': None,
+    },
+    ROLLUP_SOURCES['UNDERWRITING_DECISIONS']: {
+        'model': 'underwriting.UnderwritingDecision',
+        'date_field': 'decision_date',
+        'school_field': 'application__school_id',
+        'program_field': 'application__program_id',
+        'status_field': 'decision',
+        'amount_field': None,
+    },
+    ROLLUP_SOURCES['DOCUMENTS']: {
+        'model': 'documents.Document',
+        'date_field': 'generated_at',
+        'school_field': 'package__application__school_id',
+        'program_field': 'package__application__program_id',
+        'status_field': 'status',
+        'amount_field': None,
+    },
+    ROLLUP_SOURCES['DISBURSEMENTS']: {
+        'model': 'funding.Disbursement',
+        'date_field': 'disbursement_date',
+        'school_field': 'funding_request__application__school_id',
+        'program_field': 'funding_request__application__program_id',
+        'status_field': 'status',
+        'amount_field': 'amount',
+    },
+}
+
+# Number of rollup rows written per INSERT
+ROLLUP_BATCH_SIZE = 1000
+
+# Number of days before today rebuilt on every refresh. Queryset .update() calls and hard
+# deletes change source rows without touching updated_at, so they are only picked up by
+# this trailing window or by the scheduled full refresh.
+ROLLUP_REFRESH_WINDOW_DAYS = 7
+
+
+def get_source_model(source):
+    """
+    Returns the model class a rollup source aggregates.
+
+    Args:
+        source (str): Rollup source identifier
+
+    Returns:
+        Model: The source model class
+    """
+    return apps.get_model(ROLLUP_SOURCE_DEFINITIONS[source]['model'])
+
+
+def _is_datetime_source(source):
+    """
+    Checks whether a source is dated by a DateTimeField rather than a DateField.
+
+    Args:
+        source (str): Rollup source identifier
+
+    Returns:
+        bool: True if the source's date field holds datetimes
+    """
+    date_field = ROLLUP_SOURCE_DEFINITIONS[source]['date_field']
+    return isinstance(get_source_model(source)._meta.get_field(date_field), models.DateTimeField)
+
+
+def _day_expression(source):
+    """
+    Returns the expression that maps a source row to its rollup day.
+
+    Args:
+        source (str): Rollup source identifier
+
+    Returns:
+        Expression: Local calendar day of the row's date field
+    """
+    date_field = ROLLUP_SOURCE_DEFINITIONS[source]['date_field']
+    if _is_datetime_source(source):
+        return TruncDate(date_field)
+    return F(date_field)
+
+
+def _day_start(day):
+    """
+    Returns the aware datetime at which a local calendar day starts.
+
+    Args:
+        day (date): Calendar day
+
+    Returns:
+        datetime: Local midnight at the start of the day
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _window_q(source, first_day, last_day):
+    """
+    Builds a filter matching source rows dated within an inclusive range of days.
+
+    Args:
+        source (str): Rollup source identifier
+        first_day (date): First day of the window
+        last_day (date): Last day of the window
+
+    Returns:
+        Q: Filter on the source's date field
+    """
+    date_field = ROLLUP_SOURCE_DEFINITIONS[source]['date_field']
+    if _is_datetime_source(source):
+        return Q(**{
+            f'{date_field}__gte': _day_start(first_day),
+            f'{date_field}__lt': _day_start(last_day + timedelta(days=1)),
+        })
+    return Q(**{f'{date_field}__gte': first_day, f'{date_field}__lte': last_day})
+
+
+def _aggregate_by_day(source, queryset, by_day=True, school=False):
+    """
+    Groups source rows by status (and optionally day, school and program) in the database.
+
+    Args:
+        source (str): Rollup source identifier
+        queryset (QuerySet): Source rows to aggregate
+        by_day (bool): Whether to group by rollup day
+        school (bool): Whether to group by school and program
+
+    Returns:
+        QuerySet: Values queryset with rollup_status, rollup_count and rollup_amount keys
+    """
+    definition = ROLLUP_SOURCE_DEFINITIONS[source]
+    group = {'rollup_status': F(definition['status_field'])}
+    if by_day:
+        group['rollup_day'] = _day_expression(source)
+    if school:
+        group['rollup_school'] = F(definition['school_field'])
+        group['rollup_program'] = F(definition['program_field'])
+
+    amount = Sum(definition['amount_field']) if definition['amount_field'] else Value(Decimal('0'))
+    return queryset.order_by().values(**group).annotate(
+        rollup_count=Count('pk'),
+        rollup_amount=amount
+    )
+
+
+def rebuild_rollup_days(source, days):
+    """
+    Recomputes the rollup rows of a source for the given days from the source table.
+
+    Rebuilding is idempotent: the days' existing rollup rows are replaced in a single
+    transaction with one grouped query's worth of fresh counts.
+
+    Args:
+        source (str): Rollup source identifier
+        days (iterable): Calendar days to rebuild
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    days = sorted(set(days))
+    if not days:
+        return 0
+
+    model = get_source_model(source)
+    rows = _aggregate_by_day(
+        source,
+        model.objects.filter(_window_q(source, days[0], days[-1])),
+        school=True
+    ).filter(rollup_day__in=days)
+
+    rollups = [
+        ReportRollup(
+            source=source,
+            day=row['rollup_day'],
+            school_id=row['rollup_school'],
+            program_id=row['rollup_program'],
+            status=row['rollup_status'],
+            count=row['rollup_count'],
+            amount=row['rollup_amount'] or Decimal('0')
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        ReportRollup.all_objects.filter(source=source, day__in=days).delete()
+        ReportRollup.objects.bulk_create(rollups, batch_size=ROLLUP_BATCH_SIZE)
+
+    return len(rollups)
+
+
+def refresh_rollups(source, full=False):
+    """
+    Brings the rollups of a source up to date with every day before today.
+
+    Only days touched by rows changed since the last run (by updated_at), days the
+    watermark has newly passed and the last ROLLUP_REFRESH_WINDOW_DAYS days are rebuilt,
+    so a routine refresh reads a small slice of the source table. The first run, or a full
+    refresh, rebuilds every day, including rolled-up days whose source rows are all gone.
+    Changes that bypass updated_at on older days are only corrected by a full refresh,
+    which the reporting app schedules weekly.
+
+    Args:
+        source (str): Rollup source identifier
+        full (bool): Whether to rebuild all days regardless of the watermark
+
+    Returns:
+        int: Number of days rebuilt
+    """
+    model = get_source_model(source)
+    date_field = ROLLUP_SOURCE_DEFINITIONS[source]['date_field']
+    watermark, _ = ReportRollupWatermark.objects.get_or_create(source=source)
+
+    now = timezone.now()
+    today = timezone.localdate(now)
+    day_expression = _day_expression(source)
+
+    # Changed rows, including soft-deleted ones, mark their day as stale
+    changed = model._base_manager.filter(**{f'{date_field}__isnull': False})
+    if watermark.last_processed_at and watermark.covered_through and not full:
+        changed = changed.filter(updated_at__gt=watermark.last_processed_at)
+    days = set(
+        changed.order_by().annotate(rollup_day=day_expression).filter(
+            rollup_day__lt=today
+        ).values_list('rollup_day', flat=True).distinct()
+    )
+
+    # Days the watermark passes for the first time, e.g. future-dated rows that came due
+    if watermark.covered_through and not full:
+        first_new_day = watermark.covered_through + timedelta(days=1)
+        if first_new_day < today:
+            days.update(
+                model.objects.filter(_window_q(source, first_new_day, today - timedelta(days=1)))
+                .order_by().annotate(rollup_day=day_expression)
+                .values_list('rollup_day', flat=True).distinct()
+            )
+
+    if full or not watermark.covered_through:
+        # Days whose source rows were hard deleted still have rollup rows to clear
+        days.update(
+            ReportRollup.all_objects.filter(source=source, day__lt=today)
+            .order_by().values_list('day', flat=True).distinct()
+        )
+    else:
+        # Recent days are rebuilt regardless, to catch writes that skip updated_at
+        days.update(today - timedelta(days=offset) for offset in range(1, ROLLUP_REFRESH_WINDOW_DAYS + 1))
+
+    rebuild_rollup_days(source, days)
+
+    watermark.last_processed_at = now
+    watermark.covered_through = today - timedelta(days=1)
+    watermark.save()
+
+    logger.info(f"Rebuilt {len(days)} {source} rollup days, covered through {watermark.covered_through}")
+    return len(days)
+
+
+def get_covered_through(source):
+    """
+    Returns the last day for which a source's rollups are complete.
+
+    Args:
+        source (str): Rollup source identifier
+
+    Returns:
+        date: Last rolled-up day, or None if the source has never been rolled up
+    """
+    return ReportRollupWatermark.objects.filter(source=source).values_list(
+        'covered_through', flat=True
+    ).first()
+
+
+def get_covered_days(source, start, end):
+    """
+    Determines which whole days of a report range can be answered from rollups.
+
+    Datetime bounds only cover days that lie entirely within them; date bounds are
+    treated as inclusive whole days.
+
+    Args:
+        source (str): Rollup source identifier
+        start (datetime|date): Start of the report range
+        end (datetime|date): End of the report range
+
+    Returns:
+        tuple: (first_day, last_day) of the rolled-up window, or None if no day is covered
+    """
+    if not start or not end:
+        return None
+
+    covered_through = get_covered_through(source)
+    if covered_through is None:
+        return None
+
+    # Report parameters parsed from ISO dates are naive; they are read in local time
+    if isinstance(start, datetime) and timezone.is_naive(start):
+        start = timezone.make_aware(start)
+    if isinstance(end, datetime) and timezone.is_naive(end):
+        end = timezone.make_aware(end)
+
+    if isinstance(start, datetime):
+        first_day = timezone.localdate(start)
+        if _day_start(first_day) < start:
+            first_day += timedelta(days=1)
+    else:
+        first_day = start
+
+    if isinstance(end, datetime):
+        last_day = timezone.localdate(end) - timedelta(days=1)
+    else:
+        last_day = end
+
+    last_day = min(last_day, covered_through)
+    if first_day > last_day:
+        return None
+    return first_day, last_day
+
+
+def get_rollup_counts(source, queryset, start, end, school_id=None, program_id=None,
+                      by_day=False, use_rollups=True):
+    """
+    Counts source records by status, reading rolled-up days from the rollup table.
+
+    The queryset must already carry the report's filters. Rows dated inside the covered
+    window are read from rollups (filtered by school and program), and the remaining
+    rows, i.e. the live tail and partial boundary days, are aggregated from the queryset.
+
+    Args:
+        source (str): Rollup source identifier
+        queryset (QuerySet): Filtered source queryset for the report range
+        start (datetime|date): Start of the range the queryset was filtered with
+        end (datetime|date): End of the range the queryset was filtered with
+        school_id (uuid): School filter applied to the queryset, if any
+        program_id (uuid): Program filter applied to the queryset, if any
+        by_day (bool): Whether to break counts down by day
+        use_rollups (bool): False when the queryset has filters rollups cannot express
+
+    Returns:
+        list: Dicts with status, count and amount keys (and day when by_day is set)
+    """
+    totals = {}
+
+    def accumulate(status, day, count, amount):
+        key = (status, day)
+        entry = totals.setdefault(key, {'count': 0, 'amount': Decimal('0')})
+        entry['count'] += count
+        entry['amount'] += amount or Decimal('0')
+
+    covered = get_covered_days(source, start, end) if use_rollups else None
+    if covered:
+        first_day, last_day = covered
+        rollups = ReportRollup.objects.filter(source=source, day__gte=first_day, day__lte=last_day)
+        if school_id:
+            rollups = rollups.filter(school_id=school_id)
+        if program_id:
+            rollups = rollups.filter(program_id=program_id)
+
+        group = ['status', 'day'] if by_day else ['status']
+        for row in rollups.order_by().values(*group).annotate(total=Sum('count'), total_amount=Sum('amount')):
+            accumulate(row['status'], row.get('day'), row['total'], row['total_amount'])
+
+        # Only the rows outside the rolled-up window still come from the source table
+        queryset = queryset.exclude(_window_q(source, first_day, last_day))
+
+    for row in _aggregate_by_day(source, queryset, by_day=by_day):
+        accumulate(row['rollup_status'], row.get('rollup_day'), row['rollup_count'], row['rollup_amount'])
+
+    results = []
+    for (status, day), entry in totals.items():
+        result = {'status': status, 'count': entry['count'], 'amount': entry['amount']}
+        if by_day:
+            result['day'] = day
+        results.append(result)
+    return results
+
+
+def get_interval_start(source, day, interval):
+    """
+    Maps a rollup day to the start of its reporting interval, matching Trunc().
+
+    Args:
+        source (str): Rollup source identifier
+        day (date): Calendar day
+        interval (str): One of 'day', 'week', 'month', 'quarter', 'year'
+
+    Returns:
+        datetime|date: Interval start, as an aware datetime for datetime-dated sources
+    """
+    if interval == 'week':
+        start = day - timedelta(days=day.weekday())
+    elif interval == 'month':
+        start = day.replace(day=1)
+    elif interval == 'quarter':
+        start = date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    elif interval == 'year':
+        start = date(day.year, 1, 1)
+    else:
+        start = day
+
+    if _is_datetime_source(source):
+        return _day_start(start)
+    return start
@@ -424,8 +424,8 @@ class ReportExportSerializer(BaseSerializer):
 
         # LD1: Validate that export_format is provided and is a valid value from EXPORT_FORMATS
         export_format = data.get('export_format')
-        if export_format not in EXPORT_FORMATS:
-            raise serializers.ValidationError(f"Invalid export format: {export_format}. Must be one of {', '.join(EXPORT_FORMATS.keys())}")
+        if export_format not in EXPORT_FORMATS.values():
+            raise serializers.ValidationError(f"Invalid export format: {export_format}. Must be one of {', '.join(EXPORT_FORMATS.values())}")
 
         # LD1: If async is provided, validate it's a boolean
         if data.get('async') and not isinstance(data['async'], bool):
@@ -26,7 +26,7 @@ from .reports.application_volume import ApplicationVolumeReport  # Import the Ap
 from .reports.underwriting_metrics import UnderwritingMetricsReport  # Import the UnderwritingMetricsReport class for generating underwriting metrics reports
 from .reports.document_status import DocumentStatusReport  # Import the DocumentStatusReport class for generating document status reports
 from .reports.funding_metrics import FundingMetricsReport  # Import the FundingMetricsReport class for generating funding metrics reports
-from .exports import ReportExporter  # Import the ReportExporter class for exporting reports to various formats
+from .exports import ReportExporter, ExportError, STREAMING_EXPORT_FORMATS  # Import the ReportExporter class for exporting reports to various formats
 from core.exceptions import ValidationException, ResourceNotFoundException  # Import exception class for validation errors
 from utils.logging import logger  # Import logging utility for tracking service operations
 
@@ -57,6 +57,33 @@ def get_report_generator(report_type):
         raise ValidationException(f"Invalid report type: {report_type}")
 
 
+def export_report_file(exporter, report, export_format):
+    """
+    Exports a report, streaming its rows from the database for row-level formats
+
+    CSV, Excel, Parquet and Arrow exports stream one row per record the report covers
+    through ReportExporter.export_queryset, so memory use does not grow with the size of
+    the report. PDF and JSON exports render the report's summary results.
+
+    Args:
+        exporter (ReportExporter): The exporter to use
+        report (SavedReport): The report to export
+        export_format (str): The format to export the report to
+
+    Returns:
+        dict: Export details including file path and content type
+    """
+    generator_class = REPORT_GENERATORS.get(report.report_type)
+    if export_format not in STREAMING_EXPORT_FORMATS or generator_class is None:
+        return exporter.export_report(report, export_format)
+
+    if report.status != REPORT_STATUS['COMPLETED']:
+        raise ExportError(f"Cannot export report that is not in 'completed' status (current: {report.status})")
+
+    queryset, fields = generator_class().get_export_queryset(report.parameters or {})
+    return exporter.export_queryset(report, queryset, fields, export_format)
+
+
 class ReportService:
     """
     Service class that provides methods for report generation, scheduling, delivery, and permission management
@@ -232,8 +259,8 @@ class ReportService:
             if export_format not in EXPORT_FORMATS.values():
                 raise ValidationException(f"Invalid export format: {export_format}. Supported formats are: {', '.join(EXPORT_FORMATS.values())}")
 
-            # Call the ReportExporter to export the report
-            export_details = self._exporter.export_report(report, export_format)
+            # Export the report, streaming row-level formats from the database
+            export_details = export_report_file(self._exporter, report, export_format)
 
             # Generate a download URL for the exported file
             download_url = self.get_report_download_url(report, user)
@@ -785,8 +812,8 @@ class ReportTaskManager:
             # Initialize a ReportExporter with the provided bucket_name and region
             exporter = ReportExporter(bucket_name=bucket_name, region=region)
 
-            # Call the exporter's export_report method with the report and export_format
-            export_details = exporter.export_report(report, export_format)
+            # Export the report, streaming row-level formats from the database
+            export_details = export_report_file(exporter, report, export_format)
 
             # Return the export details
             return export_details
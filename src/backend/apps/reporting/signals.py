@@ -0,0 +1,132 @@
+"""
+Signal handlers that keep the reporting rollups current between refresh runs.
+
+When a status change touches a row whose day has already been rolled up, the day is
+rebuilt asynchronously once the transaction commits. Rows dated after the watermark need
+no handling; they are read live until the next periodic refresh folds them in.
+"""
+
+import logging  # standard library
+
+from django.apps import apps  # Django 4.2+
+from django.db import transaction  # Django 4.2+
+from django.db.models.signals import post_save  # Django 4.2+
+from django.utils import timezone  # Django 4.2+
+
+from .models import ROLLUP_SOURCES
+from .rollups import ROLLUP_SOURCE_DEFINITIONS, get_covered_through
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def _local_day(value):
+    """
+    Converts a date or datetime field value to the local calendar day used by rollups.
+
+    Args:
+        value (datetime|date): Field value
+
+    Returns:
+        date: Local calendar day, or None
+    """
+    if value is None:
+        return None
+    if hasattr(value, 'tzinfo'):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    return value
+
+
+def schedule_rollup_rebuild(source, day):
+    """
+    Queues a rebuild of one rollup day after commit, if that day is already rolled up.
+
+    Args:
+        source (str): Rollup source identifier
+        day (date): Calendar day of the changed row
+    """
+    if day is None:
+        return
+
+    covered_through = get_covered_through(source)
+    if covered_through is None or day > covered_through:
+        return
+
+    from .tasks import rebuild_report_rollup_days
+    transaction.on_commit(
+        lambda: rebuild_report_rollup_days.delay(source, [day.isoformat()])
+    )
+
+
+def status_history_post_save(sender, instance, created, **kwargs):
+    """
+    Signal handler that rebuilds the application rollup day after a status change.
+
+    Args:
+        sender: The model class
+        instance: The ApplicationStatusHistory record
+        created: Boolean indicating if this is a new instance
+        kwargs: Additional keyword arguments
+    """
+    if not created:
+        return
+
+    try:
+        schedule_rollup_rebuild(
+            ROLLUP_SOURCES['APPLICATIONS'],
+            _local_day(instance.application.created_at)
+        )
+    except Exception as e:
+        logger.error(f"Error scheduling application rollup rebuild: {str(e)}")
+
+
+def source_post_save(sender, instance, created, **kwargs):
+    """
+    Signal handler that rebuilds the rollup day of a saved underwriting decision,
+    document or disbursement.
+
+    Args:
+        sender: The model class
+        instance: The actual instance being saved
+        created: Boolean indicating if this is a new instance
+        kwargs: Additional keyword arguments
+    """
+    source = ROLLUP_SIGNAL_SOURCES.get(sender._meta.label)
+    if source is None:
+        return
+
+    try:
+        date_field = ROLLUP_SOURCE_DEFINITIONS[source]['date_field']
+        schedule_rollup_rebuild(source, _local_day(getattr(instance, date_field)))
+    except Exception as e:
+        logger.error(f"Error scheduling {source} rollup rebuild: {str(e)}")
+
+
+# Source models whose saves rebuild their own rollup day, keyed by model label
+ROLLUP_SIGNAL_SOURCES = {
+    ROLLUP_SOURCE_DEFINITIONS[source]['model']: source
+    for source in (
+        ROLLUP_SOURCES['UNDERWRITING_DECISIONS'],
+        ROLLUP_SOURCES['DOCUMENTS'],
+        ROLLUP_SOURCES['DISBURSEMENTS'],
+    )
+}
+
+
+def connect_reporting_signals():
+    """
+    Connects the rollup signal handlers to the source models that are installed.
+    """
+    post_save.connect(
+        status_history_post_save,
+        sender='applications.ApplicationStatusHistory',
+        dispatch_uid='reporting_rollup_status_history'
+    )
+
+    for label in ROLLUP_SIGNAL_SOURCES:
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            logger.warning(f"Rollup source model {label} is not installed")
+            continue
+        post_save.connect(source_post_save, sender=model, dispatch_uid=f'reporting_rollup_{label}')
@@ -0,0 +1,62 @@
+"""
+Defines Celery tasks for maintaining the reporting rollups.
+
+This module includes the periodic watermark-driven refresh that folds changed source rows
+into the daily rollups, and the task that rebuilds individual days when a status change
+touches a day that has already been rolled up.
+"""
+
+import logging
+from datetime import date
+
+from config.celery import app
+from .models import ROLLUP_SOURCES
+from .rollups import refresh_rollups, rebuild_rollup_days
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def refresh_report_rollups(source=None, full=False):
+    """
+    Celery task to bring the reporting rollups up to date.
+
+    Args:
+        source (str): Rollup source to refresh; None refreshes all sources
+        full (bool): Whether to rebuild every day instead of only stale ones
+
+    Returns:
+        dict: Number of days rebuilt per source
+    """
+    sources = [source] if source else list(ROLLUP_SOURCES.values())
+    rebuilt = {}
+
+    for rollup_source in sources:
+        try:
+            rebuilt[rollup_source] = refresh_rollups(rollup_source, full=full)
+        except Exception as e:
+            # One failing source should not hold back the others
+            logger.exception(f"Error refreshing {rollup_source} rollups: {str(e)}")
+            rebuilt[rollup_source] = None
+
+    return rebuilt
+
+
+@app.task
+def rebuild_report_rollup_days(source, days):
+    """
+    Celery task to rebuild the rollups of specific days for a source.
+
+    Args:
+        source (str): Rollup source identifier
+        days (list): ISO-formatted calendar days to rebuild
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    try:
+        return rebuild_rollup_days(source, [date.fromisoformat(day) for day in days])
+    except Exception as e:
+        logger.exception(f"Error rebuilding {source} rollups for {days}: {str(e)}")
+        return 0
@@ -6,6 +6,9 @@ import json
 import datetime
 import io
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from decimal import Decimal
 
 from ..exports import (
     ReportExporter, 
@@ -14,6 +17,8 @@ from ..exports import (
     EXPORT_CONTENT_TYPES
 )
 from ..models import SavedReport, REPORT_TYPES, REPORT_STATUS
+from ..reports.application_volume import ApplicationVolumeReport, EXPORT_FIELDS
+from ..services import export_report_file
 from ...utils.storage import S3Storage, StorageError
 
 # Test constants
@@ -146,7 +151,7 @@ class TestReportExporter(unittest.TestCase):
         self.funding_report = create_test_report('funding_metrics')
         
         # Patch S3Storage
-        self.s3_storage_patch = patch('src.backend.apps.reporting.exports.S3Storage')
+        self.s3_storage_patch = patch('apps.reporting.exports.S3Storage')
         self.mock_s3_storage = self.s3_storage_patch.start()
         self.mock_s3_storage_instance = Mock()
         self.mock_s3_storage.return_value = self.mock_s3_storage_instance
@@ -181,8 +186,8 @@ class TestReportExporter(unittest.TestCase):
         self.mock_s3_storage.assert_called_with(bucket_name="custom-bucket", region_name="us-west-2")
         
         # Test with default values
-        with patch('src.backend.apps.reporting.exports.EXPORT_BUCKET_NAME', 'default-bucket'):
-            with patch('src.backend.apps.reporting.exports.EXPORT_REGION', 'default-region'):
+        with patch('apps.reporting.exports.EXPORT_BUCKET_NAME', 'default-bucket'):
+            with patch('apps.reporting.exports.EXPORT_REGION', 'default-region'):
                 exporter = ReportExporter()
                 self.assertEqual(exporter._bucket_name, "default-bucket")
                 self.assertEqual(exporter._region, "default-region")
@@ -504,9 +509,9 @@ class TestReportExporter(unittest.TestCase):
         self.export_pdf_patch.stop()  # Stop the patch for this test
         
         # Create patches for dependencies
-        with patch('src.backend.apps.reporting.exports.HTML') as mock_html, \
-             patch('src.backend.apps.reporting.exports.Environment') as mock_env, \
-             patch('src.backend.apps.reporting.exports.FileSystemLoader') as mock_loader, \
+        with patch('apps.reporting.exports.HTML') as mock_html, \
+             patch('apps.reporting.exports.Environment') as mock_env, \
+             patch('apps.reporting.exports.FileSystemLoader') as mock_loader, \
              patch('os.path.exists') as mock_exists, \
              patch('os.path.join', return_value='/path/to/templates') as mock_join:
             
@@ -569,6 +574,50 @@ class TestReportExporter(unittest.TestCase):
         # Restart the patch
         self.mock_export_json = self.export_json_patch.start()
     
+    def test_export_report_parquet(self):
+        """Test exporting a report to Parquet format"""
+        with patch.object(ReportExporter, '_export_to_parquet') as mock_export_parquet:
+            mock_export_parquet.return_value = (b"PAR1", "test_report.parquet")
+            self.mock_s3_storage_instance.store.return_value = {'key': 'reports/test-report-id/test_report.parquet'}
+            
+            result = self.exporter.export_report(self.application_report, 'parquet')
+        
+        mock_export_parquet.assert_called_once_with(self.application_report.results, 'application-volume')
+        self.assertEqual(result['file_format'], 'parquet')
+        self.assertEqual(result['content_type'], EXPORT_CONTENT_TYPES['parquet'])
+        self.assertIn('parquet', EXPORT_FORMATS.values())
+        self.assertIn('arrow', EXPORT_FORMATS.values())
+    
+    def test_export_to_parquet_preserves_types(self):
+        """Test that Parquet exports keep decimal, date and dictionary-encoded columns"""
+        data = get_sample_funding_metrics_data()
+        data['results'] = [
+            {"Date": "2023-05-01", "Amount": 12500.5, "Status": "completed", "School Name": "Tech Academy"},
+            {"Date": "2023-05-02", "Amount": None, "Status": "pending", "School Name": "Tech Academy"}
+        ]
+        
+        content, filename = self.exporter._export_to_parquet(data, 'funding-metrics')
+        
+        self.assertTrue(filename.endswith('.parquet'))
+        table = pq.read_table(io.BytesIO(content))
+        self.assertEqual(table.schema.field('Amount').type, pa.decimal128(18, 2))
+        self.assertEqual(table.schema.field('Date').type, pa.date32())
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('Status').type))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('School Name').type))
+        self.assertEqual(table.column('Amount').to_pylist(), [Decimal('12500.50'), None])
+        self.assertEqual(table.column('Date').to_pylist(), [datetime.date(2023, 5, 1), datetime.date(2023, 5, 2)])
+    
+    def test_export_to_arrow(self):
+        """Test the internal _export_to_arrow method"""
+        data = get_sample_application_volume_data()
+        
+        content, filename = self.exporter._export_to_arrow(data, 'application-volume')
+        
+        self.assertTrue(filename.endswith('.arrow'))
+        table = pa.ipc.open_file(pa.BufferReader(content)).read_all()
+        self.assertEqual(table.num_rows, len(data['results']))
+        self.assertEqual(table.column('New Applications').to_pylist(), [8, 10, 13, 16])
+    
     def test_prepare_dataframe(self):
         """Test the internal _prepare_dataframe method"""
         # Create sample data with tabular data
@@ -668,4 +717,149 @@ class TestReportExporter(unittest.TestCase):
         self.assertEqual(self.exporter._get_report_title('underwriting-metrics'), 'Underwriting Metrics Report')
         
         # Test unknown report type
-        self.assertEqual(self.exporter._get_report_title('unknown-report'), 'Unknown Report Report')
\ No newline at end of file
+        self.assertEqual(self.exporter._get_report_title('unknown-report'), 'Unknown Report Report')
+
+
+class TestReportExporterStreaming(unittest.TestCase):
+    """Test case for streaming queryset exports"""
+    
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.s3_storage_patch = patch('apps.reporting.exports.S3Storage')
+        self.mock_s3_storage = self.s3_storage_patch.start()
+        self.exporter = ReportExporter(bucket_name=TEST_BUCKET_NAME, region=TEST_REGION)
+        
+        # Collect everything written to the multipart upload
+        self.uploaded = io.BytesIO()
+        self.mock_upload = MagicMock()
+        self.mock_upload.part_size = 5 * 1024 * 1024
+        self.mock_upload.closed = False
+        self.mock_upload.write.side_effect = self.uploaded.write
+        self.mock_upload.tell.side_effect = self.uploaded.tell
+        self.mock_storage = self.mock_s3_storage.return_value
+        self.mock_storage.open_multipart_upload.return_value.__enter__.return_value = self.mock_upload
+        
+        self.report = create_test_report('application_volume')
+        self.rows = [
+            ('APP-%d' % i, 1000 + i, 'submitted') for i in range(25)
+        ]
+        self.queryset = Mock()
+        self.queryset.values_list.return_value.iterator.return_value = iter(self.rows)
+    
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.s3_storage_patch.stop()
+    
+    def test_export_queryset_csv(self):
+        """Test that CSV rows are read from a server-side cursor and written in chunks"""
+        result = self.exporter.export_queryset(
+            self.report, self.queryset, ['application_id', 'amount', 'status'], 'csv', chunk_size=10
+        )
+        
+        self.queryset.values_list.assert_called_once_with('application_id', 'amount', 'status')
+        self.queryset.values_list.return_value.iterator.assert_called_once_with(chunk_size=10)
+        
+        # Two full chunks and the remainder
+        self.assertEqual(self.mock_upload.write.call_count, 3)
+        
+        csv_data = pd.read_csv(io.BytesIO(self.uploaded.getvalue()))
+        self.assertEqual(list(csv_data.columns), ['Application Id', 'Amount', 'Status'])
+        self.assertEqual(len(csv_data), 25)
+        self.assertEqual(csv_data['Amount'][0], '$1,000.00')
+        
+        upload_args = self.mock_storage.open_multipart_upload.call_args
+        self.assertEqual(upload_args[0][0], result['file_path'])
+        self.assertEqual(upload_args[1]['content_type'], 'text/csv')
+        self.assertEqual(result['row_count'], 25)
+        self.assertEqual(self.report.file_format, 'csv')
+        self.report.save.assert_called_once()
+    
+    def test_export_queryset_excel(self):
+        """Test that Excel exports use write-only worksheets and continue on new sheets"""
+        with patch('apps.reporting.exports.EXCEL_MAX_ROWS', 11):
+            result = self.exporter.export_queryset(
+                self.report, self.queryset, ['application_id', 'amount', 'status'], 'xlsx'
+            )
+        
+        self.assertEqual(result['row_count'], 25)
+        sheets = pd.read_excel(io.BytesIO(self.uploaded.getvalue()), sheet_name=None)
+        self.assertEqual(list(sheets), [
+            'Application Volume Report',
+            'Application Volume Report (2)',
+            'Application Volume Report (3)'
+        ])
+        self.assertEqual([len(sheet) for sheet in sheets.values()], [10, 10, 5])
+    
+    def test_export_queryset_parquet_row_groups(self):
+        """Test that Parquet exports are written to the upload one row group at a time"""
+        self.queryset.model = None
+        
+        with patch('apps.reporting.exports.COLUMNAR_ROW_GROUP_SIZE', 10):
+            result = self.exporter.export_queryset(
+                self.report, self.queryset, ['application_id', 'amount', 'status'], 'parquet'
+            )
+        
+        self.assertEqual(result['row_count'], 25)
+        parquet_file = pq.ParquetFile(io.BytesIO(self.uploaded.getvalue()))
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        
+        table = parquet_file.read()
+        self.assertEqual(table.schema.field('Amount').type, pa.decimal128(18, 2))
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('Status').type))
+        self.assertEqual(table.column('Status').to_pylist(), ['submitted'] * 25)
+    
+    def test_export_queryset_invalid_format(self):
+        """Test that only row-oriented formats can be streamed"""
+        with self.assertRaises(ExportError):
+            self.exporter.export_queryset(self.report, self.queryset, ['status'], 'pdf')
+        
+        self.mock_storage.open_multipart_upload.assert_not_called()
+
+
+class TestExportReportFile(unittest.TestCase):
+    """Test case for choosing between streamed and summary report exports"""
+    
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.exporter = Mock(spec=ReportExporter)
+        self.report = create_test_report('application_volume')
+        self.report.parameters = {'school_id': 'school-1'}
+        self.queryset = Mock()
+        self.export_queryset_patch = patch.object(
+            ApplicationVolumeReport, 'get_export_queryset', return_value=(self.queryset, EXPORT_FIELDS)
+        )
+        self.mock_get_export_queryset = self.export_queryset_patch.start()
+    
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.export_queryset_patch.stop()
+    
+    def test_row_formats_are_streamed(self):
+        """Test that CSV, Excel and columnar exports stream the report's queryset"""
+        for export_format in ('csv', 'xlsx', 'parquet', 'arrow'):
+            self.exporter.reset_mock()
+            
+            export_report_file(self.exporter, self.report, export_format)
+            
+            self.exporter.export_queryset.assert_called_once_with(
+                self.report, self.queryset, EXPORT_FIELDS, export_format
+            )
+            self.exporter.export_report.assert_not_called()
+        self.mock_get_export_queryset.assert_called_with({'school_id': 'school-1'})
+    
+    def test_summary_formats_use_results(self):
+        """Test that PDF and JSON exports render the report's results"""
+        for export_format in ('pdf', 'json'):
+            export_report_file(self.exporter, self.report, export_format)
+            
+            self.exporter.export_report.assert_called_with(self.report, export_format)
+        self.exporter.export_queryset.assert_not_called()
+    
+    def test_incomplete_report_is_not_streamed(self):
+        """Test that only completed reports are streamed"""
+        self.report.status = REPORT_STATUS['GENERATING']
+        
+        with self.assertRaises(ExportError):
+            export_report_file(self.exporter, self.report, 'csv')
+        
+        self.exporter.export_queryset.assert_not_called()
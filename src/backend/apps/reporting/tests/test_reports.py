@@ -0,0 +1,240 @@
+import unittest
+from unittest.mock import patch, Mock, MagicMock
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ..reports.application_volume import (
+    ApplicationVolumeReport,
+    PROCESSING_TIME_PERCENTILES
+)
+from apps.applications.models import LoanApplication, ApplicationStatusHistory
+from apps.authentication.models import Auth0User
+from apps.schools.models import School, Program, ProgramVersion
+from apps.users.models import User
+from utils.constants import APPLICATION_STATUS, USER_TYPES
+
+
+class TestApplicationVolumeProcessingTime(unittest.TestCase):
+    """Test case for ApplicationVolumeReport.get_processing_time"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.report = ApplicationVolumeReport()
+
+        # Patch the windowed status history so no database is needed to compile it
+        self.transitions_patch = patch.object(ApplicationVolumeReport, 'get_status_transitions')
+        self.mock_transitions = self.transitions_patch.start()
+        self.mock_transitions.return_value.query.sql_with_params.return_value = (
+            'SELECT 1', ('submitted',)
+        )
+
+        # Patch the database connection
+        self.connection_patch = patch('apps.reporting.reports.application_volume.connection')
+        self.mock_connection = self.connection_patch.start()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.transitions_patch.stop()
+        self.connection_patch.stop()
+
+    def test_processing_time_runs_constant_queries(self):
+        """Test that processing time metrics are aggregated in two queries"""
+        self.mock_cursor.fetchall.return_value = [
+            ('submitted', Decimal('24.0'), Decimal('2.0'), Decimal('72.0'), 10, Decimal('20.0'), Decimal('60.0')),
+            ('in_review', Decimal('8.5'), Decimal('1.0'), Decimal('16.0'), 4, Decimal('8.0'), Decimal('14.0')),
+        ]
+        self.mock_cursor.fetchone.return_value = (Decimal('30.0'), 6, Decimal('28.0'), Decimal('50.0'))
+
+        result = self.report.get_processing_time(Mock(), {})
+
+        self.assertEqual(self.mock_cursor.execute.call_count, 2)
+        for call in self.mock_cursor.execute.call_args_list:
+            sql, params = call[0]
+            self.assertIn('WITH transitions AS (SELECT 1)', sql)
+            self.assertEqual(params, ('submitted',))
+
+        self.assertEqual(result['average_time_to_decision_hours'], 30.0)
+        self.assertEqual(result['sample_size'], 6)
+        self.assertEqual(result['time_to_decision_percentiles'], {'median_hours': 28.0, 'p90_hours': 50.0})
+        self.assertEqual(result['status_timing']['submitted'], {
+            'average_hours': 24.0,
+            'min_hours': 2.0,
+            'max_hours': 72.0,
+            'count': 10,
+            'median_hours': 20.0,
+            'p90_hours': 60.0
+        })
+        self.assertEqual(result['status_timing']['in_review']['count'], 4)
+
+    def test_processing_time_without_history(self):
+        """Test processing time metrics when no applications have status history"""
+        self.mock_cursor.fetchall.return_value = []
+        self.mock_cursor.fetchone.return_value = (None, 0, None, None)
+
+        result = self.report.get_processing_time(Mock(), {})
+
+        self.assertIsNone(result['average_time_to_decision_hours'])
+        self.assertEqual(result['sample_size'], 0)
+        self.assertEqual(result['status_timing'], {})
+        self.assertEqual(
+            result['time_to_decision_percentiles'],
+            {key: None for key in PROCESSING_TIME_PERCENTILES}
+        )
+
+
+class TestApplicationVolumeProcessingTimeQueries(TestCase):
+    """Test case for the processing time queries against the test database"""
+
+    def setUp(self):
+        """Create applications with a known status history"""
+        self.report = ApplicationVolumeReport()
+        self.start = datetime.datetime(2024, 3, 1, 9, 0, tzinfo=datetime.timezone.utc)
+
+        auth0_user = Auth0User.objects.create(
+            auth0_id='auth0|processing', email='processing@example.com', email_verified=True
+        )
+        borrower = User.objects.create(
+            auth0_user=auth0_user, first_name='Test', last_name='Borrower',
+            email='processing@example.com', phone='(555) 123-4567', user_type=USER_TYPES['BORROWER']
+        )
+        school = School.objects.create(
+            name='Test School', legal_name='Test School LLC', tax_id='12-3456789',
+            address_line1='123 Main St', city='Anytown', state='CA', zip_code='12345',
+            phone='(555) 123-4567', status='active'
+        )
+        program = Program.objects.create(
+            school=school, name='Test Program', description='Test program',
+            duration_hours=400, duration_weeks=12
+        )
+        program_version = ProgramVersion.objects.create(
+            program=program, version_number=1, effective_date=datetime.date(2024, 1, 1),
+            tuition_amount=Decimal('10000.00'), is_current=True
+        )
+        self.applications = [
+            LoanApplication.objects.create(
+                borrower=borrower, school=school, program=program, program_version=program_version
+            )
+            for _ in range(3)
+        ]
+        # Replace any history written on creation with the transitions below
+        ApplicationStatusHistory.all_objects.filter(application__in=self.applications).delete()
+
+        draft = APPLICATION_STATUS['DRAFT']
+        submitted = APPLICATION_STATUS['SUBMITTED']
+        approved = APPLICATION_STATUS['APPROVED']
+        denied = APPLICATION_STATUS['DENIED']
+        # Approved six hours after submission
+        self.add_history(self.applications[0], [(draft, submitted, 0), (submitted, approved, 6)])
+        # Denied, resubmitted and approved; the latest decision counts
+        self.add_history(self.applications[1], [
+            (draft, submitted, 0), (submitted, denied, 4), (denied, submitted, 6), (submitted, approved, 14)
+        ])
+        # Still in review, without a decision
+        self.add_history(self.applications[2], [
+            (draft, submitted, 0), (submitted, APPLICATION_STATUS['IN_REVIEW'], 2)
+        ])
+
+    def add_history(self, application, transitions):
+        """Record (previous status, new status, hours after start) transitions"""
+        for previous_status, new_status, hours in transitions:
+            ApplicationStatusHistory.objects.create(
+                application=application,
+                previous_status=previous_status,
+                new_status=new_status,
+                changed_at=self.start + datetime.timedelta(hours=hours)
+            )
+
+    def queryset(self):
+        """Return the test applications as a report queryset"""
+        return LoanApplication.objects.filter(pk__in=[application.pk for application in self.applications])
+
+    def test_status_transitions(self):
+        """Test that each transition carries the next transition and latest decision"""
+        rows = list(self.report.get_status_transitions(self.queryset()).filter(
+            application_id=self.applications[1].pk
+        ).order_by('changed_at'))
+
+        self.assertEqual(
+            [row['next_changed_at'] for row in rows],
+            [self.start + datetime.timedelta(hours=hours) for hours in (4, 6, 14)] + [None]
+        )
+        self.assertTrue(all(row['first_submitted_at'] == self.start for row in rows))
+        latest_decisions = [row['new_status'] for row in rows if row['is_decision'] and row['decision_rank'] == 1]
+        self.assertEqual(latest_decisions, [APPLICATION_STATUS['APPROVED']])
+
+    def test_processing_time(self):
+        """Test that status and decision times are aggregated in two queries"""
+        with self.assertNumQueries(2):
+            result = self.report.get_processing_time(self.queryset(), {})
+
+        # Time to each application's latest decision: 6 and 14 hours
+        self.assertEqual(result['sample_size'], 2)
+        self.assertAlmostEqual(result['average_time_to_decision_hours'], 10.0, places=4)
+        self.assertAlmostEqual(result['time_to_decision_percentiles']['median_hours'], 10.0, places=4)
+        self.assertAlmostEqual(result['time_to_decision_percentiles']['p90_hours'], 13.2, places=4)
+
+        # Time in submitted before the next transition: 6, 4, 8 and 2 hours
+        submitted = result['status_timing'][APPLICATION_STATUS['SUBMITTED']]
+        self.assertEqual(submitted['count'], 4)
+        for key, hours in [('average_hours', 5.0), ('min_hours', 2.0), ('max_hours', 8.0),
+                           ('median_hours', 5.0), ('p90_hours', 7.4)]:
+            self.assertAlmostEqual(submitted[key], hours, places=4)
+
+        denied = result['status_timing'][APPLICATION_STATUS['DENIED']]
+        self.assertEqual(denied['count'], 1)
+        self.assertAlmostEqual(denied['median_hours'], 2.0, places=4)
+
+        # Final statuses have no next transition to measure against
+        self.assertNotIn(APPLICATION_STATUS['APPROVED'], result['status_timing'])
+        self.assertNotIn(APPLICATION_STATUS['IN_REVIEW'], result['status_timing'])
+
+
+class TestApplicationVolumeSchoolProgramBreakdown(unittest.TestCase):
+    """Test case for ApplicationVolumeReport.get_school_program_breakdown"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.report = ApplicationVolumeReport()
+
+    def _grouped(self, rows):
+        """Helper returning a mock grouped values() query yielding the given rows"""
+        grouped = MagicMock()
+        grouped.annotate.return_value.order_by.return_value = rows
+        return grouped
+
+    def test_breakdown_uses_grouped_queries(self):
+        """Test that approval rates come from the two grouped queries"""
+        school_rows = [
+            {'school_id': 's1', 'school__name': 'School One', 'count': 10, 'approved_count': 6, 'denied_count': 2},
+            {'school_id': 's2', 'school__name': 'School Two', 'count': 3, 'approved_count': 0, 'denied_count': 0},
+        ]
+        program_rows = [
+            {'school_id': 's1', 'program_id': 'p1', 'program__name': 'Program One',
+             'count': 7, 'approved_count': 3, 'denied_count': 1},
+            {'school_id': 's1', 'program_id': 'p2', 'program__name': 'Program Two',
+             'count': 3, 'approved_count': 3, 'denied_count': 1},
+            {'school_id': 's2', 'program_id': 'p3', 'program__name': 'Program Three',
+             'count': 3, 'approved_count': 0, 'denied_count': 0},
+        ]
+        queryset = Mock()
+        queryset.values.side_effect = [self._grouped(school_rows), self._grouped(program_rows)]
+
+        result = self.report.get_school_program_breakdown(queryset, {})
+
+        self.assertEqual(queryset.values.call_count, 2)
+        queryset.filter.assert_not_called()
+
+        school_one, school_two = result['schools']
+        self.assertEqual(school_one['id'], 's1')
+        self.assertEqual(school_one['approval_rate'], 75.0)
+        self.assertEqual([program['id'] for program in school_one['programs']], ['p1', 'p2'])
+        self.assertEqual(school_one['programs'][0]['approval_rate'], 75.0)
+        self.assertEqual(school_two['approval_rate'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+import unittest
+from unittest.mock import patch
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..rollups import (
+    get_covered_days, get_interval_start, get_rollup_counts, rebuild_rollup_days,
+    refresh_rollups, ROLLUP_REFRESH_WINDOW_DAYS
+)
+from ..models import ReportRollup, ReportRollupWatermark, ROLLUP_SOURCES
+from apps.applications.models import LoanApplication
+from apps.authentication.models import Auth0User
+from apps.schools.models import School, Program, ProgramVersion
+from apps.users.models import User
+from utils.constants import APPLICATION_STATUS, USER_TYPES
+
+# Test constants
+APPLICATIONS = ROLLUP_SOURCES['APPLICATIONS']
+DISBURSEMENTS = ROLLUP_SOURCES['DISBURSEMENTS']
+
+
+class TestGetCoveredDays(unittest.TestCase):
+    """Test case for choosing which days of a report range are read from rollups"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.covered_through_patch = patch('apps.reporting.rollups.get_covered_through')
+        self.mock_covered_through = self.covered_through_patch.start()
+        self.mock_covered_through.return_value = datetime.date(2024, 3, 30)
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.covered_through_patch.stop()
+
+    def test_date_range_is_inclusive(self):
+        """Test that date bounds cover whole days up to the watermark"""
+        covered = get_covered_days(DISBURSEMENTS, datetime.date(2024, 3, 1), datetime.date(2024, 3, 15))
+        self.assertEqual(covered, (datetime.date(2024, 3, 1), datetime.date(2024, 3, 15)))
+
+    def test_range_is_capped_at_watermark(self):
+        """Test that days after the watermark are left to the live tail"""
+        covered = get_covered_days(DISBURSEMENTS, datetime.date(2024, 3, 20), datetime.date(2024, 4, 10))
+        self.assertEqual(covered, (datetime.date(2024, 3, 20), datetime.date(2024, 3, 30)))
+
+    def test_partial_datetime_days_are_excluded(self):
+        """Test that partial first and last days are not read from rollups"""
+        start = timezone.make_aware(datetime.datetime(2024, 3, 1, 9, 30))
+        end = timezone.make_aware(datetime.datetime(2024, 3, 15, 17, 0))
+        covered = get_covered_days(APPLICATIONS, start, end)
+        self.assertEqual(covered, (datetime.date(2024, 3, 2), datetime.date(2024, 3, 14)))
+
+    def test_range_after_watermark(self):
+        """Test that a range entirely after the watermark uses no rollups"""
+        covered = get_covered_days(DISBURSEMENTS, datetime.date(2024, 4, 1), datetime.date(2024, 4, 2))
+        self.assertIsNone(covered)
+
+    def test_source_never_rolled_up(self):
+        """Test that a source without a watermark uses no rollups"""
+        self.mock_covered_through.return_value = None
+        covered = get_covered_days(DISBURSEMENTS, datetime.date(2024, 3, 1), datetime.date(2024, 3, 15))
+        self.assertIsNone(covered)
+
+
+class TestGetIntervalStart(unittest.TestCase):
+    """Test case for folding rollup days into report intervals"""
+
+    def setUp(self):
+        """Set up test environment before each test"""
+        self.datetime_source_patch = patch('apps.reporting.rollups._is_datetime_source')
+        self.mock_datetime_source = self.datetime_source_patch.start()
+        self.mock_datetime_source.return_value = False
+
+    def tearDown(self):
+        """Clean up test environment after each test"""
+        self.datetime_source_patch.stop()
+
+    def test_interval_starts(self):
+        """Test that days map to the same interval starts as Trunc()"""
+        day = datetime.date(2024, 5, 17)
+        self.assertEqual(get_interval_start(DISBURSEMENTS, day, 'day'), day)
+        self.assertEqual(get_interval_start(DISBURSEMENTS, day, 'week'), datetime.date(2024, 5, 13))
+        self.assertEqual(get_interval_start(DISBURSEMENTS, day, 'month'), datetime.date(2024, 5, 1))
+        self.assertEqual(get_interval_start(DISBURSEMENTS, day, 'quarter'), datetime.date(2024, 4, 1))
+        self.assertEqual(get_interval_start(DISBURSEMENTS, day, 'year'), datetime.date(2024, 1, 1))
+
+    def test_datetime_source_returns_local_midnight(self):
+        """Test that datetime-dated sources get aware interval starts"""
+        self.mock_datetime_source.return_value = True
+        start = get_interval_start(APPLICATIONS, datetime.date(2024, 5, 17), 'month')
+        self.assertTrue(timezone.is_aware(start))
+        self.assertEqual(timezone.localtime(start).date(), datetime.date(2024, 5, 1))
+
+
+class TestRollupRefresh(TestCase):
+    """Test case for building rollups from the application table"""
+
+    def setUp(self):
+        """Create a school, program and borrower to file applications under"""
+        self.today = timezone.localdate()
+        auth0_user = Auth0User.objects.create(
+            auth0_id='auth0|rollups', email='rollups@example.com', email_verified=True
+        )
+        self.borrower = User.objects.create(
+            auth0_user=auth0_user, first_name='Test', last_name='Borrower',
+            email='rollups@example.com', phone='(555) 123-4567', user_type=USER_TYPES['BORROWER']
+        )
+        self.school = School.objects.create(
+            name='Test School', legal_name='Test School LLC', tax_id='12-3456789',
+            address_line1='123 Main St', city='Anytown', state='CA', zip_code='12345',
+            phone='(555) 123-4567', status='active'
+        )
+        self.program = Program.objects.create(
+            school=self.school, name='Test Program', description='Test program',
+            duration_hours=400, duration_weeks=12
+        )
+        self.program_version = ProgramVersion.objects.create(
+            program=self.program, version_number=1, effective_date=datetime.date(2024, 1, 1),
+            tuition_amount=Decimal('10000.00'), is_current=True
+        )
+
+    def create_application(self, days_ago, status=APPLICATION_STATUS['SUBMITTED']):
+        """Create an application dated at noon a number of days ago"""
+        application = LoanApplication.objects.create(
+            borrower=self.borrower, school=self.school, program=self.program,
+            program_version=self.program_version
+        )
+        created_at = timezone.make_aware(datetime.datetime.combine(
+            self.today - datetime.timedelta(days=days_ago), datetime.time(12)
+        ))
+        # Queryset updates bypass updated_at, like the writes the trailing window catches
+        LoanApplication.all_objects.filter(pk=application.pk).update(created_at=created_at, status=status)
+        return application
+
+    def rollup_counts(self, days_ago):
+        """Return the rolled-up application counts of a day, by status"""
+        day = self.today - datetime.timedelta(days=days_ago)
+        return {
+            rollup.status: rollup.count
+            for rollup in ReportRollup.objects.filter(source=APPLICATIONS, day=day)
+        }
+
+    def test_rebuild_rollup_days(self):
+        """Test that rebuilding a day replaces its rollups with fresh counts"""
+        self.create_application(2)
+        self.create_application(2)
+        self.create_application(2, APPLICATION_STATUS['APPROVED'])
+        self.create_application(3)
+        day = self.today - datetime.timedelta(days=2)
+
+        self.assertEqual(rebuild_rollup_days(APPLICATIONS, [day]), 2)
+        self.assertEqual(rebuild_rollup_days(APPLICATIONS, [day]), 2)
+
+        self.assertEqual(self.rollup_counts(2), {'submitted': 2, 'approved': 1})
+        self.assertEqual(self.rollup_counts(3), {})
+        self.assertEqual(ReportRollup.objects.get(source=APPLICATIONS, day=day, status='approved').school_id,
+                         self.school.id)
+
+    def test_first_refresh_rolls_up_every_day_before_today(self):
+        """Test that the first refresh covers every past day and leaves today live"""
+        self.create_application(0)
+        self.create_application(1)
+        self.create_application(40)
+
+        refresh_rollups(APPLICATIONS)
+
+        watermark = ReportRollupWatermark.objects.get(source=APPLICATIONS)
+        self.assertEqual(watermark.covered_through, self.today - datetime.timedelta(days=1))
+        self.assertEqual(self.rollup_counts(1), {'submitted': 1})
+        self.assertEqual(self.rollup_counts(40), {'submitted': 1})
+        self.assertEqual(self.rollup_counts(0), {})
+
+    def test_refresh_catches_writes_that_skip_updated_at(self):
+        """Test that queryset updates and hard deletes in the trailing window are rolled up"""
+        updated = self.create_application(2)
+        deleted = self.create_application(ROLLUP_REFRESH_WINDOW_DAYS)
+        refresh_rollups(APPLICATIONS)
+
+        LoanApplication.all_objects.filter(pk=updated.pk).update(status=APPLICATION_STATUS['APPROVED'])
+        LoanApplication.all_objects.filter(pk=deleted.pk).delete()
+        refresh_rollups(APPLICATIONS)
+
+        self.assertEqual(self.rollup_counts(2), {'approved': 1})
+        self.assertEqual(self.rollup_counts(ROLLUP_REFRESH_WINDOW_DAYS), {})
+
+    def test_full_refresh_clears_older_deleted_days(self):
+        """Test that a full refresh corrects days outside the trailing window"""
+        deleted = self.create_application(ROLLUP_REFRESH_WINDOW_DAYS + 10)
+        refresh_rollups(APPLICATIONS)
+        LoanApplication.all_objects.filter(pk=deleted.pk).delete()
+
+        refresh_rollups(APPLICATIONS)
+        self.assertEqual(self.rollup_counts(ROLLUP_REFRESH_WINDOW_DAYS + 10), {'submitted': 1})
+
+        refresh_rollups(APPLICATIONS, full=True)
+        self.assertEqual(self.rollup_counts(ROLLUP_REFRESH_WINDOW_DAYS + 10), {})
+
+    def test_get_rollup_counts_combines_rollups_and_live_tail(self):
+        """Test that counts read rolled-up days from rollups and the rest from the source"""
+        for days_ago in (1, 5, 5, 20):
+            self.create_application(days_ago)
+        self.create_application(5, APPLICATION_STATUS['DENIED'])
+        refresh_rollups(APPLICATIONS)
+        self.create_application(0)
+
+        # Rollups alone answer the rolled-up days, so changing one shows in the counts
+        ReportRollup.objects.filter(
+            source=APPLICATIONS, day=self.today - datetime.timedelta(days=5), status='denied'
+        ).update(count=3)
+
+        start = timezone.make_aware(datetime.datetime.combine(
+            self.today - datetime.timedelta(days=10), datetime.time.min
+        ))
+        end = timezone.now() + datetime.timedelta(minutes=1)
+        queryset = LoanApplication.objects.filter(created_at__gte=start, created_at__lt=end)
+
+        counts = get_rollup_counts(APPLICATIONS, queryset, start, end, school_id=self.school.id)
+
+        self.assertEqual({row['status']: row['count'] for row in counts}, {'submitted': 4, 'denied': 3})
+
+    def test_naive_report_bounds(self):
+        """Test that naive bounds, as parsed from ISO dates, are read in local time"""
+        refresh_rollups(APPLICATIONS)
+        first_day = self.today - datetime.timedelta(days=10)
+        start = datetime.datetime.combine(first_day, datetime.time.min)
+        end = datetime.datetime.combine(self.today, datetime.time.min)
+
+        covered = get_covered_days(APPLICATIONS, start, end)
+
+        self.assertEqual(covered, (first_day, self.today - datetime.timedelta(days=1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
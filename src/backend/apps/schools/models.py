@@ -291,9 +291,9 @@ class SchoolDocument(CoreModel):
         Returns:
             str: Presigned URL for downloading the document
         """
-        # Import here to avoid circular imports
-        from utils.storage import get_presigned_url
-        return get_presigned_url(self.file_path, expiry_seconds)
+        # Import here to avoid circular imports; school documents have their own bucket
+        from .services import get_document_storage
+        return get_document_storage().get_presigned_url(self.file_path, expiry_seconds)
     
     def __str__(self):
         return f"{self.get_document_type_display()} - {self.school.name}"
@@ -12,7 +12,8 @@ from django.db import transaction
 from django.contrib.auth import get_user_model
 
 from core.serializers import (
-    BaseModelSerializer, ReadOnlyModelSerializer, AuditFieldsMixin, SensitiveDataMixin
+    BaseModelSerializer, ReadOnlyModelSerializer, AuditFieldsMixin, SensitiveDataMixin,
+    DownloadUrlMixin, DownloadUrlListSerializer
 )
 from .models import (
     School, Program, ProgramVersion, SchoolContact, SchoolDocument,
@@ -620,7 +621,7 @@ class SchoolContactSerializer(BaseModelSerializer):
         return representation
 
 
-class SchoolDocumentSerializer(BaseModelSerializer):
+class SchoolDocumentSerializer(DownloadUrlMixin, BaseModelSerializer):
     """
     Serializer for SchoolDocument model.
     """
@@ -639,6 +640,17 @@ class SchoolDocumentSerializer(BaseModelSerializer):
             'id', 'uploaded_at', 'uploaded_by', 'download_url',
             'created_at', 'updated_at'
         ]
+        list_serializer_class = DownloadUrlListSerializer
+    
+    def get_download_storage(self):
+        """
+        School documents are kept in the school document bucket.
+        
+        Returns:
+            S3Storage: The school document storage
+        """
+        from .services import get_document_storage
+        return get_document_storage()
     
     def get_download_url(self, obj):
         """
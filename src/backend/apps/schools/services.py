@@ -5,6 +5,7 @@ Provides service functions for managing schools, programs, program versions, sch
 import os
 import uuid
 import datetime
+import threading
 from django.db import transaction
 from django.core.exceptions import ValidationError, ObjectDoesNotExist, PermissionDenied
 from django.utils import timezone
@@ -27,6 +28,25 @@ logger = getLogger('schools.services')
 DOCUMENT_BUCKET_NAME = os.environ.get('DOCUMENT_BUCKET_NAME', 'loan-management-documents')
 S3_REGION_NAME = os.environ.get('S3_REGION_NAME', 'us-east-1')
 
+# Process-wide storage for school documents, created on first use
+_document_storage = None
+_document_storage_lock = threading.Lock()
+
+
+def get_document_storage():
+    """
+    Returns the process-wide storage for school document files.
+    
+    Returns:
+        S3Storage: Storage for the school document bucket
+    """
+    global _document_storage
+    if _document_storage is None:
+        with _document_storage_lock:
+            if _document_storage is None:
+                _document_storage = S3Storage(bucket_name=DOCUMENT_BUCKET_NAME, region_name=S3_REGION_NAME)
+    return _document_storage
+
 
 def create_school(school_data, administrators=None, created_by=None):
     """
@@ -743,7 +763,7 @@ def upload_school_document(school_id, document_data, document_file, uploaded_by=
     file_path = f"schools/{school.id}/documents/{document_type}/{unique_id}{file_extension}"
     
     # Initialize storage
-    storage = S3Storage(bucket_name=DOCUMENT_BUCKET_NAME, region_name=S3_REGION_NAME)
+    storage = get_document_storage()
     
     # Upload file to S3
     try:
@@ -850,7 +870,7 @@ def delete_school_document(document_id, deleted_by=None):
     document = SchoolDocument.objects.get(id=document_id)
     
     # Initialize storage
-    storage = S3Storage(bucket_name=DOCUMENT_BUCKET_NAME, region_name=S3_REGION_NAME)
+    storage = get_document_storage()
     
     # Delete file from S3
     try:
@@ -11,7 +11,8 @@ from .views import (
     SchoolContactListView,
     SchoolContactDetailView,
     SchoolDocumentListView,
-    SchoolDocumentDetailView
+    SchoolDocumentDetailView,
+    SchoolDocumentDownloadView
 )
 
 app_name = "schools"
@@ -26,5 +27,6 @@ urlpatterns = [
     path('<uuid:school_id>/contacts/', SchoolContactListView.as_view(), name='school-contact-list-create'),
     path('<uuid:school_id>/contacts/<uuid:contact_id>/', SchoolContactDetailView.as_view(), name='school-contact-detail'),
     path('<uuid:school_id>/documents/', SchoolDocumentListView.as_view(), name='school-document-list-create'),
-    path('<uuid:school_id>/documents/<uuid:document_id>/', SchoolDocumentDetailView.as_view(), name='school-document-detail')
+    path('<uuid:school_id>/documents/<uuid:document_id>/', SchoolDocumentDetailView.as_view(), name='school-document-detail'),
+    path('<uuid:school_id>/documents/<uuid:document_id>/download/', SchoolDocumentDownloadView.as_view(), name='school-document-download')
 ]
\ No newline at end of file
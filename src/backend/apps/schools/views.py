@@ -16,6 +16,7 @@ from .serializers import (
     ProgramVersionSerializer, ProgramVersionCreateSerializer,
     SchoolContactSerializer, SchoolDocumentSerializer
 )
+from .services import get_document_storage
 from .permissions import (
     CanManageSchools, CanViewSchools,
     CanManageSchoolPrograms, CanViewSchoolPrograms,
@@ -23,7 +24,7 @@ from .permissions import (
     CanManageSchoolContacts, CanViewSchoolContacts,
     CanManageSchoolDocuments, CanViewSchoolDocuments
 )
-from core.views import BaseGenericAPIView, TransactionMixin, AuditLogMixin, get_object_or_exception
+from core.views import BaseGenericAPIView, TransactionMixin, AuditLogMixin, StreamingDownloadMixin, get_object_or_exception
 from core.exceptions import ResourceNotFoundException, ValidationException
 
 
@@ -821,4 +822,45 @@ class SchoolDocumentDetailView(BaseGenericAPIView, generics.RetrieveDestroyAPIVi
         """
         instance = self.get_object()
         self.perform_destroy(instance)
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class SchoolDocumentDownloadView(StreamingDownloadMixin, BaseGenericAPIView):
+    """
+    API view for downloading the file of a school document
+    """
+    queryset = SchoolDocument.objects.all()
+    permission_classes = [CanViewSchoolDocuments]
+    lookup_url_kwarg = 'document_id'
+
+    def get_queryset(self):
+        """
+        Returns the documents of the school in the URL
+
+        Returns:
+            QuerySet: School documents of the school
+        """
+        return self.queryset.filter(school_id=self.kwargs.get('school_id'))
+
+    def get_download_storage(self):
+        """
+        Returns the storage holding school document files
+
+        Returns:
+            S3Storage: School document storage
+        """
+        return get_document_storage()
+
+    def get(self, request, *args, **kwargs):
+        """
+        Download the file of a school document
+
+        parameters:
+            request
+            kwargs
+
+        Returns:
+            StreamingHttpResponse: Response streaming the file, or a redirect to it
+        """
+        instance = self.get_object()
+        return self.stream_file(request, instance.file_path, instance.file_name)
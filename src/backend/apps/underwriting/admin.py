@@ -9,7 +9,7 @@ capabilities.
 from django.contrib import admin  # Django 4.2+
 from .models import (
     UnderwritingQueue, CreditInformation, UnderwritingDecision,
-    DecisionReason, Stipulation, UnderwritingNote,
+    DecisionReason, Stipulation, UnderwritingNote, UnderwritingRuleSet,
     UNDERWRITING_QUEUE_PRIORITY_CHOICES, UNDERWRITING_QUEUE_STATUS_CHOICES,
     UNDERWRITING_DECISION_CHOICES, STIPULATION_TYPE_CHOICES, STIPULATION_STATUS_CHOICES
 )
@@ -86,8 +86,9 @@ class StipulationInline(admin.TabularInline):
 class UnderwritingDecisionAdmin(admin.ModelAdmin):
     """Admin interface for the UnderwritingDecision model."""
     list_display = ('application_id', 'borrower_name', 'decision', 'decision_date',
-                    'underwriter_name', 'approved_amount', 'interest_rate', 'term_months')
-    list_filter = ('decision', 'decision_date', 'is_deleted')
+                    'underwriter_name', 'approved_amount', 'interest_rate', 'term_months',
+                    'rule_set_version')
+    list_filter = ('decision', 'decision_date', 'rule_set_version', 'is_deleted')
     search_fields = ('application__id', 'application__borrower__first_name', 
                      'application__borrower__last_name', 'underwriter__first_name', 
                      'underwriter__last_name', 'comments')
@@ -163,10 +164,37 @@ class UnderwritingNoteAdmin(admin.ModelAdmin):
         return obj.note_text
 
 
+class UnderwritingRuleSetAdmin(admin.ModelAdmin):
+    """Admin interface for the UnderwritingRuleSet model."""
+    list_display = ('version', 'name', 'is_active', 'published_at', 'publisher_name')
+    list_filter = ('is_active', 'published_at', 'is_deleted')
+    search_fields = ('name', 'description')
+    raw_id_fields = ('published_by', 'created_by', 'updated_by')
+    readonly_fields = ('is_active', 'published_at', 'published_by', 'created_at', 'updated_at')
+    actions = ['publish_rule_set']
+    
+    def publisher_name(self, obj):
+        """Display the publishing user's full name."""
+        if obj.published_by:
+            return f"{obj.published_by.first_name} {obj.published_by.last_name}"
+        return "Unpublished"
+    
+    @admin.action(description="Publish selected rule set")
+    def publish_rule_set(self, request, queryset):
+        """Publish a single selected rule set version."""
+        if queryset.count() != 1:
+            self.message_user(request, "Select exactly one rule set to publish.")
+            return
+        rule_set = queryset.first()
+        rule_set.publish(user=request.user)
+        self.message_user(request, f"Rule set v{rule_set.version} published.")
+
+
 # Register models with the admin site
 admin.site.register(UnderwritingQueue, UnderwritingQueueAdmin)
 admin.site.register(CreditInformation, CreditInformationAdmin)
 admin.site.register(UnderwritingDecision, UnderwritingDecisionAdmin)
 admin.site.register(DecisionReason, DecisionReasonAdmin)
 admin.site.register(Stipulation, StipulationAdmin)
-admin.site.register(UnderwritingNote, UnderwritingNoteAdmin)
\ No newline at end of file
+admin.site.register(UnderwritingNote, UnderwritingNoteAdmin)
+admin.site.register(UnderwritingRuleSet, UnderwritingRuleSetAdmin)
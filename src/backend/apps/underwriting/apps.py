@@ -1,5 +1,4 @@
 from django.apps import AppConfig  # Django 4.2+
-from .signals import connect_underwriting_signals  # src/backend/apps/underwriting/signals.py
 
 
 class UnderwritingConfig(AppConfig):
@@ -7,7 +6,7 @@ class UnderwritingConfig(AppConfig):
     Django app configuration class for the underwriting app that defines app metadata and initialization behavior
     """
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'underwriting'
+    name = 'apps.underwriting'
     label = 'underwriting'
     verbose_name = 'Underwriting'
 
@@ -21,7 +20,13 @@ class UnderwritingConfig(AppConfig):
         """
         # Import underwriting-related signals
         # Call connect_underwriting_signals to register signal handlers for underwriting events
-        connect_underwriting_signals()
+        try:
+            from .signals import connect_underwriting_signals
+            connect_underwriting_signals()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error connecting underwriting signals: {e}")
         # Register signal handlers for underwriting decisions
         # Register signal handlers for underwriting queue status changes
         # Register signal handlers for stipulation updates
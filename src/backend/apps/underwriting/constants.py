@@ -9,7 +9,7 @@ business rules and underwriting standards.
 
 from decimal import Decimal  # standard library v3.11+
 
-from ...utils.constants import (
+from utils.constants import (
     UNDERWRITING_DECISION,
     APPLICATION_STATUS,
     STIPULATION_TYPES,
@@ -0,0 +1,231 @@
+"""
+Prefetched data context for underwriting evaluation.
+
+This module provides the UnderwritingContext loader, which fetches an application and
+everything the underwriting rules read from it (loan details, borrower and co-borrower
+profiles, employment records, program and credit reports) in a single
+select_related/prefetch_related pass. A context is memoized per request so that
+evaluation, automatic decisioning and risk scoring share the same objects instead of
+repeating the same queries.
+"""
+
+from functools import cached_property  # standard library
+import logging  # standard library
+
+from django.core.exceptions import ObjectDoesNotExist  # Django 4.2+
+from django.db.models import Prefetch  # Django 4.2+
+from django.shortcuts import get_object_or_404  # Django 4.2+
+
+from apps.applications.models import LoanApplication
+from apps.users.models import EmploymentInfo
+from .models import CreditInformation
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Attribute used to memoize contexts on the request object
+REQUEST_CONTEXT_ATTRIBUTE = '_underwriting_contexts'
+
+# Forward relations and reverse one-to-one relations joined into the application query
+CONTEXT_SELECT_RELATED = (
+    'borrower__borrowerprofile',
+    'co_borrower__borrowerprofile',
+    'school',
+    'program',
+    'program_version',
+    'loan_details',
+)
+
+
+def _employment_prefetch(lookup):
+    """
+    Builds an ordered employment prefetch so that .first() is served from the cache.
+
+    Args:
+        lookup (str): Prefetch lookup path ending in employment_info
+
+    Returns:
+        Prefetch: Prefetch object for active employment records ordered by primary key
+    """
+    return Prefetch(lookup, queryset=EmploymentInfo.objects.order_by('pk'))
+
+
+class UnderwritingContext:
+    """
+    Request-scoped, prefetched view of a loan application for underwriting rules.
+    """
+
+    def __init__(self, application):
+        """
+        Initialize the context with an application loaded by get_queryset().
+
+        Args:
+            application (LoanApplication): The prefetched loan application
+        """
+        self.application = application
+
+    @classmethod
+    def get_queryset(cls):
+        """
+        Returns the LoanApplication queryset that loads everything in one pass.
+
+        Returns:
+            QuerySet: LoanApplication queryset with related data selected and prefetched
+        """
+        return LoanApplication.objects.select_related(*CONTEXT_SELECT_RELATED).prefetch_related(
+            _employment_prefetch('borrower__borrowerprofile__employment_info'),
+            _employment_prefetch('co_borrower__borrowerprofile__employment_info'),
+            Prefetch(
+                'credit_information',
+                queryset=CreditInformation.objects.order_by('-report_date'),
+                to_attr='prefetched_credit_reports'
+            ),
+        )
+
+    @classmethod
+    def load(cls, application_id):
+        """
+        Loads a context for an application.
+
+        Args:
+            application_id (uuid): The ID of the loan application
+
+        Returns:
+            UnderwritingContext: The loaded context
+
+        Raises:
+            Http404: If the application does not exist
+        """
+        return cls(get_object_or_404(cls.get_queryset(), pk=application_id))
+
+    @classmethod
+    def for_request(cls, request, application_id):
+        """
+        Returns the context for an application, memoized on the request.
+
+        Args:
+            request (object): The current request
+            application_id (uuid): The ID of the loan application
+
+        Returns:
+            UnderwritingContext: The memoized context
+        """
+        contexts = getattr(request, REQUEST_CONTEXT_ATTRIBUTE, None)
+        if contexts is None:
+            contexts = {}
+            setattr(request, REQUEST_CONTEXT_ATTRIBUTE, contexts)
+
+        key = str(application_id)
+        if key not in contexts:
+            contexts[key] = cls.load(application_id)
+        return contexts[key]
+
+    @staticmethod
+    def _related(instance, attribute):
+        """
+        Safely reads a possibly missing one-to-one relation.
+
+        Args:
+            instance (Model): Model instance, possibly None
+            attribute (str): Relation attribute name
+
+        Returns:
+            object: The related object or None
+        """
+        if instance is None:
+            return None
+        try:
+            return getattr(instance, attribute)
+        except ObjectDoesNotExist:
+            return None
+
+    @cached_property
+    def loan_details(self):
+        """
+        Returns the application's loan details.
+
+        Returns:
+            LoanDetails: Loan details or None
+        """
+        return self._related(self.application, 'loan_details')
+
+    @cached_property
+    def borrower_profile(self):
+        """
+        Returns the primary borrower's profile.
+
+        Returns:
+            BorrowerProfile: Borrower profile or None
+        """
+        return self._related(self.application.borrower, 'borrowerprofile')
+
+    @cached_property
+    def co_borrower_profile(self):
+        """
+        Returns the co-borrower's profile.
+
+        Returns:
+            BorrowerProfile: Co-borrower profile or None
+        """
+        return self._related(self.application.co_borrower, 'borrowerprofile')
+
+    @cached_property
+    def employment_info(self):
+        """
+        Returns the primary borrower's first employment record.
+
+        Returns:
+            EmploymentInfo: Employment record or None
+        """
+        if self.borrower_profile is None:
+            return None
+        return self.borrower_profile.employment_info.first()
+
+    @cached_property
+    def co_borrower_employment_info(self):
+        """
+        Returns the co-borrower's first employment record.
+
+        Returns:
+            EmploymentInfo: Employment record or None
+        """
+        if self.co_borrower_profile is None:
+            return None
+        return self.co_borrower_profile.employment_info.first()
+
+    @cached_property
+    def credit_info(self):
+        """
+        Returns the most recent credit report for the primary borrower.
+
+        Returns:
+            CreditInformation: Credit report or None
+        """
+        return self._latest_credit_report(self.application.borrower_id)
+
+    @cached_property
+    def co_borrower_credit_info(self):
+        """
+        Returns the most recent credit report for the co-borrower.
+
+        Returns:
+            CreditInformation: Credit report or None
+        """
+        if not self.application.co_borrower_id:
+            return None
+        return self._latest_credit_report(self.application.co_borrower_id)
+
+    def _latest_credit_report(self, borrower_id):
+        """
+        Finds the most recent prefetched credit report for a borrower.
+
+        Args:
+            borrower_id (uuid): The borrower's user ID
+
+        Returns:
+            CreditInformation: Credit report or None
+        """
+        for credit_report in self.application.prefetched_credit_reports:
+            if credit_report.borrower_id == borrower_id:
+                return credit_report
+        return None
@@ -6,7 +6,8 @@ queue management, credit information tracking, decision recording, and stipulati
 management for loan applications.
 """
 
-from django.db import models  # Django 4.2+
+from django.db import models, transaction  # Django 4.2+
+from django.core.exceptions import ValidationError  # Django 4.2+
 from django.utils import timezone  # Django 4.2+
 from decimal import Decimal  # standard library
 
@@ -416,6 +417,11 @@ class UnderwritingDecision(CoreModel):
         blank=True
     )
     term_months = models.IntegerField(null=True, blank=True)
+    rule_set_version = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Version of the underwriting rule set that produced this decision"
+    )
     
     # Custom managers
     objects = ActiveManager()
@@ -425,8 +431,9 @@ class UnderwritingDecision(CoreModel):
         """
         Override save method to handle decision-specific logic.
         
-        Sets decision_date if not provided and updates application status
-        based on the decision.
+        Sets decision_date if not provided, records the active rule set version
+        for manual decisions that do not carry the version of an evaluation,
+        and updates application status based on the decision.
         
         Args:
             **kwargs: Additional arguments to pass to parent save method
@@ -434,6 +441,12 @@ class UnderwritingDecision(CoreModel):
         # Set decision date if not provided
         if not self.decision_date:
             self.decision_date = timezone.now()
+        
+        # Decisions based on an evaluation carry its rule_set_version so they can be
+        # replayed deterministically; only manual decisions fall back to the active version
+        if self.rule_set_version is None:
+            from .rulesets import get_active_rule_set
+            self.rule_set_version = get_active_rule_set().version
             
         # Update application status if this is a new decision
         is_new = not self.pk
@@ -483,6 +496,9 @@ class UnderwritingDecision(CoreModel):
         Returns:
             QuerySet: QuerySet of Stipulation objects
         """
+        # Reuse stipulations already loaded through prefetch_related
+        if 'stipulations' in getattr(self.application, '_prefetched_objects_cache', {}):
+            return self.application.stipulations.all()
         return Stipulation.objects.filter(application=self.application)
     
     def is_approved(self):
@@ -742,4 +758,131 @@ class UnderwritingNote(CoreModel):
             str: Note preview with application ID
         """
         preview = self.note_text[:50] + "..." if len(self.note_text) > 50 else self.note_text
-        return f"Application {self.application.id}: {preview}"
\ No newline at end of file
+        return f"Application {self.application.id}: {preview}"
+
+
+class UnderwritingRuleSet(CoreModel):
+    """
+    Model for versioned underwriting threshold and weight configurations.
+    
+    Each version stores overrides for the decision thresholds and factor weights in
+    constants.py. Publishing a version compiles it and hot-swaps it into every process;
+    published versions are immutable so past decisions can be replayed.
+    """
+    version = models.PositiveIntegerField(unique=True)
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    thresholds = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Threshold overrides keyed by constant name, e.g. AUTOMATIC_APPROVAL_CRITERIA"
+    )
+    weights = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Factor weight overrides, e.g. CREDIT_SCORE"
+    )
+    is_active = models.BooleanField(default=False)
+    published_at = models.DateTimeField(null=True, blank=True)
+    published_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='published_rule_sets'
+    )
+    
+    # Custom managers
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    class Meta:
+        ordering = ['-version']
+    
+    def clean(self):
+        """
+        Validates that the configuration compiles.
+        
+        Raises:
+            ValidationError: If thresholds or weights are invalid
+        """
+        super().clean()
+        
+        from .rulesets import RuleSetError
+        try:
+            self.compile()
+        except RuleSetError as e:
+            raise ValidationError(str(e))
+    
+    def save(self, **kwargs):
+        """
+        Override save method to keep published configurations immutable.
+        
+        Args:
+            **kwargs: Additional arguments to pass to parent save method
+            
+        Raises:
+            ValidationError: If the thresholds or weights of a published version change
+        """
+        if self.pk:
+            stored = UnderwritingRuleSet.all_objects.filter(pk=self.pk).values(
+                'published_at', 'thresholds', 'weights'
+            ).first()
+            if stored and stored['published_at'] and (
+                stored['thresholds'] != self.thresholds or stored['weights'] != self.weights
+            ):
+                raise ValidationError("Published rule sets cannot be modified; create a new version instead.")
+        
+        super().save(**kwargs)
+    
+    def compile(self):
+        """
+        Compiles this configuration into an immutable evaluator object.
+        
+        Returns:
+            CompiledRuleSet: The compiled rule set
+        """
+        from .rulesets import compile_rule_set
+        return compile_rule_set(self.version, self.thresholds, self.weights)
+    
+    def publish(self, user=None):
+        """
+        Makes this version the active rule set for all processes.
+        
+        Args:
+            user (User): The user publishing the rule set
+            
+        Returns:
+            CompiledRuleSet: The compiled rule set that was activated
+        """
+        from .rulesets import activate_rule_set
+        compiled = self.compile()
+        
+        with transaction.atomic():
+            UnderwritingRuleSet.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False)
+            self.is_active = True
+            if not self.published_at:
+                self.published_at = timezone.now()
+                self.published_by = user
+            self.save()
+            transaction.on_commit(lambda: activate_rule_set(compiled))
+        
+        return compiled
+    
+    def is_published(self):
+        """
+        Checks if this version has been published.
+        
+        Returns:
+            bool: True if published, False otherwise
+        """
+        return self.published_at is not None
+    
+    def __str__(self):
+        """
+        String representation of the UnderwritingRuleSet instance.
+        
+        Returns:
+            str: Version number with name
+        """
+        return f"Rule set v{self.version} - {self.name}"
@@ -9,66 +9,91 @@ denial, or revision recommendations.
 from decimal import Decimal
 import logging
 
+import numpy as np  # numpy 1.26+
+
 # Import application models
-from ...apps.applications.models import LoanApplication
+from apps.applications.models import LoanApplication
 
 # Import underwriting models
 from .models import CreditInformation
 
 # Import user models
-from ...apps.users.models import BorrowerProfile
+from apps.users.models import BorrowerProfile, EmploymentInfo
 
 # Import constants
 from .constants import (
-    AUTOMATIC_APPROVAL_CRITERIA,
-    AUTOMATIC_DENIAL_CRITERIA,
     CONSIDERATION_CRITERIA,
     CREDIT_SCORE_TIERS,
     DEBT_TO_INCOME_TIERS,
-    EMPLOYMENT_HISTORY_REQUIREMENTS,
-    HOUSING_PAYMENT_RATIO_LIMITS,
     DECISION_REASON_CODES,
     REQUIRED_STIPULATIONS_BY_DECISION,
-    CREDIT_SCORE_WEIGHT,
-    DEBT_TO_INCOME_WEIGHT,
-    EMPLOYMENT_HISTORY_WEIGHT,
-    HOUSING_PAYMENT_WEIGHT,
-    MINIMUM_INCOME_TO_LOAN_RATIO,
     BORDERLINE_CREDIT_SCORE_RANGE,
     BORDERLINE_DTI_RANGE,
     BORDERLINE_EMPLOYMENT_RANGE
 )
 
-from ...utils.constants import (
+from utils.constants import (
     UNDERWRITING_DECISION,
     CITIZENSHIP_STATUS
 )
 
-from ...utils.validators import ValidationError
+from utils.validators import ValidationError
+
+from .rulesets import get_active_rule_set, get_rule_set
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Numeric status codes used by the vectorized batch evaluation
+_BATCH_DENIED = -1
+_BATCH_CONSIDERATION = 0
+_BATCH_APPROVED = 1
+
+_BATCH_STATUS_LABELS = {
+    _BATCH_DENIED: 'denied',
+    _BATCH_CONSIDERATION: 'consideration',
+    _BATCH_APPROVED: 'approved',
+}
+
+# Scored factors in the order evaluate_application reports them, with their denial reason
+_BATCH_SCORED_FACTORS = (
+    ('credit_score', DECISION_REASON_CODES['CREDIT_SCORE']),
+    ('dti_ratio', DECISION_REASON_CODES['DEBT_TO_INCOME']),
+    ('employment_history', DECISION_REASON_CODES['EMPLOYMENT_HISTORY']),
+    ('housing_ratio', DECISION_REASON_CODES['HOUSING_PAYMENT']),
+)
 
-def evaluate_credit_score(credit_score):
+# Status-only factors in the order evaluate_application reports them, with their denial reason
+_BATCH_STATUS_FACTORS = (
+    ('income_ratio', DECISION_REASON_CODES['INCOME_INSUFFICIENT']),
+    ('citizenship', DECISION_REASON_CODES['CITIZENSHIP_STATUS']),
+    ('program', DECISION_REASON_CODES['PROGRAM_ELIGIBILITY']),
+)
+
+
+def evaluate_credit_score(credit_score, rule_set=None):
     """
     Evaluates the credit score against approval criteria.
     
     Args:
         credit_score (int): The credit score to evaluate
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         dict: Evaluation result with score, status, and reason
     """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
     if credit_score is None:
         return {'status': 'consideration', 'score': 0.5}
     
     # Check for automatic approval
-    if credit_score >= AUTOMATIC_APPROVAL_CRITERIA['MIN_CREDIT_SCORE']:
+    if credit_score >= rule_set.approval_min_credit_score:
         return {'status': 'approved', 'score': 1.0}
     
     # Check for automatic denial
-    if credit_score <= AUTOMATIC_DENIAL_CRITERIA['MAX_CREDIT_SCORE']:
+    if credit_score <= rule_set.denial_max_credit_score:
         return {
             'status': 'denied', 
             'score': 0.0, 
@@ -76,8 +101,8 @@ def evaluate_credit_score(credit_score):
         }
     
     # Score is in consideration range, calculate normalized score
-    min_score = AUTOMATIC_DENIAL_CRITERIA['MAX_CREDIT_SCORE']
-    max_score = AUTOMATIC_APPROVAL_CRITERIA['MIN_CREDIT_SCORE']
+    min_score = rule_set.denial_max_credit_score
+    max_score = rule_set.approval_min_credit_score
     range_size = max_score - min_score
     
     # Normalize to 0-1 scale
@@ -92,25 +117,29 @@ def evaluate_credit_score(credit_score):
     }
 
 
-def evaluate_debt_to_income(dti_ratio):
+def evaluate_debt_to_income(dti_ratio, rule_set=None):
     """
     Evaluates the debt-to-income ratio against approval criteria.
     
     Args:
         dti_ratio (Decimal): The debt-to-income ratio to evaluate
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         dict: Evaluation result with score, status, and reason
     """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
     if dti_ratio is None:
         return {'status': 'consideration', 'score': 0.5}
     
     # Check for automatic approval
-    if dti_ratio <= AUTOMATIC_APPROVAL_CRITERIA['MAX_DTI']:
+    if dti_ratio <= rule_set.approval_max_dti:
         return {'status': 'approved', 'score': 1.0}
     
     # Check for automatic denial
-    if dti_ratio >= AUTOMATIC_DENIAL_CRITERIA['MIN_DTI']:
+    if dti_ratio >= rule_set.denial_min_dti:
         return {
             'status': 'denied', 
             'score': 0.0, 
@@ -118,8 +147,8 @@ def evaluate_debt_to_income(dti_ratio):
         }
     
     # DTI is in consideration range, calculate normalized score
-    min_dti = AUTOMATIC_APPROVAL_CRITERIA['MAX_DTI']
-    max_dti = AUTOMATIC_DENIAL_CRITERIA['MIN_DTI']
+    min_dti = rule_set.approval_max_dti
+    max_dti = rule_set.denial_min_dti
     range_size = max_dti - min_dti
     
     # Normalize to 0-1 scale (inverted because lower DTI is better)
@@ -134,25 +163,29 @@ def evaluate_debt_to_income(dti_ratio):
     }
 
 
-def evaluate_employment_history(employment_months):
+def evaluate_employment_history(employment_months, rule_set=None):
     """
     Evaluates the employment history duration against approval criteria.
     
     Args:
         employment_months (int): The employment duration in months
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         dict: Evaluation result with score, status, and reason
     """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
     if employment_months is None:
         return {'status': 'consideration', 'score': 0.5}
     
     # Check for automatic approval
-    if employment_months >= AUTOMATIC_APPROVAL_CRITERIA['MIN_EMPLOYMENT_MONTHS']:
+    if employment_months >= rule_set.approval_min_employment_months:
         return {'status': 'approved', 'score': 1.0}
     
     # Check for automatic denial
-    if employment_months < EMPLOYMENT_HISTORY_REQUIREMENTS['MINIMUM']:
+    if employment_months < rule_set.minimum_employment_months:
         return {
             'status': 'denied', 
             'score': 0.0, 
@@ -160,8 +193,8 @@ def evaluate_employment_history(employment_months):
         }
     
     # Employment is in consideration range, calculate normalized score
-    min_months = EMPLOYMENT_HISTORY_REQUIREMENTS['MINIMUM']
-    max_months = AUTOMATIC_APPROVAL_CRITERIA['MIN_EMPLOYMENT_MONTHS']
+    min_months = rule_set.minimum_employment_months
+    max_months = rule_set.approval_min_employment_months
     range_size = max_months - min_months
     
     # Normalize to 0-1 scale
@@ -176,25 +209,29 @@ def evaluate_employment_history(employment_months):
     }
 
 
-def evaluate_housing_payment_ratio(housing_ratio):
+def evaluate_housing_payment_ratio(housing_ratio, rule_set=None):
     """
     Evaluates the housing payment to income ratio against approval criteria.
     
     Args:
         housing_ratio (Decimal): The housing payment to income ratio
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         dict: Evaluation result with score, status, and reason
     """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
     if housing_ratio is None:
         return {'status': 'consideration', 'score': 0.5}
     
     # Check for automatic approval
-    if housing_ratio <= HOUSING_PAYMENT_RATIO_LIMITS['LOW']:
+    if housing_ratio <= rule_set.low_housing_ratio:
         return {'status': 'approved', 'score': 1.0}
     
     # Check for automatic denial
-    if housing_ratio >= AUTOMATIC_DENIAL_CRITERIA['MAX_HOUSING_RATIO']:
+    if housing_ratio >= rule_set.denial_max_housing_ratio:
         return {
             'status': 'denied', 
             'score': 0.0, 
@@ -202,8 +239,8 @@ def evaluate_housing_payment_ratio(housing_ratio):
         }
     
     # Housing ratio is in consideration range, calculate normalized score
-    min_ratio = HOUSING_PAYMENT_RATIO_LIMITS['LOW']
-    max_ratio = AUTOMATIC_DENIAL_CRITERIA['MAX_HOUSING_RATIO']
+    min_ratio = rule_set.low_housing_ratio
+    max_ratio = rule_set.denial_max_housing_ratio
     range_size = max_ratio - min_ratio
     
     # Normalize to 0-1 scale (inverted because lower ratio is better)
@@ -218,17 +255,21 @@ def evaluate_housing_payment_ratio(housing_ratio):
     }
 
 
-def evaluate_income_to_loan_ratio(annual_income, loan_amount):
+def evaluate_income_to_loan_ratio(annual_income, loan_amount, rule_set=None):
     """
     Evaluates the income to loan amount ratio against approval criteria.
     
     Args:
         annual_income (Decimal): The annual income amount
         loan_amount (Decimal): The requested loan amount
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         dict: Evaluation result with status and reason
     """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
     if annual_income is None or loan_amount is None:
         return {'status': 'consideration'}
     
@@ -237,7 +278,7 @@ def evaluate_income_to_loan_ratio(annual_income, loan_amount):
     
     income_to_loan_ratio = annual_income / loan_amount
     
-    if income_to_loan_ratio >= MINIMUM_INCOME_TO_LOAN_RATIO:
+    if income_to_loan_ratio >= rule_set.minimum_income_to_loan_ratio:
         return {'status': 'approved'}
     
     return {
@@ -296,7 +337,7 @@ def evaluate_program_eligibility(application):
     }
 
 
-def calculate_weighted_score(credit_score_result, dti_result, employment_result, housing_ratio_result):
+def calculate_weighted_score(credit_score_result, dti_result, employment_result, housing_ratio_result, rule_set=None):
     """
     Calculates the weighted score based on individual factor evaluations.
     
@@ -305,22 +346,27 @@ def calculate_weighted_score(credit_score_result, dti_result, employment_result,
         dti_result (dict): Debt-to-income evaluation result
         employment_result (dict): Employment history evaluation result
         housing_ratio_result (dict): Housing payment ratio evaluation result
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
         
     Returns:
         float: Weighted score between 0 and 1
     """
-    # Extract scores from evaluation results, defaulting to 0.5 if not present
-    credit_score = credit_score_result.get('score', 0.5)
-    dti = dti_result.get('score', 0.5)
-    employment = employment_result.get('score', 0.5)
-    housing = housing_ratio_result.get('score', 0.5)
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
+    # Extract scores from evaluation results, defaulting to 0.5 if not present.
+    # The DTI and housing scores are Decimals, and the weights are floats.
+    credit_score = float(credit_score_result.get('score', 0.5))
+    dti = float(dti_result.get('score', 0.5))
+    employment = float(employment_result.get('score', 0.5))
+    housing = float(housing_ratio_result.get('score', 0.5))
     
     # Calculate weighted score
     weighted_score = (
-        (credit_score * CREDIT_SCORE_WEIGHT) +
-        (dti * DEBT_TO_INCOME_WEIGHT) +
-        (employment * EMPLOYMENT_HISTORY_WEIGHT) +
-        (housing * HOUSING_PAYMENT_WEIGHT)
+        (credit_score * rule_set.credit_score_weight) +
+        (dti * rule_set.dti_weight) +
+        (employment * rule_set.employment_weight) +
+        (housing * rule_set.housing_weight)
     )
     
     return weighted_score
@@ -366,6 +412,59 @@ def determine_required_stipulations(decision, evaluation_results):
     return stipulations
 
 
+def get_evaluation_inputs(application, context=None):
+    """
+    Returns the loan details, borrower profile and employment record used by the rules.
+    
+    Reads from a prefetched UnderwritingContext when one is provided, so repeated
+    evaluations in the same request do not query the database again.
+    
+    Args:
+        application (LoanApplication): The loan application
+        context (UnderwritingContext): Optional prefetched context for the application
+        
+    Returns:
+        tuple: (loan_details, borrower_profile, employment_info), any of which may be None
+    """
+    if context is not None:
+        return context.loan_details, context.borrower_profile, context.employment_info
+    
+    loan_details = application.get_loan_details()
+    borrower_profile = application.borrower.get_profile()
+    
+    try:
+        employment_info = borrower_profile.employment_info.first()
+    except AttributeError:
+        employment_info = None
+    
+    return loan_details, borrower_profile, employment_info
+
+
+def _resolve_context(application, credit_info, context):
+    """
+    Fills in the application and credit information from a context when omitted.
+    
+    Args:
+        application (LoanApplication): The loan application, or None with a context
+        credit_info (CreditInformation): Credit information, or None with a context
+        context (UnderwritingContext): Optional prefetched context
+        
+    Returns:
+        tuple: (application, credit_info)
+        
+    Raises:
+        ValidationError: If no credit information is available
+    """
+    if context is not None:
+        application = application or context.application
+        credit_info = credit_info or context.credit_info
+    
+    if credit_info is None:
+        raise ValidationError(f"No credit information available for application {application.id}")
+    
+    return application, credit_info
+
+
 def get_decision_reasons(evaluation_results):
     """
     Extracts decision reasons from evaluation results.
@@ -386,45 +485,49 @@ def get_decision_reasons(evaluation_results):
     return reasons
 
 
-def evaluate_application(application, credit_info):
+def evaluate_application(application, credit_info, rule_set=None, context=None):
     """
     Performs comprehensive evaluation of a loan application.
     
     Args:
         application (LoanApplication): The loan application to evaluate
         credit_info (CreditInformation): Credit information for the borrower
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
+        context (UnderwritingContext): Optional prefetched context; when given, the
+            application and credit information default to the context's
         
     Returns:
         dict: Complete evaluation result with decision, reasons, and stipulations
     """
-    logger.info(f"Evaluating application {application.id}")
+    if rule_set is None:
+        rule_set = get_active_rule_set()
     
-    # Get loan details
-    loan_details = application.get_loan_details()
+    application, credit_info = _resolve_context(application, credit_info, context)
     
-    # Get borrower profile
-    borrower_profile = application.borrower.get_profile()
+    logger.info(f"Evaluating application {application.id}")
+    
+    # Get loan details, borrower profile and employment info
+    loan_details, borrower_profile, employment_info = get_evaluation_inputs(application, context)
     
     # Initialize evaluation results dictionary
     evaluation_results = {}
     
     # Evaluate credit score
-    credit_score_result = evaluate_credit_score(credit_info.credit_score)
+    credit_score_result = evaluate_credit_score(credit_info.credit_score, rule_set)
     evaluation_results['credit_score'] = credit_score_result
     
     # Evaluate debt-to-income ratio
     dti_ratio = credit_info.debt_to_income_ratio
-    dti_result = evaluate_debt_to_income(dti_ratio)
+    dti_result = evaluate_debt_to_income(dti_ratio, rule_set)
     evaluation_results['dti_ratio'] = dti_result
     
-    # Get employment info and evaluate
+    # Evaluate employment history
     try:
-        employment_info = borrower_profile.employment_info.first()
         employment_months = employment_info.get_total_employment_duration()
-    except (AttributeError, IndexError):
+    except AttributeError:
         employment_months = None
     
-    employment_result = evaluate_employment_history(employment_months)
+    employment_result = evaluate_employment_history(employment_months, rule_set)
     evaluation_results['employment_history'] = employment_result
     
     # Calculate and evaluate housing payment ratio
@@ -435,7 +538,7 @@ def evaluate_application(application, credit_info):
     except (AttributeError, ZeroDivisionError):
         housing_ratio = None
     
-    housing_ratio_result = evaluate_housing_payment_ratio(housing_ratio)
+    housing_ratio_result = evaluate_housing_payment_ratio(housing_ratio, rule_set)
     evaluation_results['housing_ratio'] = housing_ratio_result
     
     # Evaluate income to loan ratio
@@ -446,7 +549,7 @@ def evaluate_application(application, credit_info):
         annual_income = None
         loan_amount = None
     
-    income_ratio_result = evaluate_income_to_loan_ratio(annual_income, loan_amount)
+    income_ratio_result = evaluate_income_to_loan_ratio(annual_income, loan_amount, rule_set)
     evaluation_results['income_ratio'] = income_ratio_result
     
     # Evaluate citizenship status
@@ -471,7 +574,8 @@ def evaluate_application(application, credit_info):
                 'reasons': reasons,
                 'stipulations': stipulations,
                 'evaluation_results': evaluation_results,
-                'score': 0.0
+                'score': 0.0,
+                'rule_set_version': rule_set.version
             }
     
     # Calculate weighted score for consideration
@@ -479,13 +583,14 @@ def evaluate_application(application, credit_info):
         credit_score_result,
         dti_result,
         employment_result,
-        housing_ratio_result
+        housing_ratio_result,
+        rule_set
     )
     
     # Determine decision based on weighted score
-    if weighted_score >= 0.7:
+    if weighted_score >= rule_set.approve_score_threshold:
         decision = UNDERWRITING_DECISION['APPROVE']
-    elif weighted_score < 0.4:
+    elif weighted_score < rule_set.deny_score_threshold:
         decision = UNDERWRITING_DECISION['DENY']
     else:
         decision = UNDERWRITING_DECISION['REVISE']
@@ -503,121 +608,440 @@ def evaluate_application(application, credit_info):
         'reasons': reasons,
         'stipulations': stipulations,
         'evaluation_results': evaluation_results,
-        'score': weighted_score
+        'score': weighted_score,
+        'rule_set_version': rule_set.version
+    }
+
+
+def _to_float_array(values):
+    """
+    Converts a sequence of numeric values into a float64 array, mapping None to NaN.
+    
+    Args:
+        values (list): Sequence of Decimal, int, float or None values
+        
+    Returns:
+        numpy.ndarray: Array of floats with NaN for missing values
+    """
+    return np.fromiter(
+        (np.nan if value is None else float(value) for value in values),
+        dtype=np.float64,
+        count=len(values)
+    )
+
+
+def _normalize_range(values, lower, upper, invert=False):
+    """
+    Normalizes values between two thresholds to a 0-1 scale.
+    
+    Args:
+        values (numpy.ndarray): Values to normalize
+        lower (float): Value mapped to 0 (or 1 when inverted)
+        upper (float): Value mapped to 1 (or 0 when inverted)
+        invert (bool): Whether lower values are better
+        
+    Returns:
+        numpy.ndarray: Normalized scores
+    """
+    range_size = upper - lower
+    if range_size <= 0:
+        return np.full(values.shape, 0.5)
+    
+    normalized = (values - lower) / range_size
+    return 1 - normalized if invert else normalized
+
+
+def _evaluate_factor_array(values, approved, denied, normalized):
+    """
+    Applies the approve/deny/consideration logic of a scored factor to an array.
+    
+    Missing values (NaN) are treated as consideration with a neutral score of 0.5,
+    matching the behavior of the scalar evaluate_* functions.
+    
+    Args:
+        values (numpy.ndarray): Factor values
+        approved (numpy.ndarray): Boolean mask of automatically approved values
+        denied (numpy.ndarray): Boolean mask of automatically denied values
+        normalized (numpy.ndarray): Normalized scores for the consideration range
+        
+    Returns:
+        tuple: (status codes array, scores array)
+    """
+    missing = np.isnan(values)
+    conditions = [missing, approved, denied]
+    
+    statuses = np.select(
+        conditions,
+        [_BATCH_CONSIDERATION, _BATCH_APPROVED, _BATCH_DENIED],
+        default=_BATCH_CONSIDERATION
+    ).astype(np.int8)
+    scores = np.select(conditions, [0.5, 1.0, 0.0], default=normalized)
+    
+    return statuses, scores
+
+
+def load_batch_columns(queryset):
+    """
+    Loads the underwriting inputs for a set of applications into columnar arrays.
+    
+    Runs a fixed number of queries regardless of the number of applications: one for
+    application, loan, program and borrower profile fields, one for the latest primary
+    borrower credit report per application, and one for employment records.
+    
+    Args:
+        queryset (QuerySet): LoanApplication queryset to load
+        
+    Returns:
+        dict: Application IDs and NumPy arrays of evaluation inputs
+    """
+    application_ids = queryset.values('pk')
+    
+    rows = list(queryset.values_list(
+        'id',
+        'program_id',
+        'program__status',
+        'loan_details__requested_amount',
+        'borrower__borrowerprofile__id',
+        'borrower__borrowerprofile__housing_payment',
+        'borrower__borrowerprofile__citizenship_status',
+    ))
+    
+    # Latest primary borrower credit report per application (later rows overwrite earlier)
+    credit_by_application = {}
+    credit_rows = CreditInformation.objects.filter(
+        application_id__in=application_ids,
+        is_co_borrower=False
+    ).order_by('application_id', 'report_date').values_list(
+        'application_id', 'credit_score', 'debt_to_income_ratio'
+    )
+    for application_id, credit_score, dti_ratio in credit_rows:
+        credit_by_application[application_id] = (credit_score, dti_ratio)
+    
+    # First employment record per profile, matching borrower_profile.employment_info.first()
+    employment_by_profile = {}
+    employment_rows = EmploymentInfo.objects.filter(
+        profile__user__applications_as_borrower__in=application_ids
+    ).order_by('profile_id', 'pk').values_list(
+        'profile_id', 'years_employed', 'months_employed', 'annual_income', 'other_income'
+    ).distinct()
+    for profile_id, years, months, annual_income, other_income in employment_rows:
+        employment_by_profile.setdefault(profile_id, (years, months, annual_income, other_income))
+    
+    count = len(rows)
+    credit = [credit_by_application.get(row[0], (None, None)) for row in rows]
+    employment = [employment_by_profile.get(row[4]) for row in rows]
+    
+    annual_income = _to_float_array([e[2] if e else None for e in employment])
+    other_income = np.nan_to_num(_to_float_array([e[3] if e else None for e in employment]))
+    
+    return {
+        'application_ids': [row[0] for row in rows],
+        'credit_score': _to_float_array([c[0] for c in credit]),
+        'dti_ratio': _to_float_array([c[1] for c in credit]),
+        'employment_months': _to_float_array(
+            [(e[0] * 12) + e[1] if e else None for e in employment]
+        ),
+        'annual_income': annual_income,
+        'monthly_income': (annual_income + other_income) / 12,
+        'housing_payment': _to_float_array([row[5] for row in rows]),
+        'requested_amount': _to_float_array([row[3] for row in rows]),
+        'citizenship_status': np.array([row[6] for row in rows], dtype=object),
+        'has_program': np.fromiter((row[1] is not None for row in rows), dtype=bool, count=count),
+        'program_active': np.fromiter((row[2] == 'active' for row in rows), dtype=bool, count=count),
     }
 
 
+def evaluate_batch_columns(columns, rule_set=None):
+    """
+    Evaluates columnar underwriting inputs with vectorized array operations.
+    
+    Applies the same thresholds, weights and decision cut-offs as evaluate_application
+    to every application at once and returns results in the same structure.
+    
+    Args:
+        columns (dict): Columnar inputs as returned by load_batch_columns
+        rule_set (CompiledRuleSet): Rule set to apply; defaults to the active rule set
+        
+    Returns:
+        dict: Evaluation results keyed by application ID
+    """
+    if rule_set is None:
+        rule_set = get_active_rule_set()
+    
+    application_ids = columns['application_ids']
+    if not application_ids:
+        return {}
+    
+    credit_score = columns['credit_score']
+    dti_ratio = columns['dti_ratio']
+    employment_months = columns['employment_months']
+    annual_income = columns['annual_income']
+    requested_amount = columns['requested_amount']
+    
+    approval_min_credit = float(rule_set.approval_min_credit_score)
+    denial_max_credit = float(rule_set.denial_max_credit_score)
+    approval_max_dti = float(rule_set.approval_max_dti)
+    denial_min_dti = float(rule_set.denial_min_dti)
+    approval_min_months = float(rule_set.approval_min_employment_months)
+    minimum_months = float(rule_set.minimum_employment_months)
+    low_housing_ratio = float(rule_set.low_housing_ratio)
+    denial_housing_ratio = float(rule_set.denial_max_housing_ratio)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        monthly_income = columns['monthly_income']
+        housing_ratio = np.where(
+            monthly_income != 0, columns['housing_payment'] / monthly_income, np.nan
+        )
+        income_to_loan_ratio = annual_income / requested_amount
+        
+        credit_status, credit_scores = _evaluate_factor_array(
+            credit_score,
+            credit_score >= approval_min_credit,
+            credit_score <= denial_max_credit,
+            _normalize_range(credit_score, denial_max_credit, approval_min_credit)
+        )
+        dti_status, dti_scores = _evaluate_factor_array(
+            dti_ratio,
+            dti_ratio <= approval_max_dti,
+            dti_ratio >= denial_min_dti,
+            _normalize_range(dti_ratio, approval_max_dti, denial_min_dti, invert=True)
+        )
+        employment_status, employment_scores = _evaluate_factor_array(
+            employment_months,
+            employment_months >= approval_min_months,
+            employment_months < minimum_months,
+            _normalize_range(employment_months, minimum_months, approval_min_months)
+        )
+        housing_status, housing_scores = _evaluate_factor_array(
+            housing_ratio,
+            housing_ratio <= low_housing_ratio,
+            housing_ratio >= denial_housing_ratio,
+            _normalize_range(housing_ratio, low_housing_ratio, denial_housing_ratio, invert=True)
+        )
+        
+        income_missing = np.isnan(annual_income) | np.isnan(requested_amount)
+        income_approved = (
+            (requested_amount <= 0) |
+            (income_to_loan_ratio >= rule_set.minimum_income_to_loan_ratio)
+        )
+    
+    income_status = np.select(
+        [income_missing, income_approved],
+        [_BATCH_CONSIDERATION, _BATCH_APPROVED],
+        default=_BATCH_DENIED
+    ).astype(np.int8)
+    
+    citizenship_status = columns['citizenship_status']
+    eligible_statuses = [
+        CITIZENSHIP_STATUS['US_CITIZEN'],
+        CITIZENSHIP_STATUS['PERMANENT_RESIDENT'],
+        CITIZENSHIP_STATUS['ELIGIBLE_NON_CITIZEN']
+    ]
+    citizenship_result = np.select(
+        [np.equal(citizenship_status, None), np.isin(citizenship_status, eligible_statuses)],
+        [_BATCH_CONSIDERATION, _BATCH_APPROVED],
+        default=_BATCH_DENIED
+    ).astype(np.int8)
+    
+    program_status = np.select(
+        [~columns['has_program'], columns['program_active']],
+        [_BATCH_CONSIDERATION, _BATCH_APPROVED],
+        default=_BATCH_DENIED
+    ).astype(np.int8)
+    
+    scored_statuses = np.vstack([credit_status, dti_status, employment_status, housing_status])
+    scored_values = np.vstack([credit_scores, dti_scores, employment_scores, housing_scores])
+    status_only = np.vstack([income_status, citizenship_result, program_status])
+    
+    # Weighted score and decision for every application in one pass
+    weights = np.array([
+        rule_set.credit_score_weight, rule_set.dti_weight,
+        rule_set.employment_weight, rule_set.housing_weight
+    ])
+    weighted_scores = weights @ scored_values
+    any_denied = (
+        (scored_statuses == _BATCH_DENIED).any(axis=0) |
+        (status_only == _BATCH_DENIED).any(axis=0)
+    )
+    weighted_scores = np.where(any_denied, 0.0, weighted_scores)
+    decisions = np.select(
+        [
+            any_denied,
+            weighted_scores >= rule_set.approve_score_threshold,
+            weighted_scores < rule_set.deny_score_threshold
+        ],
+        [UNDERWRITING_DECISION['DENY'], UNDERWRITING_DECISION['APPROVE'], UNDERWRITING_DECISION['DENY']],
+        default=UNDERWRITING_DECISION['REVISE']
+    )
+    
+    results = {}
+    for index, application_id in enumerate(application_ids):
+        evaluation_results = {}
+        for row, (factor, reason) in enumerate(_BATCH_SCORED_FACTORS):
+            status_code = int(scored_statuses[row, index])
+            result = {
+                'status': _BATCH_STATUS_LABELS[status_code],
+                'score': float(scored_values[row, index])
+            }
+            if status_code == _BATCH_DENIED:
+                result['reason'] = reason
+            evaluation_results[factor] = result
+        for row, (factor, reason) in enumerate(_BATCH_STATUS_FACTORS):
+            status_code = int(status_only[row, index])
+            result = {'status': _BATCH_STATUS_LABELS[status_code]}
+            if status_code == _BATCH_DENIED:
+                result['reason'] = reason
+            evaluation_results[factor] = result
+        
+        decision = str(decisions[index])
+        if any_denied[index]:
+            stipulations = []
+        else:
+            stipulations = determine_required_stipulations(decision, evaluation_results)
+        
+        results[application_id] = {
+            'decision': decision,
+            'reasons': get_decision_reasons(evaluation_results),
+            'stipulations': stipulations,
+            'evaluation_results': evaluation_results,
+            'score': float(weighted_scores[index]),
+            'rule_set_version': rule_set.version
+        }
+    
+    return results
+
+
 class UnderwritingRuleEngine:
     """
     Engine for applying underwriting rules to loan applications.
     """
     
-    def __init__(self):
+    def __init__(self, rule_set_version=None):
         """
         Initialize the rule engine.
+        
+        Args:
+            rule_set_version (int): Rule set version to pin, e.g. to replay a past
+                decision; None follows the active rule set
         """
         self.logger = logging.getLogger(__name__)
+        self.rule_set_version = rule_set_version
     
-    def evaluate_application(self, application, credit_info):
+    def get_rule_set(self):
+        """
+        Returns the compiled rule set this engine evaluates with.
+        
+        Returns:
+            CompiledRuleSet: The pinned version, or the active rule set
+        """
+        return get_rule_set(self.rule_set_version)
+    
+    def evaluate_application(self, application=None, credit_info=None, context=None):
         """
         Evaluates a loan application against underwriting rules.
         
         Args:
             application (LoanApplication): The loan application to evaluate
             credit_info (CreditInformation): Credit information for the borrower
+            context (UnderwritingContext): Optional prefetched context shared across calls
             
         Returns:
             dict: Evaluation result with decision, reasons, and stipulations
         """
-        return evaluate_application(application, credit_info)
+        return evaluate_application(application, credit_info, self.get_rule_set(), context)
     
-    def get_auto_decision(self, application, credit_info):
+    def get_auto_decision(self, application=None, credit_info=None, context=None):
         """
         Attempts to make an automatic decision based on clear criteria.
         
         Args:
             application (LoanApplication): The loan application to evaluate
             credit_info (CreditInformation): Credit information for the borrower
+            context (UnderwritingContext): Optional prefetched context shared across calls
             
         Returns:
             dict: Automatic decision result or None if manual review needed
         """
-        # Get borrower profile
-        borrower_profile = application.borrower.get_profile()
+        rule_set = self.get_rule_set()
+        application, credit_info = _resolve_context(application, credit_info, context)
         
-        # Get loan details
-        loan_details = application.get_loan_details()
+        # Get borrower profile and employment info
+        _, borrower_profile, employment_info = get_evaluation_inputs(application, context)
         
         # Check for automatic approval criteria
-        if (credit_info.credit_score >= AUTOMATIC_APPROVAL_CRITERIA['MIN_CREDIT_SCORE'] and
-            credit_info.debt_to_income_ratio <= AUTOMATIC_APPROVAL_CRITERIA['MAX_DTI']):
+        if (credit_info.credit_score >= rule_set.approval_min_credit_score and
+            credit_info.debt_to_income_ratio <= rule_set.approval_max_dti):
             
-            # Get employment info
+            # Get employment duration
             try:
-                employment_info = borrower_profile.employment_info.first()
                 employment_months = employment_info.get_total_employment_duration()
                 
                 # If employment meets criteria, approve
-                if employment_months >= AUTOMATIC_APPROVAL_CRITERIA['MIN_EMPLOYMENT_MONTHS']:
+                if employment_months >= rule_set.approval_min_employment_months:
                     return {
                         'decision': UNDERWRITING_DECISION['APPROVE'],
                         'reasons': [],
                         'stipulations': determine_required_stipulations(
                             UNDERWRITING_DECISION['APPROVE'], {}
                         ),
-                        'auto_approved': True
+                        'auto_approved': True,
+                        'rule_set_version': rule_set.version
                     }
             except (AttributeError, IndexError):
                 pass
         
         # Check for automatic denial criteria
-        if (credit_info.credit_score <= AUTOMATIC_DENIAL_CRITERIA['MAX_CREDIT_SCORE'] or
-            credit_info.debt_to_income_ratio >= AUTOMATIC_DENIAL_CRITERIA['MIN_DTI']):
+        if (credit_info.credit_score <= rule_set.denial_max_credit_score or
+            credit_info.debt_to_income_ratio >= rule_set.denial_min_dti):
             
             reasons = []
             
-            if credit_info.credit_score <= AUTOMATIC_DENIAL_CRITERIA['MAX_CREDIT_SCORE']:
+            if credit_info.credit_score <= rule_set.denial_max_credit_score:
                 reasons.append(DECISION_REASON_CODES['CREDIT_SCORE'])
                 
-            if credit_info.debt_to_income_ratio >= AUTOMATIC_DENIAL_CRITERIA['MIN_DTI']:
+            if credit_info.debt_to_income_ratio >= rule_set.denial_min_dti:
                 reasons.append(DECISION_REASON_CODES['DEBT_TO_INCOME'])
             
             return {
                 'decision': UNDERWRITING_DECISION['DENY'],
                 'reasons': reasons,
                 'stipulations': [],
-                'auto_denied': True
+                'auto_denied': True,
+                'rule_set_version': rule_set.version
             }
         
         # If neither auto-approve nor auto-deny, return None to indicate manual review needed
         return None
     
-    def calculate_risk_score(self, application, credit_info):
+    def calculate_risk_score(self, application=None, credit_info=None, context=None):
         """
         Calculates a risk score for the application.
         
         Args:
             application (LoanApplication): The loan application to evaluate
             credit_info (CreditInformation): Credit information for the borrower
+            context (UnderwritingContext): Optional prefetched context shared across calls
             
         Returns:
             float: Risk score between 0 (highest risk) and 100 (lowest risk)
         """
-        # Get borrower profile
-        borrower_profile = application.borrower.get_profile()
+        rule_set = self.get_rule_set()
+        application, credit_info = _resolve_context(application, credit_info, context)
+        
+        # Get borrower profile and employment info
+        _, borrower_profile, employment_info = get_evaluation_inputs(application, context)
         
         # Evaluate individual factors
-        credit_score_result = evaluate_credit_score(credit_info.credit_score)
-        dti_result = evaluate_debt_to_income(credit_info.debt_to_income_ratio)
+        credit_score_result = evaluate_credit_score(credit_info.credit_score, rule_set)
+        dti_result = evaluate_debt_to_income(credit_info.debt_to_income_ratio, rule_set)
         
-        # Get employment info and evaluate
+        # Evaluate employment history
         try:
-            employment_info = borrower_profile.employment_info.first()
             employment_months = employment_info.get_total_employment_duration()
-        except (AttributeError, IndexError):
+        except AttributeError:
             employment_months = None
         
-        employment_result = evaluate_employment_history(employment_months)
+        employment_result = evaluate_employment_history(employment_months, rule_set)
         
         # Calculate and evaluate housing payment ratio
         try:
@@ -627,17 +1051,38 @@ class UnderwritingRuleEngine:
         except (AttributeError, ZeroDivisionError):
             housing_ratio = None
         
-        housing_ratio_result = evaluate_housing_payment_ratio(housing_ratio)
+        housing_ratio_result = evaluate_housing_payment_ratio(housing_ratio, rule_set)
         
         # Calculate weighted score
         weighted_score = calculate_weighted_score(
             credit_score_result,
             dti_result,
             employment_result,
-            housing_ratio_result
+            housing_ratio_result,
+            rule_set
         )
         
         # Scale to 0-100 range (higher is better/less risky)
         risk_score = weighted_score * 100
         
-        return risk_score
\ No newline at end of file
+        return risk_score
+    
+    def evaluate_batch(self, queryset):
+        """
+        Evaluates many loan applications at once using vectorized rule evaluation.
+        
+        Loads credit, DTI, employment, housing and income inputs for the whole queryset
+        with a fixed number of queries and scores them as NumPy arrays. Each application
+        is evaluated against its most recent primary borrower credit report.
+        
+        Args:
+            queryset (QuerySet): LoanApplication queryset to evaluate
+            
+        Returns:
+            dict: Evaluation results keyed by application ID, each with decision,
+                reasons, stipulations, evaluation_results, score and rule_set_version
+        """
+        columns = load_batch_columns(queryset)
+        self.logger.info(f"Evaluating batch of {len(columns['application_ids'])} applications")
+        
+        return evaluate_batch_columns(columns, self.get_rule_set())
\ No newline at end of file
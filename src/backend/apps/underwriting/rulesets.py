@@ -0,0 +1,339 @@
+"""
+Compiled, versioned underwriting rule sets.
+
+This module turns threshold and weight configurations stored in UnderwritingRuleSet
+records into frozen, slot-based CompiledRuleSet objects that the rule functions read
+as plain attributes. Compiled rule sets are cached per process, and the active one is
+hot-swapped when a new version is published, without a redeploy.
+"""
+
+from dataclasses import dataclass  # standard library
+from decimal import Decimal  # standard library
+import logging  # standard library
+import threading  # standard library
+import time  # standard library
+
+from django.core.cache import cache  # Django 4.2+
+
+from .constants import (
+    AUTOMATIC_APPROVAL_CRITERIA,
+    AUTOMATIC_DENIAL_CRITERIA,
+    EMPLOYMENT_HISTORY_REQUIREMENTS,
+    HOUSING_PAYMENT_RATIO_LIMITS,
+    CREDIT_SCORE_WEIGHT,
+    DEBT_TO_INCOME_WEIGHT,
+    EMPLOYMENT_HISTORY_WEIGHT,
+    HOUSING_PAYMENT_WEIGHT,
+    MINIMUM_INCOME_TO_LOAN_RATIO,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Version number of the built-in rule set compiled from constants.py
+DEFAULT_RULE_SET_VERSION = 0
+
+# Shared cache key holding the currently published rule set version
+ACTIVE_RULE_SET_CACHE_KEY = 'underwriting:active_rule_set_version'
+
+# How often (seconds) a process checks the shared cache for a newly published version
+RULE_SET_CHECK_INTERVAL_SECONDS = 30
+
+# Weighted score cut-offs used to turn a score into a decision
+APPROVE_SCORE_THRESHOLD = 0.7
+DENY_SCORE_THRESHOLD = 0.4
+
+# Thresholds a stored rule set may override, keyed by constant dict name
+DEFAULT_THRESHOLDS = {
+    'AUTOMATIC_APPROVAL_CRITERIA': AUTOMATIC_APPROVAL_CRITERIA,
+    'AUTOMATIC_DENIAL_CRITERIA': AUTOMATIC_DENIAL_CRITERIA,
+    'EMPLOYMENT_HISTORY_REQUIREMENTS': EMPLOYMENT_HISTORY_REQUIREMENTS,
+    'HOUSING_PAYMENT_RATIO_LIMITS': HOUSING_PAYMENT_RATIO_LIMITS,
+    'MINIMUM_INCOME_TO_LOAN_RATIO': MINIMUM_INCOME_TO_LOAN_RATIO,
+    'APPROVE_SCORE_THRESHOLD': APPROVE_SCORE_THRESHOLD,
+    'DENY_SCORE_THRESHOLD': DENY_SCORE_THRESHOLD,
+}
+
+# Factor weights a stored rule set may override
+DEFAULT_WEIGHTS = {
+    'CREDIT_SCORE': CREDIT_SCORE_WEIGHT,
+    'DEBT_TO_INCOME': DEBT_TO_INCOME_WEIGHT,
+    'EMPLOYMENT_HISTORY': EMPLOYMENT_HISTORY_WEIGHT,
+    'HOUSING_PAYMENT': HOUSING_PAYMENT_WEIGHT,
+}
+
+
+class RuleSetError(Exception):
+    """
+    Exception raised when a rule set configuration cannot be compiled.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRuleSet:
+    """
+    Immutable, attribute-based view of an underwriting rule set.
+
+    Ratio thresholds are kept as Decimal so that comparisons against model values
+    behave exactly like the module-level constants; weights and score cut-offs are floats.
+    """
+    version: int
+    approval_min_credit_score: int
+    approval_max_dti: Decimal
+    approval_min_employment_months: int
+    denial_max_credit_score: int
+    denial_min_dti: Decimal
+    denial_max_housing_ratio: Decimal
+    minimum_employment_months: int
+    low_housing_ratio: Decimal
+    minimum_income_to_loan_ratio: float
+    credit_score_weight: float
+    dti_weight: float
+    employment_weight: float
+    housing_weight: float
+    approve_score_threshold: float
+    deny_score_threshold: float
+
+
+def _merged(defaults, overrides):
+    """
+    Merges stored overrides over a default threshold group.
+
+    Args:
+        defaults (dict): Default values for the group
+        overrides (dict): Stored override values, possibly None
+
+    Returns:
+        dict: Merged values
+    """
+    merged = dict(defaults)
+    merged.update(overrides or {})
+    return merged
+
+
+def compile_rule_set(version, thresholds=None, weights=None):
+    """
+    Compiles a threshold and weight configuration into a CompiledRuleSet.
+
+    Any value not present in the configuration falls back to constants.py, so a stored
+    rule set only needs to contain the values it changes.
+
+    Args:
+        version (int): Rule set version number
+        thresholds (dict): Threshold overrides keyed like DEFAULT_THRESHOLDS
+        weights (dict): Weight overrides keyed like DEFAULT_WEIGHTS
+
+    Returns:
+        CompiledRuleSet: The compiled rule set
+
+    Raises:
+        RuleSetError: If the configuration contains invalid values
+    """
+    thresholds = thresholds or {}
+    weights = _merged(DEFAULT_WEIGHTS, weights)
+
+    approval = _merged(AUTOMATIC_APPROVAL_CRITERIA, thresholds.get('AUTOMATIC_APPROVAL_CRITERIA'))
+    denial = _merged(AUTOMATIC_DENIAL_CRITERIA, thresholds.get('AUTOMATIC_DENIAL_CRITERIA'))
+    employment = _merged(EMPLOYMENT_HISTORY_REQUIREMENTS, thresholds.get('EMPLOYMENT_HISTORY_REQUIREMENTS'))
+    housing = _merged(HOUSING_PAYMENT_RATIO_LIMITS, thresholds.get('HOUSING_PAYMENT_RATIO_LIMITS'))
+
+    try:
+        compiled = CompiledRuleSet(
+            version=int(version),
+            approval_min_credit_score=int(approval['MIN_CREDIT_SCORE']),
+            approval_max_dti=Decimal(str(approval['MAX_DTI'])),
+            approval_min_employment_months=int(approval['MIN_EMPLOYMENT_MONTHS']),
+            denial_max_credit_score=int(denial['MAX_CREDIT_SCORE']),
+            denial_min_dti=Decimal(str(denial['MIN_DTI'])),
+            denial_max_housing_ratio=Decimal(str(denial['MAX_HOUSING_RATIO'])),
+            minimum_employment_months=int(employment['MINIMUM']),
+            low_housing_ratio=Decimal(str(housing['LOW'])),
+            minimum_income_to_loan_ratio=float(
+                thresholds.get('MINIMUM_INCOME_TO_LOAN_RATIO', MINIMUM_INCOME_TO_LOAN_RATIO)
+            ),
+            credit_score_weight=float(weights['CREDIT_SCORE']),
+            dti_weight=float(weights['DEBT_TO_INCOME']),
+            employment_weight=float(weights['EMPLOYMENT_HISTORY']),
+            housing_weight=float(weights['HOUSING_PAYMENT']),
+            approve_score_threshold=float(
+                thresholds.get('APPROVE_SCORE_THRESHOLD', APPROVE_SCORE_THRESHOLD)
+            ),
+            deny_score_threshold=float(
+                thresholds.get('DENY_SCORE_THRESHOLD', DENY_SCORE_THRESHOLD)
+            ),
+        )
+    except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+        raise RuleSetError(f"Invalid rule set configuration for version {version}: {e}")
+
+    total_weight = (
+        compiled.credit_score_weight + compiled.dti_weight +
+        compiled.employment_weight + compiled.housing_weight
+    )
+    if abs(total_weight - 1.0) > 1e-6:
+        raise RuleSetError(f"Rule set version {version} weights must sum to 1.0, got {total_weight}")
+
+    if compiled.deny_score_threshold > compiled.approve_score_threshold:
+        raise RuleSetError(f"Rule set version {version} deny threshold exceeds approve threshold")
+
+    return compiled
+
+
+# Built-in rule set matching the module-level constants
+DEFAULT_RULE_SET = compile_rule_set(DEFAULT_RULE_SET_VERSION)
+
+
+class _RuleSetRegistry:
+    """
+    Per-process registry of compiled rule sets and the currently active one.
+    """
+
+    def __init__(self):
+        """
+        Initialize the registry with the built-in rule set active.
+        """
+        self._lock = threading.Lock()
+        self._compiled = {DEFAULT_RULE_SET_VERSION: DEFAULT_RULE_SET}
+        self._active = DEFAULT_RULE_SET
+        self._checked_at = None
+
+    def get(self, version):
+        """
+        Returns the compiled rule set for a version, loading it on first use.
+
+        Args:
+            version (int): Rule set version number
+
+        Returns:
+            CompiledRuleSet: The compiled rule set
+        """
+        compiled = self._compiled.get(version)
+        if compiled is not None:
+            return compiled
+
+        from .models import UnderwritingRuleSet
+        rule_set = UnderwritingRuleSet.all_objects.get(version=version)
+        compiled = rule_set.compile()
+
+        with self._lock:
+            # Published versions are immutable, so a compiled version never goes stale
+            self._compiled.setdefault(version, compiled)
+        return self._compiled[version]
+
+    def active(self):
+        """
+        Returns the active rule set, swapping it if a newer version was published.
+
+        The shared cache is consulted at most once per RULE_SET_CHECK_INTERVAL_SECONDS;
+        between checks this is a plain attribute read.
+
+        Returns:
+            CompiledRuleSet: The active compiled rule set
+        """
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < RULE_SET_CHECK_INTERVAL_SECONDS:
+            return self._active
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < RULE_SET_CHECK_INTERVAL_SECONDS:
+                return self._active
+            self._checked_at = now
+
+        try:
+            version = cache.get(ACTIVE_RULE_SET_CACHE_KEY)
+            if version is None:
+                version = self._load_active_version()
+                cache.set(ACTIVE_RULE_SET_CACHE_KEY, version, None)
+            if version != self._active.version:
+                self.swap(self.get(version))
+        except Exception as e:
+            # Keep evaluating with the last known rule set if the store is unavailable
+            logger.warning(f"Could not refresh active underwriting rule set: {str(e)}")
+
+        return self._active
+
+    def swap(self, compiled):
+        """
+        Makes a compiled rule set the active one in this process.
+
+        Args:
+            compiled (CompiledRuleSet): The rule set to activate
+        """
+        with self._lock:
+            self._compiled.setdefault(compiled.version, compiled)
+            previous = self._active
+            self._active = compiled
+
+        if previous.version != compiled.version:
+            logger.info(
+                f"Underwriting rule set swapped from version {previous.version} to {compiled.version}"
+            )
+
+    def reset(self):
+        """
+        Drops all loaded rule sets and reactivates the built-in defaults.
+        """
+        with self._lock:
+            self._compiled = {DEFAULT_RULE_SET_VERSION: DEFAULT_RULE_SET}
+            self._active = DEFAULT_RULE_SET
+            self._checked_at = None
+
+    @staticmethod
+    def _load_active_version():
+        """
+        Reads the active rule set version from the database.
+
+        Returns:
+            int: Active version, or the built-in version if none is published
+        """
+        from .models import UnderwritingRuleSet
+        version = UnderwritingRuleSet.objects.filter(is_active=True).values_list(
+            'version', flat=True
+        ).first()
+        return DEFAULT_RULE_SET_VERSION if version is None else version
+
+
+_registry = _RuleSetRegistry()
+
+
+def get_active_rule_set():
+    """
+    Returns the currently active compiled rule set for this process.
+
+    Returns:
+        CompiledRuleSet: The active rule set
+    """
+    return _registry.active()
+
+
+def get_rule_set(version):
+    """
+    Returns the compiled rule set for a specific version, e.g. to replay a decision.
+
+    Args:
+        version (int): Rule set version number; None returns the active rule set
+
+    Returns:
+        CompiledRuleSet: The compiled rule set
+    """
+    if version is None:
+        return get_active_rule_set()
+    return _registry.get(version)
+
+
+def activate_rule_set(compiled):
+    """
+    Announces a newly published rule set to all processes and activates it locally.
+
+    Args:
+        compiled (CompiledRuleSet): The rule set that was published
+    """
+    cache.set(ACTIVE_RULE_SET_CACHE_KEY, compiled.version, None)
+    _registry.swap(compiled)
+
+
+def reset_rule_set_cache():
+    """
+    Clears the per-process rule set cache, reverting to the built-in defaults.
+    """
+    _registry.reset()
@@ -10,7 +10,10 @@ from django.utils import timezone  # django version: 4.2+
 from decimal import Decimal  # standard library
 from decimal import InvalidOperation
 
-from core.serializers import BaseModelSerializer, ReadOnlyModelSerializer, AuditFieldsMixin, SensitiveDataMixin
+from core.serializers import (
+    BaseModelSerializer, ReadOnlyModelSerializer, AuditFieldsMixin, SensitiveDataMixin,
+    DownloadUrlMixin, DownloadUrlListSerializer
+)
 from .models import (
     UnderwritingQueue,
     CreditInformation,
@@ -18,7 +21,9 @@ from .models import (
     DecisionReason,
     Stipulation,
     UnderwritingNote,
+    UnderwritingRuleSet,
 )
+from .rulesets import DEFAULT_RULE_SET_VERSION
 from apps.applications.models import LoanApplication
 from apps.users.models import User
 from .models import (
@@ -80,7 +85,7 @@ class UnderwritingQueueSerializer(BaseModelSerializer):
         }
 
 
-class CreditInformationSerializer(SensitiveDataMixin, BaseModelSerializer):
+class CreditInformationSerializer(DownloadUrlMixin, SensitiveDataMixin, BaseModelSerializer):
     """
     Serializer for the CreditInformation model with sensitive data handling.
     """
@@ -92,6 +97,7 @@ class CreditInformationSerializer(SensitiveDataMixin, BaseModelSerializer):
         model = CreditInformation
         fields = '__all__'
         read_only_fields = ['application', 'borrower', 'uploaded_by', 'uploaded_at']
+        list_serializer_class = DownloadUrlListSerializer
 
     def get_credit_tier(self, obj: CreditInformation) -> str:
         """
@@ -128,7 +134,7 @@ class UnderwritingDecisionSerializer(BaseModelSerializer):
     class Meta:
         model = UnderwritingDecision
         fields = '__all__'
-        read_only_fields = ['application', 'underwriter', 'decision_date']
+        read_only_fields = ['application', 'underwriter', 'decision_date', 'rule_set_version']
 
     def get_reasons(self, obj: UnderwritingDecision) -> list:
         """
@@ -451,6 +457,16 @@ class ApplicationUnderwritingSerializer(ReadOnlyModelSerializer):
         Returns:
             dict: Dictionary with borrower and co-borrower credit information.
         """
+        # Use prefetched credit reports when the view supplies an underwriting context
+        underwriting_context = self.context.get('underwriting_context')
+        if underwriting_context is not None:
+            borrower_credit_info = underwriting_context.credit_info
+            co_borrower_credit_info = underwriting_context.co_borrower_credit_info
+            return {
+                'borrower': CreditInformationSerializer(borrower_credit_info).data if borrower_credit_info else None,
+                'co_borrower': CreditInformationSerializer(co_borrower_credit_info).data if co_borrower_credit_info else None,
+            }
+
         borrower_credit_info = CreditInformation.objects.filter(application=obj, borrower=obj.borrower).first()
         borrower_credit_data = CreditInformationSerializer(borrower_credit_info).data if borrower_credit_info else None
 
@@ -488,10 +504,30 @@ class UnderwritingDecisionCreateSerializer(BaseModelSerializer):
     Serializer for creating underwriting decisions.
     """
     reason_codes = serializers.ListField(child=serializers.CharField(), required=False)
+    rule_set_version = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="rule_set_version of the evaluation the decision is based on; omit for manual decisions"
+    )
 
     class Meta:
         model = UnderwritingDecision
-        fields = ['application', 'decision', 'comments', 'approved_amount', 'interest_rate', 'term_months', 'reason_codes']
+        fields = ['application', 'decision', 'comments', 'approved_amount', 'interest_rate', 'term_months',
+                  'reason_codes', 'rule_set_version']
+
+    def validate_rule_set_version(self, value: int) -> int:
+        """
+        Validates that the rule set version exists.
+
+        Args:
+            value (int): The rule set version of the evaluation.
+
+        Returns:
+            int: The validated version.
+        """
+        if value != DEFAULT_RULE_SET_VERSION and not UnderwritingRuleSet.all_objects.filter(version=value).exists():
+            raise ValidationError(f"Rule set version {value} does not exist.")
+        return value
 
     def validate(self, data: dict) -> dict:
         """
@@ -543,6 +579,7 @@ class UnderwritingDecisionCreateSerializer(BaseModelSerializer):
         interest_rate = validated_data.pop('interest_rate', None)
         term_months = validated_data.pop('term_months', None)
         reason_codes = validated_data.pop('reason_codes', [])
+        rule_set_version = validated_data.pop('rule_set_version', None)
 
         request = self.context.get('request')
         user = request.user if request else None
@@ -555,6 +592,7 @@ class UnderwritingDecisionCreateSerializer(BaseModelSerializer):
             interest_rate=interest_rate,
             term_months=term_months,
             reason_codes=reason_codes,
+            rule_set_version=rule_set_version,
             user=user
         )
         return decision_obj
@@ -1,5 +1,5 @@
 from django.test import TestCase
-from unittest.mock import mock, patch
+from unittest.mock import Mock, patch
 from django.utils import timezone
 from decimal import Decimal
 
@@ -774,6 +774,28 @@ class TestUnderwritingDecision(TestCase):
             # Assert update_application_status was called
             mock_update.assert_called_once()
 
+    def test_save_keeps_evaluation_rule_set_version(self):
+        """Test that a decision keeps the rule set version of its evaluation"""
+        active_rule_set = Mock(version=3)
+        with patch('apps.underwriting.rulesets.get_active_rule_set', return_value=active_rule_set), \
+                patch.object(UnderwritingDecision, 'update_application_status'):
+            evaluated_decision = UnderwritingDecision.objects.create(
+                application=self.application,
+                decision=UNDERWRITING_DECISION["DENY"],
+                underwriter=self.underwriter,
+                rule_set_version=2
+            )
+            manual_decision = UnderwritingDecision.objects.create(
+                application=self.application,
+                decision=UNDERWRITING_DECISION["DENY"],
+                underwriter=self.underwriter
+            )
+
+        # Evaluated under version 2 before version 3 was published
+        self.assertEqual(evaluated_decision.rule_set_version, 2)
+        # Manual decisions fall back to the active version
+        self.assertEqual(manual_decision.rule_set_version, 3)
+
     def test_update_application_status(self):
         """Test that update_application_status correctly updates the application status"""
         # Create applications and decisions with different decision types
@@ -1,12 +1,22 @@
+import dataclasses
 import unittest
+from unittest.mock import Mock
 from decimal import Decimal
 
+import numpy as np
+
+from utils.validators import ValidationError
+
 from ..rules import (
     evaluate_credit_score, evaluate_debt_to_income, evaluate_employment_history,
     evaluate_housing_payment_ratio, evaluate_income_to_loan_ratio,
     evaluate_citizenship_status, evaluate_program_eligibility,
     calculate_weighted_score, determine_required_stipulations,
-    get_decision_reasons, evaluate_application, UnderwritingRuleEngine
+    get_decision_reasons, evaluate_application, UnderwritingRuleEngine,
+    evaluate_batch_columns
+)
+from ..rulesets import (
+    compile_rule_set, DEFAULT_RULE_SET, DEFAULT_RULE_SET_VERSION, RuleSetError
 )
 from ..constants import (
     AUTOMATIC_APPROVAL_CRITERIA, AUTOMATIC_DENIAL_CRITERIA, CONSIDERATION_CRITERIA,
@@ -15,13 +25,13 @@ from ..constants import (
     EMPLOYMENT_HISTORY_REQUIREMENTS, HOUSING_PAYMENT_RATIO_LIMITS,
     CREDIT_SCORE_WEIGHT, DEBT_TO_INCOME_WEIGHT, EMPLOYMENT_HISTORY_WEIGHT, HOUSING_PAYMENT_WEIGHT
 )
-from ../../../utils/constants import (
+from utils.constants import (
     UNDERWRITING_DECISION, CITIZENSHIP_STATUS
 )
-from ../../applications/models import LoanApplication, LoanDetails
-from ../../users/models import BorrowerProfile
-from ../models import CreditInformation
-from ../../schools/models import Program
+from apps.applications.models import LoanApplication, LoanDetails
+from apps.users.models import BorrowerProfile
+from apps.underwriting.models import CreditInformation
+from apps.schools.models import Program
 
 
 class TestCreditScoreEvaluation(unittest.TestCase):
@@ -372,8 +382,8 @@ class TestProgramEligibilityEvaluation(unittest.TestCase):
     def test_active_program(self):
         """Test that active program results in approval"""
         # Create a mock LoanApplication with active program
-        application = unittest.mock.Mock(spec=LoanApplication)
-        application.program = unittest.mock.Mock(spec=Program)
+        application = Mock(spec=LoanApplication)
+        application.program = Mock(spec=Program)
         application.program.status = 'active'
         
         # Call evaluate_program_eligibility with the application
@@ -385,8 +395,8 @@ class TestProgramEligibilityEvaluation(unittest.TestCase):
     def test_inactive_program(self):
         """Test that inactive program results in denial"""
         # Create a mock LoanApplication with inactive program
-        application = unittest.mock.Mock(spec=LoanApplication)
-        application.program = unittest.mock.Mock(spec=Program)
+        application = Mock(spec=LoanApplication)
+        application.program = Mock(spec=Program)
         application.program.status = 'inactive'
         
         # Call evaluate_program_eligibility with the application
@@ -400,7 +410,7 @@ class TestProgramEligibilityEvaluation(unittest.TestCase):
     def test_null_program(self):
         """Test handling of null program values"""
         # Create a mock LoanApplication with null program
-        application = unittest.mock.Mock(spec=LoanApplication)
+        application = Mock(spec=LoanApplication)
         application.program = None
         
         # Call evaluate_program_eligibility with the application
@@ -430,8 +440,8 @@ class TestWeightedScoreCalculation(unittest.TestCase):
             credit_score_result, dti_result, employment_result, housing_ratio_result
         )
         
-        # Assert that the weighted score is 1.0
-        self.assertEqual(weighted_score, 1.0)
+        # Assert that the weighted score is 1.0, up to float rounding of the weights
+        self.assertAlmostEqual(weighted_score, 1.0)
     
     def test_all_denied_factors(self):
         """Test weighted score calculation with all factors denied"""
@@ -523,9 +533,9 @@ class TestRequiredStipulationsDetermination(unittest.TestCase):
         """Test stipulations for revision decision"""
         # Create evaluation results with no borderline factors
         evaluation_results = {
-            'credit_score': {'status': 'consideration', 'score': 0.5},
-            'dti_ratio': {'status': 'consideration', 'score': 0.5},
-            'employment_history': {'status': 'consideration', 'score': 0.5}
+            'credit_score': {'status': 'approved', 'score': 1.0},
+            'dti_ratio': {'status': 'approved', 'score': 1.0},
+            'employment_history': {'status': 'approved', 'score': 1.0}
         }
         
         # Call determine_required_stipulations with 'revise' decision and results
@@ -690,27 +700,27 @@ class TestApplicationEvaluation(unittest.TestCase):
         super().setUp()
         
         # Create mock LoanApplication
-        self.application = unittest.mock.Mock(spec=LoanApplication)
+        self.application = Mock(spec=LoanApplication)
         
         # Create mock LoanDetails
-        self.loan_details = unittest.mock.Mock(spec=LoanDetails)
+        self.loan_details = Mock(spec=LoanDetails)
         self.application.get_loan_details.return_value = self.loan_details
         
         # Create mock BorrowerProfile
-        self.borrower_profile = unittest.mock.Mock(spec=BorrowerProfile)
-        self.application.borrower = unittest.mock.Mock()
+        self.borrower_profile = Mock(spec=BorrowerProfile)
+        self.application.borrower = Mock()
         self.application.borrower.get_profile.return_value = self.borrower_profile
         
         # Create mock CreditInformation
-        self.credit_info = unittest.mock.Mock(spec=CreditInformation)
+        self.credit_info = Mock(spec=CreditInformation)
         
         # Set up relationships between mocks
-        self.application.program = unittest.mock.Mock(spec=Program)
+        self.application.program = Mock(spec=Program)
         self.application.program.status = 'active'
         
         # Set up BorrowerProfile with EmploymentInfo
-        self.employment_info = unittest.mock.Mock()
-        self.borrower_profile.employment_info = unittest.mock.Mock()
+        self.employment_info = Mock()
+        self.borrower_profile.employment_info = Mock()
         self.borrower_profile.employment_info.first.return_value = self.employment_info
         self.employment_info.get_total_employment_duration.return_value = 36  # 3 years
         self.employment_info.get_monthly_income.return_value = Decimal('5000')  # $5000/month
@@ -891,27 +901,27 @@ class TestUnderwritingRuleEngine(unittest.TestCase):
         super().setUp()
         
         # Create mock LoanApplication
-        self.application = unittest.mock.Mock(spec=LoanApplication)
+        self.application = Mock(spec=LoanApplication)
         
         # Create mock LoanDetails
-        self.loan_details = unittest.mock.Mock(spec=LoanDetails)
+        self.loan_details = Mock(spec=LoanDetails)
         self.application.get_loan_details.return_value = self.loan_details
         
         # Create mock BorrowerProfile
-        self.borrower_profile = unittest.mock.Mock(spec=BorrowerProfile)
-        self.application.borrower = unittest.mock.Mock()
+        self.borrower_profile = Mock(spec=BorrowerProfile)
+        self.application.borrower = Mock()
         self.application.borrower.get_profile.return_value = self.borrower_profile
         
         # Create mock CreditInformation
-        self.credit_info = unittest.mock.Mock(spec=CreditInformation)
+        self.credit_info = Mock(spec=CreditInformation)
         
         # Set up relationships between mocks
-        self.application.program = unittest.mock.Mock(spec=Program)
+        self.application.program = Mock(spec=Program)
         self.application.program.status = 'active'
         
         # Set up BorrowerProfile with EmploymentInfo
-        self.employment_info = unittest.mock.Mock()
-        self.borrower_profile.employment_info = unittest.mock.Mock()
+        self.employment_info = Mock()
+        self.borrower_profile.employment_info = Mock()
         self.borrower_profile.employment_info.first.return_value = self.employment_info
         self.employment_info.get_total_employment_duration.return_value = 36  # 3 years
         self.employment_info.get_monthly_income.return_value = Decimal('5000')  # $5000/month
@@ -1011,4 +1021,262 @@ class TestUnderwritingRuleEngine(unittest.TestCase):
         # Assert that better profile has higher score than moderate profile
         self.assertTrue(better_risk_score > moderate_risk_score)
         # Assert that worse profile has lower score than moderate profile
-        self.assertTrue(worse_risk_score < moderate_risk_score)
\ No newline at end of file
+        self.assertTrue(worse_risk_score < moderate_risk_score)
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    """Test cases for the vectorized batch evaluation"""
+    
+    def setUp(self):
+        """Set up columnar inputs covering approval, denial and consideration cases"""
+        super().setUp()
+        
+        self.columns = {
+            'application_ids': ['approve', 'deny_credit', 'deny_citizenship', 'revise', 'missing'],
+            'credit_score': np.array([720, 550, 720, 640, np.nan]),
+            'dti_ratio': np.array([0.35, 0.35, 0.35, 0.45, np.nan]),
+            'employment_months': np.array([36, 36, 36, 15, np.nan]),
+            'annual_income': np.array([60000, 60000, 60000, 60000, np.nan]),
+            'monthly_income': np.array([5000, 5000, 5000, 5000, np.nan]),
+            'housing_payment': np.array([1500, 1500, 1500, 1500, 1500]),
+            'requested_amount': np.array([20000, 20000, 20000, 20000, 20000]),
+            'citizenship_status': np.array([
+                CITIZENSHIP_STATUS['US_CITIZEN'],
+                CITIZENSHIP_STATUS['US_CITIZEN'],
+                CITIZENSHIP_STATUS['INELIGIBLE_NON_CITIZEN'],
+                CITIZENSHIP_STATUS['US_CITIZEN'],
+                None,
+            ], dtype=object),
+            'has_program': np.array([True, True, True, True, False]),
+            'program_active': np.array([True, True, True, True, False]),
+        }
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns no results"""
+        self.assertEqual(evaluate_batch_columns({'application_ids': []}), {})
+    
+    def test_batch_decisions(self):
+        """Test that batch decisions follow the same thresholds as single evaluation"""
+        results = evaluate_batch_columns(self.columns)
+        
+        # Assert that each application received the expected decision
+        self.assertEqual(results['approve']['decision'], UNDERWRITING_DECISION['APPROVE'])
+        self.assertEqual(results['deny_credit']['decision'], UNDERWRITING_DECISION['DENY'])
+        self.assertEqual(results['deny_citizenship']['decision'], UNDERWRITING_DECISION['DENY'])
+        self.assertEqual(results['revise']['decision'], UNDERWRITING_DECISION['REVISE'])
+        
+        # Assert that denial reasons and stipulations are populated as in evaluate_application
+        self.assertEqual(results['deny_credit']['reasons'], [DECISION_REASON_CODES['CREDIT_SCORE']])
+        self.assertEqual(results['deny_credit']['stipulations'], [])
+        self.assertEqual(results['deny_credit']['score'], 0.0)
+        self.assertEqual(
+            results['deny_citizenship']['reasons'], [DECISION_REASON_CODES['CITIZENSHIP_STATUS']]
+        )
+        self.assertEqual(
+            results['approve']['stipulations'], REQUIRED_STIPULATIONS_BY_DECISION['approve']
+        )
+    
+    def test_missing_inputs_are_considered(self):
+        """Test that missing inputs are treated as consideration with a neutral score"""
+        results = evaluate_batch_columns(self.columns)
+        evaluation_results = results['missing']['evaluation_results']
+        
+        # Assert that every scored factor falls back to consideration at 0.5
+        for factor in ('credit_score', 'dti_ratio', 'employment_history', 'housing_ratio'):
+            self.assertEqual(evaluation_results[factor], {'status': 'consideration', 'score': 0.5})
+        self.assertEqual(evaluation_results['citizenship'], {'status': 'consideration'})
+        self.assertEqual(evaluation_results['program'], {'status': 'consideration'})
+        self.assertEqual(results['missing']['decision'], UNDERWRITING_DECISION['REVISE'])
+    
+    def test_batch_matches_single_evaluation(self):
+        """Test that batch results match evaluate_application for the same inputs"""
+        results = evaluate_batch_columns(self.columns)
+        
+        # Build a mock application equivalent to the 'revise' column entry
+        application = Mock(spec=LoanApplication)
+        application.id = 'revise'
+        loan_details = Mock(spec=LoanDetails)
+        loan_details.requested_amount = Decimal('20000')
+        application.get_loan_details.return_value = loan_details
+        borrower_profile = Mock(spec=BorrowerProfile)
+        borrower_profile.citizenship_status = CITIZENSHIP_STATUS['US_CITIZEN']
+        borrower_profile.housing_payment = Decimal('1500')
+        employment_info = Mock()
+        employment_info.get_total_employment_duration.return_value = 15
+        employment_info.get_monthly_income.return_value = Decimal('5000')
+        employment_info.annual_income = Decimal('60000')
+        borrower_profile.employment_info = Mock()
+        borrower_profile.employment_info.first.return_value = employment_info
+        application.borrower = Mock()
+        application.borrower.get_profile.return_value = borrower_profile
+        application.program = Mock(spec=Program)
+        application.program.status = 'active'
+        credit_info = Mock(spec=CreditInformation)
+        credit_info.credit_score = 640
+        credit_info.debt_to_income_ratio = Decimal('0.45')
+        
+        expected = evaluate_application(application, credit_info)
+        
+        # Assert that decision, reasons, stipulations and score agree
+        self.assertEqual(results['revise']['decision'], expected['decision'])
+        self.assertEqual(results['revise']['reasons'], expected['reasons'])
+        self.assertEqual(results['revise']['stipulations'], expected['stipulations'])
+        self.assertAlmostEqual(results['revise']['score'], float(expected['score']))
+
+
+class TestCompiledRuleSet(unittest.TestCase):
+    """Test cases for compiled, versioned underwriting rule sets"""
+    
+    def test_default_rule_set_matches_constants(self):
+        """Test that the built-in rule set mirrors the module-level constants"""
+        self.assertEqual(DEFAULT_RULE_SET.version, DEFAULT_RULE_SET_VERSION)
+        self.assertEqual(
+            DEFAULT_RULE_SET.approval_min_credit_score, AUTOMATIC_APPROVAL_CRITERIA['MIN_CREDIT_SCORE']
+        )
+        self.assertEqual(DEFAULT_RULE_SET.denial_min_dti, AUTOMATIC_DENIAL_CRITERIA['MIN_DTI'])
+        self.assertEqual(DEFAULT_RULE_SET.credit_score_weight, CREDIT_SCORE_WEIGHT)
+        self.assertEqual(DEFAULT_RULE_SET.housing_weight, HOUSING_PAYMENT_WEIGHT)
+    
+    def test_rule_set_is_frozen_and_slotted(self):
+        """Test that compiled rule sets cannot be mutated and carry no instance dict"""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            DEFAULT_RULE_SET.approval_min_credit_score = 500
+        self.assertFalse(hasattr(DEFAULT_RULE_SET, '__dict__'))
+    
+    def test_overrides_change_evaluation(self):
+        """Test that a compiled override is applied instead of the constants"""
+        rule_set = compile_rule_set(
+            3,
+            thresholds={'AUTOMATIC_APPROVAL_CRITERIA': {'MIN_CREDIT_SCORE': 740}},
+        )
+        
+        # Assert that a score approved by default falls into consideration under the override
+        self.assertEqual(evaluate_credit_score(720, DEFAULT_RULE_SET)['status'], 'approved')
+        self.assertEqual(evaluate_credit_score(720, rule_set)['status'], 'consideration')
+        # Assert that values not overridden keep their defaults
+        self.assertEqual(rule_set.denial_max_credit_score, DEFAULT_RULE_SET.denial_max_credit_score)
+    
+    def test_decimal_thresholds_from_json(self):
+        """Test that ratio thresholds stored as JSON strings compile to Decimal"""
+        rule_set = compile_rule_set(4, thresholds={'AUTOMATIC_DENIAL_CRITERIA': {'MIN_DTI': '0.50'}})
+        
+        self.assertEqual(rule_set.denial_min_dti, Decimal('0.50'))
+        self.assertEqual(evaluate_debt_to_income(Decimal('0.52'), rule_set)['status'], 'denied')
+    
+    def test_invalid_weights_rejected(self):
+        """Test that weights that do not sum to 1.0 are rejected"""
+        with self.assertRaises(RuleSetError):
+            compile_rule_set(5, weights={'CREDIT_SCORE': 0.9})
+    
+    def test_invalid_threshold_rejected(self):
+        """Test that non-numeric thresholds are rejected"""
+        with self.assertRaises(RuleSetError):
+            compile_rule_set(6, thresholds={'AUTOMATIC_APPROVAL_CRITERIA': {'MAX_DTI': 'high'}})
+    
+    def test_weighted_score_uses_rule_set_weights(self):
+        """Test that calculate_weighted_score applies the rule set weights"""
+        rule_set = compile_rule_set(7, weights={
+            'CREDIT_SCORE': 1.0, 'DEBT_TO_INCOME': 0.0,
+            'EMPLOYMENT_HISTORY': 0.0, 'HOUSING_PAYMENT': 0.0
+        })
+        
+        score = calculate_weighted_score(
+            {'score': 1.0}, {'score': 0.0}, {'score': 0.0}, {'score': 0.0}, rule_set
+        )
+        
+        self.assertAlmostEqual(score, 1.0)
+    
+    def test_evaluation_records_rule_set_version(self):
+        """Test that evaluation results carry the version of the rule set used"""
+        columns = {
+            'application_ids': ['app'],
+            'credit_score': np.array([720.0]),
+            'dti_ratio': np.array([0.35]),
+            'employment_months': np.array([36.0]),
+            'annual_income': np.array([60000.0]),
+            'monthly_income': np.array([5000.0]),
+            'housing_payment': np.array([1500.0]),
+            'requested_amount': np.array([20000.0]),
+            'citizenship_status': np.array([CITIZENSHIP_STATUS['US_CITIZEN']], dtype=object),
+            'has_program': np.array([True]),
+            'program_active': np.array([True]),
+        }
+        rule_set = compile_rule_set(8)
+        
+        results = evaluate_batch_columns(columns, rule_set)
+        
+        self.assertEqual(results['app']['rule_set_version'], 8)
+
+
+class TestUnderwritingContextEvaluation(unittest.TestCase):
+    """Test cases for rule engine evaluation from a prefetched UnderwritingContext"""
+    
+    def setUp(self):
+        """Set up a mock context holding all prefetched underwriting data"""
+        super().setUp()
+        
+        self.application = Mock(spec=LoanApplication)
+        self.application.program = Mock(spec=Program)
+        self.application.program.status = 'active'
+        self.application.borrower = Mock()
+        
+        self.employment_info = Mock()
+        self.employment_info.get_total_employment_duration.return_value = 36
+        self.employment_info.get_monthly_income.return_value = Decimal('5000')
+        self.employment_info.annual_income = Decimal('60000')
+        
+        self.borrower_profile = Mock(spec=BorrowerProfile)
+        self.borrower_profile.citizenship_status = CITIZENSHIP_STATUS['US_CITIZEN']
+        self.borrower_profile.housing_payment = Decimal('1500')
+        
+        self.loan_details = Mock(spec=LoanDetails)
+        self.loan_details.requested_amount = Decimal('20000')
+        
+        self.credit_info = Mock(spec=CreditInformation)
+        self.credit_info.credit_score = 720
+        self.credit_info.debt_to_income_ratio = Decimal('0.35')
+        
+        self.context = Mock()
+        self.context.application = self.application
+        self.context.loan_details = self.loan_details
+        self.context.borrower_profile = self.borrower_profile
+        self.context.employment_info = self.employment_info
+        self.context.credit_info = self.credit_info
+        
+        self.rule_engine = UnderwritingRuleEngine()
+    
+    def test_engine_methods_use_context(self):
+        """Test that all engine methods read from the context instead of the ORM"""
+        result = self.rule_engine.evaluate_application(context=self.context)
+        auto_decision = self.rule_engine.get_auto_decision(context=self.context)
+        risk_score = self.rule_engine.calculate_risk_score(context=self.context)
+        
+        # Assert that the evaluation used the context data
+        self.assertEqual(result['decision'], UNDERWRITING_DECISION['APPROVE'])
+        self.assertEqual(auto_decision['decision'], UNDERWRITING_DECISION['APPROVE'])
+        self.assertTrue(0 <= risk_score <= 100)
+        
+        # Assert that no per-call lookups were made on the application
+        self.application.get_loan_details.assert_not_called()
+        self.application.borrower.get_profile.assert_not_called()
+    
+    def test_context_matches_direct_evaluation(self):
+        """Test that evaluating from a context gives the same result as direct evaluation"""
+        self.application.get_loan_details.return_value = self.loan_details
+        self.application.borrower.get_profile.return_value = self.borrower_profile
+        self.borrower_profile.employment_info = Mock()
+        self.borrower_profile.employment_info.first.return_value = self.employment_info
+        
+        direct = evaluate_application(self.application, self.credit_info)
+        from_context = evaluate_application(None, None, context=self.context)
+        
+        self.assertEqual(direct['decision'], from_context['decision'])
+        self.assertEqual(direct['stipulations'], from_context['stipulations'])
+        self.assertEqual(direct['score'], from_context['score'])
+    
+    def test_missing_credit_information(self):
+        """Test that evaluation without credit information raises a validation error"""
+        self.context.credit_info = None
+        
+        with self.assertRaises(ValidationError):
+            self.rule_engine.evaluate_application(context=self.context)
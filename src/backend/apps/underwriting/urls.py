@@ -11,6 +11,7 @@ from .views import (
     StipulationViewSet,
     UnderwritingNoteViewSet,
     CreditInformationView,
+    CreditInformationFileView,
     UnderwritingStatisticsView,
     UnderwriterWorkloadView
 )
@@ -47,6 +48,8 @@ urlpatterns = [
     path('applications/<int:application_id>/decision/', UnderwritingDecisionView.as_view(), name='underwriting-decision'),
     # Define a path for managing credit information
     path('applications/<int:application_id>/credit/', CreditInformationView.as_view(), name='credit-information'),
+    # Define a path for downloading the credit report file
+    path('applications/<int:application_id>/credit/file/', CreditInformationFileView.as_view(), name='credit-information-file'),
     # Define a path for retrieving underwriting statistics
     path('statistics/', UnderwritingStatisticsView.as_view(), name='underwriting-statistics'),
     # Define a path for retrieving underwriter workload statistics
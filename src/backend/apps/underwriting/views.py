@@ -9,9 +9,10 @@ from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 # standard library
 import logging
+import os
 
 # Import internal modules and classes
-from core.views import BaseAPIView, BaseGenericAPIView, TransactionMixin, AuditLogMixin
+from core.views import BaseAPIView, BaseGenericAPIView, TransactionMixin, AuditLogMixin, StreamingDownloadMixin
 from .models import UnderwritingQueue, CreditInformation, UnderwritingDecision, Stipulation, UnderwritingNote
 from .serializers import (
     UnderwritingQueueSerializer, CreditInformationSerializer, UnderwritingDecisionSerializer,
@@ -26,6 +27,9 @@ from .permissions import (
     CanViewUnderwritingNotes, CanViewCreditInformation, CanUploadCreditInformation
 )
 from .services import UnderwritingService
+from .rules import UnderwritingRuleEngine
+from .context import UnderwritingContext
+from utils.validators import ValidationError
 from apps.applications.models import LoanApplication
 from .constants import UNDERWRITING_QUEUE_STATUS, UNDERWRITING_QUEUE_PRIORITY
 # Import constants from utils
@@ -37,6 +41,9 @@ logger = logging.getLogger(__name__)
 # Initialize underwriting service
 underwriting_service = UnderwritingService()
 
+# Initialize underwriting rule engine
+rule_engine = UnderwritingRuleEngine()
+
 
 class UnderwritingQueueViewSet(viewsets.ModelViewSet):  # rest_framework version: 3.14+
     """
@@ -186,17 +193,18 @@ class ApplicationReviewView(BaseGenericAPIView):  # rest_framework version: 3.14
         Returns:
             Response: Response with comprehensive application data
         """
-        # Get the application object by application_id
-        application = get_object_or_404(LoanApplication, pk=application_id)
+        # Load the application with all underwriting data prefetched for this request
+        context = UnderwritingContext.for_request(request, application_id)
+        application = context.application
 
         # Check if user has permission to review this application
         self.check_object_permissions(request, application)
 
-        # Get comprehensive application data from underwriting_service.get_application_data()
-        application_data = underwriting_service.get_application_data(application)
-
-        # Return Response with application data
-        serializer = self.get_serializer(application)
+        # Return Response with application data, serialized from the prefetched context
+        serializer = self.get_serializer(application, context={
+            **self.get_serializer_context(),
+            'underwriting_context': context,
+        })
         return Response(serializer.data)
 
 
@@ -217,14 +225,21 @@ class ApplicationEvaluationView(BaseGenericAPIView):  # rest_framework version:
         Returns:
             Response: Response with evaluation results
         """
-        # Get the application object by application_id
-        application = get_object_or_404(LoanApplication, pk=application_id)
+        # Load the application with all underwriting data prefetched for this request
+        context = UnderwritingContext.for_request(request, application_id)
 
         # Check if user has permission to review this application
-        self.check_object_permissions(request, application)
+        self.check_object_permissions(request, context.application)
 
-        # Call underwriting_service.evaluate_application(application)
-        evaluation_results = underwriting_service.evaluate_application(application)
+        # Evaluate, auto-decide and score from the same prefetched context, pinned to one
+        # rule set version so the returned rule_set_version covers all three results
+        engine = UnderwritingRuleEngine(rule_set_version=rule_engine.get_rule_set().version)
+        try:
+            evaluation_results = engine.evaluate_application(context=context)
+            evaluation_results['auto_decision'] = engine.get_auto_decision(context=context)
+            evaluation_results['risk_score'] = engine.calculate_risk_score(context=context)
+        except ValidationError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         # Return Response with evaluation results
         return Response(evaluation_results)
@@ -292,6 +307,8 @@ class UnderwritingDecisionView(BaseGenericAPIView):  # rest_framework version: 3
         interest_rate = serializer.validated_data.get('interest_rate')
         term_months = serializer.validated_data.get('term_months')
         reason_codes = serializer.validated_data.get('reason_codes', [])
+        # Version of the evaluation the decision is based on, if any
+        rule_set_version = serializer.validated_data.get('rule_set_version')
 
         # Call underwriting_service.record_decision() with parameters
         decision_obj = underwriting_service.record_decision(
@@ -302,6 +319,7 @@ class UnderwritingDecisionView(BaseGenericAPIView):  # rest_framework version: 3
             interest_rate=interest_rate,
             term_months=term_months,
             reason_codes=reason_codes,
+            rule_set_version=rule_set_version,
             user=request.user
         )
 
@@ -585,6 +603,41 @@ class CreditInformationView(BaseGenericAPIView):  # rest_framework version: 3.14
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class CreditInformationFileView(StreamingDownloadMixin, BaseGenericAPIView):  # rest_framework version: 3.14+
+    """
+    View for downloading the credit report file of an application.
+    """
+    permission_classes = [IsAuthenticated, CanViewCreditInformation]
+
+    def get(self, request, application_id):
+        """
+        Downloads the credit report file for an application.
+
+        Args:
+            request (object): The request object
+            application_id (int): The ID of the loan application
+
+        Returns:
+            StreamingHttpResponse: Response streaming the credit report, or a redirect to it
+        """
+        # Get the application object by application_id
+        application = get_object_or_404(LoanApplication, pk=application_id)
+
+        # Check if user has permission to view credit information for this application
+        self.check_object_permissions(request, application)
+
+        # Get credit information for the borrower or co-borrower
+        is_co_borrower = request.query_params.get('is_co_borrower', False)
+        credit_info = underwriting_service.get_credit_information(application, is_co_borrower=is_co_borrower)
+
+        # If there is no credit report file, return 404
+        if not credit_info or not credit_info.file_path:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        # Stream the credit report from storage
+        return self.stream_file(request, credit_info.file_path, os.path.basename(credit_info.file_path))
+
+
 class UnderwritingStatisticsView(BaseAPIView):  # rest_framework version: 3.14+
     """
     View for retrieving underwriting statistics.
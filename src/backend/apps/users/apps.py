@@ -22,7 +22,11 @@ class UsersConfig(AppConfig):
         - Register signal handlers for user creation/modification events
         - Register signal handlers for profile creation/modification events
         - Register signal handlers for role assignment events
+        - Register the system check for the SSN blind index key
         - Set up any app-specific configurations
         """
         # Import signals module to register the signal handlers
-        import apps.users.signals  # noqa
\ No newline at end of file
+        import apps.users.signals  # noqa
+        
+        # Import checks module to register the system checks
+        import apps.users.checks  # noqa
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+System checks for the users app.
+
+Borrower SSNs are indexed with a keyed hash, so a deployment without BLIND_INDEX_KEY
+cannot create borrower profiles. These checks report the missing key when the server
+starts or migrations run, rather than on the first profile write.
+"""
+from django.conf import settings  # Django 4.2+
+from django.core.checks import Error, Tags, register  # Django 4.2+
+
+
+@register(Tags.security)
+def check_blind_index_key(app_configs, **kwargs):
+    """
+    Checks that BLIND_INDEX_KEY is configured.
+
+    Returns:
+        list: An error if the key is missing
+    """
+    if getattr(settings, 'BLIND_INDEX_KEY', None):
+        return []
+    return [
+        Error(
+            'BLIND_INDEX_KEY is not set.',
+            hint='Set the BLIND_INDEX_KEY environment variable to a random secret. It is '
+                 'needed to store and look up borrower SSNs, and must not change once set.',
+            id='users.E001',
+        )
+    ]
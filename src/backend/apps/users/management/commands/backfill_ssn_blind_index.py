@@ -0,0 +1,73 @@
+"""
+Management command that fills the SSN blind index of existing borrower profiles.
+
+Profiles saved before ssn_hash existed cannot be found by find_by_ssn, so run this once
+after deploying the column, with BLIND_INDEX_KEY configured. The command is idempotent
+and walks the table in primary key order, one batch at a time, decrypting each SSN to
+compute its index.
+"""
+
+from cryptography.fernet import InvalidToken  # version 39.0.0
+from django.core.management.base import BaseCommand  # Django 4.2+
+from django.db import transaction  # Django 4.2+
+
+from utils.encryption import decrypt, ssn_blind_index
+
+from ...models import BorrowerProfile
+
+
+class Command(BaseCommand):
+    """
+    Computes the blind index of each borrower profile's SSN.
+    """
+    help = 'Backfill ssn_hash on borrower profiles from their encrypted SSN'
+
+    def add_arguments(self, parser):
+        """
+        Adds the batch size option.
+        """
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of borrower profiles updated per transaction')
+
+    def handle(self, *args, **options):
+        """
+        Backfills every borrower profile that has an SSN but no blind index.
+        """
+        batch_size = options['batch_size']
+        pending = BorrowerProfile.all_objects.filter(
+            ssn_hash__isnull=True
+        ).exclude(ssn='').order_by('pk')
+
+        updated = 0
+        unreadable = 0
+        last_pk = None
+        while True:
+            batch = pending.filter(pk__gt=last_pk) if last_pk is not None else pending
+            batch = list(batch.only('pk', 'ssn')[:batch_size])
+            if not batch:
+                break
+
+            indexed = []
+            for profile in batch:
+                try:
+                    ssn = decrypt(profile.ssn)
+                except InvalidToken:
+                    # Not encrypted with a configured key; left for manual review
+                    unreadable += 1
+                    continue
+                profile.ssn_hash = ssn_blind_index(ssn)
+                indexed.append(profile)
+
+            if indexed:
+                with transaction.atomic():
+                    BorrowerProfile.all_objects.bulk_update(indexed, ['ssn_hash'])
+
+            updated += len(indexed)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"Backfilled {updated} borrower profiles")
+
+        if unreadable:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped {unreadable} borrower profiles whose SSN could not be decrypted"
+            ))
+        self.stdout.write(self.style.SUCCESS(f"Backfilled SSN blind index on {updated} borrower profiles"))
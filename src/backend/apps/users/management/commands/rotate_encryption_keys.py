@@ -0,0 +1,64 @@
+"""
+Management command that re-encrypts stored SSNs with the current encryption key.
+
+To rotate the field encryption key, set ENCRYPTION_KEY to the new key, move the previous
+key to ENCRYPTION_OLD_KEYS, deploy, then run this command. Once it completes, the old key
+can be removed from ENCRYPTION_OLD_KEYS. The command is idempotent: values already
+encrypted with the current key are skipped, and it walks the table in primary key order,
+one batch at a time.
+"""
+
+from django.core.management.base import BaseCommand  # Django 4.2+
+from django.db import transaction  # Django 4.2+
+
+from utils.encryption import needs_reencryption, reencrypt
+
+from ...models import BorrowerProfile
+
+
+class Command(BaseCommand):
+    """
+    Re-encrypts each borrower profile's SSN with the current encryption key.
+    """
+    help = 'Re-encrypt borrower SSNs with ENCRYPTION_KEY after a key rotation'
+
+    def add_arguments(self, parser):
+        """
+        Adds the batch size and dry run options.
+        """
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of borrower profiles read per transaction')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Count the SSNs that need re-encryption without writing them')
+
+    def handle(self, *args, **options):
+        """
+        Re-encrypts every SSN that is not encrypted with the current key.
+        """
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+        profiles = BorrowerProfile.all_objects.exclude(ssn='').order_by('pk')
+
+        scanned = 0
+        rotated = 0
+        last_pk = None
+        while True:
+            batch = profiles.filter(pk__gt=last_pk) if last_pk is not None else profiles
+            batch = list(batch.only('pk', 'ssn')[:batch_size])
+            if not batch:
+                break
+
+            stale = [profile for profile in batch if needs_reencryption(profile.ssn)]
+            if stale and not dry_run:
+                for profile in stale:
+                    profile.ssn = reencrypt(profile.ssn)
+                with transaction.atomic():
+                    BorrowerProfile.all_objects.bulk_update(stale, ['ssn'])
+
+            scanned += len(batch)
+            rotated += len(stale)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"Scanned {scanned} borrower profiles, {rotated} SSNs to re-encrypt")
+
+        action = 'Would re-encrypt' if dry_run else 'Re-encrypted'
+        self.stdout.write(self.style.SUCCESS(f"{action} {rotated} of {scanned} borrower SSNs"))
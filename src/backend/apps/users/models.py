@@ -115,12 +115,34 @@ class User(CoreModel):
         return f"{self.get_full_name()} ({self.email})"
 
 
+class BorrowerProfileManager(ActiveManager):
+    """
+    Custom manager for BorrowerProfile providing indexed SSN lookups
+    """
+
+    def find_by_ssn(self, ssn):
+        """
+        Returns the borrower profiles with an SSN, matched through its blind index.
+
+        Args:
+            ssn (str): The SSN, with or without hyphens
+
+        Returns:
+            QuerySet: QuerySet of BorrowerProfile objects with the SSN
+        """
+        from utils.encryption import ssn_blind_index
+        return self.get_queryset().filter(ssn_hash=ssn_blind_index(ssn))
+
+
 class BorrowerProfile(CoreModel):
     """
     Profile model for borrowers with personal and financial information.
     
     This model stores additional information for users who are borrowers or co-borrowers,
     including personal, financial, and eligibility information needed for loan applications.
+    
+    The SSN is stored encrypted, which cannot be matched in queries; ssn_hash holds its
+    blind index so profiles can be found by SSN through the database index.
     """
     user = models.OneToOneField(
         User,
@@ -128,6 +150,7 @@ class BorrowerProfile(CoreModel):
         related_name='borrowerprofile'
     )
     ssn = models.CharField(max_length=255)  # Stored encrypted, accessed via get_ssn/set_ssn
+    ssn_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)  # Set by set_ssn
     dob = models.DateField()
     citizenship_status = models.CharField(
         max_length=30,
@@ -154,28 +177,36 @@ class BorrowerProfile(CoreModel):
     )
     
     # Managers
-    objects = ActiveManager()
+    objects = BorrowerProfileManager()
     all_objects = models.Manager()
     
     def get_ssn(self):
         """
         Gets the decrypted SSN.
         
+        The decrypted value is remembered for the lifetime of this instance, and
+        recomputed only if the stored SSN changes.
+        
         Returns:
             str: Decrypted SSN
         """
-        from utils.encryption import decrypt_ssn
-        return decrypt_ssn(self.ssn)
+        memo = self.__dict__.get('_ssn_decrypted')
+        if memo is None or memo[0] != self.ssn:
+            from utils.encryption import decrypt_ssn
+            memo = (self.ssn, decrypt_ssn(self.ssn))
+            self._ssn_decrypted = memo
+        return memo[1]
     
     def set_ssn(self, value):
         """
-        Sets the SSN with encryption.
+        Sets the SSN with encryption, along with its blind index.
         
         Args:
             value (str): The SSN value to encrypt and store
         """
-        from utils.encryption import encrypt_ssn
+        from utils.encryption import encrypt_ssn, ssn_blind_index
         self.ssn = encrypt_ssn(value)
+        self.ssn_hash = ssn_blind_index(value)
     
     def get_full_address(self):
         """
@@ -463,4 +494,118 @@ class UserPermission(CoreModel):
             str: Permission details
         """
         status = "granted" if self.is_granted else "denied"
-        return f"{self.user.get_full_name()} - {self.permission_name} on {self.resource_type} ({status})"
\ No newline at end of file
+        return f"{self.user.get_full_name()} - {self.permission_name} on {self.resource_type} ({status})"
+
+
+class Role(CoreModel):
+    """
+    Model for named roles that group permissions for role-based access control.
+    
+    Users are given roles through UserRole and roles grant permissions through
+    RolePermission.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    description = models.TextField(blank=True)
+    is_active = models.BooleanField(default=True)
+    
+    # Managers
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the Role instance.
+        
+        Returns:
+            str: Role name
+        """
+        return self.name
+
+
+class Permission(CoreModel):
+    """
+    Model for permissions on a type of resource that can be granted to roles.
+    """
+    name = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    resource_type = models.CharField(max_length=100)
+    is_active = models.BooleanField(default=True)
+    
+    # Managers
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the Permission instance.
+        
+        Returns:
+            str: Permission name and resource type
+        """
+        return f"{self.name} on {self.resource_type}"
+
+
+class UserRole(CoreModel):
+    """
+    Model for assigning a role to a user.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='user_roles'
+    )
+    role = models.ForeignKey(
+        Role,
+        on_delete=models.CASCADE,
+        related_name='user_roles'
+    )
+    assigned_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='assigned_roles'
+    )
+    assigned_at = models.DateTimeField(default=timezone.now)
+    
+    # Managers
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the UserRole instance.
+        
+        Returns:
+            str: User and role names
+        """
+        return f"{self.user.get_full_name()} - {self.role.name}"
+
+
+class RolePermission(CoreModel):
+    """
+    Model for granting a permission to a role.
+    """
+    role = models.ForeignKey(
+        Role,
+        on_delete=models.CASCADE,
+        related_name='role_permissions'
+    )
+    permission = models.ForeignKey(
+        Permission,
+        on_delete=models.CASCADE,
+        related_name='role_permissions'
+    )
+    
+    # Managers
+    objects = ActiveManager()
+    all_objects = models.Manager()
+    
+    def __str__(self):
+        """
+        String representation of the RolePermission instance.
+        
+        Returns:
+            str: Role and permission names
+        """
+        return f"{self.role.name} - {self.permission}"
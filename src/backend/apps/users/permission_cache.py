@@ -0,0 +1,206 @@
+"""
+Compiled per-user permission sets shared between processes through the Django cache.
+
+Permission checks run on every guarded action, so RoleService compiles a user's
+permissions once into a CompiledPermissions object and keeps it in the shared cache
+(Redis in production). Entries are versioned rather than deleted: each user has a
+version, bumped by writes to their roles and custom permissions, and a global version,
+bumped by writes to roles, permissions and role permissions, which can affect any user.
+A write makes every entry compiled under the old versions unreachable, and stale entries
+expire on their own.
+
+Versions are bumped after the writing transaction commits, so a check running alongside
+the write cannot cache the state from before it under the new version.
+"""
+
+import time  # standard library
+
+from django.core.cache import caches  # Django 4.2+
+from django.db import transaction  # Django 4.2+
+
+# Seconds a compiled permission set is kept; later writes make it unreachable sooner
+PERMISSION_CACHE_TIMEOUT_SECONDS = 3600
+
+# Cache key of the version shared by all users
+GLOBAL_VERSION_KEY = 'permissions:version'
+
+
+class CompiledPermissions:
+    """
+    A user's permissions, compiled for constant-time checks.
+
+    Attributes:
+        grants (frozenset): (permission_name, resource_type) pairs granted through roles,
+            which apply to every resource of the type
+        resource_grants (dict): Maps (permission_name, resource_type) to the frozenset of
+            resource IDs, as strings, granted to the user directly
+    """
+
+    def __init__(self, grants, resource_grants):
+        """
+        Initialize the compiled permissions.
+
+        Args:
+            grants (iterable): (permission_name, resource_type) pairs granted through roles
+            resource_grants (dict): Maps (permission_name, resource_type) to resource IDs
+        """
+        self.grants = frozenset(grants)
+        self.resource_grants = {
+            pair: frozenset(str(resource_id) for resource_id in resource_ids)
+            for pair, resource_ids in resource_grants.items()
+        }
+
+    def has_permission(self, permission_name, resource_type, resource_id=None):
+        """
+        Checks a permission.
+
+        Args:
+            permission_name (str): The name of the permission
+            resource_type (str): The type of resource
+            resource_id (uuid.UUID, optional): The specific resource ID
+
+        Returns:
+            bool: True if the permission is granted
+        """
+        if (permission_name, resource_type) in self.grants:
+            return True
+        if resource_id:
+            return str(resource_id) in self.resource_grants.get((permission_name, resource_type), ())
+        return False
+
+    def filter_permitted(self, permission_name, resource_type, resource_ids):
+        """
+        Keeps the resources a permission is granted for.
+
+        Args:
+            permission_name (str): The name of the permission
+            resource_type (str): The type of resource
+            resource_ids (iterable): Resource IDs to check
+
+        Returns:
+            list: The permitted resource IDs, in their original order
+        """
+        if (permission_name, resource_type) in self.grants:
+            return list(resource_ids)
+        granted = self.resource_grants.get((permission_name, resource_type))
+        if not granted:
+            return []
+        return [resource_id for resource_id in resource_ids if str(resource_id) in granted]
+
+
+class PermissionCache:
+    """
+    Versioned store of compiled permission sets in the Django cache.
+    """
+
+    def __init__(self, cache_alias='default', cache=None, timeout=PERMISSION_CACHE_TIMEOUT_SECONDS):
+        """
+        Initialize the permission cache.
+
+        Args:
+            cache_alias (str): Django cache used to share permission sets (default: 'default')
+            cache (BaseCache, optional): Cache to use instead of looking up cache_alias
+            timeout (int): Seconds a compiled permission set is kept
+        """
+        self.cache_alias = cache_alias
+        self._cache = cache
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        """
+        Shared cache holding the permission sets.
+
+        Returns:
+            BaseCache: The Django cache
+        """
+        if self._cache is None:
+            self._cache = caches[self.cache_alias]
+        return self._cache
+
+    def get_permissions(self, user_id, build):
+        """
+        Returns a user's compiled permissions, compiling them if they are not cached.
+
+        Args:
+            user_id: Primary key of the user
+            build (callable): Called without arguments to compile the CompiledPermissions
+
+        Returns:
+            CompiledPermissions: The user's permissions
+        """
+        key = self._make_key(user_id)
+        permissions = self.cache.get(key)
+        if permissions is None:
+            permissions = build()
+            self.cache.set(key, permissions, timeout=self.timeout)
+        return permissions
+
+    def invalidate_user(self, user_id):
+        """
+        Makes a user's cached permissions unreachable once the current transaction commits.
+
+        Args:
+            user_id: Primary key of the user
+        """
+        transaction.on_commit(lambda: self._bump(self._user_version_key(user_id)))
+
+    def invalidate_all(self):
+        """
+        Makes every user's cached permissions unreachable once the current transaction commits.
+        """
+        transaction.on_commit(lambda: self._bump(GLOBAL_VERSION_KEY))
+
+    def _make_key(self, user_id):
+        """
+        Builds the cache key of a user's permissions under the current versions.
+
+        Args:
+            user_id: Primary key of the user
+
+        Returns:
+            str: Cache key
+        """
+        user_version_key = self._user_version_key(user_id)
+        versions = self.cache.get_many([GLOBAL_VERSION_KEY, user_version_key])
+        global_version = versions.get(GLOBAL_VERSION_KEY) or self._init_version(GLOBAL_VERSION_KEY)
+        user_version = versions.get(user_version_key) or self._init_version(user_version_key)
+        return f"permissions:{user_id}:{global_version}:{user_version}"
+
+    def _init_version(self, key):
+        """
+        Starts a version that is missing, e.g. after the cache was cleared or evicted it.
+
+        The first version is the current time in nanoseconds rather than 1, so it cannot
+        match the version of entries compiled before the key went missing.
+
+        Args:
+            key (str): Cache key of the version
+
+        Returns:
+            int: The version now stored
+        """
+        self.cache.add(key, time.time_ns(), timeout=None)
+        return self.cache.get(key)
+
+    def _bump(self, key):
+        """
+        Increments a version.
+
+        Args:
+            key (str): Cache key of the version
+        """
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Nothing was cached under the missing version, so starting a new one suffices
+            self._init_version(key)
+
+    @staticmethod
+    def _user_version_key(user_id):
+        """Builds the cache key of a user's version."""
+        return f"permissions:version:{user_id}"
+
+
+# Process-wide permission cache used by RoleService and the invalidation signals
+permission_cache = PermissionCache()
@@ -10,14 +10,14 @@ from rest_framework import serializers  # version 3.14+
 from django.core.validators import validate_email  # version 4.2+
 from django.contrib.auth.password_validation import validate_password  # version 4.2+
 
-from ../../core.serializers import BaseSerializer, BaseModelSerializer, SensitiveDataMixin
-from ../../core.exceptions import ValidationException
+from core.serializers import BaseSerializer, BaseModelSerializer, SensitiveDataMixin
+from core.exceptions import ValidationException
 from .models import (
     User, Role, Permission, UserRole, RolePermission,
     BorrowerProfile, EmploymentInfo, SchoolAdminProfile, InternalUserProfile,
     USER_ROLE_CHOICES
 )
-from ../../utils.constants import (
+from utils.constants import (
     EMPLOYMENT_TYPES, HOUSING_STATUS, CITIZENSHIP_STATUS, US_STATES
 )
 
@@ -321,7 +321,39 @@ class BorrowerProfileSerializer(BaseModelSerializer, SensitiveDataMixin):
             'housing_status', 'housing_payment', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
-    
+
+    def create(self, validated_data):
+        """
+        Creates a borrower profile, storing the SSN encrypted with its blind index.
+
+        Args:
+            validated_data (dict): The validated data for creating the profile
+
+        Returns:
+            BorrowerProfile: Created borrower profile
+        """
+        if 'ssn' in validated_data:
+            profile = BorrowerProfile()
+            profile.set_ssn(validated_data['ssn'])
+            validated_data['ssn'] = profile.ssn
+            validated_data['ssn_hash'] = profile.ssn_hash
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        """
+        Updates a borrower profile, storing a new SSN encrypted with its blind index.
+
+        Args:
+            instance (BorrowerProfile): The borrower profile to update
+            validated_data (dict): The validated data for updating the profile
+
+        Returns:
+            BorrowerProfile: Updated borrower profile
+        """
+        if 'ssn' in validated_data:
+            instance.set_ssn(validated_data.pop('ssn'))
+        return super().update(instance, validated_data)
+
     def get_full_address(self, obj):
         """
         Returns the borrower's full address as a formatted string.
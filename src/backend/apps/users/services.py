@@ -15,9 +15,10 @@ from .models import (
     InternalUserProfile, UserPermission, Role, Permission, UserRole, RolePermission
 )
 from ..authentication.models import Auth0User
-from ..authentication.auth0 import Auth0Manager
-from ...utils.constants import USER_TYPES
-from ...core.exceptions import (
+from ..authentication.auth0 import get_auth0_manager
+from .permission_cache import CompiledPermissions, permission_cache
+from utils.constants import USER_TYPES
+from core.exceptions import (
     ValidationException, ResourceNotFoundException, 
     PermissionException, ConflictException
 )
@@ -30,8 +31,8 @@ class UserService:
     """Service class for user management operations"""
     
     def __init__(self):
-        """Initialize the UserService with Auth0Manager"""
-        self.auth0_manager = Auth0Manager()
+        """Initialize the UserService with the process-wide Auth0Manager"""
+        self.auth0_manager = get_auth0_manager()
         
     def get_user_by_id(self, user_id):
         """
@@ -328,10 +329,9 @@ class UserService:
                 raise ValidationException(f"Missing required field for borrower profile: {field}")
         
         # Create the profile
-        profile = BorrowerProfile.objects.create(
+        profile = BorrowerProfile(
             user=user,
             # Add basic fields
-            ssn=profile_data['ssn'],
             dob=profile_data['dob'],
             citizenship_status=profile_data.get('citizenship_status', 'us_citizen'),
             address_line1=profile_data['address_line1'],
@@ -342,6 +342,9 @@ class UserService:
             housing_status=profile_data.get('housing_status', 'rent'),
             housing_payment=profile_data.get('housing_payment', 0.0)
         )
+        # Encrypt the SSN and set its blind index
+        profile.set_ssn(profile_data['ssn'])
+        profile.save()
         
         # Create employment info if provided
         if 'employment_info' in profile_data:
@@ -929,21 +932,42 @@ class RoleService:
         Returns:
             QuerySet: QuerySet of Permission objects
         """
-        # Get all roles for the user
-        roles = self.get_user_roles(user)
+        # Resolve roles and their permissions in one query through subqueries
+        role_ids = UserRole.objects.filter(user=user, role__is_active=True).values('role_id')
+        permission_ids = RolePermission.objects.filter(role_id__in=role_ids).values('permission_id')
+        return Permission.objects.filter(id__in=permission_ids, is_active=True).distinct()
+    
+    def get_compiled_permissions(self, user):
+        """
+        Retrieves a user's permissions compiled for fast checks, from the shared cache when possible.
         
-        # Get all permissions for these roles
-        permission_sets = [self.get_role_permissions(role) for role in roles]
+        Args:
+            user (User): The user to get permissions for
+            
+        Returns:
+            CompiledPermissions: Role-granted permissions and resource-scoped custom grants
+        """
+        return permission_cache.get_permissions(user.pk, lambda: self._compile_permissions(user))
+    
+    def _compile_permissions(self, user):
+        """
+        Compiles a user's permissions from the database.
         
-        # Combine all permissions into one queryset
-        if not permission_sets:
-            return Permission.objects.none()
+        Args:
+            user (User): The user to compile permissions for
+            
+        Returns:
+            CompiledPermissions: The compiled permissions
+        """
+        grants = self.get_user_permissions(user).values_list('name', 'resource_type')
         
-        combined_permissions = permission_sets[0]
-        for permission_set in permission_sets[1:]:
-            combined_permissions = combined_permissions | permission_set
+        resource_grants = {}
+        for permission_name, resource_type, resource_id in UserPermission.objects.filter(
+            user=user, is_granted=True, resource_id__isnull=False
+        ).values_list('permission_name', 'resource_type', 'resource_id'):
+            resource_grants.setdefault((permission_name, resource_type), set()).add(resource_id)
         
-        return combined_permissions.distinct()
+        return CompiledPermissions(grants, resource_grants)
     
     def assign_role_to_user(self, user, role, assigned_by):
         """
@@ -1078,30 +1102,23 @@ class RoleService:
         Returns:
             bool: True if user has the permission, False otherwise
         """
-        # Get all permissions for the user
-        permissions = self.get_user_permissions(user)
-        
-        # Check if any permission matches the criteria
-        for permission in permissions:
-            if permission.name == permission_name and permission.resource_type == resource_type:
-                return True
-        
-        # Check for specific resource permission in UserPermission
-        if resource_id:
-            try:
-                # Check if there's a custom permission grant for this specific resource
-                user_permission = UserPermission.objects.get(
-                    user=user,
-                    permission_name=permission_name,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    is_granted=True
-                )
-                return True
-            except UserPermission.DoesNotExist:
-                pass
+        # Role permissions apply to all resources; custom grants to a specific resource
+        return self.get_compiled_permissions(user).has_permission(permission_name, resource_type, resource_id)
+    
+    def filter_permitted(self, user, permission_name, resource_type, resource_ids):
+        """
+        Filters resources down to those a user has a specific permission for, e.g. for list endpoints.
         
-        return False
+        Args:
+            user (User): The user to check
+            permission_name (str): The name of the permission
+            resource_type (str): The type of resource
+            resource_ids (iterable): The resource IDs to check
+            
+        Returns:
+            list: The permitted resource IDs, in their original order
+        """
+        return self.get_compiled_permissions(user).filter_permitted(permission_name, resource_type, resource_ids)
     
     def grant_user_permission(self, user, permission_name, resource_type, resource_id=None):
         """
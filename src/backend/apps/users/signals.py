@@ -0,0 +1,36 @@
+"""
+Signal handlers for the users app.
+
+Writes to role assignments, role permissions and custom user permissions invalidate the
+compiled permission sets kept by RoleService, whichever code path makes them.
+"""
+from django.db.models.signals import post_save, post_delete  # Django 4.2+
+from django.dispatch import receiver  # Django 4.2+
+
+from .models import UserPermission, Role, Permission, UserRole, RolePermission
+from .permission_cache import permission_cache
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+@receiver(post_save, sender=UserPermission)
+@receiver(post_delete, sender=UserPermission)
+def invalidate_user_permissions(sender, instance, **kwargs):
+    """
+    Signal handler that invalidates the permissions of the user whose roles or custom permissions changed
+    """
+    permission_cache.invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def invalidate_all_permissions(sender, instance, **kwargs):
+    """
+    Signal handler that invalidates every user's permissions when a role or permission changes,
+    as any number of users may hold the role
+    """
+    permission_cache.invalidate_all()
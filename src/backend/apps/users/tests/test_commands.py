@@ -0,0 +1,88 @@
+"""
+Tests for the management commands of the users app.
+
+These run against the test database, covering the re-encryption of stored SSNs by
+rotate_encryption_keys.
+"""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.authentication.models import Auth0User
+from apps.users.models import User, BorrowerProfile
+from utils.constants import USER_TYPES, CITIZENSHIP_STATUS, HOUSING_STATUS
+from utils.encryption import generate_key, encrypt_ssn, decrypt_ssn, needs_reencryption
+
+OLD_KEY = generate_key()
+NEW_KEY = generate_key()
+
+
+class TestRotateEncryptionKeys(TestCase):
+    """Test case for the rotate_encryption_keys management command"""
+
+    def setUp(self):
+        """Create borrower profiles with SSNs encrypted under the old key"""
+        self.profiles = []
+        for index, ssn in enumerate(['123-45-6789', '987-65-4321', '555-44-3333']):
+            auth0_user = Auth0User.objects.create(
+                auth0_id=f'auth0|rotate{index}',
+                email=f'rotate{index}@example.com',
+                email_verified=True
+            )
+            user = User.objects.create(
+                auth0_user=auth0_user,
+                first_name='Test',
+                last_name=f'Borrower{index}',
+                email=f'rotate{index}@example.com',
+                phone='(555) 123-4567',
+                user_type=USER_TYPES['BORROWER']
+            )
+            self.profiles.append(BorrowerProfile.objects.create(
+                user=user,
+                ssn=encrypt_ssn(ssn, OLD_KEY),
+                dob=date(1990, 1, 1),
+                citizenship_status=CITIZENSHIP_STATUS['US_CITIZEN'],
+                address_line1='123 Main St',
+                city='Anytown',
+                state='CA',
+                zip_code='12345',
+                housing_status=HOUSING_STATUS['RENT'],
+                housing_payment=Decimal('1500.00')
+            ))
+
+    def rotate(self, *args):
+        """Run the command with NEW_KEY current and OLD_KEY retired, returning its output"""
+        output = StringIO()
+        with patch('utils.encryption.ENCRYPTION_KEY', NEW_KEY), \
+                patch('utils.encryption.ENCRYPTION_OLD_KEYS', (OLD_KEY,)):
+            call_command('rotate_encryption_keys', *args, stdout=output)
+        return output.getvalue()
+
+    def test_reencrypts_ssns_with_current_key(self):
+        """Test that every SSN is re-encrypted with the current key, in batches"""
+        output = self.rotate('--batch-size', '2')
+
+        self.assertIn('Re-encrypted 3 of 3 borrower SSNs', output)
+        for profile in self.profiles:
+            stored = BorrowerProfile.all_objects.get(pk=profile.pk).ssn
+            self.assertNotEqual(stored, profile.ssn)
+            self.assertEqual(decrypt_ssn(stored, NEW_KEY), decrypt_ssn(profile.ssn, OLD_KEY))
+
+        # Running again finds nothing left to rotate
+        self.assertIn('Re-encrypted 0 of 3 borrower SSNs', self.rotate())
+
+    def test_dry_run_does_not_write(self):
+        """Test that --dry-run counts the stale SSNs without changing them"""
+        output = self.rotate('--dry-run')
+
+        self.assertIn('Would re-encrypt 3 of 3 borrower SSNs', output)
+        for profile in self.profiles:
+            self.assertEqual(BorrowerProfile.all_objects.get(pk=profile.pk).ssn, profile.ssn)
+        with patch('utils.encryption.ENCRYPTION_KEY', NEW_KEY), \
+                patch('utils.encryption.ENCRYPTION_OLD_KEYS', (OLD_KEY,)):
+            self.assertTrue(needs_reencryption(self.profiles[0].ssn))
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase, override_settings
 from unittest.mock import patch, mock
 from django.utils import timezone
 import uuid
@@ -11,6 +11,8 @@ from apps.users.models import (
     USER_ROLE_CHOICES
 )
 from apps.authentication.models import Auth0User
+from apps.users.checks import check_blind_index_key
+from utils.encryption import generate_key, ssn_blind_index
 from utils.constants import (
     USER_TYPES, EMPLOYMENT_TYPES, HOUSING_STATUS, 
     CITIZENSHIP_STATUS, MINIMUM_AGE, MINIMUM_INCOME,
@@ -416,6 +418,25 @@ class TestBorrowerProfile(TestCase):
         # Assert that the result is False
         self.assertFalse(eligible)
     
+    @patch('utils.encryption.ENCRYPTION_KEY', generate_key())
+    def test_set_ssn_sets_blind_index(self):
+        """Test that set_ssn encrypts the SSN and sets its blind index"""
+        self.borrower_profile.set_ssn('123-45-6789')
+        
+        self.assertNotEqual(self.borrower_profile.ssn, '123456789')
+        self.assertEqual(self.borrower_profile.ssn_hash, ssn_blind_index('123456789'))
+        self.assertEqual(self.borrower_profile.get_ssn(), '123-45-6789')
+    
+    @patch('utils.encryption.ENCRYPTION_KEY', generate_key())
+    def test_find_by_ssn(self):
+        """Test that find_by_ssn matches profiles through the blind index"""
+        self.borrower_profile.set_ssn('123-45-6789')
+        self.borrower_profile.save()
+        
+        self.assertEqual(list(BorrowerProfile.objects.find_by_ssn('123456789')), [self.borrower_profile])
+        self.assertEqual(list(BorrowerProfile.objects.find_by_ssn('123-45-6789')), [self.borrower_profile])
+        self.assertFalse(BorrowerProfile.objects.find_by_ssn('987-65-4321').exists())
+    
     def test_str_method(self):
         """Test that the __str__ method returns the expected string"""
         # Convert the BorrowerProfile instance to a string
@@ -425,6 +446,22 @@ class TestBorrowerProfile(TestCase):
         self.assertEqual(profile_str, 'John Doe Borrower Profile')
 
 
+class TestBlindIndexKeyCheck(SimpleTestCase):
+    """Test case for the BLIND_INDEX_KEY system check"""
+    
+    @override_settings(BLIND_INDEX_KEY=None)
+    def test_missing_key_is_an_error(self):
+        """Test that the check reports a missing BLIND_INDEX_KEY"""
+        errors = check_blind_index_key(None)
+        
+        self.assertEqual([error.id for error in errors], ['users.E001'])
+    
+    @override_settings(BLIND_INDEX_KEY='test-blind-index-key')
+    def test_configured_key_passes(self):
+        """Test that the check passes when BLIND_INDEX_KEY is set"""
+        self.assertEqual(check_blind_index_key(None), [])
+
+
 class TestEmploymentInfo(TestCase):
     """Test case for the EmploymentInfo model"""
     
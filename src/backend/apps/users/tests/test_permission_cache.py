@@ -0,0 +1,216 @@
+"""
+Tests for the compiled permission cache of the users app.
+
+These cover checks against compiled permission sets, the versioned cache shared between
+processes, and, against the test database, how RoleService compiles permissions and how
+the users signals invalidate them when roles or grants change.
+"""
+
+import uuid
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase, TestCase
+
+from apps.authentication.models import Auth0User
+from apps.users.models import User, UserPermission, Role, Permission, UserRole, RolePermission
+from apps.users.permission_cache import CompiledPermissions, PermissionCache
+from apps.users.services import RoleService
+from utils.constants import USER_TYPES
+
+
+class TestCompiledPermissions(SimpleTestCase):
+    """Test case for checks against a compiled permission set"""
+
+    def setUp(self):
+        """Set up test data before each test method runs"""
+        self.resource_id = uuid.uuid4()
+        self.permissions = CompiledPermissions(
+            [('view', 'application'), ('edit', 'application')],
+            {('approve', 'application'): {self.resource_id}}
+        )
+
+    def test_role_permissions_apply_to_all_resources(self):
+        """Test that role-granted permissions are checked without a resource"""
+        self.assertTrue(self.permissions.has_permission('view', 'application'))
+        self.assertTrue(self.permissions.has_permission('edit', 'application', uuid.uuid4()))
+        self.assertFalse(self.permissions.has_permission('view', 'document'))
+
+    def test_custom_grants_apply_to_their_resource(self):
+        """Test that custom grants only cover the granted resource"""
+        self.assertTrue(self.permissions.has_permission('approve', 'application', self.resource_id))
+        self.assertTrue(self.permissions.has_permission('approve', 'application', str(self.resource_id)))
+        self.assertFalse(self.permissions.has_permission('approve', 'application', uuid.uuid4()))
+        self.assertFalse(self.permissions.has_permission('approve', 'application'))
+
+    def test_filter_permitted(self):
+        """Test that resources are filtered in their original order"""
+        other_ids = [uuid.uuid4(), uuid.uuid4()]
+        resource_ids = [other_ids[0], self.resource_id, other_ids[1]]
+
+        self.assertEqual(self.permissions.filter_permitted('view', 'application', resource_ids), resource_ids)
+        self.assertEqual(
+            self.permissions.filter_permitted('approve', 'application', resource_ids), [self.resource_id]
+        )
+        self.assertEqual(self.permissions.filter_permitted('delete', 'application', resource_ids), [])
+
+
+class TestPermissionCache(TestCase):
+    """Test case for the versioned permission cache, which invalidates once transactions commit"""
+
+    def setUp(self):
+        """Set up test data before each test method runs"""
+        self.shared_cache = LocMemCache(f'permissions-{uuid.uuid4()}', {})
+        self.permission_cache = PermissionCache(cache=self.shared_cache)
+        self.build = MagicMock(side_effect=lambda: CompiledPermissions([('view', 'application')], {}))
+
+    def test_permissions_are_compiled_once(self):
+        """Test that repeated lookups read the compiled set from the cache"""
+        first = self.permission_cache.get_permissions(1, self.build)
+        second = self.permission_cache.get_permissions(1, self.build)
+
+        self.assertTrue(first.has_permission('view', 'application'))
+        self.assertTrue(second.has_permission('view', 'application'))
+        self.build.assert_called_once()
+
+    def test_permissions_are_shared_between_processes(self):
+        """Test that another process reads the compiled set from the shared cache"""
+        self.permission_cache.get_permissions(1, self.build)
+
+        PermissionCache(cache=self.shared_cache).get_permissions(1, self.build)
+
+        self.build.assert_called_once()
+
+    def test_invalidate_user(self):
+        """Test that invalidating a user recompiles only that user's permissions"""
+        self.permission_cache.get_permissions(1, self.build)
+        self.permission_cache.get_permissions(2, self.build)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.permission_cache.invalidate_user(1)
+        self.permission_cache.get_permissions(1, self.build)
+        self.permission_cache.get_permissions(2, self.build)
+
+        self.assertEqual(self.build.call_count, 3)
+
+    def test_invalidate_all(self):
+        """Test that a global invalidation recompiles every user's permissions"""
+        self.permission_cache.get_permissions(1, self.build)
+        self.permission_cache.get_permissions(2, self.build)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.permission_cache.invalidate_all()
+        self.permission_cache.get_permissions(1, self.build)
+        self.permission_cache.get_permissions(2, self.build)
+
+        self.assertEqual(self.build.call_count, 4)
+
+    def test_lost_versions_do_not_revive_old_entries(self):
+        """Test that a version evicted from the cache does not match entries compiled before"""
+        self.permission_cache.get_permissions(1, self.build)
+
+        self.shared_cache.delete('permissions:version:1')
+        self.permission_cache.get_permissions(1, self.build)
+
+        self.assertEqual(self.build.call_count, 2)
+
+
+class TestPermissionInvalidation(TestCase):
+    """Test case for RoleService permission checks as roles and grants change"""
+
+    def setUp(self):
+        """Create a user, a role and a permission the role does not grant yet"""
+        cache.clear()
+        auth0_user = Auth0User.objects.create(
+            auth0_id='auth0|permissions', email='permissions@example.com', email_verified=True
+        )
+        self.user = User.objects.create(
+            auth0_user=auth0_user, first_name='Test', last_name='Underwriter',
+            email='permissions@example.com', phone='(555) 123-4567', user_type=USER_TYPES['UNDERWRITER']
+        )
+        self.role = Role.objects.create(name='Underwriter', description='Reviews applications')
+        self.permission = Permission.objects.create(
+            name='approve', description='Approve applications', resource_type='application'
+        )
+        self.resource_id = uuid.uuid4()
+        self.role_service = RoleService()
+
+    def has_permission(self, resource_id=None):
+        """Check the approve permission on applications through RoleService"""
+        return self.role_service.check_user_has_permission(self.user, 'approve', 'application', resource_id)
+
+    def test_compile_permissions_takes_two_queries(self):
+        """Test that compiling reads role grants and custom grants in one query each"""
+        RolePermission.objects.create(role=self.role, permission=self.permission)
+        UserRole.objects.create(user=self.user, role=self.role, assigned_by=self.user)
+        UserPermission.objects.create(
+            user=self.user, permission_name='edit', resource_type='document', resource_id=self.resource_id
+        )
+
+        with self.assertNumQueries(2):
+            permissions = self.role_service._compile_permissions(self.user)
+
+        self.assertTrue(permissions.has_permission('approve', 'application'))
+        self.assertTrue(permissions.has_permission('edit', 'document', self.resource_id))
+
+    def test_checks_are_served_from_the_cache(self):
+        """Test that repeated checks do not query the database"""
+        self.assertFalse(self.has_permission())
+
+        with self.assertNumQueries(0):
+            self.assertFalse(self.has_permission())
+
+    def test_user_role_changes_invalidate(self):
+        """Test that assigning and removing a role changes the check"""
+        RolePermission.objects.create(role=self.role, permission=self.permission)
+        self.assertFalse(self.has_permission())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_role = UserRole.objects.create(user=self.user, role=self.role, assigned_by=self.user)
+        self.assertTrue(self.has_permission())
+
+        # Soft delete, through post_save
+        with self.captureOnCommitCallbacks(execute=True):
+            user_role.delete()
+        self.assertFalse(self.has_permission())
+
+    def test_role_permission_changes_invalidate(self):
+        """Test that granting and removing a role's permission changes the check for its users"""
+        UserRole.objects.create(user=self.user, role=self.role, assigned_by=self.user)
+        self.assertFalse(self.has_permission())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            role_permission = RolePermission.objects.create(role=self.role, permission=self.permission)
+        self.assertTrue(self.has_permission())
+
+        # Hard delete, through post_delete
+        with self.captureOnCommitCallbacks(execute=True):
+            role_permission.delete(hard_delete=True)
+        self.assertFalse(self.has_permission())
+
+    def test_user_permission_changes_invalidate(self):
+        """Test that granting, revoking and deleting a custom grant changes the check"""
+        self.assertFalse(self.has_permission(self.resource_id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_permission = UserPermission.objects.create(
+                user=self.user, permission_name='approve', resource_type='application',
+                resource_id=self.resource_id
+            )
+        self.assertTrue(self.has_permission(self.resource_id))
+        self.assertFalse(self.has_permission(uuid.uuid4()))
+
+        user_permission.is_granted = False
+        with self.captureOnCommitCallbacks(execute=True):
+            user_permission.save()
+        self.assertFalse(self.has_permission(self.resource_id))
+
+        user_permission.is_granted = True
+        with self.captureOnCommitCallbacks(execute=True):
+            user_permission.save()
+        self.assertTrue(self.has_permission(self.resource_id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_permission.delete()
+        self.assertFalse(self.has_permission(self.resource_id))
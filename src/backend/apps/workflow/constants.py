@@ -6,7 +6,7 @@ between different states in the loan application lifecycle. This includes workfl
 state transition rules, permissions, SLA definitions, and event mappings.
 """
 
-from ...utils.constants import (
+from utils.constants import (
     APPLICATION_STATUS,
     DOCUMENT_STATUS,
     FUNDING_STATUS,
@@ -11,7 +11,7 @@ from django.utils import timezone  # Django 4.2+
 from django.contrib.contenttypes.models import ContentType  # Django 4.2+
 from django.contrib.contenttypes.fields import GenericForeignKey  # Django 4.2+
 
-from ...core.models import CoreModel, ActiveManager
+from core.models import CoreModel, ActiveManager
 from .constants import (
     WORKFLOW_TYPES,
     WORKFLOW_TASK_TYPES,
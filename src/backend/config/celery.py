@@ -11,7 +11,6 @@ import os  # standard library
 from celery import Celery  # 5.3+
 from django.conf import settings  # 4.2+
 from celery.schedules import crontab  # 5.3+
-import logging  # standard library
 
 from utils.logging import setup_logger
 
@@ -19,7 +18,7 @@ from utils.logging import setup_logger
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
 
 # Create logger for Celery
-logger = setup_logger('celery', level=logging.INFO)
+logger = setup_logger('celery', log_level='INFO')
 
 # Create a basic Celery application instance
 app = Celery('loan_management')
@@ -257,6 +257,12 @@ LOGGING = {
 # Field-level encryption key for sensitive data
 ENCRYPTION_KEY = os.environ.get('ENCRYPTION_KEY')
 
+# Previous encryption keys, comma-separated, accepted for decryption during key rotation
+ENCRYPTION_OLD_KEYS = [key for key in os.environ.get('ENCRYPTION_OLD_KEYS', '').split(',') if key]
+
+# HMAC key for blind indexes of encrypted fields, kept apart from the encryption keys
+BLIND_INDEX_KEY = os.environ.get('BLIND_INDEX_KEY')
+
 # DocuSign Integration Settings
 DOCUSIGN_INTEGRATION_KEY = os.environ.get('DOCUSIGN_INTEGRATION_KEY')
 DOCUSIGN_USER_ID = os.environ.get('DOCUSIGN_USER_ID')
@@ -123,6 +123,7 @@ AUTH0_API_AUDIENCE = os.environ.get('AUTH0_API_AUDIENCE', 'https://api.example.c
 
 # Field-level encryption key for development
 ENCRYPTION_KEY = os.environ.get('ENCRYPTION_KEY', 'development-encryption-key-not-for-production')
+BLIND_INDEX_KEY = os.environ.get('BLIND_INDEX_KEY', 'development-blind-index-key-not-for-production')
 
 # DocuSign development settings
 DOCUSIGN_INTEGRATION_KEY = os.environ.get('DOCUSIGN_INTEGRATION_KEY', 'dev-integration-key')
@@ -21,6 +21,12 @@ SECRET_KEY = 'django-insecure-test-key-not-for-production'
 # Allow testing hosts
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', '[::1]', 'testserver']
 
+# Install the admin without autodiscovering every app's admin module
+INSTALLED_APPS = [
+    'django.contrib.admin.apps.SimpleAdminConfig' if app == 'django.contrib.admin' else app
+    for app in INSTALLED_APPS
+]
+
 # Use SQLite in-memory database for faster testing
 DATABASES = {
     'default': {
@@ -64,9 +70,14 @@ SECURE_SSL_REDIRECT = False
 # Mock Auth0 settings for testing
 AUTH0_DOMAIN = 'test.auth0.com'
 AUTH0_API_AUDIENCE = 'https://test-api.example.com'
+JWT_SECRET_KEY = 'test-jwt-secret-key-not-for-production'
 
 # Mock encryption key for testing
 ENCRYPTION_KEY = 'test-encryption-key-not-for-production'
+BLIND_INDEX_KEY = 'test-blind-index-key-not-for-production'
+
+# Mock document storage bucket for testing
+DOCUMENT_STORAGE_BUCKET = 'test-documents'
 
 # Mock DocuSign settings for testing
 DOCUSIGN_INTEGRATION_KEY = 'test-integration-key'
@@ -74,6 +85,11 @@ DOCUSIGN_USER_ID = 'test-user-id'
 DOCUSIGN_BASE_URL = 'https://demo.docusign.net/restapi'
 DOCUSIGN_ACCOUNT_ID = 'test-account-id'
 DOCUSIGN_PRIVATE_KEY_PATH = os.path.join(BASE_DIR, 'tests', 'test_docusign_private_key.pem')
+DOCUSIGN_OAUTH_HOST = 'account-d.docusign.com'
+DOCUSIGN_CLIENT_ID = 'test-client-id'
+DOCUSIGN_CLIENT_SECRET = 'test-client-secret'
+DOCUSIGN_REDIRECT_URI = 'https://test-app.example.com/docusign/callback'
+DOCUSIGN_WEBHOOK_SECRET = 'test-webhook-secret'
 
 # Mock SendGrid settings for testing
 SENDGRID_API_KEY = 'test-sendgrid-key'
@@ -9,7 +9,7 @@ from rest_framework import status
 from rest_framework.exceptions import APIException as DRFAPIException
 from rest_framework.exceptions import ValidationError
 
-from ..utils.logging import log_exception
+from utils.logging import log_exception
 
 # Standard error response template
 ERROR_RESPONSE_TEMPLATE = {
@@ -110,6 +110,27 @@ class ValidationException(BaseException):
         self.status_code = status.HTTP_400_BAD_REQUEST
 
 
+class AuthenticationException(BaseException):
+    """
+    Exception for authentication errors.
+
+    This exception is raised when credentials or tokens are invalid,
+    expired, or revoked.
+    """
+
+    def __init__(self, message, details=None):
+        """
+        Initialize the authentication exception.
+
+        Args:
+            message (str): Human-readable error message
+            details (dict, optional): Additional error details
+        """
+        super().__init__(message, details)
+        self.code = 'authentication_failed'
+        self.status_code = status.HTTP_401_UNAUTHORIZED
+
+
 class PermissionException(BaseException):
     """
     Exception for permission denied errors.
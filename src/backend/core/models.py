@@ -13,9 +13,8 @@ from django.contrib.auth import get_user_model  # Django 4.2+
 from django.dispatch import Signal  # Django 4.2+
 
 # Signals for model changes and audit logging
-# Note: providing_args is deprecated in Django 3.1+ but kept for compatibility
-model_change_signal = Signal(providing_args=['instance', 'created'])
-audit_log_signal = Signal(providing_args=['instance', 'action', 'user'])
+model_change_signal = Signal()  # Sends instance, created
+audit_log_signal = Signal()  # Sends instance, action, user
 
 
 class BaseModel(models.Model):
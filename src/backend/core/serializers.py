@@ -9,10 +9,12 @@ sensitive data, audit fields, validation, and error formatting across the applic
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django.db import models
 
-from ..core.exceptions import ValidationException
-from ..utils.encryption import mask_ssn
-from ..utils.logging import get_request_logger
+from core.exceptions import ValidationException
+from utils.encryption import mask_ssn
+from utils.logging import get_request_logger
+from utils.storage import get_default_storage
 
 # List of fields that should be treated as sensitive
 SENSITIVE_FIELDS = ['ssn', 'tax_id', 'account_number', 'routing_number', 'credit_score']
@@ -357,4 +359,61 @@ class SensitiveDataMixin:
             return self.sensitive_fields
         
         # Otherwise return SENSITIVE_FIELDS global variable
-        return SENSITIVE_FIELDS
\ No newline at end of file
+        return SENSITIVE_FIELDS
+
+
+class DownloadUrlListSerializer(serializers.ListSerializer):
+    """
+    List serializer that signs the download URLs of all rows in one batch.
+
+    The child serializer must use DownloadUrlMixin. The batch fills the presigned URL cache,
+    so the get_download_url() call made for each row returns a cached URL instead of
+    signing a new one.
+    """
+    
+    def to_representation(self, data):
+        """
+        Sign the download URLs of the page, then serialize each row.
+        
+        Args:
+            data (QuerySet or list): The instances being serialized
+            
+        Returns:
+            list: Serialized rows
+        """
+        instances = list(data.all() if isinstance(data, models.Manager) else data)
+        self.child.sign_download_urls(instances)
+        return super().to_representation(instances)
+
+
+class DownloadUrlMixin:
+    """
+    Mixin for serializers of models with a stored file and a get_download_url() method.
+    
+    Set Meta.list_serializer_class to DownloadUrlListSerializer to sign the URLs of a list
+    response in one batch. The expiry must match the one get_download_url() uses by default.
+    """
+    download_url_expiry = 3600
+    download_path_field = 'file_path'
+    
+    def get_download_storage(self):
+        """
+        Storage holding the files.
+        
+        Returns:
+            S3Storage: The storage the model's get_download_url() signs URLs with
+        """
+        return get_default_storage()
+    
+    def sign_download_urls(self, instances):
+        """
+        Sign the download URLs of many instances at once.
+        
+        Args:
+            instances (list): Instances being serialized
+            
+        Returns:
+            dict: Maps each file path to its presigned URL
+        """
+        paths = [getattr(instance, self.download_path_field, None) for instance in instances]
+        return self.get_download_storage().get_presigned_urls(paths, self.download_url_expiry)
@@ -18,8 +18,8 @@ logger = logging.getLogger('core.signals')
 audit_logger = get_audit_logger()
 
 # Define custom signals
-model_change_signal = Signal(providing_args=['instance', 'created', 'user'])
-audit_log_signal = Signal(providing_args=['instance', 'action', 'user', 'details'])
+model_change_signal = Signal()  # Sends instance, created, user
+audit_log_signal = Signal()  # Sends instance, action, user, details
 
 
 def log_user_action(user, action, resource, details):
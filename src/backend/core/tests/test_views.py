@@ -0,0 +1,123 @@
+import io
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from core.views import StreamingDownloadMixin
+from core.exceptions import ResourceNotFoundException
+from utils.storage import S3ObjectStream, StorageError
+
+# Test constants
+FILE_KEY = 'documents/loan_agreement.pdf'
+FILE_CONTENT = b'%PDF-1.7 loan agreement content'
+
+
+def create_stream(content, status_code=200, content_range=None):
+    """Creates an open S3 object stream over the given bytes"""
+    return S3ObjectStream(
+        status_code,
+        body=StreamingBody(io.BytesIO(content), len(content)),
+        content_type='application/pdf',
+        content_length=len(content),
+        content_range=content_range,
+        etag='abc123'
+    )
+
+
+class TestStreamingDownloadMixin(SimpleTestCase):
+    """Test case for streaming stored files to the client"""
+
+    def setUp(self):
+        """Set up test data before each test method runs"""
+        self.factory = APIRequestFactory()
+        self.storage = MagicMock()
+        self.storage.open_stream.return_value = create_stream(FILE_CONTENT)
+        self.view = StreamingDownloadMixin()
+        self.view.get_download_storage = lambda: self.storage
+
+    def test_file_is_streamed(self):
+        """Test that the file is sent in chunks with its headers"""
+        self.view.download_chunk_size = 8
+        request = self.factory.get('/download/')
+
+        response = self.view.stream_file(request, FILE_KEY, 'loan agreement.pdf')
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.status_code, 200)
+        chunks = list(response.streaming_content)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks), FILE_CONTENT)
+        self.assertEqual(response['Content-Length'], str(len(FILE_CONTENT)))
+        self.assertEqual(response['ETag'], '"abc123"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="loan agreement.pdf"')
+        self.storage.open_stream.assert_called_once_with(FILE_KEY, version_id=None, byte_range=None, if_none_match=None)
+
+    def test_range_is_forwarded(self):
+        """Test that a single byte range is answered with partial content"""
+        self.storage.open_stream.return_value = create_stream(
+            FILE_CONTENT[:4], status_code=206, content_range=f'bytes 0-3/{len(FILE_CONTENT)}'
+        )
+        request = self.factory.get('/download/', HTTP_RANGE='bytes=0-3')
+
+        response = self.view.stream_file(request, FILE_KEY, 'loan_agreement.pdf')
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 0-3/{len(FILE_CONTENT)}')
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF')
+        self.assertEqual(self.storage.open_stream.call_args[1]['byte_range'], 'bytes=0-3')
+
+    def test_unsupported_ranges_are_ignored(self):
+        """Test that multiple ranges and If-Range requests read the whole file"""
+        for headers in ({'HTTP_RANGE': 'bytes=0-3,8-10'}, {'HTTP_RANGE': 'bytes=0-3', 'HTTP_IF_RANGE': '"old"'}):
+            self.storage.open_stream.reset_mock()
+            self.view.stream_file(self.factory.get('/download/', **headers), FILE_KEY, 'loan_agreement.pdf')
+            self.assertIsNone(self.storage.open_stream.call_args[1]['byte_range'])
+
+    def test_not_modified(self):
+        """Test that a matching ETag is answered with 304"""
+        self.storage.open_stream.return_value = S3ObjectStream(304, etag='abc123')
+        request = self.factory.get('/download/', HTTP_IF_NONE_MATCH='"abc123"')
+
+        response = self.view.stream_file(request, FILE_KEY, 'loan_agreement.pdf')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], '"abc123"')
+        self.assertEqual(self.storage.open_stream.call_args[1]['if_none_match'], '"abc123"')
+
+    def test_range_not_satisfiable(self):
+        """Test that an unsatisfiable range is answered with 416"""
+        self.storage.open_stream.return_value = S3ObjectStream(416, content_range='bytes */31')
+        request = self.factory.get('/download/', HTTP_RANGE='bytes=100-')
+
+        response = self.view.stream_file(request, FILE_KEY, 'loan_agreement.pdf')
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */31')
+
+    @override_settings(FILE_DOWNLOAD_REDIRECT=True)
+    def test_redirect_to_presigned_url(self):
+        """Test that downloads can be redirected to a presigned URL"""
+        self.storage.get_presigned_url.return_value = 'https://bucket.s3.amazonaws.com/signed'
+
+        response = self.view.stream_file(self.factory.get('/download/'), FILE_KEY, 'loan_agreement.pdf')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], 'https://bucket.s3.amazonaws.com/signed')
+        self.storage.open_stream.assert_not_called()
+
+        # The query parameter overrides the setting
+        response = self.view.stream_file(self.factory.get('/download/?redirect=false'), FILE_KEY, 'loan_agreement.pdf')
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_file_raises_not_found(self):
+        """Test that a missing object is reported as a missing resource"""
+        self.storage.open_stream.side_effect = StorageError(
+            'missing', ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'missing'}}, 'GetObject')
+        )
+
+        with self.assertRaises(ResourceNotFoundException):
+            self.view.stream_file(self.factory.get('/download/'), FILE_KEY, 'loan_agreement.pdf')
@@ -8,6 +8,7 @@ consistency across the application's API layer.
 """
 
 import logging
+import re
 from rest_framework.views import APIView
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
@@ -15,15 +16,22 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.http import content_disposition_header
 
 from .exceptions import BaseException, ValidationException, ResourceNotFoundException, format_exception_response
 from .serializers import BaseSerializer, BaseModelSerializer
 from .permissions import has_object_permission_or_403
 from ..utils.logging import get_request_logger
+from ..utils.storage import StorageError, get_default_storage, DEFAULT_STREAM_CHUNK_SIZE
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# A single byte range; S3 serves one range per request, so other Range headers are ignored
+SINGLE_BYTE_RANGE_PATTERN = re.compile(r'^bytes=(\d+-\d*|-\d+)$')
+
 # Standard success response template
 SUCCESS_RESPONSE_TEMPLATE = {
     'status': 'success',
@@ -476,4 +484,134 @@ class ReadOnlyViewMixin:
         return Response(
             {'status': 'error', 'error': {'code': 'method_not_allowed', 'message': 'Method not allowed'}},
             status=status.HTTP_405_METHOD_NOT_ALLOWED
-        )
\ No newline at end of file
+        )
+
+
+class StreamingDownloadMixin:
+    """
+    Mixin that serves stored files by streaming them from S3.
+    
+    The file is passed to the client in chunks as it is read from S3, so a download holds
+    one chunk in memory rather than the whole file. Single byte ranges and If-None-Match
+    are forwarded to S3, giving 206, 304 and 416 responses without reading the file, and
+    a download can instead be answered with a 302 redirect to a presigned URL.
+    """
+    
+    # Size of the chunks read from S3 and written to the client
+    download_chunk_size = DEFAULT_STREAM_CHUNK_SIZE
+    
+    # Whether to redirect to a presigned URL; None follows the FILE_DOWNLOAD_REDIRECT setting
+    download_redirect = None
+    
+    # Lifetime of presigned URLs used for redirects, in seconds
+    download_redirect_expiry = 300
+    
+    def get_download_storage(self):
+        """
+        Returns the storage downloads are read from.
+        
+        Returns:
+            S3Storage: Storage holding the files served by this view
+        """
+        return get_default_storage()
+    
+    def should_redirect_download(self, request):
+        """
+        Determines whether to redirect to a presigned URL instead of streaming.
+        
+        A 'redirect' query parameter overrides the view and project defaults.
+        
+        Args:
+            request (object): The request object
+            
+        Returns:
+            bool: True to redirect
+        """
+        redirect = request.GET.get('redirect')
+        if redirect is not None:
+            return redirect.lower() in ('1', 'true', 'yes')
+        if self.download_redirect is not None:
+            return self.download_redirect
+        return getattr(settings, 'FILE_DOWNLOAD_REDIRECT', False)
+    
+    def stream_file(self, request, key, file_name, version_id=None, content_type=None, storage=None):
+        """
+        Builds the download response for a stored file.
+        
+        Args:
+            request (object): The request object
+            key (str): Object key (path) of the file in S3
+            file_name (str): File name offered to the client
+            version_id (str, optional): Specific version of the file
+            content_type (str, optional): Content type to send instead of the stored one
+            storage (S3Storage, optional): Storage to read from instead of get_download_storage()
+            
+        Returns:
+            HttpResponse: Streaming, redirect, not modified or range not satisfiable response
+            
+        Raises:
+            ResourceNotFoundException: If the file does not exist in storage
+            StorageError: If the file cannot be read
+        """
+        storage = storage or self.get_download_storage()
+        
+        try:
+            if self.should_redirect_download(request):
+                return HttpResponseRedirect(
+                    storage.get_presigned_url(key, self.download_redirect_expiry, version_id)
+                )
+            
+            stream = storage.open_stream(
+                key,
+                version_id=version_id,
+                byte_range=self._get_byte_range(request),
+                if_none_match=request.headers.get('If-None-Match')
+            )
+        except StorageError as e:
+            error_code = getattr(e.original_exception, 'response', {}).get('Error', {}).get('Code')
+            if error_code in ('NoSuchKey', 'NoSuchVersion', '404'):
+                raise ResourceNotFoundException(f"File {file_name} not found")
+            raise
+        
+        if stream.status_code == status.HTTP_304_NOT_MODIFIED:
+            response = HttpResponseNotModified()
+            response['ETag'] = f'"{stream.etag}"'
+            return response
+        
+        if stream.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+            response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+            if stream.content_range:
+                response['Content-Range'] = stream.content_range
+            return response
+        
+        response = StreamingHttpResponse(
+            stream.iter_chunks(self.download_chunk_size),
+            status=stream.status_code,
+            content_type=content_type or stream.content_type or 'application/octet-stream'
+        )
+        if stream.content_length is not None:
+            response['Content-Length'] = str(stream.content_length)
+        if stream.content_range:
+            response['Content-Range'] = stream.content_range
+        if stream.etag:
+            response['ETag'] = f'"{stream.etag}"'
+        response['Accept-Ranges'] = 'bytes'
+        response['Content-Disposition'] = content_disposition_header(True, file_name)
+        return response
+    
+    def _get_byte_range(self, request):
+        """
+        Extracts a byte range S3 can serve from the request.
+        
+        Ranges conditional on If-Range are ignored, so a changed file is always sent whole.
+        
+        Args:
+            request (object): The request object
+            
+        Returns:
+            str: The Range header, or None to read the whole file
+        """
+        byte_range = request.headers.get('Range', '').replace(' ', '')
+        if not byte_range or request.headers.get('If-Range'):
+            return None
+        return byte_range if SINGLE_BYTE_RANGE_PATTERN.match(byte_range) else None
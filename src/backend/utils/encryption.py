@@ -4,11 +4,24 @@ Encryption utility module for the loan management system.
 This module provides encryption and decryption utilities for securing sensitive
 data such as PII (Personally Identifiable Information) and financial information.
 It implements field-level encryption and integrates with AWS KMS for key management.
+
+Cipher objects are built once per key and reused. Values are encrypted with
+ENCRYPTION_KEY and decrypted with it or any key in ENCRYPTION_OLD_KEYS, so keys can be
+rotated by adding the new key, moving the old one to ENCRYPTION_OLD_KEYS, and running
+the rotate_encryption_keys management command.
+
+Encrypted values are randomized, so they cannot be compared in the database. Values that
+need exact-match lookups also get a blind index: a keyed HMAC of the value, stored in an
+indexed column. BLIND_INDEX_KEY is kept apart from the encryption keys and is not rotated
+with them, as changing it requires recomputing every stored index.
 """
 
 import base64
+import functools
+import hashlib
+import hmac
 import os
-from cryptography.fernet import Fernet  # version 39.0.0
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken  # version 39.0.0
 import boto3  # version 1.26.0
 from django.conf import settings  # version 4.2+
 
@@ -17,6 +30,12 @@ from .constants import SSN_FORMAT, SSN_DISPLAY_FORMAT
 # Global encryption key from settings if available
 ENCRYPTION_KEY = settings.ENCRYPTION_KEY if hasattr(settings, 'ENCRYPTION_KEY') else None
 
+# Previous encryption keys, still accepted for decryption until values are re-encrypted
+ENCRYPTION_OLD_KEYS = tuple(getattr(settings, 'ENCRYPTION_OLD_KEYS', None) or ())
+
+# Key for blind indexes of encrypted values from settings if available
+BLIND_INDEX_KEY = settings.BLIND_INDEX_KEY if hasattr(settings, 'BLIND_INDEX_KEY') else None
+
 
 def generate_key():
     """
@@ -28,6 +47,44 @@ def generate_key():
     return Fernet.generate_key()
 
 
+@functools.lru_cache(maxsize=32)
+def _build_cipher(keys):
+    """
+    Builds the cipher for a tuple of keys; cached, as building one derives its subkeys.
+    
+    Args:
+        keys (tuple): Keys, the first used for encryption
+    
+    Returns:
+        MultiFernet: Cipher that encrypts with the first key and decrypts with any of them
+    """
+    return MultiFernet([Fernet(key) for key in keys])
+
+
+def get_cipher(key=None):
+    """
+    Returns the cached cipher for a key.
+    
+    Args:
+        key (bytes, optional): The encryption key to use. Defaults to ENCRYPTION_KEY from
+            settings, together with ENCRYPTION_OLD_KEYS for decryption.
+    
+    Returns:
+        MultiFernet: The cipher
+    
+    Raises:
+        ValueError: If no key is provided and none is configured
+    """
+    if key is None:
+        if not ENCRYPTION_KEY:
+            raise ValueError("Encryption key not provided and not available in settings")
+        return _build_cipher((ENCRYPTION_KEY,) + ENCRYPTION_OLD_KEYS)
+    
+    if not key:
+        raise ValueError("Encryption key not provided and not available in settings")
+    return _build_cipher((key,))
+
+
 def encrypt(value, key=None):
     """
     Encrypts a string value using Fernet symmetric encryption.
@@ -42,13 +99,7 @@ def encrypt(value, key=None):
     if value is None:
         return None
     
-    if key is None:
-        key = ENCRYPTION_KEY
-        
-    if not key:
-        raise ValueError("Encryption key not provided and not available in settings")
-    
-    cipher = Fernet(key)
+    cipher = get_cipher(key)
     encoded_value = value.encode('utf-8')
     encrypted_value = cipher.encrypt(encoded_value)
     return encrypted_value.decode('utf-8')
@@ -68,18 +119,123 @@ def decrypt(encrypted_value, key=None):
     if encrypted_value is None:
         return None
     
-    if key is None:
-        key = ENCRYPTION_KEY
-        
-    if not key:
-        raise ValueError("Encryption key not provided and not available in settings")
-    
-    cipher = Fernet(key)
+    cipher = get_cipher(key)
     encoded_value = encrypted_value.encode('utf-8')
     decrypted_value = cipher.decrypt(encoded_value)
     return decrypted_value.decode('utf-8')
 
 
+def encrypt_many(values, key=None):
+    """
+    Encrypts many string values with one cipher lookup.
+    
+    Args:
+        values (iterable): The values to encrypt; None values stay None
+        key (bytes, optional): The encryption key to use. Defaults to ENCRYPTION_KEY from settings.
+    
+    Returns:
+        list: Encrypted values, in the order given
+    """
+    cipher = get_cipher(key)
+    return [
+        None if value is None else cipher.encrypt(value.encode('utf-8')).decode('utf-8')
+        for value in values
+    ]
+
+
+def decrypt_many(encrypted_values, key=None):
+    """
+    Decrypts many encrypted values with one cipher lookup, e.g. a column of a page of rows.
+    
+    Args:
+        encrypted_values (iterable): The encrypted values; None values stay None
+        key (bytes, optional): The encryption key to use. Defaults to ENCRYPTION_KEY from settings.
+    
+    Returns:
+        list: Decrypted values, in the order given
+    """
+    cipher = get_cipher(key)
+    decrypted = {}
+    result = []
+    for encrypted_value in encrypted_values:
+        if encrypted_value is None:
+            result.append(None)
+            continue
+        # The same stored value may appear on several rows, e.g. through joins
+        if encrypted_value not in decrypted:
+            decrypted[encrypted_value] = cipher.decrypt(encrypted_value.encode('utf-8')).decode('utf-8')
+        result.append(decrypted[encrypted_value])
+    return result
+
+
+def needs_reencryption(encrypted_value):
+    """
+    Checks whether a value was encrypted with a key other than the current ENCRYPTION_KEY.
+    
+    Args:
+        encrypted_value (str): The encrypted value
+    
+    Returns:
+        bool: True if the value should be re-encrypted with the current key
+    """
+    if encrypted_value is None:
+        return False
+    
+    try:
+        _build_cipher((ENCRYPTION_KEY,)).decrypt(encrypted_value.encode('utf-8'))
+        return False
+    except InvalidToken:
+        return True
+
+
+def reencrypt(encrypted_value):
+    """
+    Re-encrypts a value with the current ENCRYPTION_KEY, keeping its original timestamp.
+    
+    Args:
+        encrypted_value (str): Value encrypted with ENCRYPTION_KEY or one of ENCRYPTION_OLD_KEYS
+    
+    Returns:
+        str: The value encrypted with ENCRYPTION_KEY
+    
+    Raises:
+        cryptography.fernet.InvalidToken: If no configured key can decrypt the value
+    """
+    if encrypted_value is None:
+        return None
+    
+    return get_cipher().rotate(encrypted_value.encode('utf-8')).decode('utf-8')
+
+
+def blind_index(value, key=None):
+    """
+    Computes the blind index of a value, a keyed hash that can be stored and matched exactly.
+    
+    Args:
+        value (str): The value to index
+        key (bytes, optional): The HMAC key to use. Defaults to BLIND_INDEX_KEY from settings.
+    
+    Returns:
+        str: Hex-encoded HMAC-SHA256 of the value, 64 characters
+    
+    Raises:
+        ValueError: If no key is provided and none is configured
+    """
+    if value is None:
+        return None
+    
+    if key is None:
+        key = BLIND_INDEX_KEY
+    
+    if not key:
+        raise ValueError("Blind index key not provided and not available in settings")
+    
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+    
+    return hmac.new(key, value.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
 def encrypt_ssn(ssn, key=None):
     """
     Encrypts a Social Security Number with special formatting handling.
@@ -115,14 +271,43 @@ def decrypt_ssn(encrypted_ssn, key=None):
     if encrypted_ssn is None:
         return None
     
-    # Decrypt the SSN
-    decrypted_ssn = decrypt(encrypted_ssn, key)
+    # Decrypt the SSN and format it with hyphens
+    return format_ssn(decrypt(encrypted_ssn, key))
+
+
+def format_ssn(ssn):
+    """
+    Formats a normalized Social Security Number with hyphens, as decrypt_ssn returns it.
+    
+    Args:
+        ssn (str): The SSN without hyphens
+    
+    Returns:
+        str: SSN formatted as XXX-XX-XXXX, or unchanged if it is not 9 characters long
+    """
+    if len(ssn) == 9:
+        return f"{ssn[:3]}-{ssn[3:5]}-{ssn[5:]}"
+    
+    return ssn
+
+
+def ssn_blind_index(ssn, key=None):
+    """
+    Computes the blind index of a Social Security Number.
+    
+    The SSN is normalized as in encrypt_ssn, so formatted and unformatted SSNs match.
+    
+    Args:
+        ssn (str): The SSN, can be with or without hyphens
+        key (bytes, optional): The HMAC key to use. Defaults to BLIND_INDEX_KEY from settings.
     
-    # Format the SSN with hyphens
-    if len(decrypted_ssn) == 9:
-        return f"{decrypted_ssn[:3]}-{decrypted_ssn[3:5]}-{decrypted_ssn[5:]}"
+    Returns:
+        str: Blind index of the SSN
+    """
+    if ssn is None:
+        return None
     
-    return decrypted_ssn
+    return blind_index(ssn.replace('-', ''), key)
 
 
 def mask_ssn(ssn):
@@ -264,6 +449,7 @@ class EncryptedField:
     
     This class can be used to declare encrypted fields in model classes,
     automatically handling encryption and decryption when getting or setting values.
+    The decrypted value is remembered on the instance, so repeated reads decrypt once.
     
     Example:
         class User:
@@ -312,7 +498,14 @@ class EncryptedField:
         if encrypted_value is None:
             return None
         
-        return decrypt_field(encrypted_value, self.field_type)
+        # The memo holds the encrypted value it was computed from, so it is discarded if
+        # the stored value is replaced directly, e.g. when a model is refreshed
+        memo_key = f"_{self.name}_decrypted"
+        memo = instance.__dict__.get(memo_key)
+        if memo is None or memo[0] != encrypted_value:
+            memo = (encrypted_value, decrypt_field(encrypted_value, self.field_type))
+            instance.__dict__[memo_key] = memo
+        return memo[1]
     
     def __set__(self, instance, value):
         """
@@ -324,6 +517,12 @@ class EncryptedField:
         """
         if value is None:
             instance.__dict__[f"_{self.name}"] = None
+            instance.__dict__.pop(f"_{self.name}_decrypted", None)
         else:
             encrypted_value = encrypt_field(value, self.field_type)
-            instance.__dict__[f"_{self.name}"] = encrypted_value
\ No newline at end of file
+            instance.__dict__[f"_{self.name}"] = encrypted_value
+            # The value is known, so the first read need not decrypt it; SSNs are
+            # remembered normalized and formatted as decrypt_ssn returns them
+            if self.field_type == 'ssn':
+                value = format_ssn(value.replace('-', ''))
+            instance.__dict__[f"_{self.name}_decrypted"] = (encrypted_value, value)
\ No newline at end of file
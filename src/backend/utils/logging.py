@@ -21,11 +21,15 @@ from utils.constants import AUDIT_LOG_RETENTION_DAYS
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 REQUEST_ID_HEADER = 'X-Request-ID'
 
+# An email address, matched without backtracking so long words are scanned in linear time
+EMAIL_ADDRESS_PATTERN = r"[a-zA-Z0-9_.+-]++@[a-zA-Z0-9-]++\.[a-zA-Z0-9-.]+"
+
 # PII detection and masking patterns
 PII_PATTERNS = {
     "ssn": r"\d{3}-\d{2}-\d{4}",
     "credit_card": r"\d{4}-\d{4}-\d{4}-\d{4}",
-    "email": r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+",
+    # Only tried at the start of a run of address characters; see PII_CONTINUATION_REGEX
+    "email": r"(?<![a-zA-Z0-9_.+-])" + EMAIL_ADDRESS_PATTERN,
     "phone": r"\(\d{3}\) \d{3}-\d{4}"
 }
 
@@ -37,6 +41,41 @@ PII_REPLACEMENTS = {
 }
 
 
+def _compile_pii_regex(email_pattern):
+    """
+    Compiles all PII patterns into one expression, so a string is masked in a single pass.
+    The patterns starting with a digit or parenthesis are grouped behind a lookahead, so
+    positions that cannot start them skip straight to the email pattern.
+    """
+    return re.compile(
+        r"(?=[\d(])(?:{})|{}".format(
+            "|".join(
+                f"(?P<{pii_type}>{PII_PATTERNS[pii_type]})"
+                for pii_type in ("credit_card", "ssn", "phone")
+            ),
+            f"(?P<email>{email_pattern})"
+        )
+    )
+
+
+PII_REGEX = _compile_pii_regex(PII_PATTERNS["email"])
+
+# Tried once where the previous match ended, so an email directly following another match
+# (as in "123-45-6789john@example.com") is masked even though it starts mid-word
+PII_CONTINUATION_REGEX = _compile_pii_regex(EMAIL_ADDRESS_PATTERN)
+
+# Every PII pattern needs a digit or an '@'; strings without either are returned as is
+PII_TRIGGER_REGEX = re.compile(r"[\d@]")
+
+# Keys whose values are always redacted, compared in lowercase
+SENSITIVE_KEYS = frozenset(('password', 'ssn', 'social_security_number', 'credit_card', 'card_number'))
+
+# Limits on the nested data masked; anything beyond them is logged as TRUNCATED_VALUE
+PII_MAX_DEPTH = 10
+PII_MAX_ITEMS = 1000
+TRUNCATED_VALUE = '[TRUNCATED]'
+
+
 class JsonFormatter(logging.Formatter):
     """
     Custom log formatter that outputs logs in JSON format for structured logging.
@@ -151,13 +190,6 @@ class PiiFilter(logging.Filter):
     Filter that masks PII in log messages.
     """
     
-    def __init__(self):
-        """Initialize the PII filter."""
-        super().__init__()
-        self.patterns = {
-            key: re.compile(pattern) for key, pattern in PII_PATTERNS.items()
-        }
-    
     def filter(self, record):
         """
         Mask PII in the log record.
@@ -176,7 +208,7 @@ class PiiFilter(logging.Filter):
         if record.args:
             masked_args = []
             for arg in record.args:
-                if isinstance(arg, (str, dict)):
+                if isinstance(arg, (str, dict, list, tuple)):
                     masked_args.append(mask_pii(arg))
                 else:
                     masked_args.append(arg)
@@ -295,42 +327,101 @@ def get_audit_logger():
     return logger
 
 
-def mask_pii(data):
+def _mask_string(value):
+    """
+    Masks PII in a string, scanning it once with PII_REGEX.
+    """
+    parts = []
+    position = 0
+    match = PII_REGEX.search(value)
+    while match:
+        parts.append(value[position:match.start()])
+        parts.append(PII_REPLACEMENTS[match.lastgroup])
+        position = match.end()
+        match = (
+            PII_CONTINUATION_REGEX.match(value, position)
+            or PII_REGEX.search(value, position)
+        )
+    if not parts:
+        return value
+    parts.append(value[position:])
+    return ''.join(parts)
+
+
+def mask_pii(data, _depth=0):
     """
     Mask personally identifiable information in log data.
     
+    Strings are masked in a single pass of PII_REGEX. Dictionaries, lists and tuples are
+    masked recursively; values of sensitive keys are redacted entirely. Nesting deeper than
+    PII_MAX_DEPTH, and items past the first PII_MAX_ITEMS of a container, are replaced with
+    TRUNCATED_VALUE rather than logged unmasked.
+    
     Args:
-        data (dict or str): Data to mask
+        data (dict, list, tuple or str): Data to mask
         
     Returns:
-        dict or str: Data with PII masked
+        dict, list, tuple or str: Data with PII masked
     """
     if isinstance(data, str):
-        # Apply regex replacements
-        result = data
-        for pii_type, pattern in PII_PATTERNS.items():
-            replacement = PII_REPLACEMENTS.get(pii_type)
-            if replacement:
-                result = re.sub(pattern, replacement, result)
-        return result
+        # Fast path: without a digit or an '@' no pattern can match
+        if not PII_TRIGGER_REGEX.search(data):
+            return data
+        return _mask_string(data)
     
     elif isinstance(data, dict):
+        if _depth >= PII_MAX_DEPTH:
+            return TRUNCATED_VALUE
+        
         # Process dictionary recursively
         result = {}
-        for key, value in data.items():
+        for index, (key, value) in enumerate(data.items()):
+            if index >= PII_MAX_ITEMS:
+                result[TRUNCATED_VALUE] = len(data) - PII_MAX_ITEMS
+                break
             # Completely redact sensitive keys
-            if key.lower() in ('password', 'ssn', 'social_security_number', 'credit_card', 'card_number'):
+            if isinstance(key, str) and key.lower() in SENSITIVE_KEYS:
                 result[key] = '[REDACTED]'
-            # Recursively process nested dictionaries
-            elif isinstance(value, dict):
-                result[key] = mask_pii(value)
-            # Process strings
-            elif isinstance(value, str):
-                result[key] = mask_pii(value)
-            # Keep other types as is
             else:
-                result[key] = value
+                result[key] = mask_pii(value, _depth + 1)
         return result
     
+    elif isinstance(data, (list, tuple)):
+        if _depth >= PII_MAX_DEPTH:
+            return TRUNCATED_VALUE
+        
+        result = [mask_pii(value, _depth + 1) for value in data[:PII_MAX_ITEMS]]
+        if len(data) > PII_MAX_ITEMS:
+            result.append(TRUNCATED_VALUE)
+        return result if isinstance(data, list) else tuple(result)
+    
     # Return other types unchanged
-    return data
\ No newline at end of file
+    return data
+
+
+def getLogger(name=None):
+    """
+    Get a standard logger for a module logging through these utilities.
+    
+    Args:
+        name (str): Name of the logger, usually the module's __name__
+        
+    Returns:
+        logging.Logger: Logger instance
+    """
+    return logging.getLogger(name)
+
+
+def log_exception(exception):
+    """
+    Log an application exception with PII masked from its message.
+    
+    Args:
+        exception (Exception): The exception being raised
+    """
+    message = getattr(exception, 'message', str(exception))
+    logger.warning("%s: %s", type(exception).__name__, mask_pii(message))
+
+
+# Shared logger for modules without a logger of their own
+logger = getLogger('loan_management')
@@ -4,18 +4,73 @@ Utility module for document storage operations using AWS S3.
 This module provides a unified interface for document storage, retrieval, and management
 in the loan management system. It supports secure storage with encryption, versioning,
 and temporary access via presigned URLs.
+
+Large objects are uploaded and downloaded in parts transferred in parallel, and all
+S3Storage instances in a process share one S3 client per region and endpoint, so they
+share its connection pool. Set S3_ENDPOINT_URL to use an S3-compatible store such as
+MinIO or a moto server.
+
+Presigned URLs are cached per process and reused while they still have most of their
+requested validity left, so listing many documents does not sign a URL per row.
 """
 
 import boto3  # version 1.26.0+
+import functools
+import io
+import itertools
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import uuid
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from utils.logging import getLogger
 
 # Configure logger
 logger = getLogger('storage')
 
+# S3 rejects multipart parts smaller than 5 MiB, except for the last part
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+# Default part size for streamed multipart uploads (8 MiB)
+DEFAULT_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# Default size of the chunks read from a streamed object body (64 KiB)
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Part size for multipart transfers; smaller objects are sent in a single request
+S3_TRANSFER_CHUNK_SIZE = int(os.environ.get('S3_TRANSFER_CHUNK_SIZE', DEFAULT_MULTIPART_PART_SIZE))
+
+# Number of parts of one object transferred at the same time
+S3_TRANSFER_MAX_CONCURRENCY = int(os.environ.get('S3_TRANSFER_MAX_CONCURRENCY', 8))
+
+# Connections kept open by each shared S3 client
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get('S3_MAX_POOL_CONNECTIONS', 50))
+
+# Endpoint of an S3-compatible store (default: None, AWS S3)
+S3_ENDPOINT_URL = os.environ.get('S3_ENDPOINT_URL') or None
+
+# DeleteObjects accepts at most 1000 keys per request
+MAX_DELETE_BATCH_SIZE = 1000
+
+# ListObjectsV2 returns at most 1000 keys per page
+MAX_LIST_PAGE_SIZE = 1000
+
+# Most presigned URLs kept in the process-wide cache
+PRESIGNED_URL_CACHE_SIZE = int(os.environ.get('PRESIGNED_URL_CACHE_SIZE', 10000))
+
+# Share of a presigned URL's validity during which a cached URL is handed out again
+PRESIGNED_URL_REUSE_FRACTION = 0.1
+
+# Process-wide storage for the default bucket, created on first use
+_default_storage = None
+_default_storage_lock = threading.Lock()
+
 
 class StorageError(Exception):
     """
@@ -45,6 +100,29 @@ class StorageError(Exception):
         return self.message
 
 
+@functools.lru_cache(maxsize=None)
+def get_s3_client(region_name, endpoint_url=None):
+    """
+    Get the process-wide S3 client for a region and endpoint.
+
+    boto3 clients are thread-safe, so every S3Storage instance shares one client and its
+    connection pool instead of creating its own.
+
+    Args:
+        region_name (str): AWS region name
+        endpoint_url (str): Endpoint of an S3-compatible store (default: None, AWS S3)
+
+    Returns:
+        botocore.client.S3: The shared client
+    """
+    config = Config(
+        max_pool_connections=max(S3_MAX_POOL_CONNECTIONS, S3_TRANSFER_MAX_CONCURRENCY),
+        retries={'max_attempts': 5, 'mode': 'standard'},
+        tcp_keepalive=True
+    )
+    return boto3.client('s3', region_name=region_name, endpoint_url=endpoint_url, config=config)
+
+
 def generate_presigned_url(bucket_name, object_key, expiration=3600, region_name=None, version_id=None):
     """
     Generate a presigned URL for temporary access to a document in S3.
@@ -63,7 +141,7 @@ def generate_presigned_url(bucket_name, object_key, expiration=3600, region_name
         StorageError: If URL generation fails
     """
     try:
-        s3_client = boto3.client('s3', region_name=region_name)
+        s3_client = get_s3_client(region_name, S3_ENDPOINT_URL)
         params = {
             'Bucket': bucket_name,
             'Key': object_key,
@@ -82,30 +160,481 @@ def generate_presigned_url(bucket_name, object_key, expiration=3600, region_name
         raise StorageError(error_message, e)
 
 
+def _get_size(file_obj):
+    """
+    Determine the number of bytes left to read from content passed to S3Storage.store.
+
+    Args:
+        file_obj: Bytes, string or file-like object
+
+    Returns:
+        int: Remaining size in bytes, or None if it cannot be determined without reading
+    """
+    if isinstance(file_obj, (bytes, bytearray)):
+        return len(file_obj)
+    if isinstance(file_obj, str):
+        return len(file_obj.encode('utf-8'))
+    try:
+        position = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell() - position
+        file_obj.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _as_file(file_obj):
+    """
+    Wrap bytes or a string in a file-like object for the transfer manager.
+
+    Args:
+        file_obj: Bytes, string or file-like object
+
+    Returns:
+        File-like object with a read method
+    """
+    if isinstance(file_obj, str):
+        file_obj = file_obj.encode('utf-8')
+    if isinstance(file_obj, (bytes, bytearray)):
+        return io.BytesIO(file_obj)
+    return file_obj
+
+
+class PresignedUrlCache:
+    """
+    Bounded, process-wide cache of presigned download URLs.
+
+    Signing is local, but it is repeated for every row of a list response. URLs are keyed
+    by bucket, key, version and requested expiration, plus the expiry bucket: the window of
+    expiration * reuse_fraction seconds in which the URL was requested. A URL is only handed
+    out within its own window, so it always has at least (1 - reuse_fraction) of the
+    requested validity left.
+    """
+
+    def __init__(self, max_entries=PRESIGNED_URL_CACHE_SIZE, reuse_fraction=PRESIGNED_URL_REUSE_FRACTION):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Most URLs kept; the least recently used are dropped first
+            reuse_fraction (float): Share of the validity during which a URL is reused
+        """
+        self.max_entries = max_entries
+        self.reuse_fraction = reuse_fraction
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_url(self, bucket_name, key, expiration, sign, version_id=None):
+        """
+        Return a cached URL for an object, signing a new one if needed.
+
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            key (str): Object key (path) in S3
+            expiration (int): Requested validity in seconds
+            sign (callable): Called with the key to sign a new URL
+            version_id (str): Specific version of the object (default: None, latest version)
+
+        Returns:
+            str: Presigned URL
+        """
+        return self.get_urls(bucket_name, [key], expiration, sign, version_id=version_id)[key]
+
+    def get_urls(self, bucket_name, keys, expiration, sign, version_id=None):
+        """
+        Return URLs for many objects, signing only those not cached.
+
+        Args:
+            bucket_name (str): Name of the S3 bucket
+            keys (iterable): Object keys (paths) in S3
+            expiration (int): Requested validity in seconds
+            sign (callable): Called with each uncached key to sign a new URL
+            version_id (str): Specific version of the objects (default: None, latest version)
+
+        Returns:
+            dict: Maps each key to its presigned URL
+        """
+        window = max(int(expiration * self.reuse_fraction), 1)
+        expiry_bucket = int(time.time() // window)
+        cache_keys = {
+            key: (bucket_name, key, version_id, expiration, expiry_bucket)
+            for key in keys
+        }
+
+        urls = {}
+        with self._lock:
+            for key, cache_key in cache_keys.items():
+                url = self._urls.get(cache_key)
+                if url is not None:
+                    self._urls.move_to_end(cache_key)
+                    urls[key] = url
+
+        # Sign outside the lock; a concurrent request may sign the same URL, which is harmless
+        signed = {key: sign(key) for key in cache_keys if key not in urls}
+        if signed:
+            with self._lock:
+                for key, url in signed.items():
+                    self._urls[cache_keys[key]] = url
+                while len(self._urls) > self.max_entries:
+                    self._urls.popitem(last=False)
+            urls.update(signed)
+
+        return urls
+
+    def clear(self):
+        """Drop all cached URLs."""
+        with self._lock:
+            self._urls.clear()
+
+
+# Process-wide presigned URL cache shared by all S3Storage instances
+presigned_url_cache = PresignedUrlCache()
+
+
+class S3MultipartWriter:
+    """
+    Writable file-like object that streams data to S3 through a multipart upload.
+
+    Writes are buffered in memory until a part is full. Full parts are uploaded by a pool of
+    max_concurrency threads while writing continues, and a write waits when that many parts
+    are in flight, so at most max_concurrency + 1 parts are held in memory regardless of the
+    total object size. The upload is completed on close() and aborted by abort() or when the
+    writer is used as a context manager and an error occurs.
+    """
+
+    def __init__(self, s3_client, bucket_name, key, content_type=None, encrypt=True, metadata=None,
+                 part_size=DEFAULT_MULTIPART_PART_SIZE, max_concurrency=1):
+        """
+        Initialize the writer and start the multipart upload.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket_name (str): Name of the S3 bucket
+            key (str): Object key (path) in S3
+            content_type (str): MIME type of the object (default: None)
+            encrypt (bool): Whether to encrypt the object (default: True)
+            metadata (dict): Additional metadata to store with the object (default: None)
+            part_size (int): Size of each uploaded part in bytes (default: 8 MiB, minimum: 5 MiB)
+            max_concurrency (int): Number of parts uploaded at the same time (default: 1, sequential)
+
+        Raises:
+            StorageError: If the multipart upload cannot be started
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.part_size = max(part_size, MIN_MULTIPART_PART_SIZE)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.bytes_written = 0
+        self.closed = False
+        self._buffer = io.BytesIO()
+        self._parts = []
+        self._part_count = 0
+        self._pending = []
+        self._executor = None
+
+        params = {
+            'Bucket': bucket_name,
+            'Key': key
+        }
+
+        if content_type:
+            params['ContentType'] = content_type
+
+        if metadata:
+            params['Metadata'] = metadata
+
+        if encrypt:
+            params['ServerSideEncryption'] = 'AES256'
+
+        try:
+            response = self.s3_client.create_multipart_upload(**params)
+            self.upload_id = response['UploadId']
+            logger.info(f"Started multipart upload of {key} to bucket {bucket_name}")
+        except ClientError as e:
+            error_message = f"Failed to start multipart upload of {key} to bucket {bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+    def write(self, data):
+        """
+        Buffer data and upload a part each time the buffer reaches the part size.
+
+        Args:
+            data (bytes): Data to write
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            StorageError: If the writer is closed or a part upload fails
+        """
+        if self.closed:
+            raise StorageError(f"Cannot write to closed multipart upload of {self.key}")
+
+        self._buffer.write(data)
+        self.bytes_written += len(data)
+
+        if self._buffer.tell() >= self.part_size:
+            self._upload_part()
+
+        return len(data)
+
+    def close(self):
+        """
+        Upload any buffered data and complete the multipart upload.
+
+        Returns:
+            dict: Dictionary containing object key, URL, and version ID
+
+        Raises:
+            StorageError: If completing the upload fails
+        """
+        if self.closed:
+            return None
+
+        try:
+            # S3 requires at least one part, so an empty object is uploaded as one empty part
+            if self._buffer.tell() or not self._part_count:
+                self._upload_part()
+
+            # Wait for the parts still in flight
+            while self._pending:
+                self._parts.append(self._pending.pop(0).result())
+            self._shutdown_executor()
+
+            response = self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={'Parts': sorted(self._parts, key=lambda part: part['PartNumber'])}
+            )
+            self.closed = True
+        except StorageError:
+            self.abort()
+            raise
+        except ClientError as e:
+            self.abort()
+            error_message = f"Failed to complete multipart upload of {self.key} to bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+        logger.info(
+            f"Successfully stored object {self.key} in bucket {self.bucket_name} "
+            f"({self.bytes_written} bytes in {len(self._parts)} parts)"
+        )
+        return {
+            'key': self.key,
+            'url': f"s3://{self.bucket_name}/{self.key}",
+            'version_id': response.get('VersionId')
+        }
+
+    def abort(self):
+        """
+        Abort the multipart upload so S3 discards the parts uploaded so far.
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        self._buffer = io.BytesIO()
+
+        # Stop queued parts and let running ones finish before S3 discards the upload
+        for future in self._pending:
+            future.cancel()
+        self._pending = []
+        self._shutdown_executor()
+
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                UploadId=self.upload_id
+            )
+            logger.info(f"Aborted multipart upload of {self.key} to bucket {self.bucket_name}")
+        except ClientError as e:
+            logger.error(f"Failed to abort multipart upload of {self.key}: {str(e)}")
+
+    def writable(self):
+        """Return True; the writer only supports writing."""
+        return True
+
+    def tell(self):
+        """Return the number of bytes written so far."""
+        return self.bytes_written
+
+    def flush(self):
+        """No-op; buffered data is uploaded when a part fills or on close()."""
+
+    def _upload_part(self):
+        """
+        Upload the buffered data as the next part and reset the buffer.
+
+        With max_concurrency above one, the part is handed to the upload threads, waiting
+        first for the oldest part in flight if all threads are busy.
+
+        Raises:
+            StorageError: If the part upload, or an earlier part still in flight, fails
+        """
+        self._part_count += 1
+        part_number = self._part_count
+        body = self._buffer.getvalue()
+        self._buffer = io.BytesIO()
+
+        if self.max_concurrency == 1:
+            self._parts.append(self._send_part(part_number, body))
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        while len(self._pending) >= self.max_concurrency:
+            self._parts.append(self._pending.pop(0).result())
+        self._pending.append(self._executor.submit(self._send_part, part_number, body))
+
+    def _send_part(self, part_number, body):
+        """
+        Send one part to S3.
+
+        Args:
+            part_number (int): Position of the part in the object, starting at 1
+            body (bytes): Content of the part
+
+        Returns:
+            dict: The part's ETag and number, as complete_multipart_upload expects them
+
+        Raises:
+            StorageError: If the part upload fails
+        """
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=self.key,
+                UploadId=self.upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+        except ClientError as e:
+            error_message = f"Failed to upload part {part_number} of {self.key} to bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    def _shutdown_executor(self):
+        """Stop the upload threads, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        """Return the writer for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Complete the upload on success, or abort it if the block raised."""
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
+
+
+class S3ObjectStream:
+    """
+    An S3 object opened for streaming, with the HTTP semantics of the GET that opened it.
+
+    status_code is 200 for a full object, 206 for a byte range, 304 when the object still
+    matches the ETag the client sent and 416 when the requested range is not satisfiable;
+    only 200 and 206 streams have a body.
+    """
+
+    def __init__(self, status_code, body=None, content_type=None, content_length=None, content_range=None,
+                 etag=None, version_id=None, last_modified=None):
+        """
+        Initialize the stream.
+
+        Args:
+            status_code (int): HTTP status of the read
+            body: botocore StreamingBody, or None when there is no content
+            content_type (str): MIME type of the object
+            content_length (int): Number of bytes in the body
+            content_range (str): Content-Range of a partial read, e.g. 'bytes 0-99/1000'
+            etag (str): ETag of the object, without quotes
+            version_id (str): Version of the object read
+            last_modified (datetime): Last modification time of the object
+        """
+        self.status_code = status_code
+        self.body = body
+        self.content_type = content_type
+        self.content_length = content_length
+        self.content_range = content_range
+        self.etag = etag
+        self.version_id = version_id
+        self.last_modified = last_modified
+
+    def iter_chunks(self, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Yields the body in chunks and closes it once read or abandoned.
+
+        Args:
+            chunk_size (int): Maximum size of each chunk in bytes (default: 64 KiB)
+
+        Yields:
+            bytes: The next chunk of the body
+        """
+        if self.body is None:
+            return
+        try:
+            for chunk in self.body.iter_chunks(chunk_size):
+                if chunk:
+                    yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        """Releases the underlying HTTP connection"""
+        if self.body is not None:
+            self.body.close()
+
+
 class S3Storage:
     """
     Class providing a unified interface for S3 storage operations.
     
     This class implements methods for storing, retrieving, and managing documents in S3,
-    with support for versioning, encryption, and access control.
+    with support for versioning, encryption, and access control. Objects larger than the
+    chunk size are uploaded and downloaded in parts, max_concurrency parts at a time.
     """
     
-    def __init__(self, bucket_name=None, region_name=None):
+    def __init__(self, bucket_name=None, region_name=None, chunk_size=None, max_concurrency=None,
+                 endpoint_url=None):
         """
         Initialize the S3Storage with AWS credentials and configuration.
         
         Args:
             bucket_name (str): Name of the S3 bucket (default: from environment)
             region_name (str): AWS region name (default: from environment or 'us-east-1')
+            chunk_size (int): Part size for multipart transfers in bytes (default: S3_TRANSFER_CHUNK_SIZE)
+            max_concurrency (int): Parts transferred at the same time (default: S3_TRANSFER_MAX_CONCURRENCY)
+            endpoint_url (str): Endpoint of an S3-compatible store (default: S3_ENDPOINT_URL)
         """
         self.bucket_name = bucket_name or os.environ.get('S3_BUCKET_NAME')
         if not self.bucket_name:
             raise ValueError("S3 bucket name must be provided or set in S3_BUCKET_NAME environment variable")
             
         self.region_name = region_name or os.environ.get('AWS_REGION', 'us-east-1')
+        self.endpoint_url = endpoint_url or S3_ENDPOINT_URL
+        self.chunk_size = max(chunk_size or S3_TRANSFER_CHUNK_SIZE, MIN_MULTIPART_PART_SIZE)
+        self.max_concurrency = max(max_concurrency or S3_TRANSFER_MAX_CONCURRENCY, 1)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=self.chunk_size,
+            multipart_chunksize=self.chunk_size,
+            max_concurrency=self.max_concurrency
+        )
         
         try:
-            self.s3_client = boto3.client('s3', region_name=self.region_name)
+            self.s3_client = get_s3_client(self.region_name, self.endpoint_url)
             logger.info(f"Initialized S3Storage with bucket: {self.bucket_name}, region: {self.region_name}")
         except ClientError as e:
             error_message = f"Failed to initialize S3 client: {str(e)}"
@@ -115,6 +644,9 @@ class S3Storage:
     def store(self, file_obj, key, content_type=None, encrypt=True, metadata=None):
         """
         Store a file in S3 with optional encryption and metadata.
+
+        Content up to the chunk size is sent in one request; larger files, and file objects
+        of unknown size, are uploaded in parts in parallel.
         
         Args:
             file_obj: File-like object or bytes to store
@@ -130,22 +662,26 @@ class S3Storage:
             StorageError: If file storage fails
         """
         try:
-            params = {
-                'Bucket': self.bucket_name,
-                'Key': key,
-                'Body': file_obj
-            }
+            extra_args = {}
             
             if content_type:
-                params['ContentType'] = content_type
+                extra_args['ContentType'] = content_type
                 
             if metadata:
-                params['Metadata'] = metadata
+                extra_args['Metadata'] = metadata
                 
             if encrypt:
-                params['ServerSideEncryption'] = 'AES256'
-                
-            response = self.s3_client.put_object(**params)
+                extra_args['ServerSideEncryption'] = 'AES256'
+
+            size = _get_size(file_obj)
+            if size is not None and size <= self.chunk_size:
+                response = self.s3_client.put_object(Bucket=self.bucket_name, Key=key, Body=file_obj, **extra_args)
+            else:
+                self.s3_client.upload_fileobj(
+                    _as_file(file_obj), self.bucket_name, key, ExtraArgs=extra_args, Config=self.transfer_config
+                )
+                # upload_fileobj does not return the response, so read the version from the object
+                response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
             
             result = {
                 'key': key,
@@ -155,11 +691,41 @@ class S3Storage:
             
             logger.info(f"Successfully stored object {key} in bucket {self.bucket_name}")
             return result
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             error_message = f"Failed to store object {key} in bucket {self.bucket_name}: {str(e)}"
             logger.error(error_message)
             raise StorageError(error_message, e)
     
+    def open_multipart_upload(self, key, content_type=None, encrypt=True, metadata=None,
+                              part_size=None, max_concurrency=None):
+        """
+        Open a streaming multipart upload for an object of unknown or large size.
+
+        Args:
+            key (str): Object key (path) in S3
+            content_type (str): MIME type of the file (default: None)
+            encrypt (bool): Whether to encrypt the file (default: True)
+            metadata (dict): Additional metadata to store with the file (default: None)
+            part_size (int): Size of each uploaded part in bytes (default: the chunk size)
+            max_concurrency (int): Parts uploaded at the same time (default: the storage's max_concurrency)
+
+        Returns:
+            S3MultipartWriter: Writable file-like object; close() completes the upload
+
+        Raises:
+            StorageError: If the multipart upload cannot be started
+        """
+        return S3MultipartWriter(
+            self.s3_client,
+            self.bucket_name,
+            key,
+            content_type=content_type,
+            encrypt=encrypt,
+            metadata=metadata,
+            part_size=part_size or self.chunk_size,
+            max_concurrency=max_concurrency or self.max_concurrency
+        )
+
     def retrieve(self, key, version_id=None):
         """
         Retrieve a file from S3 by its key.
@@ -195,7 +761,134 @@ class S3Storage:
             error_message = f"Failed to retrieve object {key} from bucket {self.bucket_name}: {str(e)}"
             logger.error(error_message)
             raise StorageError(error_message, e)
-    
+
+    def download(self, key, file_obj, version_id=None):
+        """
+        Download a file from S3 into a file-like object.
+
+        Objects larger than the chunk size are fetched as parallel ranged requests, so this
+        is the fastest way to copy a large object to a local file.
+
+        Args:
+            key (str): Object key (path) in S3
+            file_obj: Writable binary file-like object; must be seekable for parallel downloads
+            version_id (str): Specific version of the object (default: None, latest version)
+
+        Returns:
+            bool: True if the download was successful
+
+        Raises:
+            StorageError: If the download fails
+        """
+        try:
+            extra_args = {'VersionId': version_id} if version_id else None
+            self.s3_client.download_fileobj(
+                self.bucket_name, key, file_obj, ExtraArgs=extra_args, Config=self.transfer_config
+            )
+            logger.info(f"Successfully downloaded object {key} from bucket {self.bucket_name}")
+            return True
+        except ClientError as e:
+            error_message = f"Failed to download object {key} from bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+    def open_stream(self, key, version_id=None, byte_range=None, if_none_match=None):
+        """
+        Open an object for streaming without reading its content into memory.
+
+        Args:
+            key (str): Object key (path) in S3
+            version_id (str): Specific version of the object (default: None, latest version)
+            byte_range (str): HTTP Range to read, e.g. 'bytes=0-1023' (default: None, whole object)
+            if_none_match (str): ETag the caller already has; a match returns a 304 stream
+
+        Returns:
+            S3ObjectStream: The opened object; the caller must read it to the end or close it
+
+        Raises:
+            StorageError: If the object cannot be opened
+        """
+        params = {
+            'Bucket': self.bucket_name,
+            'Key': key
+        }
+
+        if version_id:
+            params['VersionId'] = version_id
+
+        if byte_range:
+            params['Range'] = byte_range
+
+        if if_none_match:
+            params['IfNoneMatch'] = if_none_match
+
+        try:
+            response = self.s3_client.get_object(**params)
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            status_code = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+
+            # Conditional and range failures are answers, not errors
+            if status_code == 304 or error.get('Code') in ('304', 'NotModified'):
+                return S3ObjectStream(304, etag=(if_none_match or '').strip('"'), version_id=version_id)
+            if error.get('Code') == 'InvalidRange':
+                object_size = error.get('ActualObjectSize')
+                return S3ObjectStream(416, content_range=f"bytes */{object_size}" if object_size else None)
+
+            error_message = f"Failed to open object {key} from bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+        content_range = response.get('ContentRange')
+        return S3ObjectStream(
+            206 if content_range else 200,
+            body=response['Body'],
+            content_type=response.get('ContentType'),
+            content_length=response.get('ContentLength'),
+            content_range=content_range,
+            etag=response.get('ETag', '').strip('"'),
+            version_id=response.get('VersionId'),
+            last_modified=response.get('LastModified')
+        )
+
+    def get_object_info(self, key, version_id=None):
+        """
+        Get an object's version, ETag and size without downloading its content.
+
+        Args:
+            key (str): Object key (path) in S3
+            version_id (str): Specific version of the object (default: None, latest version)
+
+        Returns:
+            dict: Dictionary containing version ID, ETag, content type, size and last modified time
+
+        Raises:
+            StorageError: If the object cannot be found or read
+        """
+        try:
+            params = {
+                'Bucket': self.bucket_name,
+                'Key': key
+            }
+
+            if version_id:
+                params['VersionId'] = version_id
+
+            response = self.s3_client.head_object(**params)
+
+            return {
+                'key': key,
+                'version_id': response.get('VersionId'),
+                'etag': response.get('ETag', '').strip('"'),
+                'content_type': response.get('ContentType'),
+                'size': response.get('ContentLength'),
+                'last_modified': response.get('LastModified')
+            }
+        except ClientError as e:
+            error_message = f"Failed to get info for object {key} in bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
     def delete(self, key, version_id=None):
         """
         Delete a file from S3 by its key.
@@ -228,9 +921,59 @@ class S3Storage:
             logger.error(error_message)
             raise StorageError(error_message, e)
     
+    def delete_many(self, keys, batch_size=MAX_DELETE_BATCH_SIZE):
+        """
+        Delete many files from S3 with batched DeleteObjects requests.
+
+        Args:
+            keys (iterable): Object keys (paths) in S3
+            batch_size (int): Keys deleted per request (default and maximum: 1000)
+
+        Returns:
+            dict: Lists of 'deleted' keys and of 'errors', each error a dict with the key,
+                the S3 error code and message
+
+        Raises:
+            StorageError: If a delete request fails as a whole
+        """
+        batch_size = min(max(batch_size, 1), MAX_DELETE_BATCH_SIZE)
+        deleted = []
+        errors = []
+        keys = iter(keys)
+
+        try:
+            while True:
+                batch = list(itertools.islice(keys, batch_size))
+                if not batch:
+                    break
+
+                # Quiet mode only reports the keys that could not be deleted
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                failed = {error['Key'] for error in response.get('Errors', [])}
+                errors.extend(
+                    {'key': error['Key'], 'code': error.get('Code'), 'message': error.get('Message')}
+                    for error in response.get('Errors', [])
+                )
+                deleted.extend(key for key in batch if key not in failed)
+        except ClientError as e:
+            error_message = f"Failed to delete objects from bucket {self.bucket_name}: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+        if errors:
+            logger.warning(f"Failed to delete {len(errors)} objects from bucket {self.bucket_name}")
+        logger.info(f"Successfully deleted {len(deleted)} objects from bucket {self.bucket_name}")
+        return {'deleted': deleted, 'errors': errors}
+
     def get_presigned_url(self, key, expiration=3600, version_id=None):
         """
         Generate a presigned URL for temporary access to a file.
+
+        A URL signed shortly before for the same object and expiration is returned from
+        the presigned URL cache instead of signing a new one.
         
         Args:
             key (str): Object key (path) in S3
@@ -244,11 +987,17 @@ class S3Storage:
             StorageError: If URL generation fails
         """
         try:
-            return generate_presigned_url(
-                self.bucket_name, 
-                key, 
-                expiration=expiration, 
-                region_name=self.region_name,
+            return presigned_url_cache.get_url(
+                self.bucket_name,
+                key,
+                expiration,
+                lambda object_key: generate_presigned_url(
+                    self.bucket_name, 
+                    object_key, 
+                    expiration=expiration, 
+                    region_name=self.region_name,
+                    version_id=version_id
+                ),
                 version_id=version_id
             )
         except StorageError as e:
@@ -259,48 +1008,98 @@ class S3Storage:
             logger.error(error_message)
             raise StorageError(error_message, e)
     
-    def list(self, prefix=None, max_items=1000):
+    def get_presigned_urls(self, keys, expiration=3600):
         """
-        List objects in S3 with an optional prefix.
-        
+        Generate presigned URLs for many files at once, e.g. for a page of a list response.
+
         Args:
-            prefix (str): Prefix to filter objects (default: None, list all)
-            max_items (int): Maximum number of items to return (default: 1000)
-            
+            keys (iterable): Object keys (paths) in S3; empty keys are skipped
+            expiration (int): URL expiration time in seconds (default: 3600)
+
         Returns:
-            list: List of dictionaries containing object keys and metadata
-            
+            dict: Maps each key to its presigned URL
+
+        Raises:
+            StorageError: If URL generation fails
+        """
+        try:
+            return presigned_url_cache.get_urls(
+                self.bucket_name,
+                {key for key in keys if key},
+                expiration,
+                lambda object_key: generate_presigned_url(
+                    self.bucket_name,
+                    object_key,
+                    expiration=expiration,
+                    region_name=self.region_name
+                )
+            )
+        except StorageError as e:
+            raise e
+        except Exception as e:
+            error_message = f"Failed to generate presigned URLs: {str(e)}"
+            logger.error(error_message)
+            raise StorageError(error_message, e)
+
+    def iter_objects(self, prefix=None, page_size=MAX_LIST_PAGE_SIZE):
+        """
+        Iterate over the objects in S3 with an optional prefix, one page at a time.
+
+        Pages are requested as the iteration reaches them, so any number of objects can be
+        listed without holding them all in memory.
+
+        Args:
+            prefix (str): Prefix to filter objects (default: None, list all)
+            page_size (int): Objects requested per page (default and maximum: 1000)
+
+        Yields:
+            dict: Object key and metadata
+
         Raises:
             StorageError: If listing fails
         """
+        params = {
+            'Bucket': self.bucket_name,
+            'PaginationConfig': {'PageSize': min(max(page_size, 1), MAX_LIST_PAGE_SIZE)}
+        }
+
+        if prefix:
+            params['Prefix'] = prefix
+
         try:
-            params = {
-                'Bucket': self.bucket_name,
-                'MaxKeys': max_items
-            }
-            
-            if prefix:
-                params['Prefix'] = prefix
-                
-            response = self.s3_client.list_objects_v2(**params)
-            
-            result = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    result.append({
+            for page in self.s3_client.get_paginator('list_objects_v2').paginate(**params):
+                for obj in page.get('Contents', []):
+                    yield {
                         'key': obj['Key'],
                         'size': obj['Size'],
                         'last_modified': obj['LastModified'].isoformat(),
                         'etag': obj['ETag'].strip('"'),
                         'storage_class': obj.get('StorageClass')
-                    })
-            
-            logger.info(f"Listed {len(result)} objects with prefix '{prefix}' in bucket {self.bucket_name}")
-            return result
+                    }
         except ClientError as e:
             error_message = f"Failed to list objects in bucket {self.bucket_name}: {str(e)}"
             logger.error(error_message)
             raise StorageError(error_message, e)
+
+    def list(self, prefix=None, max_items=1000):
+        """
+        List objects in S3 with an optional prefix.
+        
+        Args:
+            prefix (str): Prefix to filter objects (default: None, list all)
+            max_items (int): Maximum number of items to return (default: 1000, None for all)
+            
+        Returns:
+            list: List of dictionaries containing object keys and metadata
+            
+        Raises:
+            StorageError: If listing fails
+        """
+        page_size = min(max_items, MAX_LIST_PAGE_SIZE) if max_items else MAX_LIST_PAGE_SIZE
+        result = list(itertools.islice(self.iter_objects(prefix, page_size=page_size), max_items))
+
+        logger.info(f"Listed {len(result)} objects with prefix '{prefix}' in bucket {self.bucket_name}")
+        return result
     
     def get_versions(self, key):
         """
@@ -380,4 +1179,54 @@ class S3Storage:
         except ClientError as e:
             error_message = f"Failed to copy object from {source_key} to {destination_key} in bucket {self.bucket_name}: {str(e)}"
             logger.error(error_message)
-            raise StorageError(error_message, e)
\ No newline at end of file
+            raise StorageError(error_message, e)
+
+
+def get_default_storage():
+    """
+    Return the process-wide S3Storage for the default bucket.
+
+    Returns:
+        S3Storage: Storage for the bucket named by S3_BUCKET_NAME
+    """
+    global _default_storage
+    if _default_storage is None:
+        with _default_storage_lock:
+            if _default_storage is None:
+                _default_storage = S3Storage()
+    return _default_storage
+
+
+def get_presigned_url(key, expiration=3600, version_id=None):
+    """
+    Generate a presigned URL for a file in the default bucket.
+
+    Args:
+        key (str): Object key (path) in S3
+        expiration (int): URL expiration time in seconds (default: 3600)
+        version_id (str): Specific version of the object (default: None, latest version)
+
+    Returns:
+        str: Presigned URL for temporary access to the file
+
+    Raises:
+        StorageError: If URL generation fails
+    """
+    return get_default_storage().get_presigned_url(key, expiration, version_id)
+
+
+def get_presigned_urls(keys, expiration=3600):
+    """
+    Generate presigned URLs for many files in the default bucket at once.
+
+    Args:
+        keys (iterable): Object keys (paths) in S3; empty keys are skipped
+        expiration (int): URL expiration time in seconds (default: 3600)
+
+    Returns:
+        dict: Maps each key to its presigned URL
+
+    Raises:
+        StorageError: If URL generation fails
+    """
+    return get_default_storage().get_presigned_urls(keys, expiration)
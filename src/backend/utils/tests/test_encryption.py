@@ -9,10 +9,20 @@ import unittest
 from unittest.mock import patch, MagicMock
 import base64
 
-from ../../utils.encryption import (
+from cryptography.fernet import InvalidToken
+
+from utils.encryption import (
+    _build_cipher,
     generate_key,
     encrypt,
     decrypt,
+    get_cipher,
+    encrypt_many,
+    decrypt_many,
+    needs_reencryption,
+    reencrypt,
+    blind_index,
+    ssn_blind_index,
     encrypt_ssn,
     decrypt_ssn,
     mask_ssn,
@@ -22,7 +32,7 @@ from ../../utils.encryption import (
     decrypt_with_kms,
     EncryptedField
 )
-from ../../utils.constants import SSN_FORMAT, SSN_DISPLAY_FORMAT
+from utils.constants import SSN_FORMAT, SSN_DISPLAY_FORMAT
 
 
 class TestEncryption(unittest.TestCase):
@@ -30,13 +40,22 @@ class TestEncryption(unittest.TestCase):
     
     def setUp(self):
         """Set up test environment before each test."""
-        # Generate a test encryption key
+        # Generate a test encryption key and use it as the default key
         self.test_key = generate_key()
+        key_patch = patch('utils.encryption.ENCRYPTION_KEY', self.test_key)
+        key_patch.start()
+        self.addCleanup(key_patch.stop)
+        # Ciphers are cached by key, so none may outlive the patched key
+        _build_cipher.cache_clear()
         # Set up test data
         self.test_text = "This is a secret message"
         self.test_ssn = "123456789"
         self.test_ssn_formatted = "123-45-6789"
     
+    def tearDown(self):
+        """Clean up test environment after each test."""
+        _build_cipher.cache_clear()
+    
     def test_generate_key(self):
         """Test that generate_key produces a valid Fernet key."""
         key = generate_key()
@@ -217,6 +236,109 @@ class TestEncryption(unittest.TestCase):
         self.assertIsNone(test_model.ssn_field)
         self.assertIsNone(test_model.generic_field)
     
+    def test_encrypted_field_descriptor_decrypts_once(self):
+        """Test that the EncryptedField descriptor reuses the decrypted value."""
+        test_model = TestModelWithEncryptedFields()
+        test_model.generic_field = "Secret value"
+        
+        with patch('utils.encryption.decrypt_field') as mock_decrypt_field:
+            # Reads after setting the value do not decrypt it again
+            self.assertEqual(test_model.generic_field, "Secret value")
+            self.assertEqual(test_model.generic_field, "Secret value")
+            mock_decrypt_field.assert_not_called()
+            
+            # Replacing the stored value directly discards the remembered value
+            mock_decrypt_field.return_value = "Other value"
+            test_model._generic_field = encrypt("Other value")
+            self.assertEqual(test_model.generic_field, "Other value")
+            self.assertEqual(test_model.generic_field, "Other value")
+            mock_decrypt_field.assert_called_once()
+    
+    def test_encrypted_field_descriptor_set_does_not_decrypt(self):
+        """Test that assigning a value remembers it without decrypting it."""
+        test_model = TestModelWithEncryptedFields()
+        
+        with patch('utils.encryption.decrypt', side_effect=AssertionError('decrypted')):
+            test_model.ssn_field = "123456789"
+            test_model.generic_field = "Secret value"
+            
+            # SSNs read back formatted, as decrypt_ssn returns them
+            self.assertEqual(test_model.ssn_field, "123-45-6789")
+            self.assertEqual(test_model.generic_field, "Secret value")
+            
+            test_model.ssn_field = "987-65-4321"
+            self.assertEqual(test_model.ssn_field, "987-65-4321")
+        
+        # The remembered values match what decryption returns
+        self.assertEqual(decrypt_field(test_model._ssn_field, 'ssn'), test_model.ssn_field)
+        self.assertEqual(decrypt_field(test_model._generic_field, 'generic'), test_model.generic_field)
+    
+    def test_get_cipher_is_reused(self):
+        """Test that cipher objects are built once per key."""
+        self.assertIs(get_cipher(self.test_key), get_cipher(self.test_key))
+        self.assertIsNot(get_cipher(self.test_key), get_cipher(generate_key()))
+    
+    def test_get_cipher_without_key(self):
+        """Test that get_cipher fails without a configured key."""
+        with patch('utils.encryption.ENCRYPTION_KEY', None):
+            with self.assertRaises(ValueError):
+                get_cipher()
+    
+    def test_encrypt_many_decrypt_many(self):
+        """Test that values are encrypted and decrypted in bulk, in order."""
+        values = ["first", None, "second", "first"]
+        
+        encrypted_values = encrypt_many(values, self.test_key)
+        
+        self.assertIsNone(encrypted_values[1])
+        self.assertNotEqual(encrypted_values[0], "first")
+        self.assertEqual(decrypt(encrypted_values[2], self.test_key), "second")
+        self.assertEqual(decrypt_many(encrypted_values, self.test_key), values)
+    
+    def test_key_rotation(self):
+        """Test that values encrypted with an old key are readable and re-encrypted."""
+        old_key = generate_key()
+        encrypted_value = encrypt(self.test_text, old_key)
+        
+        with patch('utils.encryption.ENCRYPTION_KEY', self.test_key), \
+                patch('utils.encryption.ENCRYPTION_OLD_KEYS', (old_key,)):
+            # Old values decrypt with the current configuration
+            self.assertEqual(decrypt(encrypted_value), self.test_text)
+            self.assertTrue(needs_reencryption(encrypted_value))
+            
+            rotated_value = reencrypt(encrypted_value)
+            
+            self.assertFalse(needs_reencryption(rotated_value))
+            self.assertFalse(needs_reencryption(encrypt(self.test_text)))
+        
+        # The rotated value no longer depends on the old key
+        self.assertEqual(decrypt(rotated_value, self.test_key), self.test_text)
+        with self.assertRaises(InvalidToken):
+            decrypt(rotated_value, old_key)
+    
+    def test_blind_index(self):
+        """Test that blind indexes are deterministic and depend on the key."""
+        index = blind_index(self.test_text, self.test_key)
+        
+        self.assertEqual(len(index), 64)
+        self.assertEqual(index, blind_index(self.test_text, self.test_key))
+        self.assertNotEqual(index, blind_index("Another message", self.test_key))
+        self.assertNotEqual(index, blind_index(self.test_text, generate_key()))
+        self.assertIsNone(blind_index(None, self.test_key))
+    
+    def test_ssn_blind_index_ignores_formatting(self):
+        """Test that formatted and unformatted SSNs have the same blind index."""
+        self.assertEqual(
+            ssn_blind_index(self.test_ssn_formatted, self.test_key),
+            ssn_blind_index(self.test_ssn, self.test_key)
+        )
+    
+    def test_blind_index_without_key(self):
+        """Test that blind_index fails without a configured key."""
+        with patch('utils.encryption.BLIND_INDEX_KEY', None):
+            with self.assertRaises(ValueError):
+                blind_index(self.test_text)
+    
     @patch('boto3.client')
     def test_kms_encryption_decryption(self, mock_boto3_client):
         """Test AWS KMS encryption and decryption."""
@@ -0,0 +1,228 @@
+"""
+Unit tests and micro-benchmarks for PII masking in the logging utilities.
+
+The tests cover the single-pass masking of strings, the redaction of sensitive keys and
+the limits on nested payloads. The benchmarks, marked slow, time mask_pii on typical
+request and response bodies against the previous one-pass-per-pattern implementation.
+They are deselected by default; run them with `pytest -m slow utils/tests/test_logging.py -s`
+to print the timings.
+"""
+
+import json  # standard library
+import re  # standard library
+import time  # standard library
+
+import pytest  # version 7.3.1
+
+from utils.logging import (
+    mask_pii, EMAIL_ADDRESS_PATTERN, PII_PATTERNS, PII_REPLACEMENTS, PII_MAX_DEPTH, PII_MAX_ITEMS,
+    TRUNCATED_VALUE
+)
+
+# The email pattern before it was anchored, as used by the previous implementation
+LEGACY_EMAIL_PATTERN = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
+
+# Typical request and response bodies logged by RequestLoggingMiddleware
+APPLICATION_BODY = {
+    'borrower': {
+        'first_name': 'John',
+        'last_name': 'Doe',
+        'email': 'john.doe@example.com',
+        'phone': '(555) 123-4567',
+        'ssn': '123-45-6789',
+        'dob': '1990-01-15',
+        'address_line1': '123 Main St',
+        'city': 'Anytown',
+        'state': 'CA',
+        'zip_code': '12345',
+        'housing_status': 'rent',
+        'housing_payment': '1500.00',
+    },
+    'employment': {
+        'employer_name': 'Acme Corporation',
+        'occupation': 'Software Engineer',
+        'annual_income': '85000.00',
+    },
+    'loan_details': {
+        'school_id': '7b0c3f7e-1a2b-4c3d-9e8f-001122334455',
+        'program_id': '1f2e3d4c-5b6a-4978-8695-a4b3c2d1e0f9',
+        'requested_amount': '25000.00',
+        'start_date': '2024-09-01',
+    },
+    'notes': 'Borrower requested a callback in the afternoon',
+}
+APPLICATION_LIST_BODY = {
+    'count': 50,
+    'next': None,
+    'results': [
+        {
+            'id': f'00000000-0000-4000-8000-{index:012d}',
+            'status': 'submitted',
+            'borrower_name': 'Jane Smith',
+            'borrower_email': f'jane.smith{index}@example.com',
+            'school_name': 'Springfield Technical Institute',
+            'requested_amount': '18000.00',
+            'created_at': '2024-05-01T12:00:00Z',
+        }
+        for index in range(50)
+    ],
+}
+LOG_MESSAGE = 'Application status changed from submitted to in_review by underwriter'
+
+
+def mask_pii_multi_pass(value):
+    """
+    Reference implementation: one re.sub pass per pattern, as mask_pii did before.
+    """
+    patterns = dict(PII_PATTERNS, email=LEGACY_EMAIL_PATTERN)
+    for pii_type, pattern in patterns.items():
+        value = re.sub(pattern, PII_REPLACEMENTS[pii_type], value)
+    return value
+
+
+def time_per_call(function, value, repeat=5):
+    """
+    Returns the best average time of a call, in microseconds.
+    """
+    # Calls per repeat, sized from one call so each repeat takes about 50ms
+    start = time.perf_counter()
+    function(value)
+    number = max(1, int(0.05 / max(time.perf_counter() - start, 1e-7)))
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(value)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings) * 1_000_000
+
+
+class TestMaskPii:
+    """Test class for mask_pii"""
+
+    def test_masks_every_pattern_in_one_string(self):
+        """Test that all PII types in a string are masked"""
+        message = 'Email john.doe@example.com, phone (555) 123-4567, SSN 123-45-6789, card 1234-5678-9012-3456'
+
+        assert mask_pii(message) == (
+            'Email ****@****.com, phone (XXX) XXX-****, SSN XXX-XX-****, card XXXX-XXXX-XXXX-****'
+        )
+
+    def test_string_without_pii_is_unchanged(self):
+        """Test that strings without PII are returned as is"""
+        assert mask_pii(LOG_MESSAGE) is LOG_MESSAGE
+        assert mask_pii('Order 12345 shipped') == 'Order 12345 shipped'
+
+    def test_matches_multi_pass_masking(self):
+        """Test that single-pass masking matches masking one pattern at a time"""
+        values = [
+            'Contact jane_doe+loans@mail.example.org or (555) 987-6543',
+            'SSN 987-65-4321 and 1123-45-6789 on file',
+            'Cards 1111-2222-3333-4444,5555-6666-7777-8888',
+            '123-45-6789john@x.com',
+            '1234-5678-9012-3456john@x.com',
+            'a@b.co+c@d.co',
+            json.dumps(APPLICATION_BODY),
+            json.dumps(APPLICATION_LIST_BODY),
+        ]
+
+        for value in values:
+            assert mask_pii(value) == mask_pii_multi_pass(value)
+
+    def test_email_directly_after_another_match_is_masked(self):
+        """Test that an email starting where another match ends is masked"""
+        assert mask_pii('(555) 123-4567john@x.com') == '(XXX) XXX-********@****.com'
+        assert mask_pii('Email a@b.co+c@d.co') == 'Email ****@****.com****@****.com'
+
+    def test_long_words_are_masked_in_linear_time(self):
+        """Test that long runs of address characters do not backtrack"""
+        # The email pattern is only tried at the start of a run, and its runs are possessive
+        assert PII_PATTERNS['email'] == r"(?<![a-zA-Z0-9_.+-])" + EMAIL_ADDRESS_PATTERN
+        assert EMAIL_ADDRESS_PATTERN.startswith(r"[a-zA-Z0-9_.+-]++@[a-zA-Z0-9-]++")
+
+        value = 'a' * 100000 + '1'
+        assert mask_pii(value) == value
+
+    def test_sensitive_keys_are_redacted(self):
+        """Test that sensitive keys are redacted at any level"""
+        masked = mask_pii(APPLICATION_BODY)
+
+        assert masked['borrower']['ssn'] == '[REDACTED]'
+        assert masked['borrower']['email'] == '****@****.com'
+        assert masked['borrower']['phone'] == '(XXX) XXX-****'
+        assert masked['borrower']['first_name'] == 'John'
+        assert masked['loan_details'] == APPLICATION_BODY['loan_details']
+
+    def test_lists_are_masked(self):
+        """Test that values inside lists and tuples are masked"""
+        masked = mask_pii(APPLICATION_LIST_BODY)
+
+        assert masked['count'] == 50
+        assert masked['results'][0]['borrower_email'] == '****@****.com'
+        assert mask_pii(('john@example.com', 5)) == ('****@****.com', 5)
+
+    def test_depth_limit(self):
+        """Test that nesting beyond the depth limit is truncated"""
+        data = {'email': 'john@example.com'}
+        for _ in range(PII_MAX_DEPTH):
+            data = {'nested': data}
+
+        masked = mask_pii(data)
+        for _ in range(PII_MAX_DEPTH):
+            masked = masked['nested']
+
+        assert masked == TRUNCATED_VALUE
+
+    def test_size_limit(self):
+        """Test that items beyond the size limit are truncated"""
+        values = ['john@example.com'] * (PII_MAX_ITEMS + 5)
+
+        masked_list = mask_pii(values)
+        masked_dict = mask_pii({str(index): value for index, value in enumerate(values)})
+
+        assert len(masked_list) == PII_MAX_ITEMS + 1
+        assert masked_list[-1] == TRUNCATED_VALUE
+        assert len(masked_dict) == PII_MAX_ITEMS + 1
+        assert masked_dict[TRUNCATED_VALUE] == 5
+
+
+@pytest.mark.slow
+class TestMaskPiiBenchmark:
+    """Micro-benchmarks of mask_pii on typical log data"""
+
+    @pytest.mark.parametrize('name, value', [
+        ('log_message', LOG_MESSAGE),
+        ('email', 'john.doe@example.com'),
+        ('uuid', '7b0c3f7e-1a2b-4c3d-9e8f-001122334455'),
+        ('application_json', json.dumps(APPLICATION_BODY)),
+        ('application_list_json', json.dumps(APPLICATION_LIST_BODY)),
+    ], ids=['log_message', 'email', 'uuid', 'application_json', 'application_list_json'])
+    def test_string_masking(self, name, value):
+        """Benchmark masking of strings against one pass per pattern"""
+        single_pass = time_per_call(mask_pii, value)
+        multi_pass = time_per_call(mask_pii_multi_pass, value)
+
+        print(f"\n{name}: {single_pass:.2f}us single pass, {multi_pass:.2f}us one pass per pattern")
+        # Loose bound, to catch super-linear regressions rather than machine variance
+        assert single_pass < len(value) * 2
+
+    def test_fast_path(self):
+        """Benchmark that strings without digits or '@' skip the patterns"""
+        fast_path = time_per_call(mask_pii, LOG_MESSAGE)
+        multi_pass = time_per_call(mask_pii_multi_pass, LOG_MESSAGE)
+
+        print(f"\nfast path: {fast_path:.2f}us, {multi_pass:.2f}us one pass per pattern")
+        assert fast_path < multi_pass
+
+    @pytest.mark.parametrize('name, value', [
+        ('application_body', APPLICATION_BODY),
+        ('application_list_body', APPLICATION_LIST_BODY),
+    ], ids=['application_body', 'application_list_body'])
+    def test_body_masking(self, name, value):
+        """Benchmark masking of request and response bodies"""
+        per_call = time_per_call(mask_pii, value)
+
+        print(f"\n{name}: {per_call:.2f}us")
+        # Loose bound, to catch super-linear regressions rather than machine variance
+        assert per_call < len(json.dumps(value)) * 2
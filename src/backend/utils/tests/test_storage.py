@@ -4,12 +4,19 @@ Tests cover file storage, retrieval, deletion, presigned URL generation, and err
 """
 
 import pytest  # version 7.3.1
-from unittest.mock import patch, MagicMock, Mock  # version standard library
+from unittest.mock import patch, MagicMock, Mock, ANY  # version standard library
 import io  # version standard library
+import os  # version standard library
+import threading  # version standard library
 from datetime import datetime
 from botocore.exceptions import ClientError  # version 1.29.0+
 
-from utils.storage import S3Storage, StorageError, generate_presigned_url
+from botocore.response import StreamingBody  # version 1.29.0+
+
+from utils.storage import (
+    S3Storage, S3MultipartWriter, StorageError, PresignedUrlCache, generate_presigned_url, get_s3_client,
+    presigned_url_cache, MIN_MULTIPART_PART_SIZE
+)
 
 
 class TestS3Storage:
@@ -20,10 +27,14 @@ class TestS3Storage:
         # Create mock S3 client
         self.mock_s3_client = MagicMock()
         
-        # Patch boto3.client to return our mock
+        # Patch boto3.client to return our mock; clients are shared, so drop cached ones
+        get_s3_client.cache_clear()
         self.patcher = patch('boto3.client', return_value=self.mock_s3_client)
         self.mock_boto3_client = self.patcher.start()
         
+        # Presigned URLs are cached per process, so start each test without them
+        presigned_url_cache.clear()
+        
         # Initialize S3Storage with test bucket and region
         self.bucket_name = 'test-bucket'
         self.region_name = 'us-east-1'
@@ -44,6 +55,7 @@ class TestS3Storage:
         """Tear down method that runs after each test"""
         # Stop the patcher
         self.patcher.stop()
+        get_s3_client.cache_clear()
     
     def test_init(self):
         """Test S3Storage initialization"""
@@ -54,8 +66,15 @@ class TestS3Storage:
         
         # Verify boto3.client was called with correct parameters
         self.mock_boto3_client.assert_called_once_with(
-            's3', region_name=self.region_name
+            's3', region_name=self.region_name, endpoint_url=None, config=ANY
         )
+        config = self.mock_boto3_client.call_args[1]['config']
+        assert config.max_pool_connections >= self.storage.max_concurrency
+        
+        # Instances share the client and its connection pool
+        other = S3Storage(bucket_name='other-bucket', region_name=self.region_name)
+        assert other.s3_client is self.storage.s3_client
+        assert self.mock_boto3_client.call_count == 1
         
         # Test initialization with ValueError when bucket_name is not provided
         with patch('os.environ.get', return_value=None):
@@ -125,6 +144,47 @@ class TestS3Storage:
         # Verify original exception is preserved
         assert isinstance(excinfo.value.original_exception, ClientError)
     
+    def test_store_large_file_uses_parallel_upload(self):
+        """Test that files larger than the chunk size are uploaded with the transfer manager"""
+        storage = S3Storage(bucket_name=self.bucket_name, region_name=self.region_name, max_concurrency=4)
+        large_file = io.BytesIO(b'a' * (storage.chunk_size + 1))
+        self.mock_s3_client.head_object.return_value = {'VersionId': self.test_version_id}
+        
+        result = storage.store(large_file, self.test_key, content_type=self.test_content_type)
+        
+        self.mock_s3_client.put_object.assert_not_called()
+        self.mock_s3_client.upload_fileobj.assert_called_once_with(
+            large_file,
+            self.bucket_name,
+            self.test_key,
+            ExtraArgs={'ContentType': self.test_content_type, 'ServerSideEncryption': 'AES256'},
+            Config=storage.transfer_config
+        )
+        assert storage.transfer_config.max_request_concurrency == 4
+        assert storage.transfer_config.multipart_chunksize == storage.chunk_size
+        assert result['version_id'] == self.test_version_id
+    
+    def test_download(self):
+        """Test downloading a file into a file object"""
+        target = io.BytesIO()
+        
+        assert self.storage.download(self.test_key, target, version_id=self.test_version_id) is True
+        
+        self.mock_s3_client.download_fileobj.assert_called_once_with(
+            self.bucket_name,
+            self.test_key,
+            target,
+            ExtraArgs={'VersionId': self.test_version_id},
+            Config=self.storage.transfer_config
+        )
+        
+        # Errors are wrapped in StorageError
+        self.mock_s3_client.download_fileobj.side_effect = ClientError(
+            {'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject'
+        )
+        with pytest.raises(StorageError):
+            self.storage.download(self.test_key, target)
+    
     def test_retrieve(self):
         """Test retrieving a file from S3"""
         # Mock the S3 client response
@@ -181,6 +241,77 @@ class TestS3Storage:
         # Verify original exception is preserved
         assert isinstance(excinfo.value.original_exception, ClientError)
     
+    def test_open_stream(self):
+        """Test opening a whole object for streaming"""
+        self.mock_s3_client.get_object.return_value = {
+            'Body': StreamingBody(io.BytesIO(self.test_content), len(self.test_content)),
+            'ContentType': self.test_content_type,
+            'ContentLength': len(self.test_content),
+            'ETag': '"abc123"',
+            'VersionId': self.test_version_id
+        }
+        
+        stream = self.storage.open_stream(self.test_key)
+        
+        assert stream.status_code == 200
+        assert stream.etag == 'abc123'
+        assert stream.content_length == len(self.test_content)
+        assert b''.join(stream.iter_chunks(chunk_size=4)) == self.test_content
+        self.mock_s3_client.get_object.assert_called_once_with(Bucket=self.bucket_name, Key=self.test_key)
+    
+    def test_open_stream_range(self):
+        """Test that a byte range is forwarded and answered as partial content"""
+        self.mock_s3_client.get_object.return_value = {
+            'Body': StreamingBody(io.BytesIO(b'Test'), 4),
+            'ContentLength': 4,
+            'ContentRange': f'bytes 0-3/{len(self.test_content)}',
+            'ETag': '"abc123"'
+        }
+        
+        stream = self.storage.open_stream(self.test_key, byte_range='bytes=0-3', if_none_match='"old"')
+        
+        assert stream.status_code == 206
+        assert stream.content_range == f'bytes 0-3/{len(self.test_content)}'
+        self.mock_s3_client.get_object.assert_called_once_with(
+            Bucket=self.bucket_name, Key=self.test_key, Range='bytes=0-3', IfNoneMatch='"old"'
+        )
+    
+    def test_open_stream_not_modified(self):
+        """Test that a matching ETag is answered without a body"""
+        self.mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': '304', 'Message': 'Not Modified'}, 'ResponseMetadata': {'HTTPStatusCode': 304}},
+            'GetObject'
+        )
+        
+        stream = self.storage.open_stream(self.test_key, if_none_match='"abc123"')
+        
+        assert stream.status_code == 304
+        assert stream.etag == 'abc123'
+        assert list(stream.iter_chunks()) == []
+    
+    def test_open_stream_invalid_range(self):
+        """Test that an unsatisfiable range reports the object size"""
+        self.mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRange', 'Message': 'Bad range', 'ActualObjectSize': '17'}},
+            'GetObject'
+        )
+        
+        stream = self.storage.open_stream(self.test_key, byte_range='bytes=100-')
+        
+        assert stream.status_code == 416
+        assert stream.content_range == 'bytes */17'
+    
+    def test_open_stream_error(self):
+        """Test error handling when an object cannot be opened"""
+        self.mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchKey', 'Message': 'Test error'}}, 'GetObject'
+        )
+        
+        with pytest.raises(StorageError) as excinfo:
+            self.storage.open_stream(self.test_key)
+        
+        assert "Failed to open object" in str(excinfo.value)
+    
     def test_delete(self):
         """Test deleting a file from S3"""
         # Mock the S3 client response
@@ -228,6 +359,38 @@ class TestS3Storage:
         # Verify original exception is preserved
         assert isinstance(excinfo.value.original_exception, ClientError)
     
+    def test_delete_many(self):
+        """Test deleting objects in batches"""
+        keys = [f'test/document{index}.pdf' for index in range(5)]
+        self.mock_s3_client.delete_objects.side_effect = [
+            {},
+            {'Errors': [{'Key': 'test/document3.pdf', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]},
+            {}
+        ]
+        
+        result = self.storage.delete_many(iter(keys), batch_size=2)
+        
+        assert self.mock_s3_client.delete_objects.call_count == 3
+        self.mock_s3_client.delete_objects.assert_any_call(
+            Bucket=self.bucket_name,
+            Delete={'Objects': [{'Key': 'test/document0.pdf'}, {'Key': 'test/document1.pdf'}], 'Quiet': True}
+        )
+        assert result['deleted'] == ['test/document0.pdf', 'test/document1.pdf', 'test/document2.pdf', 'test/document4.pdf']
+        assert result['errors'] == [
+            {'key': 'test/document3.pdf', 'code': 'AccessDenied', 'message': 'Access Denied'}
+        ]
+    
+    def test_delete_many_error(self):
+        """Test error handling when a batch delete request fails"""
+        self.mock_s3_client.delete_objects.side_effect = ClientError(
+            {'Error': {'Code': 'InternalError', 'Message': 'Test error'}}, 'DeleteObjects'
+        )
+        
+        with pytest.raises(StorageError) as excinfo:
+            self.storage.delete_many(['test/document.pdf'])
+        
+        assert "Failed to delete objects" in str(excinfo.value)
+    
     def test_get_presigned_url(self):
         """Test generating a presigned URL for a file"""
         test_url = 'https://test-bucket.s3.amazonaws.com/test/document.pdf?signature=test'
@@ -268,6 +431,34 @@ class TestS3Storage:
                 version_id=self.test_version_id
             )
     
+    def test_get_presigned_url_is_cached(self):
+        """Test that repeated requests for the same URL sign it once"""
+        with patch('utils.storage.generate_presigned_url', side_effect=lambda bucket, key, **kwargs: f'url:{key}') as mock_generate:
+            first = self.storage.get_presigned_url(self.test_key)
+            second = self.storage.get_presigned_url(self.test_key)
+            
+            assert first == second == f'url:{self.test_key}'
+            mock_generate.assert_called_once()
+            
+            # A different expiration or version is a different URL
+            self.storage.get_presigned_url(self.test_key, expiration=60)
+            self.storage.get_presigned_url(self.test_key, version_id=self.test_version_id)
+            assert mock_generate.call_count == 3
+    
+    def test_get_presigned_urls(self):
+        """Test that a batch signs each uncached key once"""
+        with patch('utils.storage.generate_presigned_url', side_effect=lambda bucket, key, **kwargs: f'url:{key}') as mock_generate:
+            self.storage.get_presigned_url('test/a.pdf')
+            
+            urls = self.storage.get_presigned_urls(['test/a.pdf', 'test/b.pdf', 'test/b.pdf', None])
+            
+            assert urls == {'test/a.pdf': 'url:test/a.pdf', 'test/b.pdf': 'url:test/b.pdf'}
+            assert mock_generate.call_count == 2
+            
+            # Rows serialized after the batch read the cached URLs
+            assert self.storage.get_presigned_url('test/b.pdf') == 'url:test/b.pdf'
+            assert mock_generate.call_count == 2
+    
     def test_get_presigned_url_error(self):
         """Test error handling when generating a presigned URL fails"""
         # Mock generate_presigned_url to raise an error
@@ -290,7 +481,8 @@ class TestS3Storage:
         last_modified1 = datetime(2023, 1, 1, 12, 0, 0)
         last_modified2 = datetime(2023, 1, 2, 12, 0, 0)
         
-        self.mock_s3_client.list_objects_v2.return_value = {
+        paginator = self.mock_s3_client.get_paginator.return_value
+        paginator.paginate.return_value = [{
             'Contents': [
                 {
                     'Key': 'test/document1.pdf',
@@ -307,15 +499,16 @@ class TestS3Storage:
                     'StorageClass': 'STANDARD'
                 }
             ]
-        }
+        }]
         
         # Call list method
         result = self.storage.list(prefix='test/')
         
         # Verify S3 client was called with correct parameters
-        self.mock_s3_client.list_objects_v2.assert_called_once_with(
+        self.mock_s3_client.get_paginator.assert_called_once_with('list_objects_v2')
+        paginator.paginate.assert_called_once_with(
             Bucket=self.bucket_name,
-            MaxKeys=1000,
+            PaginationConfig={'PageSize': 1000},
             Prefix='test/'
         )
         
@@ -331,21 +524,38 @@ class TestS3Storage:
         assert result[1]['etag'] == 'test-etag-2'
         
         # Test with max_items parameter
-        self.mock_s3_client.list_objects_v2.reset_mock()
-        max_items = 50
-        self.storage.list(max_items=max_items)
+        paginator.paginate.reset_mock()
+        result = self.storage.list(max_items=1)
         
-        # Verify max_items was passed
-        self.mock_s3_client.list_objects_v2.assert_called_once_with(
+        # Verify max_items limits the page size and the result
+        paginator.paginate.assert_called_once_with(
             Bucket=self.bucket_name,
-            MaxKeys=max_items
+            PaginationConfig={'PageSize': 1}
         )
+        assert len(result) == 1
+    
+    def test_iter_objects_reads_every_page(self):
+        """Test that iterating over objects follows the pages lazily"""
+        last_modified = datetime(2023, 1, 1, 12, 0, 0)
+        pages = [
+            {'Contents': [{'Key': f'test/{page}-{index}.pdf', 'Size': 1, 'LastModified': last_modified, 'ETag': '"e"'}
+                          for index in range(2)]}
+            for page in range(3)
+        ]
+        self.mock_s3_client.get_paginator.return_value.paginate.return_value = iter(pages)
+        
+        objects = self.storage.iter_objects(prefix='test/', page_size=2)
+        assert next(objects)['key'] == 'test/0-0.pdf'
+        
+        assert [obj['key'] for obj in objects] == [
+            'test/0-1.pdf', 'test/1-0.pdf', 'test/1-1.pdf', 'test/2-0.pdf', 'test/2-1.pdf'
+        ]
     
     def test_list_error(self):
         """Test error handling when listing objects fails"""
         # Mock S3 client to raise an error
         error_response = {'Error': {'Code': 'AccessDenied', 'Message': 'Test error'}}
-        self.mock_s3_client.list_objects_v2.side_effect = ClientError(
+        self.mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
             error_response, 'ListObjectsV2'
         )
         
@@ -500,6 +710,55 @@ class TestS3Storage:
         assert isinstance(excinfo.value.original_exception, ClientError)
 
 
+class TestPresignedUrlCache:
+    """Test class for the presigned URL cache"""
+    
+    def setup_method(self, method):
+        """Set up method that runs before each test"""
+        self.cache = PresignedUrlCache(max_entries=3, reuse_fraction=0.1)
+        self.counter = 0
+    
+    def sign(self, key):
+        """Signs a distinct URL on each call"""
+        self.counter += 1
+        return f'{key}?signature={self.counter}'
+    
+    def test_url_is_reused_within_its_window(self):
+        """Test that a URL is reused until its expiry bucket ends"""
+        with patch('utils.storage.time.time', return_value=1000.0):
+            first = self.cache.get_url('bucket', 'key', 3600, self.sign)
+        # Still within the 360 second window starting at 720
+        with patch('utils.storage.time.time', return_value=1079.0):
+            assert self.cache.get_url('bucket', 'key', 3600, self.sign) == first
+        # The next window signs a new URL, which keeps at least 90% of its validity
+        with patch('utils.storage.time.time', return_value=1080.0):
+            assert self.cache.get_url('bucket', 'key', 3600, self.sign) != first
+        assert self.counter == 2
+    
+    def test_urls_are_keyed_by_bucket_and_version(self):
+        """Test that buckets and versions do not share URLs"""
+        urls = {
+            self.cache.get_url('bucket-a', 'key', 3600, self.sign),
+            self.cache.get_url('bucket-b', 'key', 3600, self.sign),
+            self.cache.get_url('bucket-a', 'key', 3600, self.sign, version_id='v1'),
+        }
+        
+        assert len(urls) == 3
+    
+    def test_least_recently_used_urls_are_dropped(self):
+        """Test that the cache stays within its size"""
+        for key in ('a', 'b', 'c'):
+            self.cache.get_url('bucket', key, 3600, self.sign)
+        self.cache.get_url('bucket', 'a', 3600, self.sign)
+        self.cache.get_url('bucket', 'd', 3600, self.sign)
+        
+        assert self.counter == 4
+        # 'b' was the least recently used and has to be signed again
+        self.cache.get_url('bucket', 'a', 3600, self.sign)
+        self.cache.get_url('bucket', 'b', 3600, self.sign)
+        assert self.counter == 5
+
+
 class TestGeneratePresignedUrl:
     """Test class for the generate_presigned_url function"""
     
@@ -508,7 +767,8 @@ class TestGeneratePresignedUrl:
         # Create mock S3 client
         self.mock_s3_client = MagicMock()
         
-        # Patch boto3.client to return our mock
+        # Patch boto3.client to return our mock; clients are shared, so drop cached ones
+        get_s3_client.cache_clear()
         self.patcher = patch('boto3.client', return_value=self.mock_s3_client)
         self.mock_boto3_client = self.patcher.start()
         
@@ -523,6 +783,7 @@ class TestGeneratePresignedUrl:
         """Tear down method that runs after each test"""
         # Stop the patcher
         self.patcher.stop()
+        get_s3_client.cache_clear()
     
     def test_generate_presigned_url(self):
         """Test generating a presigned URL"""
@@ -576,7 +837,9 @@ class TestGeneratePresignedUrl:
         )
         
         # Verify boto3.client was called with region_name
-        self.mock_boto3_client.assert_called_with('s3', region_name=self.region_name)
+        self.mock_boto3_client.assert_called_with(
+            's3', region_name=self.region_name, endpoint_url=None, config=ANY
+        )
         
         # Verify version_id was included in params
         self.mock_s3_client.generate_presigned_url.assert_called_once_with(
@@ -606,4 +869,209 @@ class TestGeneratePresignedUrl:
         assert "Test error" in str(excinfo.value)
         
         # Verify original exception is preserved
-        assert isinstance(excinfo.value.original_exception, ClientError)
\ No newline at end of file
+        assert isinstance(excinfo.value.original_exception, ClientError)
+
+
+class TestS3MultipartWriter:
+    """Test class for streaming multipart uploads"""
+    
+    def setup_method(self, method):
+        """Set up method that runs before each test"""
+        self.mock_s3_client = MagicMock()
+        self.mock_s3_client.create_multipart_upload.return_value = {'UploadId': 'upload-id'}
+        self.mock_s3_client.upload_part.side_effect = lambda **kwargs: {'ETag': f"etag-{kwargs['PartNumber']}"}
+        self.mock_s3_client.complete_multipart_upload.return_value = {'VersionId': 'version-id'}
+        
+        get_s3_client.cache_clear()
+        self.patcher = patch('boto3.client', return_value=self.mock_s3_client)
+        self.patcher.start()
+        self.storage = S3Storage(bucket_name='test-bucket', region_name='us-east-1')
+    
+    def teardown_method(self, method):
+        """Tear down method that runs after each test"""
+        self.patcher.stop()
+        get_s3_client.cache_clear()
+    
+    def test_parts_are_uploaded_as_buffer_fills(self):
+        """Test that data is uploaded one part at a time and completed on close"""
+        writer = self.storage.open_multipart_upload(
+            'exports/large.csv', content_type='text/csv', metadata={'report_id': 'r1'}, max_concurrency=1
+        )
+        assert isinstance(writer, S3MultipartWriter)
+        self.mock_s3_client.create_multipart_upload.assert_called_once_with(
+            Bucket='test-bucket',
+            Key='exports/large.csv',
+            ContentType='text/csv',
+            Metadata={'report_id': 'r1'},
+            ServerSideEncryption='AES256'
+        )
+        
+        writer.write(b'a' * (MIN_MULTIPART_PART_SIZE - 1))
+        self.mock_s3_client.upload_part.assert_not_called()
+        writer.write(b'a' * (MIN_MULTIPART_PART_SIZE + 1))
+        assert self.mock_s3_client.upload_part.call_count == 1
+        writer.write(b'tail')
+        
+        result = writer.close()
+        
+        assert self.mock_s3_client.upload_part.call_count == 2
+        self.mock_s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket='test-bucket',
+            Key='exports/large.csv',
+            UploadId='upload-id',
+            MultipartUpload={'Parts': [
+                {'ETag': 'etag-1', 'PartNumber': 1},
+                {'ETag': 'etag-2', 'PartNumber': 2}
+            ]}
+        )
+        assert result == {
+            'key': 'exports/large.csv',
+            'url': 's3://test-bucket/exports/large.csv',
+            'version_id': 'version-id'
+        }
+        assert writer.bytes_written == 2 * MIN_MULTIPART_PART_SIZE + 4
+    
+    def test_empty_upload_sends_one_part(self):
+        """Test that an empty object is completed with a single empty part"""
+        with self.storage.open_multipart_upload('exports/empty.csv'):
+            pass
+        
+        self.mock_s3_client.upload_part.assert_called_once()
+        assert self.mock_s3_client.upload_part.call_args[1]['Body'] == b''
+        self.mock_s3_client.complete_multipart_upload.assert_called_once()
+    
+    def test_error_aborts_upload(self):
+        """Test that an error inside the with block aborts the upload"""
+        with pytest.raises(RuntimeError):
+            with self.storage.open_multipart_upload('exports/failed.csv') as writer:
+                writer.write(b'partial')
+                raise RuntimeError('query failed')
+        
+        self.mock_s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket='test-bucket', Key='exports/failed.csv', UploadId='upload-id'
+        )
+        self.mock_s3_client.complete_multipart_upload.assert_not_called()
+    
+    def test_failed_part_upload_aborts(self):
+        """Test that a failed part upload raises StorageError and aborts the upload"""
+        self.mock_s3_client.upload_part.side_effect = ClientError(
+            {'Error': {'Code': 'InternalError', 'Message': 'Test error'}}, 'UploadPart'
+        )
+        writer = self.storage.open_multipart_upload('exports/failed.csv')
+        writer.write(b'partial')
+        
+        with pytest.raises(StorageError):
+            writer.close()
+        
+        self.mock_s3_client.abort_multipart_upload.assert_called_once()
+    
+    def test_parts_are_uploaded_in_parallel(self):
+        """Test that parts are uploaded concurrently and completed in order"""
+        uploading = threading.Barrier(3, timeout=5)
+        
+        def upload_part(**kwargs):
+            # Each of the three parts waits until all three are being uploaded
+            uploading.wait()
+            return {'ETag': f"etag-{kwargs['PartNumber']}"}
+        
+        self.mock_s3_client.upload_part.side_effect = upload_part
+        writer = self.storage.open_multipart_upload(
+            'exports/large.csv', part_size=MIN_MULTIPART_PART_SIZE, max_concurrency=3
+        )
+        
+        for _ in range(3):
+            writer.write(b'a' * MIN_MULTIPART_PART_SIZE)
+        writer.close()
+        
+        parts = self.mock_s3_client.complete_multipart_upload.call_args[1]['MultipartUpload']['Parts']
+        assert parts == [{'ETag': f'etag-{number}', 'PartNumber': number} for number in (1, 2, 3)]
+    
+    def test_failed_parallel_part_aborts(self):
+        """Test that a part failing in the background aborts the upload on close"""
+        self.mock_s3_client.upload_part.side_effect = ClientError(
+            {'Error': {'Code': 'InternalError', 'Message': 'Test error'}}, 'UploadPart'
+        )
+        writer = self.storage.open_multipart_upload('exports/failed.csv', max_concurrency=2)
+        writer.write(b'a' * writer.part_size)
+        
+        with pytest.raises(StorageError):
+            writer.close()
+        
+        self.mock_s3_client.abort_multipart_upload.assert_called_once()
+        self.mock_s3_client.complete_multipart_upload.assert_not_called()
+
+
+class TestS3StorageLocalStandIn:
+    """Test class running S3Storage against moto's in-memory S3"""
+    
+    def setup_method(self, method):
+        """Set up method that runs before each test"""
+        moto = pytest.importorskip('moto')
+        
+        # moto needs credentials to sign requests, although it ignores them
+        self.environ = patch.dict(os.environ, {
+            'AWS_ACCESS_KEY_ID': 'testing',
+            'AWS_SECRET_ACCESS_KEY': 'testing',
+            'AWS_DEFAULT_REGION': 'us-east-1'
+        })
+        self.environ.start()
+        self.mock = moto.mock_s3()
+        self.mock.start()
+        get_s3_client.cache_clear()
+        
+        self.storage = S3Storage(
+            bucket_name='test-bucket',
+            region_name='us-east-1',
+            chunk_size=MIN_MULTIPART_PART_SIZE,
+            max_concurrency=4
+        )
+        self.storage.s3_client.create_bucket(Bucket='test-bucket')
+    
+    def teardown_method(self, method):
+        """Tear down method that runs after each test"""
+        get_s3_client.cache_clear()
+        self.mock.stop()
+        self.environ.stop()
+    
+    def test_large_file_round_trip(self):
+        """Test that a file larger than the chunk size is uploaded and downloaded in parts"""
+        content = os.urandom(2 * MIN_MULTIPART_PART_SIZE + 1024)
+        
+        self.storage.store(io.BytesIO(content), 'documents/large.pdf', content_type='application/pdf')
+        
+        info = self.storage.s3_client.head_object(Bucket='test-bucket', Key='documents/large.pdf')
+        assert info['ContentLength'] == len(content)
+        # A multipart ETag ends with the number of parts
+        assert info['ETag'].strip('"').endswith('-3')
+        
+        target = io.BytesIO()
+        self.storage.download('documents/large.pdf', target)
+        assert target.getvalue() == content
+    
+    def test_multipart_writer_round_trip(self):
+        """Test that a streamed upload with parallel parts reassembles in order"""
+        chunks = [bytes([index]) * MIN_MULTIPART_PART_SIZE for index in range(4)]
+        
+        with self.storage.open_multipart_upload('exports/report.csv') as upload:
+            for chunk in chunks:
+                upload.write(chunk)
+        
+        content, _, _ = self.storage.retrieve('exports/report.csv')
+        assert content == b''.join(chunks)
+    
+    def test_listing_and_batched_delete(self):
+        """Test that listing follows pages and deletes are batched"""
+        keys = [f'reports/{index:03d}.csv' for index in range(25)]
+        for key in keys:
+            self.storage.store(b'row', key, encrypt=False)
+        self.storage.store(b'row', 'other/keep.csv', encrypt=False)
+        
+        listed = [obj['key'] for obj in self.storage.iter_objects(prefix='reports/', page_size=10)]
+        assert listed == keys
+        assert len(self.storage.list(prefix='reports/', max_items=None)) == 25
+        
+        result = self.storage.delete_many(keys, batch_size=10)
+        
+        assert sorted(result['deleted']) == keys
+        assert result['errors'] == []
+        assert [obj['key'] for obj in self.storage.iter_objects()] == ['other/keep.csv']
@@ -0,0 +1,124 @@
+"""
+Unit tests for the shared access-token cache used by the DocuSign and Auth0 integrations.
+Tests cover reuse across instances, refresh before expiry, and single-flight refresh.
+"""
+
+import threading  # standard library
+import time  # standard library
+import uuid  # standard library
+from unittest.mock import MagicMock  # standard library
+
+import pytest  # version 7.3.1
+from django.core.cache.backends.locmem import LocMemCache  # Django 4.2+
+
+from utils.token_cache import TokenCache
+
+
+class TestTokenCache:
+    """Test class for the TokenCache utility"""
+
+    def setup_method(self, method):
+        """Set up method that runs before each test"""
+        # A fresh shared cache per test, standing in for Redis
+        self.shared_cache = LocMemCache(f'token-cache-{uuid.uuid4()}', {})
+        self.token_cache = TokenCache(cache=self.shared_cache, poll_interval=0.01)
+        self.fetch = MagicMock(return_value=('token-1', 3600))
+
+    def test_token_is_fetched_once(self):
+        """Test that repeated calls reuse the cached token"""
+        first = self.token_cache.get_token('client', 'scope', self.fetch)
+        second = self.token_cache.get_token('client', 'scope', self.fetch)
+
+        assert first[0] == 'token-1'
+        assert first == second
+        self.fetch.assert_called_once()
+
+    def test_token_is_shared_between_processes(self):
+        """Test that another process reads the token from the shared cache"""
+        self.token_cache.get_token('client', 'scope', self.fetch)
+
+        other_process = TokenCache(cache=self.shared_cache)
+        other_fetch = MagicMock(return_value=('token-2', 3600))
+        token, _ = other_process.get_token('client', 'scope', other_fetch)
+
+        assert token == 'token-1'
+        other_fetch.assert_not_called()
+
+    def test_tokens_are_keyed_by_client_and_scope(self):
+        """Test that different clients and scopes get separate tokens"""
+        self.fetch.side_effect = [('token-1', 3600), ('token-2', 3600), ('token-3', 3600)]
+
+        tokens = {
+            self.token_cache.get_token('client-a', 'scope-1', self.fetch)[0],
+            self.token_cache.get_token('client-a', 'scope-2', self.fetch)[0],
+            self.token_cache.get_token('client-b', 'scope-1', self.fetch)[0],
+        }
+
+        assert tokens == {'token-1', 'token-2', 'token-3'}
+
+    def test_expiring_token_is_refreshed(self):
+        """Test that a token inside the refresh margin is replaced"""
+        self.fetch.side_effect = [('token-1', 200), ('token-2', 3600)]
+
+        self.token_cache.get_token('client', 'scope', self.fetch)
+        token, _ = self.token_cache.get_token('client', 'scope', self.fetch)
+
+        assert token == 'token-2'
+        assert self.fetch.call_count == 2
+
+    def test_invalidate_forces_refresh(self):
+        """Test that an invalidated token is fetched again"""
+        self.token_cache.get_token('client', 'scope', self.fetch)
+        self.token_cache.invalidate('client', 'scope')
+        self.token_cache.get_token('client', 'scope', self.fetch)
+
+        assert self.fetch.call_count == 2
+
+    def test_fetch_error_is_raised_and_lock_released(self):
+        """Test that a failed fetch raises and does not block the next refresh"""
+        self.fetch.side_effect = [RuntimeError('unavailable'), ('token-1', 3600)]
+
+        with pytest.raises(RuntimeError):
+            self.token_cache.get_token('client', 'scope', self.fetch)
+        token, _ = self.token_cache.get_token('client', 'scope', self.fetch)
+
+        assert token == 'token-1'
+
+    def test_concurrent_workers_refresh_once(self):
+        """Test that workers in separate processes wait for a single refresh"""
+        started = threading.Event()
+
+        def slow_fetch():
+            started.set()
+            time.sleep(0.1)
+            return ('token-1', 3600)
+
+        fetch = MagicMock(side_effect=slow_fetch)
+        # One TokenCache per worker, as each process has its own
+        workers = [TokenCache(cache=self.shared_cache, poll_interval=0.01) for _ in range(5)]
+        results = []
+
+        def run(worker):
+            results.append(worker.get_token('client', 'scope', fetch)[0])
+
+        threads = [threading.Thread(target=run, args=(workers[0],))]
+        threads[0].start()
+        started.wait(1)
+        threads += [threading.Thread(target=run, args=(worker,)) for worker in workers[1:]]
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+
+        assert results == ['token-1'] * 5
+        fetch.assert_called_once()
+
+    def test_valid_token_is_used_while_another_worker_refreshes(self):
+        """Test that a worker keeps its still-valid token instead of waiting"""
+        self.token_cache.get_token('client', 'scope', MagicMock(return_value=('token-1', 200)))
+        self.shared_cache.add(f"{TokenCache._make_key('client', 'scope')}:lock", 1)
+
+        token, _ = self.token_cache.get_token('client', 'scope', self.fetch)
+
+        assert token == 'token-1'
+        self.fetch.assert_not_called()
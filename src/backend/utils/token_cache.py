@@ -0,0 +1,221 @@
+"""
+Shared cache for OAuth access tokens issued to the application's API clients.
+
+Access tokens for third-party APIs (DocuSign, the Auth0 Management API) are valid for an
+hour or more and are the same for every worker, so they are kept in the shared Django
+cache (Redis in production) rather than on service instances. Each process also keeps
+a local copy so a valid token costs no cache round trip.
+
+Refreshes are single-flight: when a token is missing or about to expire, one worker
+takes a short-lived lock in the shared cache and fetches a new token while the others
+wait for it, or keep using the current token if it is still valid.
+"""
+
+import hashlib  # standard library
+import logging  # standard library
+import threading  # standard library
+import time  # standard library
+
+from django.core.cache import caches  # Django 4.2+
+
+# Configure logger
+logger = logging.getLogger('token_cache')
+
+# Tokens are refreshed this many seconds before they expire
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+
+# Longest a refresh may hold the lock before another worker may take over
+DEFAULT_LOCK_TIMEOUT_SECONDS = 30
+
+# Longest a worker waits for another worker's refresh before fetching itself
+DEFAULT_WAIT_TIMEOUT_SECONDS = 10
+
+# Interval between checks of the shared cache while waiting for a refresh
+DEFAULT_POLL_INTERVAL_SECONDS = 0.1
+
+
+class TokenCache:
+    """
+    Access tokens keyed by client and scope, shared between processes through the Django cache.
+    """
+
+    def __init__(self, cache_alias='default', cache=None, refresh_margin=DEFAULT_REFRESH_MARGIN_SECONDS,
+                 lock_timeout=DEFAULT_LOCK_TIMEOUT_SECONDS, wait_timeout=DEFAULT_WAIT_TIMEOUT_SECONDS,
+                 poll_interval=DEFAULT_POLL_INTERVAL_SECONDS):
+        """
+        Initialize the token cache.
+
+        Args:
+            cache_alias (str): Django cache used to share tokens (default: 'default')
+            cache (BaseCache, optional): Cache to use instead of looking up cache_alias
+            refresh_margin (int): Seconds before expiry at which a token is refreshed
+            lock_timeout (int): Seconds after which a refresh lock is released
+            wait_timeout (float): Seconds to wait for another worker's refresh
+            poll_interval (float): Seconds between checks while waiting
+        """
+        self.cache_alias = cache_alias
+        self._cache = cache
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+        # Process-local copies of shared tokens, and one lock per key so threads of
+        # this process do not race each other for the shared lock
+        self._local_tokens = {}
+        self._local_locks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """
+        Shared cache holding the tokens.
+
+        Returns:
+            BaseCache: The Django cache
+        """
+        if self._cache is None:
+            self._cache = caches[self.cache_alias]
+        return self._cache
+
+    def get_token(self, client, scope, fetch):
+        """
+        Returns a valid access token, fetching a new one if needed.
+
+        Args:
+            client (str): Identifies the API client, e.g. the OAuth client ID
+            scope (str): Scope or audience the token is issued for
+            fetch (callable): Called without arguments to request a new token; returns a
+                tuple of (access_token, expires_in seconds)
+
+        Returns:
+            tuple: (access_token, expires_at) where expires_at is a Unix timestamp
+
+        Raises:
+            Exception: Whatever fetch raises when no valid token is available
+        """
+        key = self._make_key(client, scope)
+
+        token = self._local_tokens.get(key)
+        if self._is_fresh(token):
+            return token
+
+        with self._get_local_lock(key):
+            token = self._read_shared(key)
+            if self._is_fresh(token):
+                return token
+
+            # Only one worker refreshes; the rest wait for its token unless theirs is still valid
+            lock_key = f"{key}:lock"
+            if self.cache.add(lock_key, 1, timeout=self.lock_timeout):
+                try:
+                    return self._refresh(key, fetch)
+                finally:
+                    self.cache.delete(lock_key)
+
+            if self._is_valid(token):
+                return token
+
+            token = self._wait_for_refresh(key)
+            if token:
+                return token
+
+            logger.warning(f"Timed out waiting for token refresh of {client}; fetching a token directly")
+            return self._refresh(key, fetch)
+
+    def invalidate(self, client, scope):
+        """
+        Drops a cached token, e.g. after the API rejected it.
+
+        Args:
+            client (str): Identifies the API client
+            scope (str): Scope or audience the token was issued for
+        """
+        key = self._make_key(client, scope)
+        self._local_tokens.pop(key, None)
+        self.cache.delete(key)
+
+    def _refresh(self, key, fetch):
+        """
+        Fetches a new token and stores it in the shared and local caches.
+
+        Args:
+            key (str): Cache key of the token
+            fetch (callable): Token request function
+
+        Returns:
+            tuple: (access_token, expires_at)
+        """
+        access_token, expires_in = fetch()
+        token = (access_token, time.time() + expires_in)
+
+        # Keep the shared entry until the token expires; readers refresh it before that
+        self.cache.set(key, token, timeout=max(int(expires_in), 1))
+        self._local_tokens[key] = token
+        return token
+
+    def _read_shared(self, key):
+        """
+        Reads a token from the shared cache into the local cache.
+
+        Args:
+            key (str): Cache key of the token
+
+        Returns:
+            tuple: (access_token, expires_at), or None if not cached
+        """
+        token = self.cache.get(key)
+        if token:
+            self._local_tokens[key] = tuple(token)
+            return tuple(token)
+        return None
+
+    def _wait_for_refresh(self, key):
+        """
+        Waits for another worker to store a fresh token.
+
+        Args:
+            key (str): Cache key of the token
+
+        Returns:
+            tuple: (access_token, expires_at), or None if no token arrived in time
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            token = self._read_shared(key)
+            if self._is_fresh(token):
+                return token
+        return None
+
+    def _is_fresh(self, token):
+        """Whether a token is valid and not due for refresh"""
+        return bool(token) and token[1] - self.refresh_margin > time.time()
+
+    def _is_valid(self, token):
+        """Whether a token has not expired yet"""
+        return bool(token) and token[1] > time.time()
+
+    def _get_local_lock(self, key):
+        """Returns the process-local lock for a key"""
+        with self._lock:
+            return self._local_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _make_key(client, scope):
+        """
+        Builds the cache key for a client and scope.
+
+        Args:
+            client (str): Identifies the API client
+            scope (str): Scope or audience
+
+        Returns:
+            str: Cache key safe for any cache backend
+        """
+        digest = hashlib.sha256(f"{client}\x00{scope}".encode('utf-8')).hexdigest()
+        return f"access_token:{digest}"
+
+
+# Process-wide token cache shared by the API integrations
+token_cache = TokenCache()